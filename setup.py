@@ -53,6 +53,7 @@ setup(
         'odm1': ['sqlalchemy', 'pyodbc'],
         'odm2': ['sqlalchemy', 'odm2api'],
         'sqlite': ['sqlalchemy'],
+        'numpy': ['numpy'],
         'server': ['uwsgi'],
     },
     tests_require=['suds-jurko', 'requests'],
@@ -0,0 +1,128 @@
+from __future__ import (absolute_import, division, print_function)
+
+import datetime
+import os
+import unittest
+
+from dateutil.tz import tzoffset
+
+from test_dao_1_1 import TestDao
+
+from wof import WOF_1_1 as WOF
+from wof import aggregation, models
+
+TEST_CONFIG_FILE = 'test_config.cfg'
+
+CST = tzoffset(None, -21600)
+
+
+class TestDataValue(models.BaseDataValue):
+    def __init__(self, value, hour, day=1):
+        self.DataValue = value
+        self.LocalDateTime = datetime.datetime(2007, 4, day, hour, tzinfo=CST)
+        self.UTCOffset = -6
+        self.MethodID = 1
+
+
+VALUES = [
+    TestDataValue(1, 0),
+    TestDataValue(-9999, 6),
+    TestDataValue(4, 12),
+    TestDataValue('bad', 13),
+    TestDataValue(2, 18),
+    TestDataValue(5, 6, day=2),
+]
+
+
+class TestAggregation(unittest.TestCase):
+    """
+    Tests the interval buckets and statistics of aggregated values.
+    """
+
+    def aggregate(self, interval, statistic):
+        return [(value.LocalDateTime.day, value.LocalDateTime.hour,
+                 value.DataValue)
+                for value in aggregation.aggregate(
+                    VALUES, aggregation.parse_interval(interval), statistic,
+                    '-9999')]
+
+    def check_statistics(self):
+        assert self.aggregate('1d', 'mean') == [(1, 0, 7 / 3), (2, 0, 5)]
+        assert self.aggregate('day', 'min') == [(1, 0, 1), (2, 0, 5)]
+        assert self.aggregate('1 day', 'max') == [(1, 0, 4), (2, 0, 5)]
+        assert self.aggregate('24h', 'sum') == [(1, 0, 7), (2, 0, 5)]
+        assert self.aggregate('1d', 'count') == [(1, 0, 3), (2, 0, 1)]
+        assert self.aggregate('1d', 'last') == [(1, 0, 2), (2, 0, 5)]
+        assert self.aggregate('12hours', 'count') == [
+            (1, 0, 1), (1, 12, 2), (2, 0, 1)]
+
+    def test_statistics_python(self):
+        numpy = aggregation.numpy
+        aggregation.numpy = None
+        try:
+            self.check_statistics()
+        finally:
+            aggregation.numpy = numpy
+
+    @unittest.skipIf(aggregation.numpy is None, 'NumPy is not installed')
+    def test_statistics_numpy(self):
+        self.check_statistics()
+
+    def test_bucket_dates(self):
+        value = aggregation.aggregate(
+            VALUES, aggregation.parse_interval('1d'), 'mean')[0]
+        assert value.LocalDateTime == datetime.datetime(2007, 4, 1,
+                                                        tzinfo=CST)
+        assert value.DateTimeUTC == datetime.datetime(
+            2007, 4, 1, 6, tzinfo=aggregation.isodates.tzinfo_for_offset(0))
+        assert (value.UTCOffset, value.MethodID) == (-6, 1)
+
+    def test_week_buckets(self):
+        def buckets(interval):
+            return [(value.LocalDateTime.date(), value.DataValue)
+                    for value in aggregation.aggregate(
+                        VALUES, aggregation.parse_interval(interval),
+                        'count', '-9999')]
+
+        # Weeks start on Monday: Sunday 2007-04-01 is in the week of
+        # 2007-03-26 and Monday 2007-04-02 starts the next one.
+        assert buckets('1w') == [(datetime.date(2007, 3, 26), 3),
+                                 (datetime.date(2007, 4, 2), 1)]
+        assert buckets('2 weeks') == [(datetime.date(2007, 3, 19), 3),
+                                      (datetime.date(2007, 4, 2), 1)]
+
+    def test_invalid_arguments(self):
+        for interval in ('0d', 'fortnight', '1.5h', ''):
+            with self.assertRaises(ValueError):
+                aggregation.parse_interval(interval)
+        with self.assertRaises(ValueError):
+            aggregation.check_statistic('median')
+
+    def test_get_values_response(self):
+        testConfig = os.path.join(os.path.dirname(__file__), TEST_CONFIG_FILE)
+        wof_inst = WOF(TestDao(), testConfig)
+        siteCode, seriesArr, varResult = wof_inst.get_values_aggregate_series(
+            'TEST:SITE_A', 'TESTVocab:Temp', interval='1w', statistic='max')
+        assert [value.DataValue for value in seriesArr[0][1]] == [10.4]
+
+        response = wof_inst.create_get_values_response(
+            'TEST:SITE_A', 'TESTVocab:Temp', interval='1w', statistic='max')
+        variable = response.timeSeries[0].variable
+        assert variable.dataType == 'Maximum'
+        assert variable.timeScale.isRegular
+        assert variable.timeScale.timeSupport == 1
+        assert variable.timeScale.unit.unitName == 'week'
+
+        with self.assertRaises(ValueError):
+            wof_inst.create_get_values_response(
+                'TEST:SITE_A', 'TESTVocab:Temp', interval='1w', since='1')
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestAggregation))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
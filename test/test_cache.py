@@ -0,0 +1,206 @@
+from __future__ import (absolute_import, division, print_function)
+
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from wof.cache import ResponseCache, SingleFlight, fcntl, normalize_query
+from wof.core_1_1 import WOF_1_1
+
+
+class FakeTimer(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResponseCache(unittest.TestCase):
+    """
+    Tests key normalization, LRU eviction and expiry of cached responses.
+    """
+
+    def setUp(self):
+        self.wof_inst = WOF_1_1(None)
+        self.wof_inst.network = 'test'
+        self.wof_inst.vocabulary = 'testvocab'
+        self.timer = FakeTimer()
+
+    def test_normalize_query(self):
+        key = normalize_query(self.wof_inst, 'GetValues', {
+            'site': 'TEST:SITE_A',
+            'variable': 'TESTVocab:salinity',
+            'start': '2007-03-23',
+            'end': None,
+        })
+        assert key == normalize_query(self.wof_inst, 'GetValues', {
+            'site': 'SITE_A',
+            'variable': 'salinity',
+            'start': '2007-03-23T00:00:00',
+            'end': '',
+        })
+        assert normalize_query(self.wof_inst, 'GetValues', {
+            'site': 'OTHER:SITE_A', 'variable': 'salinity'}) is None
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2, timer=self.timer)
+        cache.set(('GetSites', 'a'), 'A')
+        cache.set(('GetSites', 'b'), 'B')
+        assert cache.get(('GetSites', 'a')) == 'A'
+        cache.set(('GetSites', 'c'), 'C')
+
+        assert cache.get(('GetSites', 'b')) is None
+        assert cache.get(('GetSites', 'a')) == 'A'
+        assert cache.stats()['entries'] == 2
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_max_bytes(self):
+        cache = ResponseCache(max_bytes=10, max_entry_bytes=6,
+                              timer=self.timer)
+        cache.set(('GetSites', 'a'), 'AAAA')
+        cache.set(('GetSites', 'b'), 'BBBB')
+        assert cache.get(('GetSites', 'a')) == 'AAAA'
+        cache.set(('GetSites', 'c'), 'CCCCC')
+
+        # The least recently used response is evicted to fit max_bytes.
+        assert cache.get(('GetSites', 'b')) is None
+        assert cache.stats()['bytes'] == 9
+        # Responses longer than max_entry_bytes are not cached.
+        cache.set(('GetSites', 'd'), 'DDDDDDD')
+        assert cache.get(('GetSites', 'd')) is None
+        assert len(cache) == 2
+
+    def test_method_ttl(self):
+        cache = ResponseCache(default_ttl=300, ttls={'GetValues': 10},
+                              timer=self.timer)
+        cache.set(('GetValues', 'a'), 'values')
+        cache.set(('GetSites', 'a'), 'sites')
+        self.timer.now += 60
+
+        assert cache.get(('GetValues', 'a')) is None
+        assert cache.get(('GetSites', 'a')) == 'sites'
+        assert len(cache) == 1
+
+    def test_cached_response(self):
+        self.wof_inst.response_cache = ResponseCache(timer=self.timer)
+        calls = []
+
+        def create():
+            calls.append(1)
+            return '<sitesResponse/>'
+
+        for site in ('TEST:SITE_A', 'SITE_A'):
+            response = self.wof_inst.cached_response('GetSites', create,
+                                                     site=site)
+            assert response == '<sitesResponse/>'
+        assert len(calls) == 1
+        assert self.wof_inst.response_cache.hits == 1
+
+
+class TestSingleFlight(unittest.TestCase):
+    """
+    Tests that identical concurrent calls share one computation.
+    """
+
+    def setUp(self):
+        self.release = threading.Event()
+        self.calls = []
+
+    def create(self, value='<timeSeriesResponse/>'):
+        def create():
+            self.calls.append(value)
+            self.release.wait(5)
+            if isinstance(value, Exception):
+                raise value
+            return value
+        return create
+
+    def run_calls(self, callers):
+        """
+        Runs the callers concurrently, the first one in the creator until
+        the others have started, and returns their results.
+        """
+        results = []
+
+        def run(caller):
+            try:
+                results.append(caller())
+            except Exception as e:
+                results.append(e)
+
+        threads = [threading.Thread(target=run, args=(caller,))
+                   for caller in callers]
+        threads[0].start()
+        while not self.calls:
+            time.sleep(0.001)
+        for thread in threads[1:]:
+            thread.start()
+        # Give the other calls time to start waiting.
+        time.sleep(0.1)
+        self.release.set()
+        for thread in threads:
+            thread.join(5)
+        return results
+
+    def test_threads(self):
+        flight = SingleFlight()
+        create = self.create()
+        results = self.run_calls(
+            [lambda: flight.do(('GetValues', 'a'), create)] * 4)
+        assert results == ['<timeSeriesResponse/>'] * 4
+        assert len(self.calls) == 1
+        assert flight.shared == 3
+
+        # Calls after the computation completed run their own.
+        assert flight.do(('GetValues', 'a'), lambda: 'again') == 'again'
+
+    def test_shared_error(self):
+        flight = SingleFlight()
+        error = ValueError('Invalid site')
+        create = self.create(error)
+        results = self.run_calls(
+            [lambda: flight.do(('GetValues', 'a'), create)] * 2)
+        assert results == [error, error]
+        assert len(self.calls) == 1
+
+    @unittest.skipIf(fcntl is None, 'lock files need fcntl')
+    def test_lock_dir(self):
+        lock_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, lock_dir)
+        # Each SingleFlight stands in for a worker process.
+        workers = [SingleFlight(lock_dir, namespace='test:testvocab:1.1')
+                   for i in range(2)]
+        create = self.create()
+        results = self.run_calls(
+            [lambda worker=worker: worker.do(('GetValues', 'a'), create)
+             for worker in workers])
+        assert results == ['<timeSeriesResponse/>'] * 2
+        assert len(self.calls) == 1
+        assert workers[1].shared == 1
+
+    def test_cached_response(self):
+        wof_inst = WOF_1_1(None)
+        wof_inst.network = 'test'
+        wof_inst.vocabulary = 'testvocab'
+        wof_inst.single_flight = SingleFlight()
+        create = self.create('<sitesResponse/>')
+        results = self.run_calls([
+            lambda site=site: wof_inst.cached_response('GetSites', create,
+                                                       site=site)
+            for site in ('TEST:SITE_A', 'SITE_A')])
+        assert results == ['<sitesResponse/>'] * 2
+        assert len(self.calls) == 1
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestResponseCache))
+    suite.addTest(unittest.makeSuite(TestSingleFlight))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
@@ -0,0 +1,136 @@
+from __future__ import (absolute_import, division, print_function)
+
+import gzip
+import io
+import unittest
+import zlib
+
+from wof.compression import (CompressedBodyCache, CompressionMiddleware,
+                             parse_accept_encoding)
+
+BODY = b'<value dateTime="2007-03-05T00:00:00">1.0</value>' * 200
+
+
+def sized_app(environ, start_response):
+    start_response('200 OK', [('Content-Type', 'text/xml'),
+                              ('Content-Length', str(len(BODY)))])
+    return [BODY]
+
+
+def empty_app(environ, start_response):
+    return []
+
+
+def streaming_app(environ, start_response):
+    def body():
+        start_response('200 OK', [('Content-Type', 'text/xml')])
+        for idx in range(0, len(BODY), 500):
+            yield BODY[idx:idx + 500]
+    return body()
+
+
+class TestCompressionMiddleware(unittest.TestCase):
+    """
+    Tests content coding negotiation and compression of WSGI responses.
+    """
+
+    def call(self, app, accept_encoding):
+        response = {}
+
+        def start_response(status, headers, exc_info=None):
+            response['status'] = status
+            response['headers'] = dict(headers)
+
+        environ = {'REQUEST_METHOD': 'GET'}
+        if accept_encoding:
+            environ['HTTP_ACCEPT_ENCODING'] = accept_encoding
+        body = b''.join(app(environ, start_response))
+        return response['headers'], body
+
+    def test_parse_accept_encoding(self):
+        assert parse_accept_encoding('gzip, deflate') == 'gzip'
+        assert parse_accept_encoding('deflate, gzip;q=0.5') == 'deflate'
+        assert parse_accept_encoding('gzip;q=0, identity') is None
+        assert parse_accept_encoding(None) is None
+
+    def test_sized_response_gzip(self):
+        app = CompressionMiddleware(sized_app, min_size=100,
+                                    body_cache=CompressedBodyCache())
+        headers, body = self.call(app, 'gzip')
+
+        assert headers['Content-Encoding'] == 'gzip'
+        assert headers['Content-Length'] == str(len(body))
+        assert gzip.GzipFile(fileobj=io.BytesIO(body)).read() == BODY
+
+        # The second response is served from the compressed body cache.
+        self.call(app, 'gzip')
+        assert len(app.body_cache._entries) == 1
+        assert app.body_cache.size == len(body)
+
+        # Without a body cache every response is compressed.
+        app = CompressionMiddleware(sized_app, min_size=100)
+        assert self.call(app, 'gzip')[1] == body
+
+    def test_body_cache_max_bytes(self):
+        body_cache = CompressedBodyCache(max_bytes=10)
+        body_cache.set('a', b'12345')
+        body_cache.set('b', b'12345')
+        body_cache.get('a')
+        body_cache.set('c', b'123')
+        # The least recently used entry is evicted to stay within max_bytes.
+        assert list(body_cache._entries) == ['a', 'c']
+        assert body_cache.size == 8
+        # Bodies larger than max_bytes are not cached.
+        body_cache.set('d', b'12345678901')
+        assert list(body_cache._entries) == ['a', 'c']
+
+    def test_streaming_response_deflate(self):
+        app = CompressionMiddleware(streaming_app, min_size=100)
+        headers, body = self.call(app, 'deflate')
+
+        assert headers['Content-Encoding'] == 'deflate'
+        assert 'Content-Length' not in headers
+        assert zlib.decompress(body) == BODY
+
+    def test_streaming_response_flushed(self):
+        app = CompressionMiddleware(streaming_app, min_size=100)
+        chunks = app({'REQUEST_METHOD': 'GET',
+                      'HTTP_ACCEPT_ENCODING': 'gzip'},
+                     lambda status, headers, exc_info=None: None)
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        # Every chunk of the application can be decompressed as soon as it
+        # is sent.
+        assert decompressor.decompress(next(chunks)) == BODY[:500]
+        assert decompressor.decompress(next(chunks)) == BODY[500:1000]
+        chunks.close()
+
+    def test_small_or_unaccepted_response_untouched(self):
+        app = CompressionMiddleware(sized_app, min_size=len(BODY) + 1)
+        headers, body = self.call(app, 'gzip')
+        assert 'Content-Encoding' not in headers
+        assert body == BODY
+
+        app = CompressionMiddleware(streaming_app, min_size=100)
+        headers, body = self.call(app, None)
+        assert 'Content-Encoding' not in headers
+        assert body == BODY
+        # Uncompressed responses vary on Accept-Encoding as well.
+        assert headers['Vary'] == 'Accept-Encoding'
+
+    def test_empty_response_passed_through(self):
+        app = CompressionMiddleware(empty_app, min_size=100)
+        calls = []
+        body = app({'REQUEST_METHOD': 'GET', 'HTTP_ACCEPT_ENCODING': 'gzip'},
+                   lambda *args: calls.append(args))
+        assert list(body) == []
+        assert calls == []
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestCompressionMiddleware))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
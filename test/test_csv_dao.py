@@ -0,0 +1,101 @@
+from __future__ import (absolute_import, division, print_function)
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from wof.examples.flask.csv_server.csv_dao import CsvDao
+
+SITES = (
+    'Site,FullName,Latitude,Longitude\n'
+    'SanSaba,"Colorado Rv nr San Saba, TX",31.2179451,-98.56448364\n'
+    'Austin,"Colorado Rv at Austin, TX",30.2446537,-97.69445038\n'
+)
+
+VALUES = (
+    'Site,Date,Stage_ft,Discharge_cfs\n'
+    'SanSaba,1/1/2008,2.72,433\n'
+    'Austin,1/2/2008,3.1,610\n'
+    'SanSaba,1/3/2008,2.85,508\n'
+    'Austin,1/1/2008,3.0,600\n'
+    'SanSaba,1/2/2008,2.72,429\n'
+)
+
+
+class TestCsvDao(unittest.TestCase):
+    """
+    Tests the site and value indexes of CsvDao.
+    """
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.sites_file = os.path.join(self.dir, 'sites.csv')
+        self.values_file = os.path.join(self.dir, 'data.csv')
+        self.write(self.sites_file, SITES)
+        self.write(self.values_file, VALUES)
+        self.dao = CsvDao(self.sites_file, self.values_file)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def write(self, path, text, mode='w'):
+        with open(path, mode) as f:
+            f.write(text)
+
+    def discharges(self, site_code, begin='2008-01-01', end='2008-01-31'):
+        return [(value.LocalDateTime.day, value.DataValue) for value in
+                self.dao.get_datavalues(site_code, 'Discharge_cfs',
+                                        begin, end)]
+
+    def test_sites(self):
+        self.assertEqual('Colorado Rv at Austin, TX',
+                         self.dao.get_site_by_code('Austin').SiteName)
+        self.assertIsNone(self.dao.get_site_by_code('Bastrop'))
+        self.assertEqual(['Austin'], [
+            site.SiteCode for site in
+            self.dao.get_sites_by_codes(['Bastrop', 'Austin'])])
+        self.assertEqual(2, len(self.dao.get_series_by_sitecode('SanSaba')))
+
+        self.write(self.sites_file,
+                   'Bastrop,"Colorado Rv at Bastrop, TX",30.1,-97.3\n', 'a')
+        self.assertEqual(['SanSaba', 'Austin', 'Bastrop'], [
+            site.SiteCode for site in self.dao.get_all_sites()])
+
+    def test_date_range(self):
+        self.assertEqual([(1, '433'), (2, '429'), (3, '508')],
+                         self.discharges('SanSaba'))
+        self.assertEqual([(2, '429')],
+                         self.discharges('SanSaba', '2008-01-02',
+                                         '2008-01-02'))
+        self.assertEqual([], self.discharges('SanSaba', '2008-02-01',
+                                             '2008-02-28'))
+        self.assertEqual([], self.discharges('Bastrop'))
+        self.assertEqual(1, self.dao.values_index.builds)
+
+    def test_file_changes(self):
+        self.assertEqual([(1, '600'), (2, '610')], self.discharges('Austin'))
+
+        self.write(self.values_file,
+                   'Austin,1/4/2008,3.2,620\nAustin,1/3/2008,3.1,615\n', 'a')
+        self.assertEqual([(1, '600'), (2, '610'), (3, '615'), (4, '620')],
+                         self.discharges('Austin'))
+        self.assertEqual((1, 1), (self.dao.values_index.builds,
+                                  self.dao.values_index.updates))
+
+        self.write(self.values_file,
+                   'Site,Date,Stage_ft,Discharge_cfs\n'
+                   'Austin,1/5/2008,3.3,630\n')
+        self.assertEqual([(5, '630')], self.discharges('Austin'))
+        self.assertEqual([], self.discharges('SanSaba'))
+        self.assertEqual(2, self.dao.values_index.builds)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestCsvDao))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
@@ -0,0 +1,49 @@
+from __future__ import (absolute_import, division, print_function)
+
+import os
+import tempfile
+import unittest
+
+from wof import database
+
+
+class TestDatabase(unittest.TestCase):
+    """
+    Tests the [Database] pool settings and the shared engine factory.
+    """
+
+    def test_engine_options(self):
+        fd, config_file = tempfile.mkstemp(suffix='.cfg')
+        with os.fdopen(fd, 'w') as f:
+            f.write('[Database]\n'
+                    'Connection_String: sqlite://\n'
+                    'Pool_Size: 20\n'
+                    'Pool_Pre_Ping: False\n'
+                    'Statement_Timeout: 2.5\n'
+                    'Isolation_Level: READ COMMITTED\n')
+        try:
+            options = database.engine_options(config_file)
+        finally:
+            os.remove(config_file)
+        self.assertEqual({'pool_size': 20,
+                          'pool_pre_ping': False,
+                          'statement_timeout': 2.5,
+                          'isolation_level': 'READ COMMITTED'}, options)
+        self.assertEqual({}, database.engine_options('no_such_file.cfg'))
+
+    def test_create_engine_sqlite(self):
+        engine = database.create_engine('sqlite://', pool_size=100,
+                                        max_overflow=10, pool_recycle=60)
+        self.assertTrue(engine.pool._pre_ping)
+        self.assertEqual(60, engine.pool._recycle)
+        self.assertEqual(1, engine.execute('select 1').scalar())
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestDatabase))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
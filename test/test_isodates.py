@@ -0,0 +1,52 @@
+from __future__ import (absolute_import, division, print_function)
+
+import datetime
+import unittest
+
+import dateutil.parser
+
+from wof import isodates
+
+
+class TestIsoDates(unittest.TestCase):
+    """
+    Tests the ISO 8601 fast path against dateutil.
+    """
+
+    def test_parse_matches_dateutil(self):
+        for value in ['2007-04-05', '2007-03-05 00:00',
+                      '2007-04-05T00:00-06', '2007-04-05T06:00:00Z',
+                      '2007-04-05T00:00:00.5+05:30',
+                      '2007-08-16 23:30:00.000', '20080101T00:00:00-0600',
+                      '1/1/2008', 'April 5, 2007 10:30']:
+            parsed = isodates.parse(value)
+            expected = dateutil.parser.parse(value)
+            self.assertEqual(expected.replace(tzinfo=None),
+                             parsed.replace(tzinfo=None))
+            self.assertEqual(expected.utcoffset(), parsed.utcoffset())
+
+    def test_shared_tzinfo(self):
+        a = isodates.parse('2007-04-05T00:00-06:00')
+        b = isodates.parse('2008-01-01T12:00:00-0600')
+        self.assertIs(a.tzinfo, b.tzinfo)
+        dt = datetime.datetime(2007, 4, 5)
+        self.assertIs(dt, isodates.parse(dt))
+
+    def test_format_datetime(self):
+        self.assertEqual('2007-04-05T00:00:00-06:00', isodates.format_datetime(
+            isodates.parse('2007-04-05T00:00-06')))
+        self.assertEqual('2007-04-05T06:00:00.250000Z',
+                         isodates.format_datetime(
+                             isodates.parse('2007-04-05T06:00:00.25Z')))
+        self.assertEqual('0999-01-02T03:04:05', isodates.format_datetime(
+            datetime.datetime(999, 1, 2, 3, 4, 5)))
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestIsoDates))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
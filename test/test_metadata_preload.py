@@ -0,0 +1,131 @@
+from __future__ import (absolute_import, division, print_function)
+
+import importlib
+import unittest
+
+from wof import dao, models
+
+
+class TestMethod(models.BaseMethod):
+    def __init__(self, method_id):
+        self.MethodID = method_id
+        self.MethodDescription = 'Method %d' % method_id
+
+
+class CountingDao(dao.BaseDao):
+    def __init__(self):
+        self.method_ids = [1, 2]
+        self.calls = []
+
+    def get_method_by_id(self, method_id):
+        self.calls.append(('get_method_by_id', method_id))
+        return TestMethod(method_id)
+
+    def get_methods_by_ids(self, method_id_arr):
+        self.calls.append(('get_methods_by_ids', list(method_id_arr)))
+        return [TestMethod(method_id) for method_id in method_id_arr
+                if method_id in self.method_ids]
+
+    def get_sources_by_ids(self, source_id_arr):
+        self.calls.append(('get_sources_by_ids', list(source_id_arr)))
+        return []
+
+
+class PreloadDao(dao.MetadataPreloadMixin, CountingDao):
+    def load_metadata(self, kind):
+        if kind != 'methods':
+            raise NotImplementedError(kind)
+        self.calls.append(('load_metadata', kind))
+        return [TestMethod(method_id) for method_id in self.method_ids]
+
+
+class TestMetadataPreload(unittest.TestCase):
+    """
+    Tests that preloaded metadata maps answer the *_by_ids calls.
+    """
+
+    def setUp(self):
+        self.dao = PreloadDao()
+        self.timer_now = 0
+        self.dao._metadata_timer = lambda: self.timer_now
+
+    def test_served_from_memory(self):
+        for i in range(3):
+            methods = self.dao.get_methods_by_ids([2, 1])
+            self.assertEqual([2, 1], [m.MethodID for m in methods])
+        self.assertEqual(1, self.dao.get_method_by_id(1).MethodID)
+        self.assertEqual([('load_metadata', 'methods')], self.dao.calls)
+
+    def test_fallbacks(self):
+        self.dao.get_sources_by_ids([1])
+        self.dao.method_ids.append(3)
+        methods = self.dao.get_methods_by_ids([1, 3])
+
+        self.assertEqual([1, 3], [m.MethodID for m in methods])
+        self.assertEqual([('load_metadata', 'methods'),
+                          ('get_sources_by_ids', [1]),
+                          ('get_methods_by_ids', [3])], self.dao.calls)
+
+    def test_refresh(self):
+        self.dao.metadata_refresh_interval = 60
+        self.dao.get_methods_by_ids([1])
+        self.timer_now = 30
+        self.dao.get_methods_by_ids([1])
+        self.assertEqual(1, self.dao.calls.count(('load_metadata', 'methods')))
+
+        self.timer_now = 60
+        self.dao.get_methods_by_ids([1])
+        self.dao.refresh_metadata()
+        self.assertEqual(3, self.dao.calls.count(('load_metadata', 'methods')))
+
+        metadata = self.dao.get_metadata('methods')
+        with self.assertRaises(TypeError):
+            metadata[4] = TestMethod(4)
+
+    def test_preload(self):
+        metadata = self.dao.preload_metadata()
+        self.assertEqual([1, 2], sorted(metadata['methods']))
+        self.assertEqual(1, self.dao.metadata_generation)
+
+        # Lookups are served from the preloaded maps.
+        self.dao.get_methods_by_ids([1, 2])
+        self.assertEqual([('load_metadata', 'methods')], self.dao.calls)
+
+    def test_generation(self):
+        # Lookups load the maps, and every load invalidates the WaterML
+        # fragments rendered from the previous ones.
+        self.dao.metadata_refresh_interval = 60
+        self.assertEqual(0, self.dao.metadata_generation)
+        self.dao.get_method_by_id(1)
+        self.assertEqual(1, self.dao.metadata_generation)
+        self.timer_now = 60
+        self.dao.get_method_by_id(1)
+        self.assertEqual(2, self.dao.metadata_generation)
+        self.assertNotIn(('get_method_by_id', 1), self.dao.calls)
+
+    def test_example_daos_not_shadowed(self):
+        # The lookups of the example DAOs must not shadow the mixin's.
+        lookups = [name for name in vars(dao.MetadataPreloadMixin)
+                   if name.startswith('get_') and name != 'get_metadata']
+        for module_name, class_name in (
+                ('wof.examples.flask.odm_1_1.odm_dao', 'OdmDao'),
+                ('wof.examples.flask.odm2.timeseries.odm2_timeseries_dao',
+                 'Odm2Dao')):
+            try:
+                module = importlib.import_module(module_name)
+            except ImportError:
+                continue
+            dao_class = getattr(module, class_name)
+            for name in lookups:
+                self.assertIs(getattr(dao.MetadataPreloadMixin, name),
+                              getattr(dao_class, name), (class_name, name))
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestMetadataPreload))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
@@ -0,0 +1,242 @@
+from __future__ import (absolute_import, division, print_function)
+
+import datetime
+import os
+import unittest
+
+from dateutil.tz import tzoffset
+
+from test_dao_1_1 import TestDao
+
+from wof import WOF_1_1 as WOF
+from wof import dao, models, paging
+
+TEST_CONFIG_FILE = 'test_config.cfg'
+
+CST = tzoffset(None, -21600)
+
+
+class TestDataValue(models.BaseDataValue):
+    def __init__(self, value_id, day):
+        self.ValueID = value_id
+        self.LocalDateTime = datetime.datetime(2007, 4, day, tzinfo=CST)
+
+
+class ListDao(dao.BaseDao):
+    def __init__(self, days):
+        self.values = [TestDataValue(value_id, day)
+                       for value_id, day in enumerate(days)]
+
+    def get_datavalues_iter(self, site_code, var_code, begin_date_time=None,
+                            end_date_time=None):
+        return iter(self.values)
+
+
+class TestPaging(unittest.TestCase):
+    """
+    Tests that GetValues pages return every value once.
+    """
+
+    def read_pages(self, dao, limit):
+        pages = []
+        continuation = None
+        while True:
+            values, continuation = paging.read_page(
+                dao, 'SITE_A', 'Temp', limit=limit,
+                continuation=continuation)
+            pages.append([value.ValueID for value in values])
+            if continuation is None:
+                return pages
+
+    def test_pages(self):
+        list_dao = ListDao([1, 2, 3, 4, 5])
+        assert self.read_pages(list_dao, 2) == [[0, 1], [2, 3], [4]]
+        assert self.read_pages(list_dao, 5) == [[0, 1, 2, 3, 4]]
+
+    def test_ties(self):
+        # Pages of values sharing one datetime skip the values already sent.
+        list_dao = ListDao([1, 2, 2, 2, 2, 2, 3])
+        assert self.read_pages(list_dao, 2) == [
+            [0, 1], [2, 3], [4, 5], [6]]
+
+    def test_token(self):
+        values, continuation = paging.read_page(ListDao([1, 2, 2]), 'SITE_A',
+                                                'Temp', limit=2)
+        assert continuation == '2007-04-02T00:00:00-06:00_1'
+        assert paging.parse_token(continuation) == (
+            datetime.datetime(2007, 4, 2, tzinfo=CST), 1)
+        for token in ('2007-04-02', '2007-04-02T00:00:00Z_x', 'x_1'):
+            with self.assertRaises(ValueError):
+                paging.parse_token(token)
+
+    def test_get_values_response(self):
+        testConfig = os.path.join(os.path.dirname(__file__), TEST_CONFIG_FILE)
+        wof_inst = WOF(TestDao(), testConfig)
+        wof_inst.max_values_per_response = 1
+        pages = []
+        continuation = None
+        for i in range(2):
+            siteCode, seriesArr, continuation = wof_inst.get_values_series(
+                'TEST:SITE_A', 'TESTVocab:Temp', continuation=continuation)
+            pages.append([value.DataValue for value in seriesArr[0][1]])
+        assert pages == [[8.4], [10.4]]
+        assert continuation is None
+
+        response = wof_inst.create_get_values_response(
+            'TEST:SITE_A', 'TESTVocab:Temp')
+        notes = dict((note.title, note.valueOf_)
+                     for note in response.queryInfo.note)
+        assert notes == {
+            'continuationToken': '2007-04-05T00:00:00-06:00_1',
+            'nextStartDate': '2007-04-05T00:00:00-06:00',
+        }
+
+        with self.assertRaises(ValueError):
+            wof_inst.create_get_values_response(
+                'TEST:SITE_A', 'TESTVocab:Temp', pageSize='0')
+
+    def read_series_pages(self, daos, limit):
+        def map_fetch(fetch, items):
+            return ((item, fetch(item)) for item in items)
+
+        def read(list_dao, limit, token):
+            return paging.read_page(list_dao, 'SITE_A', 'Temp', limit=limit,
+                                    continuation=token)
+
+        pages = []
+        continuation = None
+        while True:
+            pairs, continuation = paging.read_series_page(
+                map_fetch, read, daos, limit, continuation)
+            pages.append([(daos.index(list_dao),
+                           [value.ValueID for value in values])
+                          for list_dao, values in pairs])
+            if continuation is None:
+                return pages
+
+    def test_series_pages(self):
+        # The limit is a budget over all the series, empty series are left
+        # out.
+        daos = [ListDao([1, 2, 2]), ListDao([]), ListDao([3, 4])]
+        assert self.read_series_pages(daos, 2) == [
+            [(0, [0, 1])], [(0, [2]), (2, [0])], [(2, [1])]]
+        assert self.read_series_pages(daos, 3) == [
+            [(0, [0, 1, 2])], [(2, [0, 1])]]
+        assert self.read_series_pages(daos, None) == [
+            [(0, [0, 1, 2]), (2, [0, 1])]]
+        for token in ('2007-04-02T00:00:00-06:00_1', 'x|', '0|x_1'):
+            with self.assertRaises(ValueError):
+                paging.parse_series_token(token)
+
+    def test_get_values_site_response(self):
+        testConfig = os.path.join(os.path.dirname(__file__), TEST_CONFIG_FILE)
+        wof_inst = WOF(TestDao(), testConfig)
+        wof_inst.max_values_per_response = 1
+        pages = []
+        continuation = None
+        while True:
+            response = wof_inst.create_get_values_site_response(
+                'TEST:SITE_A', None, None, continuation=continuation)
+            notes = dict((note.title, note.valueOf_)
+                         for note in response.queryInfo.note)
+            pages.append(([timeSeries.variable.variableCode[0].valueOf_
+                           for timeSeries in response.timeSeries], notes))
+            continuation = notes.get('continuationToken')
+            if continuation is None:
+                break
+        assert pages == [
+            (['Temp'], {
+                'continuationToken': '0|2007-04-05T00:00:00-06:00_1',
+                'nextStartDate': '2007-04-05T00:00:00-06:00',
+            }),
+            (['Temp'], {'continuationToken': '1|'}),
+            (['Flow'], {}),
+        ]
+
+
+class TestSince(unittest.TestCase):
+    """
+    Tests that incremental GetValues return the values after a watermark.
+    """
+
+    def read_since(self, since, limit=None, days=(3, 1, 2)):
+        values, watermark, more = paging.read_since(
+            ListDao(days), 'SITE_A', 'Temp', since=since, limit=limit)
+        return [value.ValueID for value in values], watermark, more
+
+    def test_value_id(self):
+        # Values are selected by ValueID and returned in date time order.
+        assert self.read_since('0') == ([1, 2], '2', False)
+        assert self.read_since('0', limit=1) == ([1], '1', True)
+        assert self.read_since('1', limit=1) == ([2], '2', False)
+        assert self.read_since('2') == ([], '2', False)
+
+    def test_date_time(self):
+        assert self.read_since('2007-04-01T12:00:00-06:00') == (
+            [2, 0], '2', False)
+        # Date times without an offset are in UTC.
+        assert self.read_since('2007-04-02T06:00:00') == ([0], '0', False)
+        with self.assertRaises(ValueError):
+            self.read_since('yesterday')
+
+    def test_date_time_ties(self):
+        # Without value ids the watermark holds the number of values of its
+        # date time already sent, so a limit cutting between values of
+        # equal date times loses none of them.
+        list_dao = ListDao([1, 1, 1, 2])
+        for value in list_dao.values:
+            value.DataValue = value.ValueID
+            del value.ValueID
+        pages = []
+        since = '2007-03-31T00:00:00-06:00'
+        more = True
+        while more:
+            values, since, more = paging.read_since(
+                list_dao, 'SITE_A', 'Temp', since=since, limit=2)
+            pages.append(([value.DataValue for value in values], since))
+        assert pages == [
+            ([0, 1], '2007-04-01T00:00:00-06:00_2'),
+            ([2, 3], '2007-04-02T00:00:00-06:00_1'),
+        ]
+        values, watermark, more = paging.read_since(
+            list_dao, 'SITE_A', 'Temp', since='2007-04-01T00:00:00-06:00_1',
+            limit=1)
+        assert ([value.DataValue for value in values], watermark, more) == (
+            [1], '2007-04-01T00:00:00-06:00_2', True)
+        with self.assertRaises(ValueError):
+            self.read_since('2007-04-01T00:00:00-06:00_x')
+
+    def test_get_values_response(self):
+        testConfig = os.path.join(os.path.dirname(__file__), TEST_CONFIG_FILE)
+        wof_inst = WOF(TestDao(), testConfig)
+        siteCode, seriesArr, watermark, more = \
+            wof_inst.get_values_since_series('TEST:SITE_A', 'TESTVocab:Temp',
+                                             since='1')
+        assert [value.DataValue for value in seriesArr[0][1]] == [10.4]
+
+        response = wof_inst.create_get_values_response(
+            'TEST:SITE_A', 'TESTVocab:Temp', since='1')
+        notes = dict((note.title, note.valueOf_)
+                     for note in response.queryInfo.note)
+        assert notes == {'watermark': '2'}
+
+        response = wof_inst.create_get_values_response(
+            'TEST:SITE_A', 'TESTVocab:Temp', since='2')
+        assert len(response.timeSeries) == 1
+        assert response.queryInfo.note[0].valueOf_ == '2'
+
+        with self.assertRaises(ValueError):
+            wof_inst.create_get_values_response(
+                'TEST:SITE_A', 'TESTVocab:Temp', since='1',
+                continuation='2007-04-05T00:00:00-06:00_1')
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestPaging))
+    suite.addTest(unittest.makeSuite(TestSince))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
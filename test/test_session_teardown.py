@@ -0,0 +1,65 @@
+from __future__ import (absolute_import, division, print_function)
+
+import unittest
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from wof.dao import BaseDao
+from wof.flask import SessionTeardownMiddleware
+
+
+class SessionDao(BaseDao):
+    def __init__(self):
+        self.engine = create_engine('sqlite://')
+        self.db_session = scoped_session(sessionmaker(bind=self.engine))
+        self.closed = 0
+
+    def close_session(self):
+        self.closed += 1
+        super(SessionDao, self).close_session()
+
+
+class TestSessionTeardown(unittest.TestCase):
+    """
+    Tests that DAO sessions are removed once a response has been sent.
+    """
+
+    def test_close_session_removes_scoped_session(self):
+        dao = SessionDao()
+        session = dao.db_session()
+        dao.close_session()
+        self.assertIsNot(session, dao.db_session())
+        BaseDao().close_session()
+
+    def test_middleware_closes_after_response(self):
+        dao = SessionDao()
+
+        def app(environ, start_response):
+            start_response('200 OK', [])
+            for chunk in [b'a', b'b']:
+                self.assertEqual(0, dao.closed)
+                yield chunk
+
+        def failing_app(environ, start_response):
+            raise ValueError('failed')
+
+        body = SessionTeardownMiddleware(app, [dao])({}, lambda s, h: None)
+        self.assertEqual(b'ab', b''.join(body))
+        body.close()
+        self.assertEqual(1, dao.closed)
+
+        with self.assertRaises(ValueError):
+            SessionTeardownMiddleware(failing_app, [dao])(
+                {}, lambda s, h: None)
+        self.assertEqual(2, dao.closed)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestSessionTeardown))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
@@ -0,0 +1,95 @@
+from __future__ import (absolute_import, division, print_function)
+
+import unittest
+
+from wof import dao, models
+
+
+class TestSite(models.BaseSite):
+    def __init__(self, site_code, longitude, latitude):
+        self.SiteCode = site_code
+        self.Longitude = longitude
+        self.Latitude = latitude
+
+
+SITES = [
+    TestSite('Mendon', -111.946402, 41.718473),
+    TestSite('Logan', -111.8, 41.7),
+    TestSite('Fiji', 179.5, -17.0),
+    TestSite('Samoa', -171.75, -13.8),
+    TestSite('Nowhere', None, None),
+    TestSite('Antimeridian', -180.0, -15.0),
+]
+
+
+class CountingDao(dao.BaseDao):
+    def __init__(self):
+        self.sites = list(SITES)
+        self.calls = []
+
+    def get_all_sites(self):
+        self.calls.append('get_all_sites')
+        return list(self.sites)
+
+    def get_sites_by_box(self, west, south, east, north):
+        raise AssertionError('get_sites_by_box should use the index')
+
+
+class SpatialDao(dao.SpatialIndexMixin, CountingDao):
+    spatial_cell_size = 0.5
+
+
+class TestSpatialIndex(unittest.TestCase):
+    """
+    Tests that the spatial index answers get_sites_by_box.
+    """
+
+    def setUp(self):
+        self.dao = SpatialDao()
+        self.timer_now = 0
+        self.dao._spatial_timer = lambda: self.timer_now
+
+    def site_codes(self, west, south, east, north):
+        return [site.SiteCode for site in
+                self.dao.get_sites_by_box(west, south, east, north)]
+
+    def test_box(self):
+        self.assertEqual(['Mendon', 'Logan'],
+                         self.site_codes(-112, 41, -111, 42))
+        # Bounds are inclusive and may be given as strings.
+        self.assertEqual(['Logan'],
+                         self.site_codes('-111.8', '41.7', '-111.0', '41.7'))
+        self.assertEqual([], self.site_codes(-111, 41, -110, 42))
+        self.assertEqual(['Mendon', 'Logan', 'Fiji', 'Samoa', 'Antimeridian'],
+                         self.site_codes(-180, -90, 180, 90))
+        self.assertEqual(['get_all_sites'], self.dao.calls)
+
+    def test_antimeridian_box(self):
+        self.assertEqual(['Fiji', 'Samoa', 'Antimeridian'],
+                         self.site_codes(170, -20, -170, -10))
+        self.assertEqual(['Fiji'], self.site_codes(179, -20, -179.5, -16))
+        self.assertEqual([], self.site_codes(170, -20, -170, -30))
+
+    def test_refresh(self):
+        self.dao.spatial_refresh_interval = 60
+        self.site_codes(-112, 41, -111, 42)
+        self.dao.sites.append(TestSite('Hyrum', -111.85, 41.63))
+        self.timer_now = 30
+        self.assertEqual(['Mendon', 'Logan'],
+                         self.site_codes(-112, 41, -111, 42))
+
+        self.timer_now = 60
+        self.assertEqual(['Mendon', 'Logan', 'Hyrum'],
+                         self.site_codes(-112, 41, -111, 42))
+        self.dao.refresh_spatial_index()
+        self.assertEqual(3, self.dao.calls.count('get_all_sites'))
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestSpatialIndex))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
@@ -142,6 +142,22 @@ class TestSwisDao(unittest.TestCase):
                 self.assertEqual(site_code, series_cat.Site.SiteCode)
                 self.assertTrue(series_cat.ValueCount > 0)
 
+    def test_get_series_by_sitecodes(self):
+        site_codes = list(self.known_series)
+        seriesDict = self.dao.get_series_by_sitecodes(site_codes)
+
+        self.assertEqual(set(site_codes), set(seriesDict))
+        for site_code in site_codes:
+            expected = [
+                (s.Variable.VariableCode, s.ValueCount,
+                 s.BeginDateTimeUTC, s.EndDateTimeUTC)
+                for s in self.dao.get_series_by_sitecode(site_code)]
+            actual = [
+                (s.Variable.VariableCode, s.ValueCount,
+                 s.BeginDateTimeUTC, s.EndDateTimeUTC)
+                for s in seriesDict[site_code]]
+            self.assertEqual(expected, actual)
+
     def test_get_series_by_sitecode_and_varcode(self):
         for site_code in self.known_series:
             for var_code in self.known_series[site_code]:
@@ -164,6 +180,20 @@ class TestSwisDao(unittest.TestCase):
                 self.assertNotEqual(dv, None)
                 self.assertNotEqual(len(dv), 0)
 
+    def test_get_datavalues_iter(self):
+        for site_code in self.known_series:
+            for var_code in self.known_series[site_code]:
+                expected = [
+                    (v.ValueID, v.DataValue, v.DateTimeUTC, v.LocalDateTime,
+                     v.MethodID, v.QualityControlLevelID)
+                    for v in self.dao.get_datavalues(site_code, var_code)]
+                actual = [
+                    (v.ValueID, v.DataValue, v.DateTimeUTC, v.LocalDateTime,
+                     v.MethodID, v.QualityControlLevelID)
+                    for v in self.dao.get_datavalues_iter(site_code,
+                                                          var_code)]
+                self.assertEqual(expected, actual)
+
     def test_get_method_by_id(self):
         for method_id in self.known_method_ids:
             methodResult = self.dao.get_method_by_id(method_id)
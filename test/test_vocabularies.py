@@ -0,0 +1,62 @@
+from __future__ import (absolute_import, division, print_function)
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from wof.vocabularies import CVRegistry
+
+
+class TestCVRegistry(unittest.TestCase):
+    """
+    Tests loading and memoizing controlled vocabulary terms.
+    """
+
+    def setUp(self):
+        self.old_dir = os.path.abspath(os.path.curdir)
+        self.work_dir = tempfile.mkdtemp()
+        os.chdir(self.work_dir)
+        self.write_cvs(['Surface Water'])
+        self.registry = CVRegistry(check_interval=0)
+
+    def tearDown(self):
+        os.chdir(self.old_dir)
+        shutil.rmtree(self.work_dir)
+
+    def write_cvs(self, samplemedium, mtime=None):
+        path = os.path.join(self.work_dir, 'watermlcvs.json')
+        with open(path, 'w') as f:
+            json.dump({'cv': {'samplemedium': samplemedium}}, f)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+
+    def test_check_term(self):
+        assert self.registry.terms('samplemedium') == \
+            frozenset(['Surface Water'])
+        assert self.registry.check_term(
+            'samplemedium', 'Surface Water', 'Unknown') == 'Surface Water'
+        assert self.registry.check_term(
+            'samplemedium', 'Lava', 'Unknown') == 'Unknown'
+
+    def test_reload_on_file_change(self):
+        assert not self.registry.is_valid('samplemedium', 'Snow')
+        self.write_cvs(['Surface Water', 'Snow'], mtime=1000000000)
+        assert self.registry.is_valid('samplemedium', 'Snow')
+
+    def test_registered_vocabulary(self):
+        self.registry.register('wml10_censorcode', ['lt', 'gt'])
+        os.remove(os.path.join(self.work_dir, 'watermlcvs.json'))
+        assert self.registry.is_valid('wml10_censorcode', 'lt')
+        assert not self.registry.is_valid('wml10_censorcode', 'nc')
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestCVRegistry))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
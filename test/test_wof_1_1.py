@@ -2,13 +2,26 @@ from __future__ import (absolute_import, division, print_function)
 
 import io
 import os
+import re
 import unittest
 
+from dateutil.parser import parse
 from lxml import etree, objectify
 
-from test_dao_1_1 import TestDao
+from test_dao_1_1 import TestDao, TestDataValue
+
+from spyne.application import Application
+from spyne.model.primitive import AnyXml, Unicode
+from spyne.protocol.soap import Soap11
+from spyne.server.wsgi import WsgiApplication
+from werkzeug.test import Client
 
 from wof import WOF_1_1 as WOF
+from wof.apps.spyned_1_1 import TWOFService
+from wof.core import getSpyneApplications
+import wof.fragments
+from wof.apps.streaming import (GetValuesMultipleStreamApplication,
+                                GetValuesStreamApplication)
 import wof.vocabularies
 
 TEST_CONFIG_FILE = 'test_config.cfg'
@@ -174,6 +187,289 @@ class TestWOF(unittest.TestCase):
         # self.compare_output_to_known_xml(response_string,
         #                                  'get_values_encloses_por_1_1.xml')
 
+    def test_compact_export(self):
+        response = self.wof_inst.create_get_site_response()
+        pretty = self.response_to_StringIO(response, 'sitesResponse')
+        compact_output = io.StringIO()
+        response.export(compact_output, 0, name_='sitesResponse',
+                        namespacedef_=NSDEF, pretty_print=False)
+        compact = compact_output.getvalue()
+
+        assert '\n' not in compact
+        parser = etree.XMLParser(remove_blank_text=True)
+        assert etree.tostring(etree.fromstring(compact, parser)) == \
+            etree.tostring(etree.fromstring(pretty, parser))
+
+    def test_get_values_stream_matches_export(self):
+        args = ('TEST:SITE_A', 'TESTVocab:Temp',
+                '2007-03-05 00:00', '2007-05-06 00:00')
+        response = self.wof_inst.create_get_values_response(*args)
+        response_output = io.StringIO()
+        response.export(response_output, 0, name_='timeSeriesResponse',
+                        namespacedef_=wof.core_1_1.NSDEF)
+        chunks = list(self.wof_inst.create_get_values_stream(
+            *args, chunk_size=100))
+
+        assert len(chunks) > 1
+        creation_time = re.compile('<creationTime>.*</creationTime>')
+        assert creation_time.sub('', ''.join(chunks)) == \
+            creation_time.sub('', response_output.getvalue())
+
+    def test_fragment_cache_output_matches(self):
+        creation_time = re.compile('<creationTime>.*</creationTime>')
+        requests = [
+            ('create_get_site_response', (), 'sitesResponse'),
+            ('create_get_site_info_response', ('TEST:SITE_A',),
+             'sitesResponse'),
+            ('create_get_variable_info_response', (), 'variablesResponse'),
+            ('create_get_values_response',
+             ('TEST:SITE_A', 'TESTVocab:Temp'), 'timeSeriesResponse'),
+        ]
+
+        def export_all():
+            return [creation_time.sub('', self.response_to_StringIO(
+                getattr(self.wof_inst, method)(*args), root_name))
+                for method, args, root_name in requests]
+
+        expected = export_all()
+        self.wof_inst.fragment_cache = wof.fragments.FragmentCache()
+        assert export_all() == expected
+        assert export_all() == expected
+        assert self.wof_inst.fragment_cache.hits > 0
+
+    def test_fragment_cache_ttl(self):
+        now = [0]
+        cache = wof.fragments.FragmentCache(ttl=60, timer=lambda: now[0])
+        cache.set('key', '<method/>')
+        now[0] = 59
+        assert cache.get('key') == '<method/>'
+        # Without a metadata_generation, fragments expire with the TTL.
+        now[0] = 60
+        assert cache.get('key') is None
+        assert self.wof_inst._config.get_fragment_cache_ttl() == \
+            self.wof_inst._config.cache_ttl
+
+    def test_value_elements_match_export(self):
+        valueResultArr = self.wof_inst.dao.get_datavalues(
+            'SITE_A', 'Temp')
+        valueResultArr.append(TestDataValue(
+            DataValue=-1, ValueAccuracy=0.25,
+            LocalDateTime=parse('2007-04-08T00:00:00.5+05:30'),
+            UTCOffset='+05:30', DateTimeUTC=parse('2007-04-07T18:30:00.5'),
+            OffsetValue=None, OffsetTypeID=None, CensorCode='lt',
+            QualifierID='a&"b\'', MethodID=None, SourceID=1, SampleID=7,
+            QualityControlLevelID='1'))
+
+        for pretty_print in (True, False):
+            expected = io.StringIO()
+            for valueResult in valueResultArr:
+                self.wof_inst.create_value_element(valueResult).export(
+                    expected, 3, name_='value', pretty_print=pretty_print)
+            valueElements = self.wof_inst.create_value_elements()
+            for valueResult in valueResultArr:
+                valueElements.add(valueResult)
+            actual = io.StringIO()
+            valueElements.export(actual, 3, pretty_print=pretty_print)
+            assert actual.getvalue() == expected.getvalue()
+
+    def test_get_values_site_parallel_fetch(self):
+        creation_time = re.compile('<creationTime>.*</creationTime>')
+        args = ('TEST:SITE_A', '2007-03-05 00:00', '2007-05-06 00:00')
+
+        def export():
+            return creation_time.sub('', self.response_to_StringIO(
+                self.wof_inst.create_get_values_site_response(*args),
+                'timeSeriesResponse'))
+
+        expected = export()
+        assert expected.count('<timeSeries>') > 1
+
+        self.wof_inst.fetch_workers = 4
+        self.addCleanup(lambda: self.wof_inst.get_fetch_pool().terminate())
+        assert export() == expected
+
+    def test_get_values_multiple(self):
+        creation_time = re.compile('<creationTime>.*</creationTime>')
+        args = ('TEST:SITE_A,TEST:SITE_B', 'TESTVocab:Temp,TESTVocab:Flow',
+                '2007-03-05 00:00', '2007-05-06 00:00')
+
+        def export():
+            return creation_time.sub('', self.response_to_StringIO(
+                self.wof_inst.create_get_values_multiple_response(*args),
+                'timeSeriesResponse'))
+
+        expected = export()
+        tree = etree.fromstring(expected.encode('utf-8'))
+        ns = {'wml': 'http://www.cuahsi.org/waterML/1.1/'}
+        assert tree.xpath('//wml:criteria/@MethodCalled', namespaces=ns) == \
+            ['GetValuesMultiple']
+        # SITE_B has no values, it has no timeSeries.
+        assert [(s.text, v.text) for s, v in zip(
+            tree.xpath('//wml:sourceInfo/wml:siteCode', namespaces=ns),
+            tree.xpath('//wml:variable/wml:variableCode', namespaces=ns))] \
+            == [('SITE_A', 'Temp'), ('SITE_A', 'Flow')]
+
+        self.wof_inst.fetch_workers = 4
+        self.addCleanup(lambda: self.wof_inst.get_fetch_pool().terminate())
+        assert export() == expected
+
+        stream = ''.join(self.wof_inst.create_get_values_multiple_stream(
+            *args, chunk_size=100))
+        # Only the namespace declarations of the root tag differ.
+        assert creation_time.sub('', stream).partition('\n')[2] == \
+            expected.partition('\n')[2]
+
+        app = GetValuesMultipleStreamApplication(self.wof_inst)
+        statuses = []
+        environ = {'QUERY_STRING': 'site=TEST:SITE_A&site=TEST:SITE_B&variable=TESTVocab:Temp,TESTVocab:Flow'}  # noqa
+        body = b''.join(app(environ, lambda s, h: statuses.append(s)))
+        assert statuses == ['200 OK']
+        assert body.count(b'<timeSeries>') == 2
+
+        app({'QUERY_STRING': 'site=TEST:SITE_A'},
+            lambda s, h: statuses.append(s))
+        assert statuses[-1].startswith('400')
+
+    def test_get_values_multiple_limits(self):
+        args = ('TEST:SITE_A,TEST:SITE_B', 'TESTVocab:Temp,TESTVocab:Flow')
+        ns = {'wml': 'http://www.cuahsi.org/waterML/1.1/'}
+
+        def read_pages(create):
+            pages = []
+            continuation = None
+            while True:
+                tree = etree.fromstring(create(continuation).encode('utf-8'))
+                pages.append(tree.xpath('//wml:value/text()', namespaces=ns))
+                continuation = (tree.xpath(
+                    '//wml:queryInfo/wml:note'
+                    '[@title="continuationToken"]/text()',
+                    namespaces=ns) or [None])[0]
+                if continuation is None:
+                    return pages
+
+        def create_response(continuation):
+            return self.response_to_StringIO(
+                self.wof_inst.create_get_values_multiple_response(
+                    *args, continuation=continuation),
+                'timeSeriesResponse')
+
+        def create_stream(continuation):
+            return ''.join(self.wof_inst.create_get_values_multiple_stream(
+                *args, continuation=continuation))
+
+        # The values of all the pairs share one budget.
+        self.wof_inst.max_values_per_response = 2
+        expected = [['8.4', '10.4'], ['110.2']]
+        assert read_pages(create_response) == expected
+        assert read_pages(create_stream) == expected
+
+        self.wof_inst.max_multiple_pairs = 3
+        with self.assertRaises(ValueError):
+            self.wof_inst.create_get_values_multiple_response(*args)
+        app = GetValuesMultipleStreamApplication(self.wof_inst)
+        statuses = []
+        app({'QUERY_STRING': 'site=TEST:SITE_A,TEST:SITE_B&variable=TESTVocab:Temp,TESTVocab:Flow'},  # noqa
+            lambda s, h: statuses.append(s))
+        assert statuses[-1].startswith('400')
+
+    def test_map_fetch_backpressure(self):
+        fetched = []
+
+        def fetch(item):
+            fetched.append(item)
+            return [item]
+
+        self.wof_inst.fetch_workers = 2
+        pairs = self.wof_inst.map_fetch(fetch, list(range(10)))
+        assert next(pairs) == (0, [0])
+        pairs.close()
+        pool = self.wof_inst.get_fetch_pool()
+        pool.close()
+        pool.join()
+        # Two items in flight, and one submitted when the first was taken.
+        assert sorted(fetched) == [0, 1, 2]
+
+    def test_get_values_stream_application(self):
+        app = GetValuesStreamApplication(self.wof_inst, chunk_size=100)
+        statuses = []
+        environ = {'QUERY_STRING': 'location=TEST:SITE_A&variable=TESTVocab:Temp'}  # noqa
+
+        body = b''.join(app(environ, lambda s, h: statuses.append(s)))
+        assert statuses == ['200 OK']
+        assert etree.fromstring(body).tag == \
+            '{http://www.cuahsi.org/waterML/1.1/}timeSeriesResponse'
+
+        body = b''.join(app({'QUERY_STRING': 'location=TEST:NOPE&variable=TESTVocab:Temp'},  # noqa
+                            lambda s, h: statuses.append(s)))
+        assert statuses[-1].startswith('500')
+        assert b'faultstring' in body
+
+        # Invalid arguments are Client faults.
+        for query in ('continuation=garbage', 'interval=3%20fortnights',
+                      'interval=1d&statistic=median'):
+            body = b''.join(app(
+                {'QUERY_STRING': 'location=TEST:SITE_A&variable=TESTVocab:Temp&' + query},  # noqa
+                lambda s, h: statuses.append(s)))
+            assert statuses[-1].startswith('400')
+            assert b'soap11env:Client' in body
+
+    def test_rest_response_is_not_reserialized(self):
+        rest_app = getSpyneApplications(self.wof_inst, self.wof_inst)[
+            '/testurl/rest/1_1']
+        response = Client(rest_app).get(
+            '/GetSiteInfoObject?site=TEST:SITE_A')
+
+        assert response.status_code == 200
+        body = response.data.decode('utf-8')
+        assert body.startswith("<?xml version='1.0' encoding='UTF-8'?>\n"
+                               '<sitesResponse xmlns="http://www.cuahsi.org/waterML/1.1/">')  # noqa
+        self.waterml_schema.assertValid(etree.fromstring(response.data))
+
+    def test_soap_values_result_unwrapped(self):
+        soap_app = Application(
+            [TWOFService(self.wof_inst, Unicode, 'soap')],
+            tns='http://www.cuahsi.org/his/1.1/ws/',
+            in_protocol=Soap11(),
+            out_protocol=Soap11()
+        )
+        request = (
+            '<soapenv:Envelope '
+            'xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/" '
+            'xmlns:ns="http://www.cuahsi.org/his/1.1/ws/"><soapenv:Body>'
+            '<ns:GetValuesObject><ns:location>TEST:SITE_A</ns:location>'
+            '<ns:variable>TESTVocab:Temp</ns:variable></ns:GetValuesObject>'
+            '</soapenv:Body></soapenv:Envelope>'
+        )
+        response = Client(WsgiApplication(soap_app)).post(
+            '/', data=request, content_type='text/xml; charset=utf-8')
+
+        body = etree.fromstring(response.data)[0]
+        assert [child.tag for child in body] == \
+            ['{http://www.cuahsi.org/waterML/1.1/}TimeSeriesResponse']
+        assert body[0][0].tag == \
+            '{http://www.cuahsi.org/waterML/1.1/}timeSeriesResponse'
+
+    def test_soap_values_signatures_unchanged(self):
+        tns = 'http://www.cuahsi.org/his/1.1/ws/'
+
+        def parameters(T, T_name, method):
+            app = Application([TWOFService(self.wof_inst, T, T_name)],
+                              tns=tns, in_protocol=Soap11(),
+                              out_protocol=Soap11())
+            descriptor = app.interface.service_method_map[
+                '{%s}%s' % (tns, method)][0]
+            return list(descriptor.in_message._type_info.keys())
+
+        standard = ['location', 'variable', 'startDate', 'endDate',
+                    'authToken']
+        for method in ('GetValues', 'GetValuesObject'):
+            assert parameters(Unicode, 'soap', method) == standard
+            assert parameters(AnyXml, 'rest', method) == standard + [
+                'pageSize', 'continuation', 'since', 'interval',
+                'statistic']
+        assert parameters(Unicode, 'soap', 'GetValuesForASiteObject') == \
+            ['site', 'startDate', 'endDate', 'authToken']
+
 
 def suite():
     suite = unittest.TestSuite()
@@ -82,9 +82,10 @@ STRING_CLEANUP_PAT = re_.compile(r"[\n\r\s]+")
 # Support/utility functions.
 #
 
-def showIndent(outfile, level):
-    for idx in range(level):
-        outfile.write(u'    ')
+def showIndent(outfile, level, pretty_print=True):
+    if pretty_print:
+        for idx in range(level):
+            outfile.write(u'    ')
 
 def quote_xml(inStr):
     if not inStr:
@@ -177,7 +178,11 @@ class MixedContainer:
         return self.value
     def getName(self):
         return self.name
-    def export(self, outfile, level, name, namespace):
+    def export(self, outfile, level, name, namespace, pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.category == MixedContainer.CategoryText:
             # Prevent exporting empty content as empty lines.
             if self.value.strip():
@@ -185,7 +190,7 @@ class MixedContainer:
         elif self.category == MixedContainer.CategorySimple:
             self.exportSimple(outfile, level, name)
         else:    # category == MixedContainer.CategoryComplex
-            self.value.export(outfile, level, namespace,name)
+            self.value.export(outfile, level, namespace,name, pretty_print=pretty_print)
     def exportSimple(self, outfile, level, name):
         if self.content_type == MixedContainer.TypeString:
             outfile.write(u'<%s>%s</%s>' % (self.name, self.value, self.name))
@@ -294,17 +299,21 @@ class siteCode(GeneratedsSuper):
     def set_agencyName(self, agencyName): self.agencyName = agencyName
     def get_valueOf_(self): return self.valueOf_
     def set_valueOf_(self, valueOf_): self.valueOf_ = valueOf_
-    def export(self, outfile, level, namespace_='', name_='siteCode', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='siteCode', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='siteCode')
         if self.hasContent_():
             outfile.write(u'>')
             outfile.write(u'%s' % self.valueOf_)
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='siteCode'):
         if self.agencyCode is not None and 'agencyCode' not in already_processed:
             already_processed.append('agencyCode')
@@ -319,7 +328,11 @@ class siteCode(GeneratedsSuper):
         if self.agencyName is not None and 'agencyName' not in already_processed:
             already_processed.append('agencyName')
             outfile.write(u' agencyName=%s' % (self.gds_format_string(quote_attrib(self.agencyName), input_name='agencyName'), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='siteCode'):
+    def exportChildren(self, outfile, level, namespace_='', name_='siteCode', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         pass
     def hasContent_(self):
         if (
@@ -425,24 +438,32 @@ class geoLocation(GeneratedsSuper):
     def set_localSiteXY(self, localSiteXY): self.localSiteXY = localSiteXY
     def add_localSiteXY(self, value): self.localSiteXY.append(value)
     def insert_localSiteXY(self, index, value): self.localSiteXY[index] = value
-    def export(self, outfile, level, namespace_='', name_='geoLocation', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='geoLocation', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='geoLocation')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='geoLocation'):
         pass
-    def exportChildren(self, outfile, level, namespace_='', name_='geoLocation'):
+    def exportChildren(self, outfile, level, namespace_='', name_='geoLocation', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.geogLocation:
-            self.geogLocation.export(outfile, level, namespace_, name_='geogLocation', )
+            self.geogLocation.export(outfile, level, namespace_, name_='geogLocation', pretty_print=pretty_print)
         for localSiteXY_ in self.localSiteXY:
-            localSiteXY_.export(outfile, level, namespace_, name_='localSiteXY')
+            localSiteXY_.export(outfile, level, namespace_, name_='localSiteXY', pretty_print=pretty_print)
     def hasContent_(self):
         if (
             self.geogLocation is not None or
@@ -531,33 +552,41 @@ class localSiteXY(GeneratedsSuper):
     def insert_note(self, index, value): self.note[index] = value
     def get_projectionInformation(self): return self.projectionInformation
     def set_projectionInformation(self, projectionInformation): self.projectionInformation = projectionInformation
-    def export(self, outfile, level, namespace_='', name_='localSiteXY', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='localSiteXY', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='localSiteXY')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='localSiteXY'):
         if self.projectionInformation is not None and 'projectionInformation' not in already_processed:
             already_processed.append('projectionInformation')
             outfile.write(u' projectionInformation=%s' % (self.gds_format_string(quote_attrib(self.projectionInformation), input_name='projectionInformation'), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='localSiteXY'):
+    def exportChildren(self, outfile, level, namespace_='', name_='localSiteXY', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.X is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sX>%s</%sX>\n' % (namespace_, self.gds_format_string(quote_xml(self.X), input_name='X'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sX>%s</%sX>%s' % (namespace_, self.gds_format_string(quote_xml(self.X), input_name='X'), namespace_, eol_))
         if self.Y is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sY>%s</%sY>\n' % (namespace_, self.gds_format_string(quote_xml(self.Y), input_name='Y'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sY>%s</%sY>%s' % (namespace_, self.gds_format_string(quote_xml(self.Y), input_name='Y'), namespace_, eol_))
         if self.Z is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sZ>%s</%sZ>\n' % (namespace_, self.gds_format_string(quote_xml(self.Z), input_name='Z'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sZ>%s</%sZ>%s' % (namespace_, self.gds_format_string(quote_xml(self.Z), input_name='Z'), namespace_, eol_))
         for note_ in self.note:
-            note_.export(outfile, level, namespace_, name_='note')
+            note_.export(outfile, level, namespace_, name_='note', pretty_print=pretty_print)
     def hasContent_(self):
         if (
             self.X is not None or
@@ -717,17 +746,21 @@ class TsValuesSingleVariableType(GeneratedsSuper):
     def set_unitsAreConverted(self, unitsAreConverted): self.unitsAreConverted = unitsAreConverted
     def get_unitsCode(self): return self.unitsCode
     def set_unitsCode(self, unitsCode): self.unitsCode = unitsCode
-    def export(self, outfile, level, namespace_='', name_='TsValuesSingleVariableType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='TsValuesSingleVariableType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='TsValuesSingleVariableType')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='TsValuesSingleVariableType'):
         if self.count is not None and 'count' not in already_processed:
             already_processed.append('count')
@@ -747,19 +780,23 @@ class TsValuesSingleVariableType(GeneratedsSuper):
         if self.unitsCode is not None and 'unitsCode' not in already_processed:
             already_processed.append('unitsCode')
             outfile.write(u' unitsCode=%s' % (self.gds_format_string(quote_attrib(self.unitsCode), input_name='unitsCode'), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='TsValuesSingleVariableType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='TsValuesSingleVariableType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         for value_ in self.value:
-            value_.export(outfile, level, namespace_, name_='value')
+            value_.export(outfile, level, namespace_, name_='value', pretty_print=pretty_print)
         for qualifier_ in self.qualifier:
-            qualifier_.export(outfile, level, namespace_, name_='qualifier')
+            qualifier_.export(outfile, level, namespace_, name_='qualifier', pretty_print=pretty_print)
         for qualityControlLevel_ in self.qualityControlLevel:
-            qualityControlLevel_.export(outfile, level, namespace_, name_='qualityControlLevel')
+            qualityControlLevel_.export(outfile, level, namespace_, name_='qualityControlLevel', pretty_print=pretty_print)
         for method_ in self.method:
-            method_.export(outfile, level, namespace_, name_='method')
+            method_.export(outfile, level, namespace_, name_='method', pretty_print=pretty_print)
         for source_ in self.source:
-            source_.export(outfile, level, namespace_, name_='source')
+            source_.export(outfile, level, namespace_, name_='source', pretty_print=pretty_print)
         for offset_ in self.offset:
-            offset_.export(outfile, level, namespace_, name_='offset')
+            offset_.export(outfile, level, namespace_, name_='offset', pretty_print=pretty_print)
     def hasContent_(self):
         if (
             self.value or
@@ -1038,17 +1075,21 @@ class VariableInfoType(GeneratedsSuper):
     def set_metadataDateTime(self, metadataDateTime): self.metadataDateTime = metadataDateTime
     def get_oid(self): return self.oid
     def set_oid(self, oid): self.oid = oid
-    def export(self, outfile, level, namespace_='', name_='VariableInfoType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='VariableInfoType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='VariableInfoType')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='VariableInfoType'):
         if self.metadataDateTime is not None and 'metadataDateTime' not in already_processed:
             already_processed.append('metadataDateTime')
@@ -1056,43 +1097,47 @@ class VariableInfoType(GeneratedsSuper):
         if self.oid is not None and 'oid' not in already_processed:
             already_processed.append('oid')
             outfile.write(u' oid=%s' % (self.gds_format_string(quote_attrib(self.oid), input_name='oid'), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='VariableInfoType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='VariableInfoType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         for variableCode_ in self.variableCode:
-            variableCode_.export(outfile, level, namespace_, name_='variableCode')
+            variableCode_.export(outfile, level, namespace_, name_='variableCode', pretty_print=pretty_print)
         if self.variableName is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%svariableName>%s</%svariableName>\n' % (namespace_, self.gds_format_string(quote_xml(self.variableName), input_name='variableName'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%svariableName>%s</%svariableName>%s' % (namespace_, self.gds_format_string(quote_xml(self.variableName), input_name='variableName'), namespace_, eol_))
         if self.variableDescription is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%svariableDescription>%s</%svariableDescription>\n' % (namespace_, self.gds_format_string(quote_xml(self.variableDescription), input_name='variableDescription'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%svariableDescription>%s</%svariableDescription>%s' % (namespace_, self.gds_format_string(quote_xml(self.variableDescription), input_name='variableDescription'), namespace_, eol_))
         if self.valueType is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%svalueType>%s</%svalueType>\n' % (namespace_, self.gds_format_string(quote_xml(self.valueType), input_name='valueType'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%svalueType>%s</%svalueType>%s' % (namespace_, self.gds_format_string(quote_xml(self.valueType), input_name='valueType'), namespace_, eol_))
         if self.dataType is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sdataType>%s</%sdataType>\n' % (namespace_, self.gds_format_string(quote_xml(self.dataType), input_name='dataType'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sdataType>%s</%sdataType>%s' % (namespace_, self.gds_format_string(quote_xml(self.dataType), input_name='dataType'), namespace_, eol_))
         if self.generalCategory is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sgeneralCategory>%s</%sgeneralCategory>\n' % (namespace_, self.gds_format_string(quote_xml(self.generalCategory), input_name='generalCategory'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sgeneralCategory>%s</%sgeneralCategory>%s' % (namespace_, self.gds_format_string(quote_xml(self.generalCategory), input_name='generalCategory'), namespace_, eol_))
         if self.sampleMedium is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%ssampleMedium>%s</%ssampleMedium>\n' % (namespace_, self.gds_format_string(quote_xml(self.sampleMedium), input_name='sampleMedium'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%ssampleMedium>%s</%ssampleMedium>%s' % (namespace_, self.gds_format_string(quote_xml(self.sampleMedium), input_name='sampleMedium'), namespace_, eol_))
         if self.units:
-            self.units.export(outfile, level, namespace_, name_='units')
+            self.units.export(outfile, level, namespace_, name_='units', pretty_print=pretty_print)
         if self.options:
-            self.options.export(outfile, level, namespace_, name_='options')
+            self.options.export(outfile, level, namespace_, name_='options', pretty_print=pretty_print)
         for note_ in self.note:
-            note_.export(outfile, level, namespace_, name_='note')
+            note_.export(outfile, level, namespace_, name_='note', pretty_print=pretty_print)
         if self.related:
-            self.related.export(outfile, level, namespace_, name_='related')
+            self.related.export(outfile, level, namespace_, name_='related', pretty_print=pretty_print)
         if self.extension is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sextension>%s</%sextension>\n' % (namespace_, self.gds_format_string(quote_xml(self.extension), input_name='extension'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sextension>%s</%sextension>%s' % (namespace_, self.gds_format_string(quote_xml(self.extension), input_name='extension'), namespace_, eol_))
         if self.NoDataValue is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sNoDataValue>%s</%sNoDataValue>\n' % (namespace_, self.gds_format_string(quote_xml(self.NoDataValue), input_name='NoDataValue'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sNoDataValue>%s</%sNoDataValue>%s' % (namespace_, self.gds_format_string(quote_xml(self.NoDataValue), input_name='NoDataValue'), namespace_, eol_))
         if self.timeSupport:
-            self.timeSupport.export(outfile, level, namespace_, name_='timeSupport')
+            self.timeSupport.export(outfile, level, namespace_, name_='timeSupport', pretty_print=pretty_print)
     def hasContent_(self):
         if (
             self.variableCode or
@@ -1287,26 +1332,34 @@ class related(GeneratedsSuper):
     def set_parentID(self, parentID): self.parentID = parentID
     def get_relatedID(self): return self.relatedID
     def set_relatedID(self, relatedID): self.relatedID = relatedID
-    def export(self, outfile, level, namespace_='', name_='related', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='related', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='related')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='related'):
         pass
-    def exportChildren(self, outfile, level, namespace_='', name_='related'):
+    def exportChildren(self, outfile, level, namespace_='', name_='related', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.parentID is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sparentID>%s</%sparentID>\n' % (namespace_, self.gds_format_string(quote_xml(self.parentID), input_name='parentID'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sparentID>%s</%sparentID>%s' % (namespace_, self.gds_format_string(quote_xml(self.parentID), input_name='parentID'), namespace_, eol_))
         if self.relatedID is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%srelatedID>%s</%srelatedID>\n' % (namespace_, self.gds_format_string(quote_xml(self.relatedID), input_name='relatedID'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%srelatedID>%s</%srelatedID>%s' % (namespace_, self.gds_format_string(quote_xml(self.relatedID), input_name='relatedID'), namespace_, eol_))
     def hasContent_(self):
         if (
             self.parentID is not None or
@@ -1371,17 +1424,21 @@ class parentID(GeneratedsSuper):
     def set_vocabulary(self, vocabulary): self.vocabulary = vocabulary
     def get_valueOf_(self): return self.valueOf_
     def set_valueOf_(self, valueOf_): self.valueOf_ = valueOf_
-    def export(self, outfile, level, namespace_='', name_='parentID', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='parentID', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='parentID')
         if self.hasContent_():
             outfile.write(u'>')
             outfile.write(u'%s' % self.valueOf_)
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='parentID'):
         if self.default is not None and 'default' not in already_processed:
             already_processed.append('default')
@@ -1392,7 +1449,11 @@ class parentID(GeneratedsSuper):
         if self.vocabulary is not None and 'vocabulary' not in already_processed:
             already_processed.append('vocabulary')
             outfile.write(u' vocabulary=%s' % (self.gds_format_string(quote_attrib(self.vocabulary), input_name='vocabulary'), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='parentID'):
+    def exportChildren(self, outfile, level, namespace_='', name_='parentID', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         pass
     def hasContent_(self):
         if (
@@ -1476,17 +1537,21 @@ class relatedID(GeneratedsSuper):
     def set_vocabulary(self, vocabulary): self.vocabulary = vocabulary
     def get_valueOf_(self): return self.valueOf_
     def set_valueOf_(self, valueOf_): self.valueOf_ = valueOf_
-    def export(self, outfile, level, namespace_='', name_='relatedID', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='relatedID', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='relatedID')
         if self.hasContent_():
             outfile.write(u'>')
             outfile.write(u'%s' % self.valueOf_)
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='relatedID'):
         if self.default is not None and 'default' not in already_processed:
             already_processed.append('default')
@@ -1497,7 +1562,11 @@ class relatedID(GeneratedsSuper):
         if self.vocabulary is not None and 'vocabulary' not in already_processed:
             already_processed.append('vocabulary')
             outfile.write(u' vocabulary=%s' % (self.gds_format_string(quote_attrib(self.vocabulary), input_name='vocabulary'), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='relatedID'):
+    def exportChildren(self, outfile, level, namespace_='', name_='relatedID', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         pass
     def hasContent_(self):
         if (
@@ -1593,28 +1662,36 @@ class timeSupport(GeneratedsSuper):
     def set_timeInterval(self, timeInterval): self.timeInterval = timeInterval
     def get_isRegular(self): return self.isRegular
     def set_isRegular(self, isRegular): self.isRegular = isRegular
-    def export(self, outfile, level, namespace_='', name_='timeSupport', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='timeSupport', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='timeSupport')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='timeSupport'):
         if self.isRegular is not None and 'isRegular' not in already_processed:
             already_processed.append('isRegular')
             outfile.write(u' isRegular="%s"' % self.gds_format_boolean(self.gds_str_lower(str(self.isRegular)), input_name='isRegular'))
-    def exportChildren(self, outfile, level, namespace_='', name_='timeSupport'):
+    def exportChildren(self, outfile, level, namespace_='', name_='timeSupport', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.unit:
-            self.unit.export(outfile, level, namespace_, name_='unit')
+            self.unit.export(outfile, level, namespace_, name_='unit', pretty_print=pretty_print)
         #TODO: Why is an empty element being exported when in ODM the value for time support is 0?
         if self.timeInterval is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%stimeInterval>%s</%stimeInterval>\n' % (namespace_, self.gds_format_string(quote_xml(self.timeInterval), input_name='timeInterval'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%stimeInterval>%s</%stimeInterval>%s' % (namespace_, self.gds_format_string(quote_xml(self.timeInterval), input_name='timeInterval'), namespace_, eol_))
     def hasContent_(self):
         if (
             self.unit is not None or
@@ -1705,36 +1782,44 @@ class QueryInfoType(GeneratedsSuper):
     def insert_note(self, index, value): self.note[index] = value
     def get_extension(self): return self.extension
     def set_extension(self, extension): self.extension = extension
-    def export(self, outfile, level, namespace_='', name_='QueryInfoType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='QueryInfoType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='QueryInfoType')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='QueryInfoType'):
         pass
-    def exportChildren(self, outfile, level, namespace_='', name_='QueryInfoType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='QueryInfoType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.creationTime is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%screationTime>%s</%screationTime>\n' % (namespace_, self.gds_format_string(quote_xml(self.creationTime), input_name='creationTime'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%screationTime>%s</%screationTime>%s' % (namespace_, self.gds_format_string(quote_xml(self.creationTime), input_name='creationTime'), namespace_, eol_))
         if self.queryURL is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%squeryURL>%s</%squeryURL>\n' % (namespace_, self.gds_format_string(quote_xml(self.queryURL), input_name='queryURL'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%squeryURL>%s</%squeryURL>%s' % (namespace_, self.gds_format_string(quote_xml(self.queryURL), input_name='queryURL'), namespace_, eol_))
         if self.querySQL is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%squerySQL>%s</%squerySQL>\n' % (namespace_, self.gds_format_string(quote_xml(self.querySQL), input_name='querySQL'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%squerySQL>%s</%squerySQL>%s' % (namespace_, self.gds_format_string(quote_xml(self.querySQL), input_name='querySQL'), namespace_, eol_))
         if self.criteria:
-            self.criteria.export(outfile, level, namespace_, name_='criteria')
+            self.criteria.export(outfile, level, namespace_, name_='criteria', pretty_print=pretty_print)
         for note_ in self.note:
-            note_.export(outfile, level, namespace_, name_='note')
+            note_.export(outfile, level, namespace_, name_='note', pretty_print=pretty_print)
         if self.extension is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sextension>%s</%sextension>\n' % (namespace_, self.gds_format_string(quote_xml(self.extension), input_name='extension'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sextension>%s</%sextension>%s' % (namespace_, self.gds_format_string(quote_xml(self.extension), input_name='extension'), namespace_, eol_))
     def hasContent_(self):
         if (
             self.creationTime is not None or
@@ -1838,28 +1923,36 @@ class criteria(GeneratedsSuper):
     def set_variableParam(self, variableParam): self.variableParam = variableParam
     def get_timeParam(self): return self.timeParam
     def set_timeParam(self, timeParam): self.timeParam = timeParam
-    def export(self, outfile, level, namespace_='', name_='criteria', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='criteria', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='criteria')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='criteria'):
         pass
-    def exportChildren(self, outfile, level, namespace_='', name_='criteria'):
+    def exportChildren(self, outfile, level, namespace_='', name_='criteria', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.locationParam is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%slocationParam>%s</%slocationParam>\n' % (namespace_, self.gds_format_string(quote_xml(self.locationParam), input_name='locationParam'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%slocationParam>%s</%slocationParam>%s' % (namespace_, self.gds_format_string(quote_xml(self.locationParam), input_name='locationParam'), namespace_, eol_))
         if self.variableParam is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%svariableParam>%s</%svariableParam>\n' % (namespace_, self.gds_format_string(quote_xml(self.variableParam), input_name='variableParam'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%svariableParam>%s</%svariableParam>%s' % (namespace_, self.gds_format_string(quote_xml(self.variableParam), input_name='variableParam'), namespace_, eol_))
         if self.timeParam:
-            self.timeParam.export(outfile, level, namespace_, name_='timeParam')
+            self.timeParam.export(outfile, level, namespace_, name_='timeParam', pretty_print=pretty_print)
     def hasContent_(self):
         if (
             self.locationParam is not None or
@@ -1928,26 +2021,34 @@ class timeParam(GeneratedsSuper):
     def set_beginDateTime(self, beginDateTime): self.beginDateTime = beginDateTime
     def get_endDateTime(self): return self.endDateTime
     def set_endDateTime(self, endDateTime): self.endDateTime = endDateTime
-    def export(self, outfile, level, namespace_='', name_='timeParam', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='timeParam', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='timeParam')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='timeParam'):
         pass
-    def exportChildren(self, outfile, level, namespace_='', name_='timeParam'):
+    def exportChildren(self, outfile, level, namespace_='', name_='timeParam', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.beginDateTime is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sbeginDateTime>%s</%sbeginDateTime>\n' % (namespace_, self.gds_format_string(quote_xml(self.beginDateTime), input_name='beginDateTime'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sbeginDateTime>%s</%sbeginDateTime>%s' % (namespace_, self.gds_format_string(quote_xml(self.beginDateTime), input_name='beginDateTime'), namespace_, eol_))
         if self.endDateTime is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sendDateTime>%s</%sendDateTime>\n' % (namespace_, self.gds_format_string(quote_xml(self.endDateTime), input_name='endDateTime'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sendDateTime>%s</%sendDateTime>%s' % (namespace_, self.gds_format_string(quote_xml(self.endDateTime), input_name='endDateTime'), namespace_, eol_))
     def hasContent_(self):
         if (
             self.beginDateTime is not None or
@@ -2006,22 +2107,30 @@ class variables(GeneratedsSuper):
     def set_variable(self, variable): self.variable = variable
     def add_variable(self, value): self.variable.append(value)
     def insert_variable(self, index, value): self.variable[index] = value
-    def export(self, outfile, level, namespace_='', name_='variables', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='variables', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='variables')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='variables'):
         pass
-    def exportChildren(self, outfile, level, namespace_='', name_='variables'):
+    def exportChildren(self, outfile, level, namespace_='', name_='variables', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         for variable_ in self.variable:
-            variable_.export(outfile, level, namespace_, name_='variable')
+            variable_.export(outfile, level, namespace_, name_='variable', pretty_print=pretty_print)
     def hasContent_(self):
         if (
             self.variable
@@ -2087,26 +2196,34 @@ class timeZoneInfo(GeneratedsSuper):
     def set_daylightSavingsTimeZone(self, daylightSavingsTimeZone): self.daylightSavingsTimeZone = daylightSavingsTimeZone
     def get_siteUsesDaylightSavingsTime(self): return self.siteUsesDaylightSavingsTime
     def set_siteUsesDaylightSavingsTime(self, siteUsesDaylightSavingsTime): self.siteUsesDaylightSavingsTime = siteUsesDaylightSavingsTime
-    def export(self, outfile, level, namespace_='', name_='timeZoneInfo', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='timeZoneInfo', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='timeZoneInfo')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='timeZoneInfo'):
         if self.siteUsesDaylightSavingsTime is not None and 'siteUsesDaylightSavingsTime' not in already_processed:
             already_processed.append('siteUsesDaylightSavingsTime')
             outfile.write(u' siteUsesDaylightSavingsTime="%s"' % self.gds_format_boolean(self.gds_str_lower(str(self.siteUsesDaylightSavingsTime)), input_name='siteUsesDaylightSavingsTime'))
-    def exportChildren(self, outfile, level, namespace_='', name_='timeZoneInfo'):
+    def exportChildren(self, outfile, level, namespace_='', name_='timeZoneInfo', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.defaultTimeZone is not None:
-            self.defaultTimeZone.export(outfile, level, namespace_, 'defaultTimeZone')
+            self.defaultTimeZone.export(outfile, level, namespace_, 'defaultTimeZone', pretty_print=pretty_print)
         if self.daylightSavingsTimeZone is not None:
-            self.daylightSavingsTimeZone.export(outfile, level, namespace_, 'daylightSavingsTimeZone')
+            self.daylightSavingsTimeZone.export(outfile, level, namespace_, 'daylightSavingsTimeZone', pretty_print=pretty_print)
     def hasContent_(self):
         if (
             self.defaultTimeZone is not None or
@@ -2179,23 +2296,31 @@ class defaultTimeZone(GeneratedsSuper):
     def set_ZoneAbbreviation(self, ZoneAbbreviation): self.ZoneAbbreviation = ZoneAbbreviation
     def get_valueOf_(self): return self.valueOf_
     def set_valueOf_(self, valueOf_): self.valueOf_ = valueOf_
-    def export(self, outfile, level, namespace_='', name_='defaultTimeZone', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='defaultTimeZone', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='defaultTimeZone')
         if self.hasContent_():
             outfile.write(u'>')
             outfile.write(u'%s' % self.valueOf_)
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='defaultTimeZone'):
         outfile.write(u' ZoneOffset=%s' % (self.gds_format_string(quote_attrib(self.ZoneOffset), input_name='ZoneOffset'), ))
         if self.ZoneAbbreviation is not None and 'ZoneAbbreviation' not in already_processed:
             already_processed.append('ZoneAbbreviation')
             outfile.write(u' ZoneAbbreviation=%s' % (self.gds_format_string(quote_attrib(self.ZoneAbbreviation), input_name='ZoneAbbreviation'), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='defaultTimeZone'):
+    def exportChildren(self, outfile, level, namespace_='', name_='defaultTimeZone', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         pass
     def hasContent_(self):
         if (
@@ -2263,23 +2388,31 @@ class daylightSavingsTimeZone(GeneratedsSuper):
     def set_ZoneAbbreviation(self, ZoneAbbreviation): self.ZoneAbbreviation = ZoneAbbreviation
     def get_valueOf_(self): return self.valueOf_
     def set_valueOf_(self, valueOf_): self.valueOf_ = valueOf_
-    def export(self, outfile, level, namespace_='', name_='daylightSavingsTimeZone', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='daylightSavingsTimeZone', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='daylightSavingsTimeZone')
         if self.hasContent_():
             outfile.write(u'>')
             outfile.write(u'%s' % self.valueOf_)
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='daylightSavingsTimeZone'):
         outfile.write(u' ZoneOffset=%s' % (self.gds_format_string(quote_attrib(self.ZoneOffset), input_name='ZoneOffset'), ))
         if self.ZoneAbbreviation is not None and 'ZoneAbbreviation' not in already_processed:
             already_processed.append('ZoneAbbreviation')
             outfile.write(u' ZoneAbbreviation=%s' % (self.gds_format_string(quote_attrib(self.ZoneAbbreviation), input_name='ZoneAbbreviation'), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='daylightSavingsTimeZone'):
+    def exportChildren(self, outfile, level, namespace_='', name_='daylightSavingsTimeZone', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         pass
     def hasContent_(self):
         if (
@@ -2344,22 +2477,30 @@ class optionGroup(GeneratedsSuper):
     def set_option(self, option): self.option = option
     def add_option(self, value): self.option.append(value)
     def insert_option(self, index, value): self.option[index] = value
-    def export(self, outfile, level, namespace_='', name_='optionGroup', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='optionGroup', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='optionGroup')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='optionGroup'):
         pass
-    def exportChildren(self, outfile, level, namespace_='', name_='optionGroup'):
+    def exportChildren(self, outfile, level, namespace_='', name_='optionGroup', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         for option_ in self.option:
-            option_.export(outfile, level, namespace_, name_='option')
+            option_.export(outfile, level, namespace_, name_='option', pretty_print=pretty_print)
     def hasContent_(self):
         if (
             self.option
@@ -2439,13 +2580,17 @@ class DocumentationType(GeneratedsSuper):
     def set_show(self, show): self.show = show
     def get_valueOf_(self): return self.valueOf_
     def set_valueOf_(self, valueOf_): self.valueOf_ = valueOf_
-    def export(self, outfile, level, namespace_='', name_='DocumentationType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='DocumentationType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='DocumentationType')
         outfile.write(u'>')
-        self.exportChildren(outfile, level + 1, namespace_, name_)
-        outfile.write(u'</%s%s>\n' % (namespace_, name_))
+        self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+        outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='DocumentationType'):
         if self.title is not None and 'title' not in already_processed:
             already_processed.append('title')
@@ -2459,7 +2604,11 @@ class DocumentationType(GeneratedsSuper):
         if self.show is not None and 'show' not in already_processed:
             already_processed.append('show')
             outfile.write(u' show=%s' % (self.gds_format_string(quote_attrib(self.show), input_name='show'), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='DocumentationType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='DocumentationType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         pass
     def hasContent_(self):
         if (
@@ -2556,22 +2705,30 @@ class options(GeneratedsSuper):
     def set_option(self, option): self.option = option
     def add_option(self, value): self.option.append(value)
     def insert_option(self, index, value): self.option[index] = value
-    def export(self, outfile, level, namespace_='', name_='options', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='options', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='options')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='options'):
         pass
-    def exportChildren(self, outfile, level, namespace_='', name_='options'):
+    def exportChildren(self, outfile, level, namespace_='', name_='options', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         for option_ in self.option:
-            option_.export(outfile, level, namespace_, name_='option')
+            option_.export(outfile, level, namespace_, name_='option', pretty_print=pretty_print)
     def hasContent_(self):
         if (
             self.option
@@ -2635,20 +2792,28 @@ class SourceInfoType(GeneratedsSuper):
     factory = staticmethod(factory)
     def get_valueOf_(self): return self.valueOf_
     def set_valueOf_(self, valueOf_): self.valueOf_ = valueOf_
-    def export(self, outfile, level, namespace_='', name_='SourceInfoType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='SourceInfoType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='SourceInfoType')
         if self.hasContent_():
             outfile.write(u'>')
             outfile.write(u'%s' % self.valueOf_)
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='SourceInfoType'):
         pass
-    def exportChildren(self, outfile, level, namespace_='', name_='SourceInfoType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='SourceInfoType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         pass
     def hasContent_(self):
         if (
@@ -2717,38 +2882,46 @@ class DataSetInfoType(SourceInfoType):
     def set_dataSetLocation(self, dataSetLocation): self.dataSetLocation = dataSetLocation
     def get_extension(self): return self.extension
     def set_extension(self, extension): self.extension = extension
-    def export(self, outfile, level, namespace_='', name_='DataSetInfoType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='DataSetInfoType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='DataSetInfoType')
         outfile.write(u' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"')
         outfile.write(u' xsi:type="DataSetInfoType"')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='DataSetInfoType'):
         super(DataSetInfoType, self).exportAttributes(outfile, level, already_processed, namespace_, name_='DataSetInfoType')
-    def exportChildren(self, outfile, level, namespace_='', name_='DataSetInfoType'):
-        super(DataSetInfoType, self).exportChildren(outfile, level, namespace_, name_)
+    def exportChildren(self, outfile, level, namespace_='', name_='DataSetInfoType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        super(DataSetInfoType, self).exportChildren(outfile, level, namespace_, name_, pretty_print=pretty_print)
         if self.dataSetIdentifier is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sdataSetIdentifier>%s</%sdataSetIdentifier>\n' % (namespace_, self.gds_format_string(quote_xml(self.dataSetIdentifier), input_name='dataSetIdentifier'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sdataSetIdentifier>%s</%sdataSetIdentifier>%s' % (namespace_, self.gds_format_string(quote_xml(self.dataSetIdentifier), input_name='dataSetIdentifier'), namespace_, eol_))
         if self.timeZoneInfo:
-            self.timeZoneInfo.export(outfile, level, namespace_, name_='timeZoneInfo')
+            self.timeZoneInfo.export(outfile, level, namespace_, name_='timeZoneInfo', pretty_print=pretty_print)
         if self.dataSetDescription is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sdataSetDescription>%s</%sdataSetDescription>\n' % (namespace_, self.gds_format_string(quote_xml(self.dataSetDescription), input_name='dataSetDescription'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sdataSetDescription>%s</%sdataSetDescription>%s' % (namespace_, self.gds_format_string(quote_xml(self.dataSetDescription), input_name='dataSetDescription'), namespace_, eol_))
         for note_ in self.note:
-            note_.export(outfile, level, namespace_, name_='note')
+            note_.export(outfile, level, namespace_, name_='note', pretty_print=pretty_print)
         if self.dataSetLocation:
-            self.dataSetLocation.export(outfile, level, namespace_, name_='dataSetLocation')
+            self.dataSetLocation.export(outfile, level, namespace_, name_='dataSetLocation', pretty_print=pretty_print)
         if self.extension is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sextension>%s</%sextension>\n' % (namespace_, self.gds_format_string(quote_xml(self.extension), input_name='extension'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sextension>%s</%sextension>%s' % (namespace_, self.gds_format_string(quote_xml(self.extension), input_name='extension'), namespace_, eol_))
     def hasContent_(self):
         if (
             self.dataSetIdentifier is not None or
@@ -2859,20 +3032,28 @@ class TimePeriodType(GeneratedsSuper):
     factory = staticmethod(factory)
     def get_valueOf_(self): return self.valueOf_
     def set_valueOf_(self, valueOf_): self.valueOf_ = valueOf_
-    def export(self, outfile, level, namespace_='', name_='TimePeriodType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='TimePeriodType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='TimePeriodType')
         if self.hasContent_():
             outfile.write(u'>')
             outfile.write(u'%s' % self.valueOf_)
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='TimePeriodType'):
         pass
-    def exportChildren(self, outfile, level, namespace_='', name_='TimePeriodType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='TimePeriodType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         pass
     def hasContent_(self):
         if (
@@ -2925,29 +3106,37 @@ class TimeIntervalType(TimePeriodType):
     def set_beginDateTime(self, beginDateTime): self.beginDateTime = beginDateTime
     def get_endDateTime(self): return self.endDateTime
     def set_endDateTime(self, endDateTime): self.endDateTime = endDateTime
-    def export(self, outfile, level, namespace_='', name_='TimeIntervalType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='TimeIntervalType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='TimeIntervalType')
         outfile.write(u' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"')
         outfile.write(u' xsi:type="TimeIntervalType"')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='TimeIntervalType'):
         super(TimeIntervalType, self).exportAttributes(outfile, level, already_processed, namespace_, name_='TimeIntervalType')
-    def exportChildren(self, outfile, level, namespace_='', name_='TimeIntervalType'):
-        super(TimeIntervalType, self).exportChildren(outfile, level, namespace_, name_)
+    def exportChildren(self, outfile, level, namespace_='', name_='TimeIntervalType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        super(TimeIntervalType, self).exportChildren(outfile, level, namespace_, name_, pretty_print=pretty_print)
         if self.beginDateTime is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sbeginDateTime>%s</%sbeginDateTime>\n' % (namespace_, self.gds_format_string(quote_xml(self.beginDateTime), input_name='beginDateTime'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sbeginDateTime>%s</%sbeginDateTime>%s' % (namespace_, self.gds_format_string(quote_xml(self.beginDateTime), input_name='beginDateTime'), namespace_, eol_))
         if self.endDateTime is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sendDateTime>%s</%sendDateTime>\n' % (namespace_, self.gds_format_string(quote_xml(self.endDateTime), input_name='endDateTime'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sendDateTime>%s</%sendDateTime>%s' % (namespace_, self.gds_format_string(quote_xml(self.endDateTime), input_name='endDateTime'), namespace_, eol_))
     def hasContent_(self):
         if (
             self.beginDateTime is not None or
@@ -3015,32 +3204,40 @@ class TimeSingleType(TimePeriodType):
     def set_beginDateTime(self, beginDateTime): self.beginDateTime = beginDateTime
     def get_endDateTime(self): return self.endDateTime
     def set_endDateTime(self, endDateTime): self.endDateTime = endDateTime
-    def export(self, outfile, level, namespace_='', name_='TimeSingleType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='TimeSingleType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='TimeSingleType')
         outfile.write(u' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"')
         outfile.write(u' xsi:type="TimeSingleType"')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='TimeSingleType'):
         super(TimeSingleType, self).exportAttributes(outfile, level, already_processed, namespace_, name_='TimeSingleType')
-    def exportChildren(self, outfile, level, namespace_='', name_='TimeSingleType'):
-        super(TimeSingleType, self).exportChildren(outfile, level, namespace_, name_)
+    def exportChildren(self, outfile, level, namespace_='', name_='TimeSingleType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        super(TimeSingleType, self).exportChildren(outfile, level, namespace_, name_, pretty_print=pretty_print)
         if self.timeSingle is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%stimeSingle>%s</%stimeSingle>\n' % (namespace_, self.gds_format_string(quote_xml(self.timeSingle), input_name='timeSingle'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%stimeSingle>%s</%stimeSingle>%s' % (namespace_, self.gds_format_string(quote_xml(self.timeSingle), input_name='timeSingle'), namespace_, eol_))
         if self.beginDateTime is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sbeginDateTime>%s</%sbeginDateTime>\n' % (namespace_, self.gds_format_string(quote_xml(self.beginDateTime), input_name='beginDateTime'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sbeginDateTime>%s</%sbeginDateTime>%s' % (namespace_, self.gds_format_string(quote_xml(self.beginDateTime), input_name='beginDateTime'), namespace_, eol_))
         if self.endDateTime is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sendDateTime>%s</%sendDateTime>\n' % (namespace_, self.gds_format_string(quote_xml(self.endDateTime), input_name='endDateTime'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sendDateTime>%s</%sendDateTime>%s' % (namespace_, self.gds_format_string(quote_xml(self.endDateTime), input_name='endDateTime'), namespace_, eol_))
     def hasContent_(self):
         if (
             self.timeSingle is not None or
@@ -3116,32 +3313,40 @@ class TimePeriodRealTimeType(TimePeriodType):
     def set_beginDateTime(self, beginDateTime): self.beginDateTime = beginDateTime
     def get_endDateTime(self): return self.endDateTime
     def set_endDateTime(self, endDateTime): self.endDateTime = endDateTime
-    def export(self, outfile, level, namespace_='', name_='TimePeriodRealTimeType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='TimePeriodRealTimeType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='TimePeriodRealTimeType')
         outfile.write(u' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"')
         outfile.write(u' xsi:type="TimePeriodRealTimeType"')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='TimePeriodRealTimeType'):
         super(TimePeriodRealTimeType, self).exportAttributes(outfile, level, already_processed, namespace_, name_='TimePeriodRealTimeType')
-    def exportChildren(self, outfile, level, namespace_='', name_='TimePeriodRealTimeType'):
-        super(TimePeriodRealTimeType, self).exportChildren(outfile, level, namespace_, name_)
+    def exportChildren(self, outfile, level, namespace_='', name_='TimePeriodRealTimeType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        super(TimePeriodRealTimeType, self).exportChildren(outfile, level, namespace_, name_, pretty_print=pretty_print)
         if self.realTimeDataPeriod is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%srealTimeDataPeriod>%s</%srealTimeDataPeriod>\n' % (namespace_, self.gds_format_string(quote_xml(self.realTimeDataPeriod), input_name='realTimeDataPeriod'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%srealTimeDataPeriod>%s</%srealTimeDataPeriod>%s' % (namespace_, self.gds_format_string(quote_xml(self.realTimeDataPeriod), input_name='realTimeDataPeriod'), namespace_, eol_))
         if self.beginDateTime is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sbeginDateTime>%s</%sbeginDateTime>\n' % (namespace_, self.gds_format_string(quote_xml(self.beginDateTime), input_name='beginDateTime'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sbeginDateTime>%s</%sbeginDateTime>%s' % (namespace_, self.gds_format_string(quote_xml(self.beginDateTime), input_name='beginDateTime'), namespace_, eol_))
         if self.endDateTime is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sendDateTime>%s</%sendDateTime>\n' % (namespace_, self.gds_format_string(quote_xml(self.endDateTime), input_name='endDateTime'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sendDateTime>%s</%sendDateTime>%s' % (namespace_, self.gds_format_string(quote_xml(self.endDateTime), input_name='endDateTime'), namespace_, eol_))
     def hasContent_(self):
         if (
             self.realTimeDataPeriod is not None or
@@ -3211,22 +3416,30 @@ class GeogLocationType(GeneratedsSuper):
     def set_srs(self, srs): self.srs = srs
     def get_valueOf_(self): return self.valueOf_
     def set_valueOf_(self, valueOf_): self.valueOf_ = valueOf_
-    def export(self, outfile, level, namespace_='', name_='GeogLocationType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='GeogLocationType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='GeogLocationType')
         if self.hasContent_():
             outfile.write(u'>')
             outfile.write(u'%s' % self.valueOf_)
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='GeogLocationType'):
         if self.srs is not None and 'srs' not in already_processed:
             already_processed.append('srs')
             outfile.write(u' srs=%s' % (self.gds_format_string(quote_attrib(self.srs), input_name='srs'), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='GeogLocationType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='GeogLocationType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         pass
     def hasContent_(self):
         if (
@@ -3288,29 +3501,37 @@ class LatLonPointType(GeogLocationType):
     def validate_longitude(self, value):
         # validate type longitude
         pass
-    def export(self, outfile, level, namespace_='', name_='LatLonPointType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='LatLonPointType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='LatLonPointType')
         outfile.write(u' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"')
         outfile.write(u' xsi:type="LatLonPointType"')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='LatLonPointType'):
         super(LatLonPointType, self).exportAttributes(outfile, level, already_processed, namespace_, name_='LatLonPointType')
-    def exportChildren(self, outfile, level, namespace_='', name_='LatLonPointType'):
-        super(LatLonPointType, self).exportChildren(outfile, level, namespace_, name_)
+    def exportChildren(self, outfile, level, namespace_='', name_='LatLonPointType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        super(LatLonPointType, self).exportChildren(outfile, level, namespace_, name_, pretty_print=pretty_print)
         if self.latitude is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%slatitude>%s</%slatitude>\n' % (namespace_, self.gds_format_double(self.latitude, input_name='latitude'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%slatitude>%s</%slatitude>%s' % (namespace_, self.gds_format_double(self.latitude, input_name='latitude'), namespace_, eol_))
         if self.longitude is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%slongitude>%s</%slongitude>\n' % (namespace_, self.gds_format_double(self.longitude, input_name='longitude'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%slongitude>%s</%slongitude>%s' % (namespace_, self.gds_format_double(self.longitude, input_name='longitude'), namespace_, eol_))
     def hasContent_(self):
         if (
             self.latitude is not None or
@@ -3398,35 +3619,43 @@ class LatLonBoxType(GeogLocationType):
     def validate_east(self, value):
         # validate type east
         pass
-    def export(self, outfile, level, namespace_='', name_='LatLonBoxType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='LatLonBoxType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='LatLonBoxType')
         outfile.write(u' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"')
         outfile.write(u' xsi:type="LatLonBoxType"')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='LatLonBoxType'):
         super(LatLonBoxType, self).exportAttributes(outfile, level, already_processed, namespace_, name_='LatLonBoxType')
-    def exportChildren(self, outfile, level, namespace_='', name_='LatLonBoxType'):
-        super(LatLonBoxType, self).exportChildren(outfile, level, namespace_, name_)
+    def exportChildren(self, outfile, level, namespace_='', name_='LatLonBoxType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        super(LatLonBoxType, self).exportChildren(outfile, level, namespace_, name_, pretty_print=pretty_print)
         if self.south is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%ssouth>%s</%ssouth>\n' % (namespace_, self.gds_format_double(self.south, input_name='south'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%ssouth>%s</%ssouth>%s' % (namespace_, self.gds_format_double(self.south, input_name='south'), namespace_, eol_))
         if self.west is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%swest>%s</%swest>\n' % (namespace_, self.gds_format_double(self.west, input_name='west'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%swest>%s</%swest>%s' % (namespace_, self.gds_format_double(self.west, input_name='west'), namespace_, eol_))
         if self.north is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%snorth>%s</%snorth>\n' % (namespace_, self.gds_format_double(self.north, input_name='north'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%snorth>%s</%snorth>%s' % (namespace_, self.gds_format_double(self.north, input_name='north'), namespace_, eol_))
         if self.east is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%seast>%s</%seast>\n' % (namespace_, self.gds_format_double(self.east, input_name='east'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%seast>%s</%seast>%s' % (namespace_, self.gds_format_double(self.east, input_name='east'), namespace_, eol_))
     def hasContent_(self):
         if (
             self.south is not None or
@@ -3543,17 +3772,21 @@ class seriesCatalogType(GeneratedsSuper):
     def set_menuGroupName(self, menuGroupName): self.menuGroupName = menuGroupName
     def get_serviceWsdl(self): return self.serviceWsdl
     def set_serviceWsdl(self, serviceWsdl): self.serviceWsdl = serviceWsdl
-    def export(self, outfile, level, namespace_='', name_='seriesCatalogType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='seriesCatalogType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='seriesCatalogType')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='seriesCatalogType'):
         if self.menuGroupName is not None and 'menuGroupName' not in already_processed:
             already_processed.append('menuGroupName')
@@ -3561,11 +3794,15 @@ class seriesCatalogType(GeneratedsSuper):
         if self.serviceWsdl is not None and 'serviceWsdl' not in already_processed:
             already_processed.append('serviceWsdl')
             outfile.write(u' serviceWsdl=%s' % (self.gds_format_string(quote_attrib(self.serviceWsdl), input_name='serviceWsdl'), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='seriesCatalogType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='seriesCatalogType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         for note_ in self.note:
-            note_.export(outfile, level, namespace_, name_='note')
+            note_.export(outfile, level, namespace_, name_='note', pretty_print=pretty_print)
         for series_ in self.series:
-            series_.export(outfile, level, namespace_, name_='series')
+            series_.export(outfile, level, namespace_, name_='series', pretty_print=pretty_print)
     def hasContent_(self):
         if (
             self.note or
@@ -3702,44 +3939,52 @@ class series(GeneratedsSuper):
     def set_Source(self, Source): self.Source = Source
     def get_QualityControlLevel(self): return self.QualityControlLevel
     def set_QualityControlLevel(self, QualityControlLevel): self.QualityControlLevel = QualityControlLevel
-    def export(self, outfile, level, namespace_='', name_='series', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='series', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='series')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='series'):
         pass
-    def exportChildren(self, outfile, level, namespace_='', name_='series'):
+    def exportChildren(self, outfile, level, namespace_='', name_='series', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.dataType is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sdataType>%s</%sdataType>\n' % (namespace_, self.gds_format_string(quote_xml(self.dataType), input_name='dataType'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sdataType>%s</%sdataType>%s' % (namespace_, self.gds_format_string(quote_xml(self.dataType), input_name='dataType'), namespace_, eol_))
         if self.variable:
-            self.variable.export(outfile, level, namespace_, name_='variable', )
+            self.variable.export(outfile, level, namespace_, name_='variable', pretty_print=pretty_print)
         if self.valueCount:
-            self.valueCount.export(outfile, level, namespace_, name_='valueCount', )
+            self.valueCount.export(outfile, level, namespace_, name_='valueCount', pretty_print=pretty_print)
         if self.variableTimeInterval:
-            self.variableTimeInterval.export(outfile, level, namespace_, name_='variableTimeInterval', )
+            self.variableTimeInterval.export(outfile, level, namespace_, name_='variableTimeInterval', pretty_print=pretty_print)
         if self.valueType is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%svalueType>%s</%svalueType>\n' % (namespace_, self.gds_format_string(quote_xml(self.valueType), input_name='valueType'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%svalueType>%s</%svalueType>%s' % (namespace_, self.gds_format_string(quote_xml(self.valueType), input_name='valueType'), namespace_, eol_))
         if self.generalCategory is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sgeneralCategory>%s</%sgeneralCategory>\n' % (namespace_, self.gds_format_string(quote_xml(self.generalCategory), input_name='generalCategory'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sgeneralCategory>%s</%sgeneralCategory>%s' % (namespace_, self.gds_format_string(quote_xml(self.generalCategory), input_name='generalCategory'), namespace_, eol_))
         if self.sampleMedium is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%ssampleMedium>%s</%ssampleMedium>\n' % (namespace_, self.gds_format_string(quote_xml(self.sampleMedium), input_name='sampleMedium'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%ssampleMedium>%s</%ssampleMedium>%s' % (namespace_, self.gds_format_string(quote_xml(self.sampleMedium), input_name='sampleMedium'), namespace_, eol_))
         if self.Method:
-            self.Method.export(outfile, level, namespace_, name_='Method')
+            self.Method.export(outfile, level, namespace_, name_='Method', pretty_print=pretty_print)
         if self.Source:
-            self.Source.export(outfile, level, namespace_, name_='Source')
+            self.Source.export(outfile, level, namespace_, name_='Source', pretty_print=pretty_print)
         if self.QualityControlLevel:
-            self.QualityControlLevel.export(outfile, level, namespace_, name_='QualityControlLevel')
+            self.QualityControlLevel.export(outfile, level, namespace_, name_='QualityControlLevel', pretty_print=pretty_print)
     def hasContent_(self):
         if (
             self.dataType is not None or
@@ -3879,22 +4124,30 @@ class valueCount(GeneratedsSuper):
     def set_countIsEstimated(self, countIsEstimated): self.countIsEstimated = countIsEstimated
     def get_valueOf_(self): return self.valueOf_
     def set_valueOf_(self, valueOf_): self.valueOf_ = valueOf_
-    def export(self, outfile, level, namespace_='', name_='valueCount', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='valueCount', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='valueCount')
         if self.hasContent_():
             outfile.write(u'>')
             outfile.write(u'%s' % self.valueOf_)
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='valueCount'):
         if self.countIsEstimated is not None and 'countIsEstimated' not in already_processed:
             already_processed.append('countIsEstimated')
             outfile.write(u' countIsEstimated="%s"' % self.gds_format_boolean(self.gds_str_lower(str(self.countIsEstimated)), input_name='countIsEstimated'))
-    def exportChildren(self, outfile, level, namespace_='', name_='valueCount'):
+    def exportChildren(self, outfile, level, namespace_='', name_='valueCount', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         pass
     def hasContent_(self):
         if (
@@ -3952,22 +4205,30 @@ class QualifiersType(GeneratedsSuper):
     factory = staticmethod(factory)
     def get_qualifier(self): return self.qualifier
     def set_qualifier(self, qualifier): self.qualifier = qualifier
-    def export(self, outfile, level, namespace_='', name_='QualifiersType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='QualifiersType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='QualifiersType')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='QualifiersType'):
         pass
-    def exportChildren(self, outfile, level, namespace_='', name_='QualifiersType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='QualifiersType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.qualifier:
-            self.qualifier.export(outfile, level, namespace_, name_='qualifier', )
+            self.qualifier.export(outfile, level, namespace_, name_='qualifier', pretty_print=pretty_print)
     def hasContent_(self):
         if (
             self.qualifier is not None
@@ -4037,17 +4298,21 @@ class qualifier(GeneratedsSuper):
     def set_network(self, network): self.network = network
     def get_vocabulary(self): return self.vocabulary
     def set_vocabulary(self, vocabulary): self.vocabulary = vocabulary
-    def export(self, outfile, level, namespace_='', name_='qualifier', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='qualifier', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='qualifier')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='qualifier'):
         if self.qualifierID is not None and 'qualifierID' not in already_processed:
             already_processed.append('qualifierID')
@@ -4061,10 +4326,14 @@ class qualifier(GeneratedsSuper):
         if self.vocabulary is not None and 'vocabulary' not in already_processed:
             already_processed.append('vocabulary')
             outfile.write(u' vocabulary=%s' % (self.gds_format_string(quote_attrib(self.vocabulary), input_name='vocabulary'), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='qualifier'):
+    def exportChildren(self, outfile, level, namespace_='', name_='qualifier', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.qualifierCode is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%squalifierCode>%s</%squalifierCode>\n' % (namespace_, self.gds_format_string(quote_xml(self.qualifierCode), input_name='qualifierCode'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%squalifierCode>%s</%squalifierCode>%s' % (namespace_, self.gds_format_string(quote_xml(self.qualifierCode), input_name='qualifierCode'), namespace_, eol_))
     def hasContent_(self):
         if (
             self.qualifierCode is not None
@@ -4161,26 +4430,34 @@ class TimeSeriesType(GeneratedsSuper):
     def set_values(self, values): self.values = values
     def get_name(self): return self.name
     def set_name(self, name): self.name = name
-    def export(self, outfile, level, namespace_='', name_='TimeSeriesType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='TimeSeriesType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='TimeSeriesType')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='TimeSeriesType'):
         outfile.write(u' name=%s' % (self.gds_format_string(quote_attrib(self.name), input_name='name'), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='TimeSeriesType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='TimeSeriesType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.sourceInfo:
-            self.sourceInfo.export(outfile, level, namespace_, name_='sourceInfo', )
+            self.sourceInfo.export(outfile, level, namespace_, name_='sourceInfo', pretty_print=pretty_print)
         if self.variable:
-            self.variable.export(outfile, level, namespace_, name_='variable', )
+            self.variable.export(outfile, level, namespace_, name_='variable', pretty_print=pretty_print)
         if self.values:
-            self.values.export(outfile, level, namespace_, name_='values', )
+            self.values.export(outfile, level, namespace_, name_='values', pretty_print=pretty_print)
     def hasContent_(self):
         if (
             self.sourceInfo is not None or
@@ -4274,17 +4551,21 @@ class NoteType(GeneratedsSuper):
     def set_show(self, show): self.show = show
     def get_valueOf_(self): return self.valueOf_
     def set_valueOf_(self, valueOf_): self.valueOf_ = valueOf_
-    def export(self, outfile, level, namespace_='', name_='NoteType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='NoteType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='NoteType')
         if self.hasContent_():
             outfile.write(u'>')
             outfile.write(u'%s' % self.valueOf_)
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='NoteType'):
         if self.title is not None and 'title' not in already_processed:
             already_processed.append('title')
@@ -4298,7 +4579,11 @@ class NoteType(GeneratedsSuper):
         if self.show is not None and 'show' not in already_processed:
             already_processed.append('show')
             outfile.write(u' show=%s' % (self.gds_format_string(quote_attrib(self.show), input_name='show'), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='NoteType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='NoteType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         pass
     def hasContent_(self):
         if (
@@ -4390,17 +4675,21 @@ class option(GeneratedsSuper):
     def set_name(self, name): self.name = name
     def get_valueOf_(self): return self.valueOf_
     def set_valueOf_(self, valueOf_): self.valueOf_ = valueOf_
-    def export(self, outfile, level, namespace_='', name_='option', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='option', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='option')
         if self.hasContent_():
             outfile.write(u'>')
             outfile.write(u'%s' % self.valueOf_)
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='option'):
         if self.optionCode is not None and 'optionCode' not in already_processed:
             already_processed.append('optionCode')
@@ -4411,7 +4700,11 @@ class option(GeneratedsSuper):
         if self.name is not None and 'name' not in already_processed:
             already_processed.append('name')
             outfile.write(u' name=%s' % (self.gds_format_string(quote_attrib(self.name), input_name='name'), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='option'):
+    def exportChildren(self, outfile, level, namespace_='', name_='option', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         pass
     def hasContent_(self):
         if (
@@ -4500,17 +4793,21 @@ class variableCode(GeneratedsSuper):
     def set_network(self, network): self.network = network
     def get_valueOf_(self): return self.valueOf_
     def set_valueOf_(self, valueOf_): self.valueOf_ = valueOf_
-    def export(self, outfile, level, namespace_='', name_='variableCode', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='variableCode', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='variableCode')
         if self.hasContent_():
             outfile.write(u'>')
             outfile.write(u'%s' % self.valueOf_)
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='variableCode'):
         if self.default is not None and 'default' not in already_processed:
             already_processed.append('default')
@@ -4524,7 +4821,11 @@ class variableCode(GeneratedsSuper):
         if self.network is not None and 'network' not in already_processed:
             already_processed.append('network')
             outfile.write(u' network=%s' % (self.gds_format_string(quote_attrib(self.network), input_name='network'), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='variableCode'):
+    def exportChildren(self, outfile, level, namespace_='', name_='variableCode', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         pass
     def hasContent_(self):
         if (
@@ -4620,17 +4921,21 @@ class units(GeneratedsSuper):
         pass
     def get_valueOf_(self): return self.valueOf_
     def set_valueOf_(self, valueOf_): self.valueOf_ = valueOf_
-    def export(self, outfile, level, namespace_='', name_='units', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='units', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='units')
         if self.hasContent_():
             outfile.write(u'>')
             outfile.write(u'%s' % self.valueOf_)
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='units'):
         if self.unitsAbbreviation is not None and 'unitsAbbreviation' not in already_processed:
             already_processed.append('unitsAbbreviation')
@@ -4641,7 +4946,11 @@ class units(GeneratedsSuper):
         if self.unitsType is not None and 'unitsType' not in already_processed:
             already_processed.append('unitsType')
             outfile.write(u' unitsType=%s' % (quote_attrib(self.unitsType), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='units'):
+    def exportChildren(self, outfile, level, namespace_='', name_='units', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         pass
     def hasContent_(self):
         if (
@@ -4767,17 +5076,21 @@ class ValueSingleVariable(GeneratedsSuper):
     def set_offsetUnitsCode(self, offsetUnitsCode): self.offsetUnitsCode = offsetUnitsCode
     def get_valueOf_(self): return self.valueOf_
     def set_valueOf_(self, valueOf_): self.valueOf_ = valueOf_
-    def export(self, outfile, level, namespace_='', name_='ValueSingleVariable', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='ValueSingleVariable', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='ValueSingleVariable')
         if self.hasContent_():
             outfile.write(u'>')
             outfile.write(u'%s' % self.valueOf_)
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='ValueSingleVariable'):
         if self.codedVocabularyTerm is not None and 'codedVocabularyTerm' not in already_processed:
             already_processed.append('codedVocabularyTerm')
@@ -4828,7 +5141,11 @@ class ValueSingleVariable(GeneratedsSuper):
         if self.offsetUnitsCode is not None and 'offsetUnitsCode' not in already_processed:
             already_processed.append('offsetUnitsCode')
             outfile.write(u' offsetUnitsCode=%s' % (self.gds_format_string(quote_attrib(self.offsetUnitsCode), input_name='offsetUnitsCode'), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='ValueSingleVariable'):
+    def exportChildren(self, outfile, level, namespace_='', name_='ValueSingleVariable', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         pass
     def hasContent_(self):
         if (
@@ -5038,24 +5355,32 @@ class VariablesResponseType(GeneratedsSuper):
     def set_queryInfo(self, queryInfo): self.queryInfo = queryInfo
     def get_variables(self): return self.variables
     def set_variables(self, variables): self.variables = variables
-    def export(self, outfile, level, namespace_='', name_='VariablesResponseType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='VariablesResponseType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='VariablesResponseType')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='VariablesResponseType'):
         pass
-    def exportChildren(self, outfile, level, namespace_='', name_='VariablesResponseType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='VariablesResponseType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.queryInfo:
-            self.queryInfo.export(outfile, level, namespace_, name_='queryInfo', )
+            self.queryInfo.export(outfile, level, namespace_, name_='queryInfo', pretty_print=pretty_print)
         if self.variables:
-            self.variables.export(outfile, level, namespace_, name_='variables', )
+            self.variables.export(outfile, level, namespace_, name_='variables', pretty_print=pretty_print)
     def hasContent_(self):
         if (
             self.queryInfo is not None or
@@ -5119,24 +5444,32 @@ class TimeSeriesResponseType(GeneratedsSuper):
     def set_queryInfo(self, queryInfo): self.queryInfo = queryInfo
     def get_timeSeries(self): return self.timeSeries
     def set_timeSeries(self, timeSeries): self.timeSeries = timeSeries
-    def export(self, outfile, level, namespace_='', name_='TimeSeriesResponseType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='TimeSeriesResponseType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='TimeSeriesResponseType')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='TimeSeriesResponseType'):
         pass
-    def exportChildren(self, outfile, level, namespace_='', name_='TimeSeriesResponseType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='TimeSeriesResponseType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.queryInfo:
-            self.queryInfo.export(outfile, level, namespace_, name_='queryInfo', )
+            self.queryInfo.export(outfile, level, namespace_, name_='queryInfo', pretty_print=pretty_print)
         if self.timeSeries:
-            self.timeSeries.export(outfile, level, namespace_, name_='timeSeries', )
+            self.timeSeries.export(outfile, level, namespace_, name_='timeSeries', pretty_print=pretty_print)
     def hasContent_(self):
         if (
             self.queryInfo is not None or
@@ -5213,24 +5546,32 @@ class SiteInfoResponseType(GeneratedsSuper):
     def set_site(self, site): self.site = site
     def add_site(self, value): self.site.append(value)
     def insert_site(self, index, value): self.site[index] = value
-    def export(self, outfile, level, namespace_='', name_='SiteInfoResponseType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='SiteInfoResponseType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='SiteInfoResponseType')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='SiteInfoResponseType'):
         pass
-    def exportChildren(self, outfile, level, namespace_='', name_='SiteInfoResponseType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='SiteInfoResponseType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.queryInfo:
-            self.queryInfo.export(outfile, level, namespace_, name_='queryInfo', )
+            self.queryInfo.export(outfile, level, namespace_, name_='queryInfo', pretty_print=pretty_print)
         for site_ in self.site:
-            site_.export(outfile, level, namespace_, name_='site')
+            site_.export(outfile, level, namespace_, name_='site', pretty_print=pretty_print)
     def hasContent_(self):
         if (
             self.queryInfo is not None or
@@ -5315,27 +5656,35 @@ class site(GeneratedsSuper):
     def insert_seriesCatalog(self, index, value): self.seriesCatalog[index] = value
     def get_extension(self): return self.extension
     def set_extension(self, extension): self.extension = extension
-    def export(self, outfile, level, namespace_='', name_='site', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='site', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='site')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='site'):
         pass
-    def exportChildren(self, outfile, level, namespace_='', name_='site'):
+    def exportChildren(self, outfile, level, namespace_='', name_='site', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.siteInfo:
-            self.siteInfo.export(outfile, level, namespace_, name_='siteInfo', )
+            self.siteInfo.export(outfile, level, namespace_, name_='siteInfo', pretty_print=pretty_print)
         for seriesCatalog_ in self.seriesCatalog:
-            seriesCatalog_.export(outfile, level, namespace_, name_='seriesCatalog')
+            seriesCatalog_.export(outfile, level, namespace_, name_='seriesCatalog', pretty_print=pretty_print)
         if self.extension is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sextension>%s</%sextension>\n' % (namespace_, self.gds_format_string(quote_xml(self.extension), input_name='extension'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sextension>%s</%sextension>%s' % (namespace_, self.gds_format_string(quote_xml(self.extension), input_name='extension'), namespace_, eol_))
     def hasContent_(self):
         if (
             self.siteInfo is not None or
@@ -5430,17 +5779,21 @@ class qualityControlLevel(GeneratedsSuper):
     def set_oid(self, oid): self.oid = oid
     def get_default(self): return self.default
     def set_default(self, default): self.default = default
-    def export(self, outfile, level, namespace_='', name_='qualityControlLevel', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='qualityControlLevel', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='qualityControlLevel')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='qualityControlLevel'):
         if self.metadataDateTime is not None and 'metadataDateTime' not in already_processed:
             already_processed.append('metadataDateTime')
@@ -5460,10 +5813,14 @@ class qualityControlLevel(GeneratedsSuper):
         if self.default is not None and 'default' not in already_processed:
             already_processed.append('default')
             outfile.write(u' default="%s"' % self.gds_format_boolean(self.gds_str_lower(str(self.default)), input_name='default'))
-    def exportChildren(self, outfile, level, namespace_='', name_='qualityControlLevel'):
+    def exportChildren(self, outfile, level, namespace_='', name_='qualityControlLevel', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.qualityControlLevelID is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%squalityControlLevelID>%s</%squalityControlLevelID>\n' % (namespace_, self.gds_format_string(quote_xml(self.qualityControlLevelID), input_name='qualityControlLevelID'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%squalityControlLevelID>%s</%squalityControlLevelID>%s' % (namespace_, self.gds_format_string(quote_xml(self.qualityControlLevelID), input_name='qualityControlLevelID'), namespace_, eol_))
     def hasContent_(self):
         if (
             self.qualityControlLevelID is not None
@@ -5567,22 +5924,30 @@ class QualityControlLevelType(GeneratedsSuper):
     def set_qualityControlLevelID(self, qualityControlLevelID): self.qualityControlLevelID = qualityControlLevelID
     def get_valueOf_(self): return self.valueOf_
     def set_valueOf_(self, valueOf_): self.valueOf_ = valueOf_
-    def export(self, outfile, level, namespace_='', name_='QualityControlLevelType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='QualityControlLevelType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='QualityControlLevelType')
         if self.hasContent_():
             outfile.write(u'>')
             outfile.write(u'%s' % self.valueOf_)
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='QualityControlLevelType'):
         if self.qualityControlLevelID is not None and 'qualityControlLevelID' not in already_processed:
             already_processed.append('qualityControlLevelID')
             outfile.write(u' qualityControlLevelID="%s"' % self.gds_format_integer(self.qualityControlLevelID, input_name='qualityControlLevelID'))
-    def exportChildren(self, outfile, level, namespace_='', name_='QualityControlLevelType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='QualityControlLevelType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         pass
     def hasContent_(self):
         if (
@@ -5652,34 +6017,42 @@ class UnitsType(GeneratedsSuper):
     def set_UnitAbbreviation(self, UnitAbbreviation): self.UnitAbbreviation = UnitAbbreviation
     def get_UnitID(self): return self.UnitID
     def set_UnitID(self, UnitID): self.UnitID = UnitID
-    def export(self, outfile, level, namespace_='', name_='UnitsType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='UnitsType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='UnitsType')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='UnitsType'):
         if self.UnitID is not None and 'UnitID' not in already_processed:
             already_processed.append('UnitID')
             outfile.write(u' UnitID="%s"' % self.gds_format_integer(self.UnitID, input_name='UnitID'))
-    def exportChildren(self, outfile, level, namespace_='', name_='UnitsType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='UnitsType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.UnitName is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sUnitName>%s</%sUnitName>\n' % (namespace_, self.gds_format_string(quote_xml(self.UnitName), input_name='UnitName'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sUnitName>%s</%sUnitName>%s' % (namespace_, self.gds_format_string(quote_xml(self.UnitName), input_name='UnitName'), namespace_, eol_))
         if self.UnitDescription is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sUnitDescription>%s</%sUnitDescription>\n' % (namespace_, self.gds_format_string(quote_xml(self.UnitDescription), input_name='UnitDescription'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sUnitDescription>%s</%sUnitDescription>%s' % (namespace_, self.gds_format_string(quote_xml(self.UnitDescription), input_name='UnitDescription'), namespace_, eol_))
         if self.UnitType is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sUnitType>%s</%sUnitType>\n' % (namespace_, self.gds_format_string(quote_xml(self.UnitType), input_name='UnitType'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sUnitType>%s</%sUnitType>%s' % (namespace_, self.gds_format_string(quote_xml(self.UnitType), input_name='UnitType'), namespace_, eol_))
         if self.UnitAbbreviation is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sUnitAbbreviation>%s</%sUnitAbbreviation>\n' % (namespace_, self.gds_format_string(quote_xml(self.UnitAbbreviation), input_name='UnitAbbreviation'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sUnitAbbreviation>%s</%sUnitAbbreviation>%s' % (namespace_, self.gds_format_string(quote_xml(self.UnitAbbreviation), input_name='UnitAbbreviation'), namespace_, eol_))
     def hasContent_(self):
         if (
             self.UnitName is not None or
@@ -5772,28 +6145,36 @@ class MethodType(GeneratedsSuper):
     def set_MethodLink(self, MethodLink): self.MethodLink = MethodLink
     def get_methodID(self): return self.methodID
     def set_methodID(self, methodID): self.methodID = methodID
-    def export(self, outfile, level, namespace_='', name_='MethodType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='MethodType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='MethodType')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='MethodType'):
         if self.methodID is not None and 'methodID' not in already_processed:
             already_processed.append('methodID')
             outfile.write(u' methodID="%s"' % self.gds_format_integer(self.methodID, input_name='methodID'))
-    def exportChildren(self, outfile, level, namespace_='', name_='MethodType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='MethodType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.MethodDescription is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sMethodDescription>%s</%sMethodDescription>\n' % (namespace_, self.gds_format_string(quote_xml(self.MethodDescription), input_name='MethodDescription'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sMethodDescription>%s</%sMethodDescription>%s' % (namespace_, self.gds_format_string(quote_xml(self.MethodDescription), input_name='MethodDescription'), namespace_, eol_))
         if self.MethodLink is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sMethodLink>%s</%sMethodLink>\n' % (namespace_, self.gds_format_string(quote_xml(self.MethodLink), input_name='MethodLink'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sMethodLink>%s</%sMethodLink>%s' % (namespace_, self.gds_format_string(quote_xml(self.MethodLink), input_name='MethodLink'), namespace_, eol_))
     def hasContent_(self):
         if (
             self.MethodDescription is not None or
@@ -5872,30 +6253,38 @@ class SampleType(GeneratedsSuper):
     def set_LabMethod(self, LabMethod): self.LabMethod = LabMethod
     def get_sampleID(self): return self.sampleID
     def set_sampleID(self, sampleID): self.sampleID = sampleID
-    def export(self, outfile, level, namespace_='', name_='SampleType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='SampleType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='SampleType')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='SampleType'):
         if self.sampleID is not None and 'sampleID' not in already_processed:
             already_processed.append('sampleID')
             outfile.write(u' sampleID="%s"' % self.gds_format_integer(self.sampleID, input_name='sampleID'))
-    def exportChildren(self, outfile, level, namespace_='', name_='SampleType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='SampleType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.labSampleCode is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%slabSampleCode>%s</%slabSampleCode>\n' % (namespace_, self.gds_format_string(quote_xml(self.labSampleCode), input_name='labSampleCode'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%slabSampleCode>%s</%slabSampleCode>%s' % (namespace_, self.gds_format_string(quote_xml(self.labSampleCode), input_name='labSampleCode'), namespace_, eol_))
         if self.SampleType is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sSampleType>%s</%sSampleType>\n' % (namespace_, self.gds_format_string(quote_xml(self.SampleType), input_name='SampleType'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sSampleType>%s</%sSampleType>%s' % (namespace_, self.gds_format_string(quote_xml(self.SampleType), input_name='SampleType'), namespace_, eol_))
         if self.LabMethod:
-            self.LabMethod.export(outfile, level, namespace_, name_='LabMethod')
+            self.LabMethod.export(outfile, level, namespace_, name_='LabMethod', pretty_print=pretty_print)
     def hasContent_(self):
         if (
             self.labSampleCode is not None or
@@ -5988,37 +6377,45 @@ class LabMethodType(GeneratedsSuper):
     def set_labMethodLink(self, labMethodLink): self.labMethodLink = labMethodLink
     def get_labMethodID(self): return self.labMethodID
     def set_labMethodID(self, labMethodID): self.labMethodID = labMethodID
-    def export(self, outfile, level, namespace_='', name_='LabMethodType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='LabMethodType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='LabMethodType')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='LabMethodType'):
         if self.labMethodID is not None and 'labMethodID' not in already_processed:
             already_processed.append('labMethodID')
             outfile.write(u' labMethodID="%s"' % self.gds_format_integer(self.labMethodID, input_name='labMethodID'))
-    def exportChildren(self, outfile, level, namespace_='', name_='LabMethodType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='LabMethodType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.labName is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%slabName>%s</%slabName>\n' % (namespace_, self.gds_format_string(quote_xml(self.labName), input_name='labName'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%slabName>%s</%slabName>%s' % (namespace_, self.gds_format_string(quote_xml(self.labName), input_name='labName'), namespace_, eol_))
         if self.labOrganization is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%slabOrganization>%s</%slabOrganization>\n' % (namespace_, self.gds_format_string(quote_xml(self.labOrganization), input_name='labOrganization'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%slabOrganization>%s</%slabOrganization>%s' % (namespace_, self.gds_format_string(quote_xml(self.labOrganization), input_name='labOrganization'), namespace_, eol_))
         if self.LabMethodName is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sLabMethodName>%s</%sLabMethodName>\n' % (namespace_, self.gds_format_string(quote_xml(self.LabMethodName), input_name='LabMethodName'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sLabMethodName>%s</%sLabMethodName>%s' % (namespace_, self.gds_format_string(quote_xml(self.LabMethodName), input_name='LabMethodName'), namespace_, eol_))
         if self.labMethodDescription is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%slabMethodDescription>%s</%slabMethodDescription>\n' % (namespace_, self.gds_format_string(quote_xml(self.labMethodDescription), input_name='labMethodDescription'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%slabMethodDescription>%s</%slabMethodDescription>%s' % (namespace_, self.gds_format_string(quote_xml(self.labMethodDescription), input_name='labMethodDescription'), namespace_, eol_))
         if self.labMethodLink is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%slabMethodLink>%s</%slabMethodLink>\n' % (namespace_, self.gds_format_string(quote_xml(self.labMethodLink), input_name='labMethodLink'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%slabMethodLink>%s</%slabMethodLink>%s' % (namespace_, self.gds_format_string(quote_xml(self.labMethodLink), input_name='labMethodLink'), namespace_, eol_))
     def hasContent_(self):
         if (
             self.labName is not None or
@@ -6120,35 +6517,43 @@ class SourceType(GeneratedsSuper):
     def set_SourceLink(self, SourceLink): self.SourceLink = SourceLink
     def get_sourceID(self): return self.sourceID
     def set_sourceID(self, sourceID): self.sourceID = sourceID
-    def export(self, outfile, level, namespace_='', name_='SourceType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='SourceType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='SourceType')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='SourceType'):
         if self.sourceID is not None and 'sourceID' not in already_processed:
             already_processed.append('sourceID')
             outfile.write(u' sourceID="%s"' % self.gds_format_integer(self.sourceID, input_name='sourceID'))
-    def exportChildren(self, outfile, level, namespace_='', name_='SourceType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='SourceType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.Organization is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sOrganization>%s</%sOrganization>\n' % (namespace_, self.gds_format_string(quote_xml(self.Organization), input_name='Organization'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sOrganization>%s</%sOrganization>%s' % (namespace_, self.gds_format_string(quote_xml(self.Organization), input_name='Organization'), namespace_, eol_))
         if self.SourceDescription is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sSourceDescription>%s</%sSourceDescription>\n' % (namespace_, self.gds_format_string(quote_xml(self.SourceDescription), input_name='SourceDescription'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sSourceDescription>%s</%sSourceDescription>%s' % (namespace_, self.gds_format_string(quote_xml(self.SourceDescription), input_name='SourceDescription'), namespace_, eol_))
         if self.Metadata:
-            self.Metadata.export(outfile, level, namespace_, name_='Metadata')
+            self.Metadata.export(outfile, level, namespace_, name_='Metadata', pretty_print=pretty_print)
         if self.ContactInformation:
-            self.ContactInformation.export(outfile, level, namespace_, name_='ContactInformation')
+            self.ContactInformation.export(outfile, level, namespace_, name_='ContactInformation', pretty_print=pretty_print)
         if self.SourceLink is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sSourceLink>%s</%sSourceLink>\n' % (namespace_, self.gds_format_string(quote_xml(self.SourceLink), input_name='SourceLink'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sSourceLink>%s</%sSourceLink>%s' % (namespace_, self.gds_format_string(quote_xml(self.SourceLink), input_name='SourceLink'), namespace_, eol_))
     def hasContent_(self):
         if (
             self.Organization is not None or
@@ -6255,35 +6660,43 @@ class ContactInformationType(GeneratedsSuper):
     def set_Email(self, Email): self.Email = Email
     def get_Address(self): return self.Address
     def set_Address(self, Address): self.Address = Address
-    def export(self, outfile, level, namespace_='', name_='ContactInformationType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='ContactInformationType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='ContactInformationType')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='ContactInformationType'):
         pass
-    def exportChildren(self, outfile, level, namespace_='', name_='ContactInformationType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='ContactInformationType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.ContactName is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sContactName>%s</%sContactName>\n' % (namespace_, self.gds_format_string(quote_xml(self.ContactName), input_name='ContactName'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sContactName>%s</%sContactName>%s' % (namespace_, self.gds_format_string(quote_xml(self.ContactName), input_name='ContactName'), namespace_, eol_))
         if self.TypeOfContact is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sTypeOfContact>%s</%sTypeOfContact>\n' % (namespace_, self.gds_format_string(quote_xml(self.TypeOfContact), input_name='TypeOfContact'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sTypeOfContact>%s</%sTypeOfContact>%s' % (namespace_, self.gds_format_string(quote_xml(self.TypeOfContact), input_name='TypeOfContact'), namespace_, eol_))
         if self.Phone is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sPhone>%s</%sPhone>\n' % (namespace_, self.gds_format_string(quote_xml(self.Phone), input_name='Phone'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sPhone>%s</%sPhone>%s' % (namespace_, self.gds_format_string(quote_xml(self.Phone), input_name='Phone'), namespace_, eol_))
         if self.Email is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sEmail>%s</%sEmail>\n' % (namespace_, self.gds_format_string(quote_xml(self.Email), input_name='Email'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sEmail>%s</%sEmail>%s' % (namespace_, self.gds_format_string(quote_xml(self.Email), input_name='Email'), namespace_, eol_))
         if self.Address is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sAddress>%s</%sAddress>\n' % (namespace_, self.gds_format_string(quote_xml(self.Address), input_name='Address'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sAddress>%s</%sAddress>%s' % (namespace_, self.gds_format_string(quote_xml(self.Address), input_name='Address'), namespace_, eol_))
     def hasContent_(self):
         if (
             self.ContactName is not None or
@@ -6378,35 +6791,43 @@ class MetaDataType(GeneratedsSuper):
     def set_ProfileVersion(self, ProfileVersion): self.ProfileVersion = ProfileVersion
     def get_MetadataLink(self): return self.MetadataLink
     def set_MetadataLink(self, MetadataLink): self.MetadataLink = MetadataLink
-    def export(self, outfile, level, namespace_='', name_='MetaDataType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='MetaDataType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='MetaDataType')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='MetaDataType'):
         pass
-    def exportChildren(self, outfile, level, namespace_='', name_='MetaDataType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='MetaDataType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.TopicCategory is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sTopicCategory>%s</%sTopicCategory>\n' % (namespace_, self.gds_format_string(quote_xml(self.TopicCategory), input_name='TopicCategory'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sTopicCategory>%s</%sTopicCategory>%s' % (namespace_, self.gds_format_string(quote_xml(self.TopicCategory), input_name='TopicCategory'), namespace_, eol_))
         if self.Title is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sTitle>%s</%sTitle>\n' % (namespace_, self.gds_format_string(quote_xml(self.Title), input_name='Title'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sTitle>%s</%sTitle>%s' % (namespace_, self.gds_format_string(quote_xml(self.Title), input_name='Title'), namespace_, eol_))
         if self.Abstract is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sAbstract>%s</%sAbstract>\n' % (namespace_, self.gds_format_string(quote_xml(self.Abstract), input_name='Abstract'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sAbstract>%s</%sAbstract>%s' % (namespace_, self.gds_format_string(quote_xml(self.Abstract), input_name='Abstract'), namespace_, eol_))
         if self.ProfileVersion is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sProfileVersion>%s</%sProfileVersion>\n' % (namespace_, self.gds_format_string(quote_xml(self.ProfileVersion), input_name='ProfileVersion'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sProfileVersion>%s</%sProfileVersion>%s' % (namespace_, self.gds_format_string(quote_xml(self.ProfileVersion), input_name='ProfileVersion'), namespace_, eol_))
         if self.MetadataLink is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sMetadataLink>%s</%sMetadataLink>\n' % (namespace_, self.gds_format_string(quote_xml(self.MetadataLink), input_name='MetadataLink'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sMetadataLink>%s</%sMetadataLink>%s' % (namespace_, self.gds_format_string(quote_xml(self.MetadataLink), input_name='MetadataLink'), namespace_, eol_))
     def hasContent_(self):
         if (
             self.TopicCategory is not None or
@@ -6501,36 +6922,44 @@ class OffsetType(GeneratedsSuper):
     def set_offsetHorizDirectionDegrees(self, offsetHorizDirectionDegrees): self.offsetHorizDirectionDegrees = offsetHorizDirectionDegrees
     def get_offsetTypeID(self): return self.offsetTypeID
     def set_offsetTypeID(self, offsetTypeID): self.offsetTypeID = offsetTypeID
-    def export(self, outfile, level, namespace_='', name_='OffsetType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='OffsetType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='OffsetType')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='OffsetType'):
         if self.offsetTypeID is not None and 'offsetTypeID' not in already_processed:
             already_processed.append('offsetTypeID')
             outfile.write(u' offsetTypeID="%s"' % self.gds_format_integer(self.offsetTypeID, input_name='offsetTypeID'))
-    def exportChildren(self, outfile, level, namespace_='', name_='OffsetType'):
+    def exportChildren(self, outfile, level, namespace_='', name_='OffsetType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
         if self.offsetValue is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%soffsetValue>%s</%soffsetValue>\n' % (namespace_, self.gds_format_string(quote_xml(self.offsetValue), input_name='offsetValue'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%soffsetValue>%s</%soffsetValue>%s' % (namespace_, self.gds_format_string(quote_xml(self.offsetValue), input_name='offsetValue'), namespace_, eol_))
         if self.offsetDescription is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%soffsetDescription>%s</%soffsetDescription>\n' % (namespace_, self.gds_format_string(quote_xml(self.offsetDescription), input_name='offsetDescription'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%soffsetDescription>%s</%soffsetDescription>%s' % (namespace_, self.gds_format_string(quote_xml(self.offsetDescription), input_name='offsetDescription'), namespace_, eol_))
         if self.units:
-            self.units.export(outfile, level, namespace_, name_='units', )
+            self.units.export(outfile, level, namespace_, name_='units', pretty_print=pretty_print)
         if self.offsetIsVertical is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%soffsetIsVertical>%s</%soffsetIsVertical>\n' % (namespace_, self.gds_format_string(quote_xml(self.offsetIsVertical), input_name='offsetIsVertical'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%soffsetIsVertical>%s</%soffsetIsVertical>%s' % (namespace_, self.gds_format_string(quote_xml(self.offsetIsVertical), input_name='offsetIsVertical'), namespace_, eol_))
         if self.offsetHorizDirectionDegrees is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%soffsetHorizDirectionDegrees>%s</%soffsetHorizDirectionDegrees>\n' % (namespace_, self.gds_format_string(quote_xml(self.offsetHorizDirectionDegrees), input_name='offsetHorizDirectionDegrees'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%soffsetHorizDirectionDegrees>%s</%soffsetHorizDirectionDegrees>%s' % (namespace_, self.gds_format_string(quote_xml(self.offsetHorizDirectionDegrees), input_name='offsetHorizDirectionDegrees'), namespace_, eol_))
     def hasContent_(self):
         if (
             self.offsetValue is not None or
@@ -6666,19 +7095,23 @@ class SiteInfoType(SourceInfoType):
     def set_metadataDateTime(self, metadataDateTime): self.metadataDateTime = metadataDateTime
     def get_oid(self): return self.oid
     def set_oid(self, oid): self.oid = oid
-    def export(self, outfile, level, namespace_='', name_='SiteInfoType', namespacedef_=''):
-        showIndent(outfile, level)
+    def export(self, outfile, level, namespace_='', name_='SiteInfoType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        showIndent(outfile, level, pretty_print)
         outfile.write(u'<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         self.exportAttributes(outfile, level, [], namespace_, name_='SiteInfoType')
         outfile.write(u' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"')
         outfile.write(u' xsi:type="SiteInfoType"')
         if self.hasContent_():
-            outfile.write(u'>\n')
-            self.exportChildren(outfile, level + 1, namespace_, name_)
-            showIndent(outfile, level)
-            outfile.write(u'</%s%s>\n' % (namespace_, name_))
+            outfile.write(u'>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_, name_, pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'</%s%s>%s' % (namespace_, name_, eol_))
         else:
-            outfile.write(u'/>\n')
+            outfile.write(u'/>%s' % (eol_, ))
     def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='SiteInfoType'):
         super(SiteInfoType, self).exportAttributes(outfile, level, already_processed, namespace_, name_='SiteInfoType')
         if self.metadataDateTime is not None and 'metadataDateTime' not in already_processed:
@@ -6687,31 +7120,35 @@ class SiteInfoType(SourceInfoType):
         if self.oid is not None and 'oid' not in already_processed:
             already_processed.append('oid')
             outfile.write(u' oid=%s' % (self.gds_format_string(quote_attrib(self.oid), input_name='oid'), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='SiteInfoType'):
-        super(SiteInfoType, self).exportChildren(outfile, level, namespace_, name_)
+    def exportChildren(self, outfile, level, namespace_='', name_='SiteInfoType', pretty_print=True):
+        if pretty_print:
+            eol_ = u'\n'
+        else:
+            eol_ = u''
+        super(SiteInfoType, self).exportChildren(outfile, level, namespace_, name_, pretty_print=pretty_print)
         if self.siteName is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%ssiteName>%s</%ssiteName>\n' % (namespace_, self.gds_format_string(quote_xml(self.siteName), input_name='siteName'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%ssiteName>%s</%ssiteName>%s' % (namespace_, self.gds_format_string(quote_xml(self.siteName), input_name='siteName'), namespace_, eol_))
         for siteCode_ in self.siteCode:
-            siteCode_.export(outfile, level, namespace_, name_='siteCode')
+            siteCode_.export(outfile, level, namespace_, name_='siteCode', pretty_print=pretty_print)
         if self.timeZoneInfo:
-            self.timeZoneInfo.export(outfile, level, namespace_, name_='timeZoneInfo')
+            self.timeZoneInfo.export(outfile, level, namespace_, name_='timeZoneInfo', pretty_print=pretty_print)
         if self.geoLocation:
-            self.geoLocation.export(outfile, level, namespace_, name_='geoLocation')
+            self.geoLocation.export(outfile, level, namespace_, name_='geoLocation', pretty_print=pretty_print)
         if self.elevation_m is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%selevation_m>%s</%selevation_m>\n' % (namespace_, self.gds_format_string(quote_xml(self.elevation_m), input_name='elevation_m'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%selevation_m>%s</%selevation_m>%s' % (namespace_, self.gds_format_string(quote_xml(self.elevation_m), input_name='elevation_m'), namespace_, eol_))
         if self.verticalDatum is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sverticalDatum>%s</%sverticalDatum>\n' % (namespace_, self.gds_format_string(quote_xml(self.verticalDatum), input_name='verticalDatum'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sverticalDatum>%s</%sverticalDatum>%s' % (namespace_, self.gds_format_string(quote_xml(self.verticalDatum), input_name='verticalDatum'), namespace_, eol_))
         for note_ in self.note:
-            note_.export(outfile, level, namespace_, name_='note')
+            note_.export(outfile, level, namespace_, name_='note', pretty_print=pretty_print)
         if self.extension is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%sextension>%s</%sextension>\n' % (namespace_, self.gds_format_string(quote_xml(self.extension), input_name='extension'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%sextension>%s</%sextension>%s' % (namespace_, self.gds_format_string(quote_xml(self.extension), input_name='extension'), namespace_, eol_))
         if self.altname is not None:
-            showIndent(outfile, level)
-            outfile.write(u'<%saltname>%s</%saltname>\n' % (namespace_, self.gds_format_string(quote_xml(self.altname), input_name='altname'), namespace_))
+            showIndent(outfile, level, pretty_print)
+            outfile.write(u'<%saltname>%s</%saltname>%s' % (namespace_, self.gds_format_string(quote_xml(self.altname), input_name='altname'), namespace_, eol_))
     def hasContent_(self):
         if (
             self.siteName is not None or
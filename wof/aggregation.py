@@ -0,0 +1,234 @@
+from __future__ import (absolute_import, division, print_function)
+
+import datetime
+import itertools
+import re
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from wof import isodates
+from wof import models
+from wof.paging import local_datetime
+
+STATISTICS = ('mean', 'min', 'max', 'sum', 'count', 'last')
+
+# WaterML data types of the aggregated values, count and last keep the
+# data type of the variable.
+DATA_TYPES = {
+    'mean': 'Average',
+    'min': 'Minimum',
+    'max': 'Maximum',
+    'sum': 'Incremental',
+}
+
+# Interval unit -> (seconds, ODM units id, units name, units abbreviation)
+INTERVAL_UNITS = {
+    'second': (1, 100, 'second', 's'),
+    'minute': (60, 102, 'minute', 'min'),
+    'hour': (3600, 103, 'hour', 'hr'),
+    'day': (86400, 104, 'day', 'd'),
+    'week': (604800, 105, 'week', 'week'),
+}
+
+INTERVAL_UNIT_ALIASES = {
+    's': 'second', 'sec': 'second', 'second': 'second',
+    'min': 'minute', 'minute': 'minute',
+    'h': 'hour', 'hr': 'hour', 'hour': 'hour',
+    'd': 'day', 'day': 'day',
+    'w': 'week', 'week': 'week',
+}
+
+INTERVAL_RE = re.compile(r'^(\d*)\s*([a-z]+?)s?$')
+
+# Local date time buckets are counted from this date, and week buckets
+# from the Monday before it, so that weeks are ISO weeks.
+_EPOCH = datetime.datetime(1970, 1, 1)
+_WEEK_EPOCH = datetime.datetime(1969, 12, 29)
+
+
+class Interval(object):
+    """
+    Aggregation interval of a number of time units, e.g. 15 minutes.
+    """
+
+    def __init__(self, count, unit):
+        self.count = count
+        self.unit = unit
+        seconds, self.units_id, self.units_name, self.units_abbreviation = \
+            INTERVAL_UNITS[unit]
+        self.seconds = count * seconds
+        self.epoch = _WEEK_EPOCH if unit == 'week' else _EPOCH
+
+    def __eq__(self, other):
+        return (isinstance(other, Interval) and
+                (self.count, self.unit) == (other.count, other.unit))
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return '<Interval: {0} {1}>'.format(self.count, self.unit)
+
+    def create_units(self):
+        units = models.BaseUnits()
+        units.UnitsID = self.units_id
+        units.UnitsName = self.units_name
+        units.UnitsType = 'Time'
+        units.UnitsAbbreviation = self.units_abbreviation
+        return units
+
+
+def parse_interval(interval):
+    """
+    Returns the Interval of a count and unit string, e.g. '15min', '1h',
+    'day' or '2 weeks'.
+    """
+    match = INTERVAL_RE.match(interval.strip().lower())
+    unit = INTERVAL_UNIT_ALIASES.get(match.group(2)) if match else None
+    count = int(match.group(1) or 1) if match else 0
+    if unit is None or count < 1:
+        raise ValueError('Invalid aggregation interval: {0}'.format(interval))
+    return Interval(count, unit)
+
+
+def check_statistic(statistic):
+    """
+    Returns the statistic name in lower case, raising ValueError when it is
+    not one of STATISTICS.
+    """
+    name = (statistic or '').strip().lower()
+    if name not in STATISTICS:
+        raise ValueError(
+            'Invalid aggregation statistic: {0}, expected one of {1}'.format(
+                statistic, ', '.join(STATISTICS)))
+    return name
+
+
+class AggregateDataValue(models.BaseDataValue):
+    """
+    Data value of one aggregation bucket, dated at the start of the bucket
+    and carrying the metadata ids of the first value of the bucket.
+    """
+
+    def __init__(self, first, start, value):
+        self.DataValue = value
+        self.LocalDateTime = start
+        self.DateTimeUTC = start.astimezone(isodates.tzinfo_for_offset(0))
+        self.UTCOffset = first.UTCOffset
+        self.CensorCode = 'nc'
+        for name in ('SiteID', 'VariableID', 'MethodID', 'SourceID',
+                     'QualityControlLevel', 'QualityControlLevelID'):
+            setattr(self, name, getattr(first, name, None))
+
+
+class AggregateVariable(object):
+    """
+    Variable of an aggregated series: the wrapped variable with a regular
+    time support of the aggregation interval and the data type of the
+    statistic.
+    """
+
+    def __init__(self, variable, interval, statistic):
+        self._variable = variable
+        self.IsRegular = True
+        self.TimeSupport = interval.count
+        self.TimeUnits = interval.create_units()
+        self.DataType = DATA_TYPES.get(statistic, variable.DataType)
+
+    def __getattr__(self, name):
+        return getattr(self._variable, name)
+
+
+def _columns(valueResultArr, interval, no_data_value):
+    # Returns the bucket keys, the numeric values, and the first value and
+    # local start date time of each bucket.
+    keys = []
+    values = []
+    firsts = {}
+    epoch = interval.epoch
+    for valueResult in valueResultArr:
+        try:
+            value = float(valueResult.DataValue)
+        except (TypeError, ValueError):
+            continue
+        if no_data_value is not None and value == no_data_value:
+            continue
+        local = local_datetime(valueResult)
+        seconds = (local.replace(tzinfo=None) - epoch).total_seconds()
+        key = int(seconds // interval.seconds)
+        if key not in firsts:
+            start = epoch + datetime.timedelta(seconds=key * interval.seconds)
+            firsts[key] = (valueResult, start.replace(tzinfo=local.tzinfo))
+        keys.append(key)
+        values.append(value)
+    return keys, values, firsts
+
+
+def _aggregate_numpy(keys, values, statistic):
+    keys = numpy.array(keys, dtype=numpy.int64)
+    values = numpy.array(values, dtype=numpy.float64)
+    order = numpy.argsort(keys, kind='mergesort')
+    keys = keys[order]
+    values = values[order]
+    starts = numpy.flatnonzero(numpy.r_[True, keys[1:] != keys[:-1]])
+    ends = numpy.r_[starts[1:], len(keys)]
+    if statistic == 'count':
+        results = ends - starts
+    elif statistic == 'last':
+        results = values[ends - 1]
+    elif statistic == 'min':
+        results = numpy.minimum.reduceat(values, starts)
+    elif statistic == 'max':
+        results = numpy.maximum.reduceat(values, starts)
+    else:
+        results = numpy.add.reduceat(values, starts)
+        if statistic == 'mean':
+            results = results / (ends - starts)
+    return zip(keys[starts].tolist(), results.tolist())
+
+
+def _aggregate_python(keys, values, statistic):
+    pairs = sorted(zip(keys, values), key=lambda pair: pair[0])
+    for key, group in itertools.groupby(pairs, key=lambda pair: pair[0]):
+        group = [value for _, value in group]
+        if statistic == 'count':
+            result = len(group)
+        elif statistic == 'last':
+            result = group[-1]
+        elif statistic == 'min':
+            result = min(group)
+        elif statistic == 'max':
+            result = max(group)
+        elif statistic == 'sum':
+            result = sum(group)
+        else:
+            result = sum(group) / len(group)
+        yield key, result
+
+
+def aggregate(valueResultArr, interval, statistic, no_data_value=None):
+    """
+    Returns a list of AggregateDataValue, one for each interval bucket of
+    local date time holding values, in date time order.
+
+    Buckets are aligned on multiples of the interval counted from
+    1970-01-01 in the local time of the values, so daily buckets are local
+    days, and week buckets from Monday 1969-12-29, so they start on a
+    Monday. Values that are not numbers or equal no_data_value are left out;
+    last is the last value of a bucket in the order of valueResultArr. The
+    statistics are computed with NumPy when it is installed.
+    """
+    if no_data_value is not None:
+        no_data_value = float(no_data_value)
+    keys, values, firsts = _columns(valueResultArr, interval, no_data_value)
+    if not keys:
+        return []
+    if numpy is not None:
+        buckets = _aggregate_numpy(keys, values, statistic)
+    else:
+        buckets = _aggregate_python(keys, values, statistic)
+    return [AggregateDataValue(firsts[key][0], firsts[key][1], result)
+            for key, result in buckets]
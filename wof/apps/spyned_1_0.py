@@ -16,12 +16,20 @@ __author__ = 'cyoun'
 
 logger = logging.getLogger(__name__)
 
-NSDEF = 'xmlns:gml="http://www.opengis.net/gml" \
-    xmlns:xlink="http://www.w3.org/1999/xlink" \
-    xmlns:xsd="http://www.w3.org/2001/XMLSchema" \
-    xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" \
-    xmlns:wtr="http://www.cuahsi.org/waterML/" \
-    xmlns="http://www.cuahsi.org/waterML/1.0/"'
+NSDEF = ('xmlns:gml="http://www.opengis.net/gml" '
+         'xmlns:xlink="http://www.w3.org/1999/xlink" '
+         'xmlns:xsd="http://www.w3.org/2001/XMLSchema" '
+         'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+         'xmlns:wtr="http://www.cuahsi.org/waterML/" '
+         'xmlns="http://www.cuahsi.org/waterML/1.0/"')
+
+# SOAP methods whose <method>Result element is replaced by its child.
+UNWRAPPED_RESULT_METHODS = frozenset([
+    'GetSites',
+    'GetSiteInfoObject',
+    'GetVariableInfoObject',
+    'GetValuesObject',
+])
 
 
 @memoize
@@ -37,11 +45,16 @@ def TWOFService(wof_inst, T, T_name):
                     siteArg = None
                 logging.debug(site)
                 logging.debug(siteArg)
-                siteResponse = wof_inst.create_get_site_response(siteArg)
-                outStream = StringIO()
-                siteResponse.export(outStream, 0, name_="sitesResponse",
-                                    namespacedef_=NSDEF)
-                return outStream.getvalue()
+
+                def create():
+                    siteResponse = wof_inst.create_get_site_response(siteArg)
+                    outStream = StringIO()
+                    siteResponse.export(outStream, 0, name_="sitesResponse",
+                                        namespacedef_=NSDEF,
+                                        pretty_print=wof_inst.pretty_print)
+                    return outStream.getvalue()
+                return wof_inst.cached_response('GetSites', create,
+                                                site=siteArg)
             except Exception as inst:
                 if type(inst) == Fault:
                     raise inst
@@ -52,21 +65,25 @@ def TWOFService(wof_inst, T, T_name):
         @rpc(Array(Unicode), Unicode, _returns=Unicode)
         def GetSitesXml(ctx, site=None, authToken=None):
             siteResult = WOFService.GetSites(ctx, site, authToken)
-            return siteResult.replace('\n', '')
+            return siteResult
 
         @rpc(Unicode, Unicode, _returns=AnyXml)
         def GetSiteInfoObject(ctx, site, authToken=None):
             try:
-                siteInfoResponse = \
-                    wof_inst.create_get_site_info_response(site)
-                outStream = StringIO.StringIO()
-                siteInfoResponse.export(
-                    outStream,
-                    0,
-                    name_="sitesResponse",
-                    namespacedef_=NSDEF
-                )
-                return outStream.getvalue()
+                def create():
+                    siteInfoResponse = \
+                        wof_inst.create_get_site_info_response(site)
+                    outStream = StringIO()
+                    siteInfoResponse.export(
+                        outStream,
+                        0,
+                        name_="sitesResponse",
+                        namespacedef_=NSDEF,
+                        pretty_print=wof_inst.pretty_print
+                    )
+                    return outStream.getvalue()
+                return wof_inst.cached_response('GetSiteInfo', create,
+                                                site=site)
             except Exception as inst:
                 if type(inst) == Fault:
                     raise inst
@@ -76,23 +93,25 @@ def TWOFService(wof_inst, T, T_name):
         @rpc(Unicode, Unicode, _returns=T)
         def GetSiteInfo(ctx, site, authToken=None):
             siteinfoResult = WOFService.GetSiteInfoObject(ctx, site, authToken)
-            if T_name == wof._SERVICE_PARAMS["r_type"]:
-                return siteinfoResult
-            return str(siteinfoResult.replace('\n', ''))
+            return siteinfoResult
 
         @rpc(Unicode, Unicode, _returns=AnyXml)
         def GetVariableInfoObject(ctx, variable, authToken=None):
             try:
-                variableInfoResponse = \
-                    wof_inst.create_get_variable_info_response(variable)
-                outStream = StringIO.StringIO()
-                variableInfoResponse.export(
-                    outStream,
-                    0,
-                    name_="variablesResponse",
-                    namespacedef_=NSDEF
-                )
-                return outStream.getvalue()
+                def create():
+                    variableInfoResponse = \
+                        wof_inst.create_get_variable_info_response(variable)
+                    outStream = StringIO()
+                    variableInfoResponse.export(
+                        outStream,
+                        0,
+                        name_="variablesResponse",
+                        namespacedef_=NSDEF,
+                        pretty_print=wof_inst.pretty_print
+                    )
+                    return outStream.getvalue()
+                return wof_inst.cached_response('GetVariableInfo', create,
+                                                variable=variable)
             except Exception as inst:
                 if type(inst) == Fault:
                     raise inst
@@ -102,20 +121,24 @@ def TWOFService(wof_inst, T, T_name):
         @rpc(Unicode, Unicode, _returns=T)
         def GetVariableInfo(ctx, variable, authToken=None):
             varinfoResult = WOFService.GetVariableInfoObject(ctx, variable, authToken)  # noqa
-            if T_name == wof._SERVICE_PARAMS["r_type"]:
-                return varinfoResult
-            return varinfoResult.replace('\n', '')
+            return varinfoResult
 
         @rpc(Unicode, Unicode, Unicode, Unicode, Unicode, _returns=AnyXml)
         def GetValuesObject(ctx, location, variable, startDate, endDate, authToken=None):  # noqa
             try:
-                timeSeriesResponse = wof_inst.create_get_values_response(
-                    location, variable, startDate, endDate)
-                outStream = StringIO.StringIO()
-                timeSeriesResponse.export(
-                    outStream, 0, name_="timeSeriesResponse",
-                    namespacedef_=NSDEF)
-                return outStream.getvalue()
+                def create():
+                    timeSeriesResponse = wof_inst.create_get_values_response(
+                        location, variable, startDate, endDate)
+                    outStream = StringIO()
+                    timeSeriesResponse.export(
+                        outStream, 0, name_="timeSeriesResponse",
+                        namespacedef_=NSDEF,
+                        pretty_print=wof_inst.pretty_print)
+                    return outStream.getvalue()
+                return wof_inst.cached_response(
+                    'GetValues', create, site=location, variable=variable,
+                    start=startDate, end=endDate
+                )
             except Exception as inst:
                 if type(inst) == Fault:
                     raise inst
@@ -132,9 +155,7 @@ def TWOFService(wof_inst, T, T_name):
                 endDate,
                 authToken
             )
-            if T_name == wof._SERVICE_PARAMS["r_type"]:
-                return valuesResult
-            return valuesResult.replace('\n', '')
+            return valuesResult
 
     def _on_method_return_xml(ctx):
         # whatever etree element you return is the final xml
@@ -143,44 +164,38 @@ def TWOFService(wof_inst, T, T_name):
         # element that has that element removed and replaced with
         # its child, which was the original response
 
-        # TODO: how do we determine which method is being returned from?
-        # Since I don't know, I am doing a dumb test for each one
-
-        if 'xml' and 'soap' not in list(ctx.out_protocol.type):
+        if wof._SERVICE_PARAMS["s_type"] not in list(ctx.out_protocol.type):
             logger.info("protocol types: %s" % list(ctx.out_protocol.type))
             modify_return_xml_object(ctx)
             return ctx
 
-        if wof._SERVICE_PARAMS["s_type"] in list(ctx.out_protocol.type):
-            result_element_name_list = [
-                'GetSitesResult',
-                'GetSiteInfoObjectResult',
-                'GetVariableInfoObjectResult',
-                'GetValuesObjectResult']
-
-            element = ctx.out_document
-            for result_element_name in result_element_name_list:
-                result_element = element.find(
-                    './/{%s}%s' % (element.nsmap['tns'], result_element_name))
-
-                if result_element is not None:
-                    parent = result_element.getparent()
-                    children = result_element.getchildren()
-                    parent.replace(result_element, children[0])
-                    return ctx
-        return
+        method_name = ctx.descriptor.name
+        if method_name not in UNWRAPPED_RESULT_METHODS:
+            return ctx
+
+        # Walk Envelope/Body/<method>Response/<method>Result directly; the
+        # Body is the last child of the envelope, after an optional Header.
+        element = ctx.out_document
+        tns = element.nsmap['tns']
+        body_element = element[len(element) - 1]
+        if not len(body_element) or not len(body_element[0]):
+            return ctx
+        result_element = body_element[0][0]
+        if result_element.tag == '{%s}%sResult' % (tns, method_name) \
+                and len(result_element):
+            body_element[0].replace(result_element, result_element[0])
+        return ctx
 
     def modify_return_xml_object(ctx):
-        method_name = ctx._MethodContext__descriptor.name
+        if ctx.out_document is None:
+            # The document was written as-is by core.wofXmlDocument.
+            return ctx
+        method_name = ctx.descriptor.name
         logger.info("Modify WOF10 %s request" % method_name)
-        result_element_name = '%sResult' % method_name
-        element = ctx.out_document
-        result_element = element.find('.//{%s}%s' % (
-            element.nsmap['ns0'],
-            result_element_name)
-        )
-        children = result_element.getchildren()
-        ctx.out_document = children[0]
+        # The document is <method>Response/<method>Result/<response>.
+        response_element = ctx.out_document
+        if len(response_element) and len(response_element[0]):
+            ctx.out_document = response_element[0][0]
         return ctx
 
     WOFService.event_manager.add_listener(
@@ -8,7 +8,7 @@ from lxml import etree
 from spyne.decorator import rpc
 from spyne.model.complex import Array
 from spyne.model.fault import Fault
-from spyne.model.primitive import AnyXml, Boolean, Float, Unicode
+from spyne.model.primitive import AnyXml, Boolean, Float, Integer, Unicode
 from spyne.service import ServiceBase
 from spyne.util import memoize
 
@@ -20,9 +20,106 @@ logger = logging.getLogger(__name__)
 
 NSDEF = 'xmlns="http://www.cuahsi.org/waterML/1.1/"'
 
+# T_name of the REST service, which adds the paging, incremental and
+# aggregation parameters to the GetValues operations.
+REST_T_NAME = 'rest'
+
+# SOAP methods whose <method>Result element is replaced by its child.
+UNWRAPPED_RESULT_METHODS = frozenset([
+    'GetSitesObject',
+    'GetSiteInfoObject',
+    'GetVariableInfoObject',
+    'GetValuesObject',
+    'GetSitesByBoxObject',
+    'GetSiteInfoMultpleObject',
+    'GetVariablesObject',
+    'GetValuesForASiteObject',
+    'GetValuesMultipleObject',
+])
+
 
 @memoize
 def TWOFService(wof_inst, T, T_name):
+    def get_values_object(location, variable, startDate=None, endDate=None,
+                          pageSize=None, continuation=None, since=None,
+                          interval=None, statistic=None):
+        try:
+            def create():
+                timeSeriesResponse = wof_inst.create_get_values_response(
+                        location, variable, startDate, endDate,
+                        pageSize, continuation, since, interval,
+                        statistic)
+                outStream = io.StringIO()
+                timeSeriesResponse.export(
+                    outStream, 0, name_="timeSeriesResponse",
+                    namespacedef_=NSDEF,
+                    pretty_print=wof_inst.pretty_print)
+                return outStream.getvalue()
+            return wof_inst.cached_response(
+                'GetValues', create, site=location, variable=variable,
+                start=startDate, end=endDate, page_size=pageSize,
+                continuation=continuation, since=since,
+                interval=interval, statistic=statistic
+            )
+        except Exception as inst:
+            if type(inst) == Fault:
+                raise inst
+            else:
+                raise Fault(faultstring=str(inst))
+
+    def get_values_site_object(site, startDate=None, endDate=None,
+                               pageSize=None, continuation=None):
+        try:
+            def create():
+                timeSeriesResponse = \
+                    wof_inst.create_get_values_site_response(
+                        site, startDate, endDate, pageSize,
+                        continuation)
+                outStream = io.StringIO()
+                timeSeriesResponse.export(
+                    outStream, 0, name_="timeSeriesResponse",
+                    namespacedef_=NSDEF,
+                    pretty_print=wof_inst.pretty_print)
+                return outStream.getvalue()
+            return wof_inst.cached_response(
+                'GetValuesForASite', create, site=site, start=startDate,
+                end=endDate, page_size=pageSize,
+                continuation=continuation
+            )
+        except Exception as inst:
+            if type(inst) == Fault:
+                raise inst
+            else:
+                raise Fault(faultstring=str(inst))
+
+    def get_values_multiple_object(site, variable, startDate=None,
+                                   endDate=None, pageSize=None,
+                                   continuation=None):
+        siteArg = ','.join(str(s) for s in site or [])
+        varArg = ','.join(str(v) for v in variable or [])
+        try:
+            def create():
+                timeSeriesResponse = \
+                    wof_inst.create_get_values_multiple_response(
+                        siteArg, varArg, startDate, endDate, pageSize,
+                        continuation)
+                outStream = io.StringIO()
+                timeSeriesResponse.export(
+                    outStream, 0, name_="timeSeriesResponse",
+                    namespacedef_=NSDEF,
+                    pretty_print=wof_inst.pretty_print)
+                return outStream.getvalue()
+            return wof_inst.cached_response(
+                'GetValuesMultiple', create, site=siteArg,
+                variable=varArg, start=startDate, end=endDate,
+                page_size=pageSize, continuation=continuation
+            )
+        except Exception as inst:
+            if type(inst) == Fault:
+                raise inst
+            else:
+                raise Fault(faultstring=str(inst))
+
     class WOFService(ServiceBase):
 
         @rpc(Array(Unicode), Unicode, _returns=AnyXml)
@@ -34,11 +131,16 @@ def TWOFService(wof_inst, T, T_name):
                     siteArg = None
                 logging.debug(site)
                 logging.debug(siteArg)
-                siteResponse = wof_inst.create_get_site_response(siteArg)
-                outStream = io.StringIO()
-                siteResponse.export(outStream, 0, name_="sitesResponse",
-                                    namespacedef_=NSDEF)
-                return outStream.getvalue()
+
+                def create():
+                    siteResponse = wof_inst.create_get_site_response(siteArg)
+                    outStream = io.StringIO()
+                    siteResponse.export(outStream, 0, name_="sitesResponse",
+                                        namespacedef_=NSDEF,
+                                        pretty_print=wof_inst.pretty_print)
+                    return outStream.getvalue()
+                return wof_inst.cached_response('GetSites', create,
+                                                site=siteArg)
             except Exception as inst:
                 if type(inst) == Fault:
                     raise inst
@@ -49,21 +151,26 @@ def TWOFService(wof_inst, T, T_name):
         @rpc(Array(Unicode), Unicode, _returns=T)
         def GetSites(ctx, site=None, authToken=None):
             siteResult = WOFService.GetSitesObject(ctx, site, authToken)
-            if T_name == wof._SERVICE_PARAMS["r_type"]:
-                return siteResult
-            return siteResult.replace('\n', '')
+            return siteResult
 
         @rpc(Float, Float, Float, Float, Boolean, Unicode, _returns=AnyXml)
         def GetSitesByBoxObject(ctx, west, south, east, north,
                                 IncludeSeries, authToken=None):
             try:
-                siteResponse = wof_inst.create_get_site_box_response(
-                    west, south, east, north, IncludeSeries
+                def create():
+                    siteResponse = wof_inst.create_get_site_box_response(
+                        west, south, east, north, IncludeSeries
+                    )
+                    outStream = io.StringIO()
+                    siteResponse.export(outStream, 0, name_="sitesResponse",
+                                        namespacedef_=NSDEF,
+                                        pretty_print=wof_inst.pretty_print)
+                    return outStream.getvalue()
+                return wof_inst.cached_response(
+                    'GetSitesByBox', create, west=west, south=south,
+                    east=east, north=north,
+                    include_series=wof_inst.to_bool(IncludeSeries)
                 )
-                outStream = io.StringIO()
-                siteResponse.export(outStream, 0, name_="sitesResponse",
-                                    namespacedef_=NSDEF)
-                return outStream.getvalue()
             except Exception as inst:
                 if type(inst) == Fault:
                     raise inst
@@ -76,19 +183,23 @@ def TWOFService(wof_inst, T, T_name):
             sitesResult = WOFService.GetSitesByBoxObject(
                 ctx, west, south, east, north, IncludeSeries, authToken
             )
-            if T_name == wof._SERVICE_PARAMS["r_type"]:
-                return sitesResult
-            return sitesResult.replace('\n', '')
+            return sitesResult
 
         @rpc(Unicode, Unicode, _returns=AnyXml)
         def GetSiteInfoObject(ctx, site, authToken=None):
             try:
-                siteInfoResponse = wof_inst.create_get_site_info_response(site)
-                outStream = io.StringIO()
-                siteInfoResponse.export(
-                    outStream, 0, name_="sitesResponse", namespacedef_=NSDEF
-                )
-                return outStream.getvalue()
+                def create():
+                    siteInfoResponse = \
+                        wof_inst.create_get_site_info_response(site)
+                    outStream = io.StringIO()
+                    siteInfoResponse.export(
+                        outStream, 0, name_="sitesResponse",
+                        namespacedef_=NSDEF,
+                        pretty_print=wof_inst.pretty_print
+                    )
+                    return outStream.getvalue()
+                return wof_inst.cached_response('GetSiteInfo', create,
+                                                site=site)
             except Exception as inst:
                 if type(inst) == Fault:
                     raise inst
@@ -98,9 +209,7 @@ def TWOFService(wof_inst, T, T_name):
         @rpc(Unicode, Unicode, _returns=T)
         def GetSiteInfo(ctx, site, authToken=None):
             siteinfoResult = WOFService.GetSiteInfoObject(ctx, site, authToken)
-            if T_name == wof._SERVICE_PARAMS["r_type"]:
-                return siteinfoResult
-            return siteinfoResult.replace('\n', '')
+            return siteinfoResult
 
         @rpc(Array(Unicode), Unicode, _returns=AnyXml)
         def GetSiteInfoMultpleObject(ctx, site, authToken=None):
@@ -109,13 +218,19 @@ def TWOFService(wof_inst, T, T_name):
             else:
                 siteArg = None
             try:
-                siteInfoResponse = \
-                    wof_inst.create_get_site_info_multiple_response(siteArg)
-                outStream = io.StringIO()
-                siteInfoResponse.export(
-                    outStream, 0, name_="sitesResponse", namespacedef_=NSDEF
-                )
-                return outStream.getvalue()
+                def create():
+                    siteInfoResponse = \
+                        wof_inst.create_get_site_info_multiple_response(
+                            siteArg)
+                    outStream = io.StringIO()
+                    siteInfoResponse.export(
+                        outStream, 0, name_="sitesResponse",
+                        namespacedef_=NSDEF,
+                        pretty_print=wof_inst.pretty_print
+                    )
+                    return outStream.getvalue()
+                return wof_inst.cached_response('GetSiteInfoMultiple',
+                                                create, site=siteArg)
             except Exception as inst:
                 if type(inst) == Fault:
                     raise inst
@@ -125,20 +240,23 @@ def TWOFService(wof_inst, T, T_name):
         @rpc(Array(Unicode), Unicode, _returns=T)
         def GetSiteInfoMultple(ctx, site, authToken=None):
             sitesinfoResult = WOFService.GetSiteInfoMultpleObject(ctx, site, authToken)  # noqa
-            if T_name == wof._SERVICE_PARAMS["r_type"]:
-                return sitesinfoResult
-            return sitesinfoResult.replace('\n', '')
+            return sitesinfoResult
 
         @rpc(Unicode, Unicode, _returns=AnyXml)
         def GetVariableInfoObject(ctx, variable, authToken=None):
             try:
-                variableInfoResponse = \
-                    wof_inst.create_get_variable_info_response(variable)
-                outStream = io.StringIO()
-                variableInfoResponse.export(outStream, 0,
-                                            name_="variablesResponse",
-                                            namespacedef_=NSDEF)
-                return outStream.getvalue()
+                def create():
+                    variableInfoResponse = \
+                        wof_inst.create_get_variable_info_response(variable)
+                    outStream = io.StringIO()
+                    variableInfoResponse.export(
+                        outStream, 0, name_="variablesResponse",
+                        namespacedef_=NSDEF,
+                        pretty_print=wof_inst.pretty_print
+                    )
+                    return outStream.getvalue()
+                return wof_inst.cached_response('GetVariableInfo', create,
+                                                variable=variable)
             except Exception as inst:
                 if type(inst) == Fault:
                     raise inst
@@ -148,19 +266,22 @@ def TWOFService(wof_inst, T, T_name):
         @rpc(Unicode, Unicode, _returns=T)
         def GetVariableInfo(ctx, variable, authToken=None):
             varinfoResult = WOFService.GetVariableInfoObject(ctx, variable, authToken)  # noqa
-            if T_name == wof._SERVICE_PARAMS["r_type"]:
-                return varinfoResult
-            return varinfoResult.replace('\n', '')
+            return varinfoResult
 
         @rpc(Unicode, _returns=AnyXml)
         def GetVariablesObject(ctx, authToken=None):
             try:
-                variableInfoResponse = wof_inst.create_get_variable_info_response()  # noqa
-                outStream = io.StringIO()
-                variableInfoResponse.export(outStream, 0,
-                                            name_="variablesResponse",
-                                            namespacedef_=NSDEF)
-                return outStream.getvalue()
+                def create():
+                    variableInfoResponse = wof_inst.create_get_variable_info_response()  # noqa
+                    outStream = io.StringIO()
+                    variableInfoResponse.export(
+                        outStream, 0, name_="variablesResponse",
+                        namespacedef_=NSDEF,
+                        pretty_print=wof_inst.pretty_print
+                    )
+                    return outStream.getvalue()
+                return wof_inst.cached_response('GetVariableInfo', create,
+                                                variable=None)
             except Exception as inst:
                 if type(inst) == Fault:
                     raise inst
@@ -170,68 +291,85 @@ def TWOFService(wof_inst, T, T_name):
         @rpc(Unicode, _returns=T)
         def GetVariables(ctx, authToken=None):
             varsResult = WOFService.GetVariablesObject(ctx, authToken)
-            if T_name == wof._SERVICE_PARAMS["r_type"]:
-                return varsResult
-            return varsResult.replace('\n', '')
-
-        @rpc(Unicode, Unicode, Unicode, Unicode, Unicode, _returns=AnyXml)
-        def GetValuesObject(ctx, location, variable, startDate=None, endDate=None, authToken=None):  # noqa
-            try:
-                timeSeriesResponse = wof_inst.create_get_values_response(
-                        location, variable, startDate, endDate)
-                outStream = io.StringIO()
-                timeSeriesResponse.export(
-                    outStream, 0, name_="timeSeriesResponse",
-                    namespacedef_=NSDEF)
-                return outStream.getvalue()
-            except Exception as inst:
-                if type(inst) == Fault:
-                    raise inst
-                else:
-                    raise Fault(faultstring=str(inst))
-
-        @rpc(Unicode, Unicode, Unicode, Unicode, Unicode, _returns=T)
-        def GetValues(ctx, location, variable, startDate=None, endDate=None, authToken=None):  # noqa
-            valuesResult = WOFService.GetValuesObject(
-                ctx,
-                location,
-                variable,
-                startDate,
-                endDate,
-                authToken
-            )
-            if T_name == wof._SERVICE_PARAMS["r_type"]:
-                return valuesResult
-            return valuesResult.replace('\n', '')
-
-        @rpc(Unicode, Unicode, Unicode, Unicode, _returns=AnyXml)
-        def GetValuesForASiteObject(ctx, site, startDate=None, endDate=None, authToken=None):  # noqa
-            try:
-                timeSeriesResponse = wof_inst.create_get_values_site_response(
-                        site, startDate, endDate)
-                outStream = io.StringIO()
-                timeSeriesResponse.export(
-                    outStream, 0, name_="timeSeriesResponse",
-                    namespacedef_=NSDEF)
-                return outStream.getvalue()
-            except Exception as inst:
-                if type(inst) == Fault:
-                    raise inst
-                else:
-                    raise Fault(faultstring=str(inst))
-
-        @rpc(Unicode, Unicode, Unicode, Unicode, _returns=T)
-        def GetValuesForASite(ctx, site, startDate, endDate, authToken=None):
-            valuesResult = WOFService.GetValuesForASiteObject(
-                ctx,
-                site,
-                startDate,
-                endDate,
-                authToken
-            )
-            if T_name == wof._SERVICE_PARAMS["r_type"]:
-                return valuesResult
-            return valuesResult.replace('\n', '')
+            return varsResult
+
+        # The standard WaterOneFlow 1.1 SOAP operations keep their
+        # parameters; the REST service adds pageSize and continuation, which
+        # page the values, see WOF_1_1.get_values_series, since, which only
+        # returns the values added after a watermark, see
+        # WOF_1_1.get_values_since_series, and interval and statistic, which
+        # aggregate the values, see WOF_1_1.get_values_aggregate_series.
+        if T_name == REST_T_NAME:
+            @rpc(Unicode, Unicode, Unicode, Unicode, Unicode, Integer,
+                 Unicode, Unicode, Unicode, Unicode, _returns=AnyXml)
+            def GetValuesObject(ctx, location, variable, startDate=None, endDate=None, authToken=None, pageSize=None, continuation=None, since=None, interval=None, statistic=None):  # noqa
+                return get_values_object(location, variable, startDate,
+                                         endDate, pageSize, continuation,
+                                         since, interval, statistic)
+
+            @rpc(Unicode, Unicode, Unicode, Unicode, Unicode, Integer,
+                 Unicode, Unicode, Unicode, Unicode, _returns=T)
+            def GetValues(ctx, location, variable, startDate=None, endDate=None, authToken=None, pageSize=None, continuation=None, since=None, interval=None, statistic=None):  # noqa
+                return get_values_object(location, variable, startDate,
+                                         endDate, pageSize, continuation,
+                                         since, interval, statistic)
+
+            @rpc(Unicode, Unicode, Unicode, Unicode, Integer, Unicode,
+                 _returns=AnyXml)
+            def GetValuesForASiteObject(ctx, site, startDate=None, endDate=None, authToken=None, pageSize=None, continuation=None):  # noqa
+                return get_values_site_object(site, startDate, endDate,
+                                              pageSize, continuation)
+
+            @rpc(Unicode, Unicode, Unicode, Unicode, Integer, Unicode,
+                 _returns=T)
+            def GetValuesForASite(ctx, site, startDate, endDate, authToken=None, pageSize=None, continuation=None):  # noqa
+                return get_values_site_object(site, startDate, endDate,
+                                              pageSize, continuation)
+
+            @rpc(Array(Unicode), Array(Unicode), Unicode, Unicode, Unicode,
+                 Integer, Unicode, _returns=AnyXml)
+            def GetValuesMultipleObject(ctx, site, variable, startDate=None, endDate=None, authToken=None, pageSize=None, continuation=None):  # noqa
+                return get_values_multiple_object(site, variable, startDate,
+                                                  endDate, pageSize,
+                                                  continuation)
+
+            @rpc(Array(Unicode), Array(Unicode), Unicode, Unicode, Unicode,
+                 Integer, Unicode, _returns=T)
+            def GetValuesMultiple(ctx, site, variable, startDate=None, endDate=None, authToken=None, pageSize=None, continuation=None):  # noqa
+                return get_values_multiple_object(site, variable, startDate,
+                                                  endDate, pageSize,
+                                                  continuation)
+        else:
+            @rpc(Unicode, Unicode, Unicode, Unicode, Unicode,
+                 _returns=AnyXml)
+            def GetValuesObject(ctx, location, variable, startDate=None, endDate=None, authToken=None):  # noqa
+                return get_values_object(location, variable, startDate,
+                                         endDate)
+
+            @rpc(Unicode, Unicode, Unicode, Unicode, Unicode, _returns=T)
+            def GetValues(ctx, location, variable, startDate=None, endDate=None, authToken=None):  # noqa
+                return get_values_object(location, variable, startDate,
+                                         endDate)
+
+            @rpc(Unicode, Unicode, Unicode, Unicode, _returns=AnyXml)
+            def GetValuesForASiteObject(ctx, site, startDate=None, endDate=None, authToken=None):  # noqa
+                return get_values_site_object(site, startDate, endDate)
+
+            @rpc(Unicode, Unicode, Unicode, Unicode, _returns=T)
+            def GetValuesForASite(ctx, site, startDate, endDate, authToken=None):  # noqa
+                return get_values_site_object(site, startDate, endDate)
+
+            @rpc(Array(Unicode), Array(Unicode), Unicode, Unicode, Unicode,
+                 _returns=AnyXml)
+            def GetValuesMultipleObject(ctx, site, variable, startDate=None, endDate=None, authToken=None):  # noqa
+                return get_values_multiple_object(site, variable, startDate,
+                                                  endDate)
+
+            @rpc(Array(Unicode), Array(Unicode), Unicode, Unicode, Unicode,
+                 _returns=T)
+            def GetValuesMultiple(ctx, site, variable, startDate=None, endDate=None, authToken=None):  # noqa
+                return get_values_multiple_object(site, variable, startDate,
+                                                  endDate)
 
     def _on_method_return_xml(ctx):
         # whatever etree element you return is the final xml
@@ -240,100 +378,85 @@ def TWOFService(wof_inst, T, T_name):
         # element that has that element removed and replaced with
         # its child, which was the original response
 
-        # TODO: how do we determine which method is being returned from?
-        # Since I don't know, I am doing a dumb test for each one
-
-        if 'xml' and 'soap' not in list(ctx.out_protocol.type):
+        if wof._SERVICE_PARAMS["s_type"] not in list(ctx.out_protocol.type):
             logger.info("protocol types: %s" % list(ctx.out_protocol.type))
             modify_return_xml_object(ctx)
             return ctx
 
-        if ctx._MethodContext__descriptor.name == 'GetValuesObject':
+        method_name = ctx.descriptor.name
+        if method_name == 'GetValuesObject':
             modify_method_getValueObject(ctx)
             return ctx
-        if ctx._MethodContext__descriptor.name == 'GetVariableInfoObject':
+        if method_name == 'GetVariableInfoObject':
             modify_method_getVariableInfoObject(ctx)
             return ctx
 
-        if wof._SERVICE_PARAMS["s_type"] in list(ctx.out_protocol.type):
-            result_element_name_list = [
-                'GetSitesObjectResult',
-                'GetSiteInfoObjectResult',
-                'GetVariableInfoObjectResult',
-                'GetValuesObjectResult',
-                'GetSitesByBoxObjectResult',
-                'GetSiteInfoMultpleObjectResult',
-                'GetVariablesObjectResult',
-                'GetValuesForASiteObjectResult']
-            element = ctx.out_document
-            for result_element_name in result_element_name_list:
-                result_element = element.find(
-                        './/{%s}%s' % (
-                            element.nsmap['tns'],
-                            result_element_name
-                        )
-                )
-
-                if result_element is not None:
-                    parent = result_element.getparent()
-                    children = result_element.getchildren()
-                    parent.replace(result_element, children[0])
-                    return ctx
-        return
+        if method_name in UNWRAPPED_RESULT_METHODS:
+            response_element, result_element = get_soap_result_element(ctx)
+            if result_element is not None:
+                response_element.replace(result_element, result_element[0])
+        return ctx
 
-    def modify_method_getValueObject(ctx):
-        logger.info("Modify WOF11 GetValuesObject request")
-        result_element_name = 'GetValuesObjectResult'
-        response_element_name = 'GetValuesObjectResponse'
+    def get_soap_result_element(ctx):
+        """
+        Returns the <method>Response and <method>Result elements of a SOAP
+        response, walking Envelope/Body/Response/Result by direct child
+        access so the cost does not depend on the size of the result.
+        """
+        method_name = ctx.descriptor.name
+        element = ctx.out_document
+        tns = element.nsmap['tns']
+        # Body is the last child of the envelope, after an optional Header.
+        body_element = element[len(element) - 1]
+        if not len(body_element):
+            return None, None
+        response_element = body_element[0]
+        if response_element.tag != '{%s}%sResponse' % (tns, method_name) \
+                or not len(response_element):
+            return None, None
+        result_element = response_element[0]
+        if result_element.tag != '{%s}%sResult' % (tns, method_name) \
+                or not len(result_element):
+            return None, None
+        return response_element, result_element
+
+    def wrap_soap_result(ctx, wrapping_element_name):
+        """
+        Replaces the <method>Response element with wrapping_element_name
+        holding the WaterML document from the result element.
+        """
         WML_NAMESPACE = "http://www.cuahsi.org/waterML/1.1/"
         WML = "{%s}" % WML_NAMESPACE
         NSMAP = {None: WML_NAMESPACE}
-        wrappingElement = etree.Element(WML + "TimeSeriesResponse", nsmap=NSMAP)  # noqa
 
-        element = ctx.out_document
-        element.nsmap[None] = NSMAP
-        response_element = element.find('.//{%s}%s' % (element.nsmap['tns'], response_element_name))  # noqa
-        result_element=element.find('.//{%s}%s' % (element.nsmap['tns'], result_element_name))  # noqa
+        response_element, result_element = get_soap_result_element(ctx)
+        if result_element is None:
+            return ctx
+        wrappingElement = etree.Element(WML + wrapping_element_name,
+                                        nsmap=NSMAP)
+        wrappingElement.append(result_element[0])
         parent = response_element.getparent()
-        parent.append(wrappingElement)  # Add to tree.
-        children = result_element.getchildren()
-        wrappingElement.append(children[0])
-        # parent.replace(result_element, children[0])
-
-        parent.remove(response_element)
-
+        parent.replace(response_element, wrappingElement)
         return ctx
 
+    def modify_method_getValueObject(ctx):
+        logger.info("Modify WOF11 GetValuesObject request")
+        return wrap_soap_result(ctx, "TimeSeriesResponse")
+
     def modify_method_getVariableInfoObject(ctx):
         logger.info("Modify WOF11 VariableInfoObject request")
-        result_element_name = 'GetVariableInfoObjectResult'
-        response_element_name = 'GetVariableInfoObjectResponse'
-        WML_NAMESPACE = "http://www.cuahsi.org/waterML/1.1/"
-        WML = "{%s}" % WML_NAMESPACE
-        NSMAP = {None: WML_NAMESPACE}
-        wrappingElement = etree.Element(WML + "VariablesResponse", nsmap=NSMAP)  # noqa
-
-        element = ctx.out_document
-        element.nsmap[None] = NSMAP
-        response_element = element.find('.//{%s}%s' % (element.nsmap['tns'], response_element_name))  # noqa
-        result_element=element.find('.//{%s}%s' % (element.nsmap['tns'], result_element_name))  # noqa
-        parent = response_element.getparent()
-        parent.append(wrappingElement)  # Add to tree.
-        children = result_element.getchildren()
-        wrappingElement.append(children[0])
-        # parent.replace(result_element, children[0])
-        parent.remove(response_element)
-
-        return ctx
+        return wrap_soap_result(ctx, "VariablesResponse")
 
     def modify_return_xml_object(ctx):
-        method_name = ctx._MethodContext__descriptor.name
+        if ctx.out_document is None:
+            # The document was written as-is by core.wofXmlDocument.
+            return ctx
+        method_name = ctx.descriptor.name
         logger.info("Modify WOF11 %s request" % method_name)
-        result_element_name = '%sResult' % method_name
-        element = ctx.out_document
-        result_element = element.find('.//{%s}%s' % (element.nsmap['ns0'], result_element_name))  # noqa
-        children = result_element.getchildren()
-        ctx.out_document = children[0]
+        # The document is <method>Response/<method>Result/<response>.
+        response_element = ctx.out_document
+        if len(response_element) and len(response_element[0]):
+            ctx.out_document = response_element[0][0]
         return ctx
 
     WOFService.event_manager.add_listener(
@@ -0,0 +1,140 @@
+from __future__ import (absolute_import, division, print_function)
+
+import logging
+
+from six.moves.urllib.parse import parse_qs
+from xml.sax.saxutils import escape
+
+logger = logging.getLogger(__name__)
+
+XML_DECLARATION = u"<?xml version='1.0' encoding='UTF-8'?>\n"
+
+FAULT_TEMPLATE = (
+    u'<soap11env:Fault '
+    u'xmlns:soap11env="http://schemas.xmlsoap.org/soap/envelope/">'
+    u'<faultcode>soap11env:{code}</faultcode>'
+    u'<faultstring>{message}</faultstring>'
+    u'<faultactor></faultactor>'
+    u'</soap11env:Fault>'
+)
+
+
+class GetValuesStreamApplication(object):
+    """
+    WSGI application answering WaterML 1.1 REST GetValues requests with a
+    streamed response.
+
+    The timeSeriesResponse document is encoded and handed to the server in
+    chunks while the data values are read, instead of being exported to a
+    string first, so the time to first byte and the memory used do not grow
+    with the size of the series.
+    """
+
+    def __init__(self, wof_inst, chunk_size=65536, pretty_print=True,
+                 encoding='utf-8'):
+        self.wof_inst = wof_inst
+        self.chunk_size = chunk_size
+        self.pretty_print = pretty_print
+        self.encoding = encoding
+
+    def __call__(self, environ, start_response):
+        args = parse_qs(environ.get('QUERY_STRING', ''))
+        # The data values are queried by create_stream, and the first chunk
+        # is pulled before starting the response, so that invalid requests
+        # become Client faults and errors of the data source Server faults.
+        try:
+            chunks = self.create_stream(args)
+            first_chunk = next(chunks)
+        except ValueError as inst:
+            return self._fault(start_response, '400 Bad Request', 'Client',
+                               str(inst))
+        except Exception as inst:
+            logger.error('GetValues stream failed: %s' % inst)
+            return self._fault(start_response, '500 Internal Server Error',
+                               'Server', str(inst))
+
+        start_response('200 OK', [
+            ('Content-Type', 'text/xml; charset=%s' % self.encoding)
+        ])
+        return self._iter_encoded(first_chunk, chunks)
+
+    def create_stream(self, args):
+        """
+        Returns the generator of the response chunks for the parsed query
+        string args, raising ValueError when an arg is missing or invalid.
+        """
+        location = self._get_arg(args, 'location')
+        variable = self._get_arg(args, 'variable')
+        startDate = self._get_arg(args, 'startDate')
+        endDate = self._get_arg(args, 'endDate')
+        pageSize = self._get_arg(args, 'pageSize')
+        continuation = self._get_arg(args, 'continuation')
+        since = self._get_arg(args, 'since')
+        interval = self._get_arg(args, 'interval')
+        statistic = self._get_arg(args, 'statistic')
+
+        if location is None or variable is None:
+            raise ValueError('location and variable are required')
+
+        return self.wof_inst.create_get_values_stream(
+            location, variable, startDate, endDate,
+            chunk_size=self.chunk_size,
+            pretty_print=self.pretty_print,
+            pageSize=pageSize,
+            continuation=continuation,
+            since=since,
+            interval=interval,
+            statistic=statistic
+        )
+
+    def _iter_encoded(self, first_chunk, chunks):
+        yield (XML_DECLARATION + first_chunk).encode(self.encoding)
+        for chunk in chunks:
+            yield chunk.encode(self.encoding)
+
+    def _get_arg(self, args, name):
+        values = args.get(name)
+        if not values:
+            return None
+        return values[0]
+
+    def _fault(self, start_response, status, code, message):
+        body = XML_DECLARATION + FAULT_TEMPLATE.format(
+            code=code, message=escape(message))
+        start_response(status, [
+            ('Content-Type', 'text/xml; charset=%s' % self.encoding)
+        ])
+        return [body.encode(self.encoding)]
+
+
+class GetValuesMultipleStreamApplication(GetValuesStreamApplication):
+    """
+    WSGI application answering WaterML 1.1 REST GetValuesMultiple requests
+    with a streamed response. The site and variable args may be repeated or
+    hold comma separated lists.
+    """
+
+    def create_stream(self, args):
+        site = self._get_list_arg(args, 'site')
+        variable = self._get_list_arg(args, 'variable')
+        startDate = self._get_arg(args, 'startDate')
+        endDate = self._get_arg(args, 'endDate')
+        pageSize = self._get_arg(args, 'pageSize')
+        continuation = self._get_arg(args, 'continuation')
+
+        if site is None or variable is None:
+            raise ValueError('site and variable are required')
+
+        return self.wof_inst.create_get_values_multiple_stream(
+            site, variable, startDate, endDate,
+            chunk_size=self.chunk_size,
+            pretty_print=self.pretty_print,
+            pageSize=pageSize,
+            continuation=continuation
+        )
+
+    def _get_list_arg(self, args, name):
+        values = args.get(name)
+        if not values:
+            return None
+        return ','.join(values)
@@ -11,10 +11,10 @@ from spyne.model.primitive import Unicode, AnyXml, Float, Boolean
 from spyne.service import ServiceBase
 from spyne.model.fault import Fault
 from spyne.util import memoize
-from dateutil.parser import parse
 from jinja2 import Environment, Template, PackageLoader, FileSystemLoader
 
 import wof
+from wof import isodates
 
 logger = logging.getLogger(__name__)
 
@@ -91,7 +91,7 @@ def TWOFService(wof_inst,T, T_name):
 def isoformat(value, format='%Y-%m-%dT%H:%M:%S%z'):
     if isinstance(value, str):
         try:
-            value = parse(value)
+            value = isodates.parse(value)
         except:
             raise Exception('error converting string to  datetime: ' + value)
 
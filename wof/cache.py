@@ -0,0 +1,310 @@
+from __future__ import (absolute_import, division, print_function)
+
+import collections
+import hashlib
+import logging
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from wof import isodates
+
+logger = logging.getLogger(__name__)
+
+# Service methods grouped by the [Cache] TTL option that applies to them.
+TTL_OPTIONS = {
+    'Sites_TTL': ('GetSites', 'GetSitesByBox'),
+    'SiteInfo_TTL': ('GetSiteInfo', 'GetSiteInfoMultiple'),
+    'Variables_TTL': ('GetVariableInfo',),
+    'Values_TTL': ('GetValues', 'GetValuesForASite', 'GetValuesMultiple'),
+}
+
+_MISSING = object()
+
+
+def normalize_datetime(value):
+    """
+    Returns an ISO 8601 form of a date argument, so that equivalent
+    spellings of the same instant share a cache key.
+    """
+    if value is None or value == '':
+        return None
+    try:
+        return isodates.parse(value).isoformat()
+    except (ValueError, OverflowError, TypeError):
+        return value
+
+
+def normalize_query(wof_inst, method, args):
+    """
+    Returns the cache key of a service method call, or None when the call
+    should not be cached.
+
+    Site and variable arguments have the network and vocabulary prefix
+    removed with the get_site_code and get_variable_code methods of
+    wof_inst, and start and end dates are canonicalized.
+    """
+    key = [method]
+    for name in sorted(args):
+        value = args[name]
+        if value is None or value == '':
+            value = None
+        elif name in ('site', 'variable'):
+            if name == 'site':
+                get_code = wof_inst.get_site_code
+            else:
+                get_code = wof_inst.get_variable_code
+            codes = tuple(get_code(code.strip()) for code in value.split(','))
+            if None in codes:
+                # Codes from another network or vocabulary are answered with
+                # an error or an empty response echoing the argument.
+                return None
+            value = codes
+        elif name in ('start', 'end'):
+            value = normalize_datetime(value)
+        key.append((name, value))
+    return tuple(key)
+
+
+class ResponseCache(object):
+    """
+    Bounded LRU cache of WaterOneFlow responses with per-method time to live.
+
+    Entries are keyed by the normalized query from normalize_query. The
+    cache holds at most max_entries responses and max_bytes in all, the
+    summed len of the responses, and responses longer than max_entry_bytes
+    are not cached (None for no limit). The hits and misses attributes
+    count lookups since the cache was created or last cleared.
+    """
+
+    def __init__(self, max_entries=256, default_ttl=300, ttls=None,
+                 timer=time.time, max_bytes=None, max_entry_bytes=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self.size = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_ttl(self, method):
+        return self.ttls.get(method, self.default_ttl)
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                if entry[0] > self.timer():
+                    self._entries[key] = entry
+                    self.hits += 1
+                    return entry[1]
+                self.size -= len(entry[1])
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        ttl = self.get_ttl(key[0])
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        size = len(value)
+        if (self.max_entry_bytes is not None and
+                size > self.max_entry_bytes) or \
+                (self.max_bytes is not None and size > self.max_bytes):
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old[1])
+            self._entries[key] = (self.timer() + ttl, value)
+            self.size += size
+            while len(self._entries) > self.max_entries or (
+                    self.max_bytes is not None and
+                    self.size > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted[1])
+
+    def get_or_create(self, key, creator):
+        """
+        Returns the cached response of key, or the result of creator(),
+        which is stored. Exceptions raised by creator are not cached.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = creator()
+            self.set(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'bytes': self.size,
+                'max_bytes': self.max_bytes,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class _Call(object):
+    """
+    A single-flight computation, shared by the calls waiting on it.
+    """
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """
+    Coalesces concurrent calls with the same key: the first call runs its
+    creator, and identical calls arriving while it runs wait for it and
+    share its result, or its exception, instead of running their own.
+
+    Within a process, calls are coalesced across threads. With lock_dir,
+    processes sharing that directory, e.g. the workers of a uwsgi server,
+    are coalesced as well: the process holding the lock file of a key
+    computes the response and writes it next to the lock file, and the
+    processes that waited on the lock read it instead of computing it
+    again. Only string results are shared between processes. namespace
+    separates the keys of services sharing a lock_dir, and result files
+    are removed once they are result_ttl seconds old.
+
+    The shared attribute counts the calls answered with the result of
+    another call.
+    """
+
+    def __init__(self, lock_dir=None, namespace='', result_ttl=60,
+                 timer=time.time):
+        if lock_dir is not None and fcntl is None:
+            logger.warning('Lock files are not supported on this platform, '
+                           'requests are only coalesced within a process')
+            lock_dir = None
+        self.lock_dir = lock_dir
+        self.namespace = namespace
+        self.result_ttl = result_ttl
+        self.timer = timer
+        self.shared = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._pruned_at = None
+
+    def do(self, key, creator):
+        """
+        Returns creator(), or the result of the identical call in flight.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            with self._lock:
+                self.shared += 1
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            if self.lock_dir is None:
+                call.value = creator()
+            else:
+                call.value = self._do_shared(key, creator)
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.value
+
+    def _do_shared(self, key, creator):
+        name = hashlib.sha1(
+            repr((self.namespace, key)).encode('utf-8')).hexdigest()
+        path = os.path.join(self.lock_dir, name)
+        lock_path = path + '.lock'
+        result_path = path + '.result'
+        started = self.timer()
+        while True:
+            with open(lock_path, 'a') as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                value = self._read_result(result_path, started)
+                if value is not None:
+                    with self._lock:
+                        self.shared += 1
+                    return value
+                try:
+                    current = (os.fstat(lock_file.fileno()).st_ino ==
+                               os.stat(lock_path).st_ino)
+                except OSError:
+                    current = False
+                if not current:
+                    # The process that held the lock removed this lock file
+                    # and had no result to share, lock the new one.
+                    continue
+                try:
+                    value = creator()
+                    if isinstance(value, str):
+                        self._write_result(result_path, value)
+                finally:
+                    # Removed while locked, processes waiting on it read
+                    # the result or move on to a new lock file.
+                    os.unlink(lock_path)
+                return value
+
+    def _read_result(self, result_path, started):
+        try:
+            with open(result_path, 'rb') as f:
+                # Only results completed after this call started answer it.
+                if os.fstat(f.fileno()).st_mtime < started:
+                    return None
+                return f.read().decode('utf-8')
+        except (IOError, OSError):
+            return None
+
+    def _write_result(self, result_path, value):
+        temp_path = '{0}.{1}'.format(result_path, os.getpid())
+        with open(temp_path, 'wb') as f:
+            f.write(value.encode('utf-8'))
+        os.rename(temp_path, result_path)
+        self._prune_results()
+
+    def _prune_results(self):
+        now = self.timer()
+        if self._pruned_at is not None and \
+                now - self._pruned_at < self.result_ttl:
+            return
+        self._pruned_at = now
+        for name in os.listdir(self.lock_dir):
+            if not name.endswith('.result'):
+                continue
+            path = os.path.join(self.lock_dir, name)
+            try:
+                if now - os.stat(path).st_mtime >= self.result_ttl:
+                    os.unlink(path)
+            except OSError:
+                pass
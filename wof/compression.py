@@ -0,0 +1,265 @@
+from __future__ import (absolute_import, division, print_function)
+
+import collections
+import hashlib
+import logging
+import threading
+import zlib
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_TYPES = ('text/', 'application/xml', 'application/soap+xml',
+                      'application/json')
+
+# zlib wbits selecting the container of each content coding: gzip uses the
+# gzip header and trailer, and HTTP "deflate" is the zlib format.
+_WBITS = {
+    'gzip': 16 + zlib.MAX_WBITS,
+    'deflate': zlib.MAX_WBITS,
+}
+
+
+def parse_accept_encoding(accept_encoding):
+    """
+    Returns the preferred supported content coding ('gzip' or 'deflate')
+    of an Accept-Encoding header, or None.
+    """
+    if not accept_encoding:
+        return None
+    qualities = {}
+    for item in accept_encoding.split(','):
+        parts = item.strip().split(';')
+        coding = parts[0].strip().lower()
+        quality = 1.0
+        for param in parts[1:]:
+            name, _, value = param.strip().partition('=')
+            if name.strip() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    best = None
+    for coding in ('gzip', 'deflate'):
+        quality = qualities.get(coding, qualities.get('*', 0.0))
+        if quality > 0 and (best is None or quality > best[1]):
+            best = (coding, quality)
+    return best and best[0]
+
+
+class CompressedBodyCache(object):
+    """
+    LRU store of compressed response bodies, keyed by the content coding and
+    a digest of the uncompressed body, so an identical response is only
+    compressed once. It holds at most max_bytes compressed bytes in all.
+
+    Response bodies only repeat while they are served from the response
+    cache, as they hold their creation time, so the body cache is only
+    useful along with the response cache.
+    """
+
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, coding, body):
+        return (coding, hashlib.sha1(body).hexdigest())
+
+    def get(self, key):
+        with self._lock:
+            compressed = self._entries.pop(key, None)
+            if compressed is not None:
+                self._entries[key] = compressed
+            return compressed
+
+    def set(self, key, compressed):
+        if len(compressed) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._entries[key] = compressed
+            self.size += len(compressed)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+
+class CompressionMiddleware(object):
+    """
+    WSGI middleware that gzip or deflate encodes responses for clients
+    sending a matching Accept-Encoding header.
+
+    Responses with a Content-Length are compressed in one pass, and with a
+    body_cache the compressed bytes are kept in that CompressedBodyCache,
+    which may be shared by several middlewares, so repeated responses skip
+    recompression. Responses without a Content-Length, like the streamed
+    GetValues response, are compressed and flushed chunk by chunk. Bodies
+    smaller than min_size are sent as they are. Every compressible response
+    gets a Vary: Accept-Encoding header, compressed or not.
+    """
+
+    def __init__(self, application, level=6, min_size=1024,
+                 body_cache=None):
+        self.application = application
+        self.level = level
+        self.min_size = min_size
+        self.body_cache = body_cache
+
+    def __getattr__(self, name):
+        # Expose the wrapped application's attributes, e.g. the spyne
+        # WsgiApplication.app used by wof.flask.site_map_flask_wsgi_mount.
+        if name == 'application':
+            raise AttributeError(name)
+        return getattr(self.application, name)
+
+    def __call__(self, environ, start_response):
+        if environ.get('REQUEST_METHOD') == 'HEAD':
+            return self.application(environ, start_response)
+        coding = parse_accept_encoding(environ.get('HTTP_ACCEPT_ENCODING'))
+
+        response = {}
+        buffered = []
+
+        def _start_response(status, headers, exc_info=None):
+            response['status'] = status
+            response['headers'] = headers
+            response['exc_info'] = exc_info
+            return buffered.append
+
+        result = self.application(environ, _start_response)
+        app_iter = self._chain([], result)
+
+        if 'status' not in response:
+            # The application only calls start_response when its iterable is
+            # first advanced, so pull the first chunk to see the headers.
+            try:
+                buffered.append(next(app_iter))
+            except StopIteration:
+                pass
+        if 'status' not in response:
+            # An empty body without a response started, pass it through.
+            return buffered
+
+        status = response['status']
+        headers = response['headers']
+        if not self._is_compressible(status, headers):
+            start_response(status, headers, response['exc_info'])
+            return self._chain(buffered, app_iter)
+
+        # Compressible responses vary on Accept-Encoding whether they are
+        # compressed or not, so shared caches keep one body per coding.
+        if coding is None:
+            start_response(status, self._vary_headers(headers),
+                           response['exc_info'])
+            return self._chain(buffered, app_iter)
+
+        content_length = self._get_header(headers, 'content-length')
+        if content_length is not None:
+            if int(content_length) < self.min_size:
+                start_response(status, self._vary_headers(headers),
+                               response['exc_info'])
+                return self._chain(buffered, app_iter)
+            body = b''.join(self._chain(buffered, app_iter))
+            compressed = self.compress_body(coding, body)
+            start_response(status,
+                           self._compressed_headers(headers, coding,
+                                                    len(compressed)),
+                           response['exc_info'])
+            return [compressed]
+
+        # No Content-Length: buffer up to min_size to decide, then stream.
+        app_iter = self._chain(buffered, app_iter)
+        head = []
+        head_size = 0
+        for chunk in app_iter:
+            head.append(chunk)
+            head_size += len(chunk)
+            if head_size >= self.min_size:
+                break
+        else:
+            start_response(status, self._vary_headers(headers),
+                           response['exc_info'])
+            return head
+
+        start_response(status,
+                       self._compressed_headers(headers, coding, None),
+                       response['exc_info'])
+        return self._compress_stream(coding, head, app_iter)
+
+    def compress_body(self, coding, body):
+        """Returns body compressed with coding, using the body cache."""
+        body_cache = self.body_cache
+        if body_cache is not None:
+            key = body_cache.key(coding, body)
+            compressed = body_cache.get(key)
+            if compressed is not None:
+                return compressed
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED,
+                                      _WBITS[coding])
+        compressed = compressor.compress(body) + compressor.flush()
+        if body_cache is not None:
+            body_cache.set(key, compressed)
+        return compressed
+
+    def _compress_stream(self, coding, head, app_iter):
+        # Each chunk of the application is sync flushed, so the client gets
+        # it as soon as it is produced instead of when zlib's window fills.
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED,
+                                      _WBITS[coding])
+        try:
+            yield (compressor.compress(b''.join(head)) +
+                   compressor.flush(zlib.Z_SYNC_FLUSH))
+            for chunk in app_iter:
+                if chunk:
+                    yield (compressor.compress(chunk) +
+                           compressor.flush(zlib.Z_SYNC_FLUSH))
+            yield compressor.flush()
+        finally:
+            if hasattr(app_iter, 'close'):
+                app_iter.close()
+
+    def _chain(self, buffered, app_iter):
+        for chunk in buffered:
+            yield chunk
+        try:
+            for chunk in app_iter:
+                yield chunk
+        finally:
+            if hasattr(app_iter, 'close'):
+                app_iter.close()
+
+    def _is_compressible(self, status, headers):
+        if not status.startswith('200'):
+            return False
+        if self._get_header(headers, 'content-encoding') is not None:
+            return False
+        content_type = self._get_header(headers, 'content-type') or ''
+        return content_type.lower().startswith(COMPRESSIBLE_TYPES)
+
+    def _vary_headers(self, headers):
+        new_headers = [(name, value) for name, value in headers
+                       if name.lower() != 'vary']
+        vary = self._get_header(headers, 'vary')
+        if vary and 'accept-encoding' not in vary.lower():
+            vary = vary + ', Accept-Encoding'
+        new_headers.append(('Vary', vary or 'Accept-Encoding'))
+        return new_headers
+
+    def _compressed_headers(self, headers, coding, content_length):
+        new_headers = [(name, value) for name, value
+                       in self._vary_headers(headers)
+                       if name.lower() != 'content-length']
+        new_headers.append(('Content-Encoding', coding))
+        if content_length is not None:
+            new_headers.append(('Content-Length', str(content_length)))
+        return new_headers
+
+    def _get_header(self, headers, name):
+        for header_name, value in headers:
+            if header_name.lower() == name:
+                return value
+        return None
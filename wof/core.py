@@ -7,8 +7,6 @@ import logging
 import os
 import urllib
 
-from dateutil.parser import parse
-
 from spyne.application import Application
 from spyne.const.http import HTTP_405
 from spyne.error import RequestNotAllowed
@@ -33,7 +31,12 @@ from lxml.etree import XMLSyntaxError
 from wof.WofWsdls import WofWSDL_1_0, WofWSDL_1_1
 from wof.apps.spyned_1_0 import TWOFService as wml10
 from wof.apps.spyned_1_1 import TWOFService as wml11
+from wof.apps.streaming import (GetValuesMultipleStreamApplication,
+                                GetValuesStreamApplication)
 from wof.apps.waterml2 import TWOFService as wml2
+from wof.cache import TTL_OPTIONS
+from wof.compression import CompressedBodyCache, CompressionMiddleware
+from wof import isodates
 
 
 logging.getLogger('werkzeug').setLevel(logging.CRITICAL)
@@ -117,6 +120,45 @@ class WOFConfig(object):
         phone = '555-555-555'
         link = 'http://www.example.com/'
 
+        pretty_print = False
+        # Streamed REST GetValues and GetValuesMultiple responses are never
+        # held whole in memory, so they bypass the response cache and
+        # single flight of the [Cache] section: with Stream_GetValues on,
+        # every such request reads its values from the data source.
+        stream_getvalues = False
+        stream_chunk_size = 65536
+        fetch_workers = 0
+        max_values_per_response = None
+        max_multiple_pairs = 100
+
+        compression = False
+        compression_level = 6
+        compression_min_size = 1024
+        compression_cache_max_bytes = 32 * 1024 * 1024
+
+        cache = False
+        cache_max_entries = 256
+        cache_max_bytes = 64 * 1024 * 1024
+        cache_max_entry_bytes = 4 * 1024 * 1024
+        cache_ttl = 300
+        cache_ttls = {}
+        fragment_cache = False
+        fragment_cache_max_entries = 4096
+        # None uses the [Cache] TTL.
+        fragment_cache_ttl = None
+        single_flight = False
+        single_flight_dir = None
+
+        def get_fragment_cache_ttl(self):
+            """
+            Returns the seconds after which cached WaterML fragments
+            expire, Fragment_TTL or else the [Cache] TTL, None when 0.
+            """
+            ttl = self.fragment_cache_ttl
+            if ttl is None:
+                ttl = self.cache_ttl
+            return ttl or None
+
         def __init__(self, file_name, templates=None):
             config = configparser.RawConfigParser()
             config.read(file_name)
@@ -246,6 +288,73 @@ class WOFConfig(object):
             else:
                 self.TEMPLATES = _TEMPLATES
 
+            if config.has_option('WOFPY', 'Pretty_Print'):
+                self.pretty_print = config.getboolean('WOFPY', 'Pretty_Print')
+            if config.has_option('WOFPY', 'Stream_GetValues'):
+                self.stream_getvalues = config.getboolean('WOFPY',
+                                                          'Stream_GetValues')
+            if config.has_option('WOFPY', 'Stream_Chunk_Size'):
+                self.stream_chunk_size = config.getint('WOFPY',
+                                                       'Stream_Chunk_Size')
+            if config.has_option('WOFPY', 'Fetch_Workers'):
+                self.fetch_workers = config.getint('WOFPY', 'Fetch_Workers')
+            if config.has_option('WOFPY', 'Max_Values_Per_Response'):
+                self.max_values_per_response = config.getint(
+                    'WOFPY', 'Max_Values_Per_Response') or None
+            if config.has_option('WOFPY', 'Max_Multiple_Pairs'):
+                self.max_multiple_pairs = config.getint(
+                    'WOFPY', 'Max_Multiple_Pairs') or None
+
+            if config.has_section('Compression'):
+                if config.has_option('Compression', 'Enabled'):
+                    self.compression = config.getboolean('Compression',
+                                                         'Enabled')
+                if config.has_option('Compression', 'Level'):
+                    self.compression_level = config.getint('Compression',
+                                                           'Level')
+                if config.has_option('Compression', 'Min_Size'):
+                    self.compression_min_size = config.getint('Compression',
+                                                              'Min_Size')
+                if config.has_option('Compression', 'Cache_Max_Bytes'):
+                    self.compression_cache_max_bytes = config.getint(
+                        'Compression', 'Cache_Max_Bytes')
+
+            if config.has_section('Cache'):
+                if config.has_option('Cache', 'Enabled'):
+                    self.cache = config.getboolean('Cache', 'Enabled')
+                if config.has_option('Cache', 'Max_Entries'):
+                    self.cache_max_entries = config.getint('Cache',
+                                                           'Max_Entries')
+                if config.has_option('Cache', 'Max_Bytes'):
+                    self.cache_max_bytes = config.getint(
+                        'Cache', 'Max_Bytes') or None
+                if config.has_option('Cache', 'Max_Entry_Bytes'):
+                    self.cache_max_entry_bytes = config.getint(
+                        'Cache', 'Max_Entry_Bytes') or None
+                if config.has_option('Cache', 'TTL'):
+                    self.cache_ttl = config.getint('Cache', 'TTL')
+                self.cache_ttls = {}
+                for option, methods in TTL_OPTIONS.items():
+                    if config.has_option('Cache', option):
+                        ttl = config.getint('Cache', option)
+                        for method in methods:
+                            self.cache_ttls[method] = ttl
+                if config.has_option('Cache', 'Fragments'):
+                    self.fragment_cache = config.getboolean('Cache',
+                                                            'Fragments')
+                if config.has_option('Cache', 'Fragment_Max_Entries'):
+                    self.fragment_cache_max_entries = config.getint(
+                        'Cache', 'Fragment_Max_Entries')
+                if config.has_option('Cache', 'Fragment_TTL'):
+                    self.fragment_cache_ttl = config.getint(
+                        'Cache', 'Fragment_TTL')
+                if config.has_option('Cache', 'Single_Flight'):
+                    self.single_flight = config.getboolean('Cache',
+                                                           'Single_Flight')
+                if config.has_option('Cache', 'Single_Flight_Dir'):
+                    self.single_flight_dir = config.get('Cache',
+                                                        'Single_Flight_Dir')
+
 
 class wofSoap11(Soap11):
     def _wof_parse_xml_string(self, xml_string, parser, charset=None):
@@ -292,6 +401,47 @@ class wofSoap11(Soap11):
         )
 
 
+class wofXmlDocument(XmlDocument):
+    """
+    XmlDocument out protocol for the REST applications.
+
+    The WOF service methods already return a complete, serialized WaterML
+    document. Instead of parsing it into a tree and serializing the tree
+    again, the document is encoded and written as the response body.
+    Faults and non-string results are serialized by XmlDocument as usual.
+    """
+
+    def _get_raw_document(self, ctx):
+        if ctx.out_error is not None or not ctx.out_object:
+            return None
+        if len(ctx.out_object) != 1:
+            return None
+        document = ctx.out_object[0]
+        if isinstance(document, bytes):
+            document = document.decode(self.encoding)
+        if not isinstance(document, str):
+            return None
+        return document
+
+    def serialize(self, ctx, message):
+        if message is self.RESPONSE and \
+                self._get_raw_document(ctx) is not None:
+            return
+        return super(wofXmlDocument, self).serialize(ctx, message)
+
+    def create_out_string(self, ctx, charset=None):
+        document = self._get_raw_document(ctx)
+        if document is None:
+            return super(wofXmlDocument, self).create_out_string(ctx, charset)
+
+        if charset is None:
+            charset = self.encoding
+        if self.xml_declaration:
+            document = u"<?xml version='1.0' encoding='%s'?>\n%s" % (
+                charset, document)
+        ctx.out_string = [document.encode(charset)]
+
+
 """ returns an array of the applications """
 
 
@@ -315,7 +465,7 @@ def getSpyneApplications(wof_obj_1_0, wof_obj_1_1, templates=None):
         tns=_SERVICE_PARAMS["wml10_tns"],
         name=sensorNetwork+'_svc_' + _SERVICE_PARAMS["wml10_rest_name"],
         in_protocol=HttpRpc(validator='soft'),
-        out_protocol=XmlDocument(),
+        out_protocol=wofXmlDocument(),
     )
 
     soap_app_1_1 = Application(
@@ -331,7 +481,7 @@ def getSpyneApplications(wof_obj_1_0, wof_obj_1_1, templates=None):
         tns=_SERVICE_PARAMS["wml11_tns"],
         name=sensorNetwork + '_svc_' + _SERVICE_PARAMS["wml11_rest_name"],
         in_protocol=HttpRpc(validator='soft'),
-        out_protocol=XmlDocument(),
+        out_protocol=wofXmlDocument(),
     )
     # need to update template to 1_1 object.
     # <gml:Definition gml:id="methodCode-{{ method_result.MethodID  }}">
@@ -362,6 +512,24 @@ def getSpyneApplications(wof_obj_1_0, wof_obj_1_1, templates=None):
         '/' + sensorNetwork+'/rest/2': rest_wsgi_wrapper_2_0,
     }
 
+    # The streaming GetValues applications are mounted below the spyne REST
+    # application, so the dispatcher routes GetValues requests to them
+    # first.
+    config_1_1 = wof_obj_1_1._config
+    if config_1_1 is not None and config_1_1.stream_getvalues:
+        spyneApps['/' + sensorNetwork + '/rest/1_1/GetValues'] = \
+            GetValuesStreamApplication(
+                wof_obj_1_1,
+                chunk_size=config_1_1.stream_chunk_size,
+                pretty_print=wof_obj_1_1.pretty_print
+            )
+        spyneApps['/' + sensorNetwork + '/rest/1_1/GetValuesMultiple'] = \
+            GetValuesMultipleStreamApplication(
+                wof_obj_1_1,
+                chunk_size=config_1_1.stream_chunk_size,
+                pretty_print=wof_obj_1_1.pretty_print
+            )
+
     templatesPath = None
     if templates is None:
         if wof_obj_1_1._config is not None:
@@ -403,6 +571,21 @@ def getSpyneApplications(wof_obj_1_0, wof_obj_1_1, templates=None):
             wsdl11.on_get_wsdl_1_1_
         )
 
+    if config_1_1 is not None and config_1_1.compression:
+        # Bodies only repeat when they come from the response cache, and
+        # the mounts share one body cache bounded in bytes.
+        body_cache = None
+        if config_1_1.cache and config_1_1.compression_cache_max_bytes > 0:
+            body_cache = CompressedBodyCache(
+                max_bytes=config_1_1.compression_cache_max_bytes)
+        for mount in spyneApps:
+            spyneApps[mount] = CompressionMiddleware(
+                spyneApps[mount],
+                level=config_1_1.compression_level,
+                min_size=config_1_1.compression_min_size,
+                body_cache=body_cache
+            )
+
     return spyneApps
 
 
@@ -435,7 +618,7 @@ def _get_datavalues_datetime(obj, local_datetime_attr,
             # return local_datetime.isoformat()
             return local_datetime
         else:
-            ldt = parse(local_datetime)
+            ldt = isodates.parse(local_datetime)
             return ldt
     else:
         utc_datetime = getattr(obj, utc_datetime_attr)
@@ -443,5 +626,52 @@ def _get_datavalues_datetime(obj, local_datetime_attr,
             utcdt = UTC_TZ.localize(utc_datetime)
             return utcdt
         else:
-            utcdt = parse(utc_datetime)
+            utcdt = isodates.parse(utc_datetime)
             return utcdt
+
+
+class ChunkWriter(object):
+    """
+    File-like sink for generateDS export calls that buffers written text
+    until it is drained, so exported XML can be handed out in chunks.
+    """
+    def __init__(self):
+        self._parts = []
+        self._size = 0
+
+    def write(self, text):
+        self._parts.append(text)
+        self._size += len(text)
+
+    def __len__(self):
+        return self._size
+
+    def drain(self):
+        """Returns the buffered text and empties the buffer."""
+        text = u''.join(self._parts)
+        self._parts = []
+        self._size = 0
+        return text
+
+
+def export_start_tag(obj, outfile, level, name_, namespacedef_='',
+                     pretty_print=True):
+    """
+    Writes the opening tag of a generateDS element, as its export method
+    would, without writing the children or the closing tag.
+    """
+    if pretty_print:
+        outfile.write(u'    ' * level)
+    outfile.write(u'<%s%s' % (name_, namespacedef_ and ' ' + namespacedef_ or ''))  # noqa
+    obj.exportAttributes(outfile, level, set(), '',
+                         name_=obj.__class__.__name__)
+    outfile.write(u'>%s' % (pretty_print and u'\n' or u''))
+
+
+def export_end_tag(outfile, level, name_, pretty_print=True):
+    """
+    Writes the closing tag matching export_start_tag.
+    """
+    if pretty_print:
+        outfile.write(u'    ' * level)
+    outfile.write(u'</%s>%s' % (name_, pretty_print and u'\n' or u''))
@@ -1,12 +1,18 @@
 from __future__ import (absolute_import, division, print_function)
 
 import datetime
+import functools
 import logging
 
 from xml.sax.saxutils import escape
 
 from wof import WaterML
+from wof import cache
 from wof import core
+from wof import fragments
+from wof import paging
+from wof import rendering
+from wof import vocabularies as voc
 
 
 class WOF(object):
@@ -37,6 +43,12 @@ class WOF(object):
     phone = '555-555-555'
     link = 'http://www.example.com/'
 
+    pretty_print = False
+    response_cache = None
+    fragment_cache = None
+    single_flight = None
+    max_values_per_response = None
+
     _config = None
     _templates = None
 
@@ -79,6 +91,78 @@ class WOF(object):
         self.phone = config.phone
         self.link = config.link
 
+        self.pretty_print = config.pretty_print
+        self.max_values_per_response = config.max_values_per_response
+
+        if config.cache:
+            self.response_cache = cache.ResponseCache(
+                max_entries=config.cache_max_entries,
+                default_ttl=config.cache_ttl,
+                ttls=config.cache_ttls,
+                max_bytes=config.cache_max_bytes,
+                max_entry_bytes=config.cache_max_entry_bytes
+            )
+        else:
+            self.response_cache = None
+
+        if config.fragment_cache:
+            self.fragment_cache = fragments.FragmentCache(
+                max_entries=config.fragment_cache_max_entries,
+                ttl=config.get_fragment_cache_ttl())
+        else:
+            self.fragment_cache = None
+
+        if config.single_flight:
+            self.single_flight = cache.SingleFlight(
+                lock_dir=config.single_flight_dir,
+                namespace='{0}:{1}:1.0'.format(self.network,
+                                                self.vocabulary))
+        else:
+            self.single_flight = None
+
+    def cached_response(self, method, creator, **args):
+        """
+        Returns creator(), memoized in response_cache under the normalized
+        method arguments when the response cache is enabled, and shared
+        with the identical calls in flight when single_flight is enabled.
+        """
+        if self.response_cache is None and self.single_flight is None:
+            return creator()
+        key = cache.normalize_query(self, method, args)
+        if key is None:
+            return creator()
+        if self.single_flight is not None:
+            creator = functools.partial(self.single_flight.do, key, creator)
+        if self.response_cache is None:
+            return creator()
+        return self.response_cache.get_or_create(key, creator)
+
+    def cached_element(self, kind, entity_key, factory):
+        """
+        Returns factory(), or a stand-in exporting it from fragment_cache
+        under kind and entity_key when the fragment cache is enabled.
+        """
+        if self.fragment_cache is None:
+            return factory()
+        return self.fragment_cache.element(
+            (self.network, self.vocabulary, '1.0', kind, entity_key), factory,
+            getattr(self.dao, 'metadata_generation', None))
+
+    def cached_variable_element(self, variableResult):
+        return self.cached_element(
+            'variable', fragments.variable_key(variableResult),
+            functools.partial(self.create_variable_element, variableResult))
+
+    def cached_method_element(self, methodResult):
+        return self.cached_element(
+            'method', methodResult.MethodID,
+            functools.partial(self.create_method_element, methodResult))
+
+    def cached_source_element(self, sourceResult):
+        return self.cached_element(
+            'source', sourceResult.SourceID,
+            functools.partial(self.create_source_element, sourceResult))
+
     '''
     For WML 1.0 many terms were embedded in the Schemas,
     which made them not expandable. This provides a standard warning message
@@ -213,7 +297,7 @@ class WOF(object):
 
         variables = WaterML.variables()
         for variableResult in variableResultArr:
-            v = self.create_variable_element(variableResult)
+            v = self.cached_variable_element(variableResult)
             variables.add_variable(v)
         variableInfoResponse.set_variables(variables)
         return variableInfoResponse
@@ -227,8 +311,14 @@ class WOF(object):
         siteCode = self.get_site_code(siteArg)
         varCode = self.get_variable_code(varArg)
 
-        valueResultArr = self.dao.get_datavalues(siteCode, varCode,
-                                                 startDateTime, endDateTime)
+        nextContinuation = None
+        if self.max_values_per_response is None:
+            valueResultArr = self.dao.get_datavalues(
+                siteCode, varCode, startDateTime, endDateTime)
+        else:
+            valueResultArr, nextContinuation = paging.read_page(
+                self.dao, siteCode, varCode, startDateTime, endDateTime,
+                self.max_values_per_response)
 
         timeSeriesResponse = WaterML.TimeSeriesResponseType()
 
@@ -240,6 +330,8 @@ class WOF(object):
         queryInfo.set_criteria(criteria)
         queryInfoNote = WaterML.NoteType()
         queryInfo.add_note(queryInfoNote)
+        if nextContinuation is not None:
+            paging.add_page_notes(WaterML, queryInfo, nextContinuation)
         queryInfo.set_extension('')
         timeSeriesResponse.set_queryInfo(queryInfo)
 
@@ -266,7 +358,9 @@ class WOF(object):
         if not siteResult:
             pass
 
-        sourceInfo = self.create_site_info_element(siteResult)
+        sourceInfo = self.cached_element(
+            'siteInfo', siteResult.SiteCode,
+            functools.partial(self.create_site_info_element, siteResult))
         timeSeries.sourceInfo = sourceInfo
 
         # variable element
@@ -276,7 +370,7 @@ class WOF(object):
         if not varResult:
             pass
 
-        variable = self.create_variable_element(varResult)
+        variable = self.cached_variable_element(varResult)
         timeSeries.variable = variable
 
         # TODO: fill in some more of the attributes in this element.
@@ -295,17 +389,22 @@ class WOF(object):
         offsetTypeIdSet = set()
         qualitycontrollevelIdSet = set()
 
+        valueElements = self.create_value_elements()
+        qlevelResults = {}
         for valueResult in valueResultArr:
             if valueResult.QualityControlLevelID is not None:
                 qualitycontrollevelIdSet.add(valueResult.QualityControlLevelID) # noqa
-                qlevelResult = self.dao.get_qualcontrollvl_by_id(valueResult.QualityControlLevelID)  # noqa
+                if valueResult.QualityControlLevelID not in qlevelResults:
+                    qlevelResults[valueResult.QualityControlLevelID] = \
+                        self.dao.get_qualcontrollvl_by_id(
+                            valueResult.QualityControlLevelID)
+                qlevelResult = qlevelResults[valueResult.QualityControlLevelID]  # noqa
                 if hasattr(qlevelResult, 'Definition'):
                     valueResult.QualityControlLevel = qlevelResult.Definition
                 # else:
                 #     if hasattr(valueResult,'QualityControlLevel'):
                 #         valueResult.QualityControlLevel = qlevelResult.QualityControlLevelCode  # noqa
-            v = self.create_value_element(valueResult)
-            values.add_value(v)
+            valueElements.add(valueResult)
 
             if valueResult.MethodID is not None:
                 methodIdSet.add(valueResult.MethodID)
@@ -322,12 +421,15 @@ class WOF(object):
             if valueResult.QualityControlLevelID is not None:
                 qualitycontrollevelIdSet.add(valueResult.QualityControlLevelID)
 
+        if len(valueElements):
+            values.add_value(valueElements)
+
         # Add method elements for each unique methodID
         if methodIdSet:
             methodIdArr = list(methodIdSet)
             methodResultArr = self.dao.get_methods_by_ids(methodIdArr)
             for methodResult in methodResultArr:
-                method = self.create_method_element(methodResult)
+                method = self.cached_method_element(methodResult)
                 values.add_method(method)
 
         # Add source elements for each unique sourceID
@@ -335,7 +437,7 @@ class WOF(object):
             sourceIdArr = list(sourceIdSet)
             sourceResultArr = self.dao.get_sources_by_ids(sourceIdArr)
             for sourceResult in sourceResultArr:
-                source = self.create_source_element(sourceResult)
+                source = self.cached_source_element(sourceResult)
                 values.add_source(source)
 
         # Add qualifier elements
@@ -466,14 +568,7 @@ class WOF(object):
 
     def check_censorCode(self, censorCode):
         default = "nc"
-        valueList = [
-            "lt",
-            "gt",
-            "nc",
-            "nd",
-            "pnq",
-        ]
-        if (censorCode in valueList):
+        if voc.registry.is_valid('wml10_censorcode', censorCode):
             return censorCode
         else:
             logging.info(self.invalid_enum_message('censorCode', censorCode))
@@ -481,15 +576,8 @@ class WOF(object):
 
     def check_QualityControlLevel(self, QualityControlLevel):
         default = "Unknown"
-        valueList = [
-            "Raw data",
-            "Quality controlled data",
-            "Derived products",
-            "Interpreted products",
-            "Knowledge products",
-            "Unknown",
-        ]
-        if (QualityControlLevel in valueList):
+        if voc.registry.is_valid('wml10_qualitycontrollevel',
+                                 QualityControlLevel):
             return QualityControlLevel
         else:
             logging.info(self.invalid_enum_message(
@@ -498,6 +586,14 @@ class WOF(object):
             )
             return default
 
+    def create_value_elements(self):
+        """
+        Returns the bulk renderer of the <value> elements of a time series,
+        whose output matches exporting create_value_element elements.
+        """
+        return rendering.ValueElements_1_0(self.check_censorCode,
+                                           self.check_QualityControlLevel)
+
     # TODO: lots more stuff to fill out here.
     def create_value_element(self, valueResult):
         adate = core._get_datavalues_datetime(
@@ -532,10 +628,38 @@ class WOF(object):
 
     def create_site_element(self, siteResult, seriesResultArr=None):
         site = WaterML.site()
-        siteInfo = self.create_site_info_element(siteResult)
+        siteInfo = self.cached_element(
+            'siteInfoNotes', siteResult.SiteCode,
+            functools.partial(self.create_site_info_notes_element,
+                              siteResult))
 
         site.set_siteInfo(siteInfo)
 
+        seriesCatalog = WaterML.seriesCatalogType()
+        if seriesResultArr is not None:
+            seriesCatalog.menuGroupName = self.menu_group_name
+            # TODO: Make sure this is set properly in config filename.
+            seriesCatalog.serviceWsdl = self.service_wsdl
+
+            for seriesResult in seriesResultArr:
+                series = self.create_series_element(seriesResult)
+
+                seriesCatalog.add_series(series)
+
+        site.add_seriesCatalog(seriesCatalog)
+
+        # need at least one extension element to meet WaterML 1.0
+        # schema validation
+        site.set_extension('')
+        return site
+
+    def create_site_info_notes_element(self, siteResult):
+        """
+        Returns the siteInfo element of a site element, with the county,
+        state and comments notes.
+        """
+        siteInfo = self.create_site_info_element(siteResult)
+
         # need at least one note element to meet WaterML 1.0 schema validation
         if (not siteResult.County
            and not siteResult.State
@@ -559,23 +683,7 @@ class WOF(object):
                     valueOf_=escape(siteResult.Comments))
                 siteInfo.add_note(commentsNote)
 
-        seriesCatalog = WaterML.seriesCatalogType()
-        if seriesResultArr is not None:
-            seriesCatalog.menuGroupName = self.menu_group_name
-            # TODO: Make sure this is set properly in config filename.
-            seriesCatalog.serviceWsdl = self.service_wsdl
-
-            for seriesResult in seriesResultArr:
-                series = self.create_series_element(seriesResult)
-
-                seriesCatalog.add_series(series)
-
-        site.add_seriesCatalog(seriesCatalog)
-
-        # need at least one extension element to meet WaterML 1.0
-        # schema validation
-        site.set_extension('')
-        return site
+        return siteInfo
 
     def create_site_info_element(self, siteResult):
         siteInfo = WaterML.SiteInfoType()
@@ -630,7 +738,7 @@ class WOF(object):
         series = WaterML.series()
 
         # Variable
-        variable = self.create_variable_element(seriesResult.Variable)
+        variable = self.cached_variable_element(seriesResult.Variable)
         series.set_variable(variable)
 
         series.valueCount = WaterML.valueCount(
@@ -654,12 +762,12 @@ class WOF(object):
 
         # Method
         if seriesResult.Method:
-            method = self.create_method_element(seriesResult.Method)
+            method = self.cached_method_element(seriesResult.Method)
             series.Method = method
 
         # Source
         if seriesResult.Source:
-            source = self.create_source_element(seriesResult.Source)
+            source = self.cached_source_element(seriesResult.Source)
             series.Source = source
 
         # QualityControlLevel
@@ -673,32 +781,10 @@ class WOF(object):
 
     def check_dataTypeEnum(self, datatype):
         default = "Unknown"
-        valueList = [
-            "Continuous",
-            "Instantaneous",
-            "Cumulative",
-            "Incremental",
-            "Average",
-            "Maximum",
-            "Minimum",
-            "Constant Over Interval",
-            "Categorical",
-            "Best Easy Systematic Estimator ",
-            "Unknown",
-            "Variance",
-            "Median",
-            "Mode",
-            "Best Easy Systematic Estimator",
-            "Standard Deviation",
-            "Skewness",
-            "Equivalent Mean",
-            "Sporadic",
-            "Unknown",
-        ]
         if datatype is None:
             logging.warn('Datatype is not specified')
             return default
-        if (datatype in valueList):
+        if voc.registry.is_valid('wml10_datatype', datatype):
             return datatype
         else:
             logging.info(self.invalid_enum_message('datatype', datatype))
@@ -706,32 +792,10 @@ class WOF(object):
 
     def check_UnitsType(self, UnitsType):
         default = "Dimensionless"
-        valueList = [
-            "Angle",
-            "Area",
-            "Dimensionless",
-            "Energy",
-            "Energy Flux",
-            "Flow",
-            "Force",
-            "Frequency",
-            "Length",
-            "Light",
-            "Mass",
-            "Permeability",
-            "Power",
-            "Pressure/Stress",
-            "Resolution",
-            "Scale",
-            "Temperature",
-            "Time",
-            "Velocity",
-            "Volume",
-        ]
         if UnitsType is None:
             logging.warn('UnitsType is not specified ')
             return default
-        if (UnitsType in valueList):
+        if voc.registry.is_valid('wml10_unitstype', UnitsType):
             return UnitsType
         else:
             logging.info(
@@ -745,23 +809,10 @@ class WOF(object):
 
     def check_SampleMedium(self, SampleMedium):
         default = "Unknown"
-        valueList = [
-            "Surface Water",
-            "Ground Water",
-            "Sediment",
-            "Soil",
-            "Air",
-            "Tissue",
-            "Precipitation",
-            "Unknown",
-            "Other",
-            "Snow",
-            "Not Relevant",
-        ]
         if SampleMedium is None:
             logging.warn('SampleMedium is not specified')
             return default
-        if (SampleMedium in valueList):
+        if voc.registry.is_valid('wml10_samplemedium', SampleMedium):
             return SampleMedium
         else:
             logging.info(
@@ -773,19 +824,10 @@ class WOF(object):
 
     def check_generalCategory(self, generalCategory):
         default = "Unknown"
-        valueList = [
-            "Water Quality",
-            "Climate",
-            "Hydrology",
-            "Geology",
-            "Biota",
-            "Unknown",
-            "Instrumentation",
-        ]
         if generalCategory is None:
             logging.warn('GeneralCategory is not specified')
             return default
-        if (generalCategory in valueList):
+        if voc.registry.is_valid('wml10_generalcategory', generalCategory):
             return generalCategory
         else:
             logging.info(
@@ -798,17 +840,10 @@ class WOF(object):
 
     def check_valueType(self, valueType):
         default = "Unknown"
-        valueList = [
-            "Field Observation",
-            "Sample",
-            "Model Simulation Result",
-            "Derived Value",
-            "Unknown",
-        ]
         if valueType is None:
             logging.warn('ValueType is not specified')
             return default
-        if (valueType in valueList):
+        if voc.registry.is_valid('wml10_valuetype', valueType):
             return valueType
         else:
             logging.info(self.invalid_enum_message('valueType', valueType))
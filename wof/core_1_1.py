@@ -1,15 +1,76 @@
 from __future__ import (absolute_import, division, print_function)
 
+import collections
 import datetime
+import functools
+import itertools
 import logging
+import threading
+from multiprocessing.pool import ThreadPool
 from xml.sax.saxutils import escape
 
-import dateutil.parser
 
 from wof import WaterML_1_1 as WaterML
+from wof import aggregation
+from wof import cache
 from wof import core
+from wof import fragments
+from wof import isodates
+from wof import paging
+from wof import rendering
 from wof import vocabularies as voc
 
+NSDEF = 'xmlns="http://www.cuahsi.org/waterML/1.1/"'
+
+# Serializes the creation of fetch pools.
+_fetch_pool_lock = threading.Lock()
+
+
+class _ValueMetadataIds(object):
+    """
+    Unique metadata ids referenced by the data values of one time series.
+    """
+    def __init__(self):
+        self.methodIdSet = set()
+        self.sourceIdSet = set()
+        self.qualifierIdSet = set()
+        self.offsetTypeIdSet = set()
+        self.qualitycontrollevelIdSet = set()
+        self.censorcodeset = {}
+
+    def add(self, valueResult, censorCode):
+        if valueResult.MethodID is not None and valueResult.MethodCode:
+            self.methodIdSet.add(valueResult.MethodID)
+
+        if valueResult.SourceID is not None:
+            self.sourceIdSet.add(valueResult.SourceID)
+
+        if valueResult.QualifierID is not None:
+            self.qualifierIdSet.add(valueResult.QualifierID)
+
+        if valueResult.OffsetTypeID is not None:
+            self.offsetTypeIdSet.add(valueResult.OffsetTypeID)
+
+        if valueResult.QualityControlLevelID is not None:
+            self.qualitycontrollevelIdSet.add(
+                valueResult.QualityControlLevelID)
+
+        if valueResult.CensorCode is not None:
+            self.censorcodeset[censorCode] = valueResult.CensorCode
+
+
+def _nonempty_iter(valueResultArr):
+    """
+    Returns an iterator over valueResultArr, or None when it has no values.
+    Only the first value is read to find out.
+    """
+    if valueResultArr is None:
+        return None
+    valueResultIter = iter(valueResultArr)
+    for firstValue in valueResultIter:
+        return itertools.chain([firstValue], valueResultIter)
+    return None
+
 
 class WOF_1_1(object):
 
@@ -41,7 +102,16 @@ class WOF_1_1(object):
     phone = '555-555-555'
     link = 'http://www.example.com/'
 
+    pretty_print = False
+    response_cache = None
+    fragment_cache = None
+    single_flight = None
+    fetch_workers = 0
+    max_values_per_response = None
+    max_multiple_pairs = None
+
     _config = None
+    _fetch_pool = None
     _templates = None
 
     def __init__(self, dao, config_file=None, templates=None):
@@ -88,6 +158,80 @@ class WOF_1_1(object):
         self.phone = config.phone
         self.link = config.link
 
+        self.pretty_print = config.pretty_print
+        self.fetch_workers = config.fetch_workers
+        self.max_values_per_response = config.max_values_per_response
+        self.max_multiple_pairs = config.max_multiple_pairs
+
+        if config.cache:
+            self.response_cache = cache.ResponseCache(
+                max_entries=config.cache_max_entries,
+                default_ttl=config.cache_ttl,
+                ttls=config.cache_ttls,
+                max_bytes=config.cache_max_bytes,
+                max_entry_bytes=config.cache_max_entry_bytes
+            )
+        else:
+            self.response_cache = None
+
+        if config.fragment_cache:
+            self.fragment_cache = fragments.FragmentCache(
+                max_entries=config.fragment_cache_max_entries,
+                ttl=config.get_fragment_cache_ttl())
+        else:
+            self.fragment_cache = None
+
+        if config.single_flight:
+            self.single_flight = cache.SingleFlight(
+                lock_dir=config.single_flight_dir,
+                namespace='{0}:{1}:1.1'.format(self.network,
+                                                self.vocabulary))
+        else:
+            self.single_flight = None
+
+    def cached_response(self, method, creator, **args):
+        """
+        Returns creator(), memoized in response_cache under the normalized
+        method arguments when the response cache is enabled, and shared
+        with the identical calls in flight when single_flight is enabled.
+        """
+        if self.response_cache is None and self.single_flight is None:
+            return creator()
+        key = cache.normalize_query(self, method, args)
+        if key is None:
+            return creator()
+        if self.single_flight is not None:
+            creator = functools.partial(self.single_flight.do, key, creator)
+        if self.response_cache is None:
+            return creator()
+        return self.response_cache.get_or_create(key, creator)
+
+    def cached_element(self, kind, entity_key, factory):
+        """
+        Returns factory(), or a stand-in exporting it from fragment_cache
+        under kind and entity_key when the fragment cache is enabled.
+        """
+        if self.fragment_cache is None:
+            return factory()
+        return self.fragment_cache.element(
+            (self.network, self.vocabulary, '1.1', kind, entity_key), factory,
+            getattr(self.dao, 'metadata_generation', None))
+
+    def cached_variable_element(self, variableResult):
+        return self.cached_element(
+            'variable', fragments.variable_key(variableResult),
+            functools.partial(self.create_variable_element, variableResult))
+
+    def cached_method_element(self, methodResult):
+        return self.cached_element(
+            'method', methodResult.MethodID,
+            functools.partial(self.create_method_element, methodResult))
+
+    def cached_source_element(self, sourceResult):
+        return self.cached_element(
+            'source', sourceResult.SourceID,
+            functools.partial(self.create_source_element, sourceResult))
+
     def get_site_code(self, siteArg):
         if siteArg is None:
             return None
@@ -198,10 +342,16 @@ class WOF_1_1(object):
         # queryInfo.set_extension('')
         siteInfoResponse.set_queryInfo(queryInfo)
 
-        for siteArg in siteCodesArr:
-            siteCode = self.get_site_code(siteArg)
-            siteResult = self.dao.get_site_by_code(siteCode)
-            seriesResultArr = self.dao.get_series_by_sitecode(siteCode)
+        siteResultDict = dict(
+            (siteResult.SiteCode, siteResult)
+            for siteResult in self.dao.get_sites_by_codes(siteCodesArr))
+        seriesResultDict = self.dao.get_series_by_sitecodes(siteCodesArr)
+
+        for siteCode in siteCodesArr:
+            siteResult = siteResultDict.get(siteCode)
+            if siteResult is None:
+                siteResult = self.dao.get_site_by_code(siteCode)
+            seriesResultArr = seriesResultDict.get(siteCode, [])
 
             # if len(seriesResultArr) == 0:
             #    return None
@@ -238,7 +388,13 @@ class WOF_1_1(object):
                                      IncludeSeries):
 
         IncludeSeries = self.to_bool(IncludeSeries)
-        siteResultArr = self.dao.get_sites_by_box(west, south, east, north)
+        if IncludeSeries:
+            siteSeriesArr = self.dao.get_sites_with_series_by_box(
+                west, south, east, north)
+        else:
+            siteSeriesArr = [
+                (siteResult, None) for siteResult in
+                self.dao.get_sites_by_box(west, south, east, north)]
 
         siteInfoResponse = WaterML.SiteInfoResponseType()
 
@@ -256,11 +412,7 @@ class WOF_1_1(object):
         # queryInfo.set_extension('')
         siteInfoResponse.set_queryInfo(queryInfo)
 
-        for siteResult in siteResultArr:
-            seriesResultArr = None
-            if IncludeSeries:
-                seriesResultArr = self.dao.get_series_by_sitecode(siteResult.SiteCode)  # noqa
-
+        for siteResult, seriesResultArr in siteSeriesArr:
             # if len(seriesResultArr) == 0:
             #    return None
             s = self.create_site_element(
@@ -301,30 +453,13 @@ class WOF_1_1(object):
 
         variables = WaterML.variablesType()
         for variableResult in variableResultArr:
-            v = self.create_variable_element(variableResult)
+            v = self.cached_variable_element(variableResult)
             variables.add_variable(v)
         variableInfoResponse.set_variables(variables)
         return variableInfoResponse
 
-    def create_get_values_response(self, siteArg, varArg, startDateTime=None,
-                                   endDateTime=None):
-
-        # TODO: Tim thinks the DAO should handle network and vocab parsing,
-        #      not WOF
-        siteCode = self.get_site_code(siteArg)
-        varCode = self.get_variable_code(varArg)
-
-        valueResultArr = self.dao.get_datavalues(siteCode, varCode,
-                                                 startDateTime, endDateTime)
-        # if not valueResultArr:
-        #    raise Exception(
-        #        "ERROR: No data found for {}:{} for dates {} - {}".format(
-        #            siteCode, varCode, startDateTime, endDateTime
-        #        )
-        #    )
-
-        timeSeriesResponse = WaterML.TimeSeriesResponseType()
-
+    def create_get_values_query_info(self, siteArg, varArg,
+                                     startDateTime=None, endDateTime=None):
         queryInfo = WaterML.QueryInfoType(creationTime=datetime.datetime.now())
         criteria = WaterML.criteriaType(MethodCalled='GetValues')
         pType_site = WaterML.parameterType(name='site', value=siteArg)
@@ -347,59 +482,284 @@ class WOF_1_1(object):
         # queryInfoNote = WaterML.NoteType()
         # queryInfo.add_note(queryInfoNote)
         # queryInfo.set_extension('')
-        timeSeriesResponse.set_queryInfo(queryInfo)
+        return queryInfo
+
+    def get_values_series(self, siteArg, varArg, startDateTime=None,
+                          endDateTime=None, pageSize=None,
+                          continuation=None):
+        """
+        Returns the site code, a list of (variable code, data values) pairs
+        and the continuation token of the next page for a GetValues
+        request.
+
+        The values are read one page at a time when pageSize,
+        max_values_per_response or continuation is given; the continuation
+        token is None when there is no next page.
+        """
+        # TODO: Tim thinks the DAO should handle network and vocab parsing,
+        #      not WOF
+        siteCode = self.get_site_code(siteArg)
+        varCode = self.get_variable_code(varArg)
+
+        limit = paging.page_limit(pageSize, self.max_values_per_response)
+        nextContinuation = None
+        if limit is None and not continuation:
+            valueResultArr = self.dao.get_datavalues_iter(
+                siteCode, varCode, startDateTime, endDateTime)
+        else:
+            valueResultArr, nextContinuation = paging.read_page(
+                self.dao, siteCode, varCode, startDateTime, endDateTime,
+                limit, continuation)
 
-        # if not valueResultArr:
-        #    timeSeries = WaterML.TimeSeriesType()
-        #    timeSeriesResponse.add_timeSeries(timeSeries)
-        #    return timeSeriesResponse
+        if isinstance(valueResultArr, dict):
+            seriesArr = list(valueResultArr.items())
+        else:
+            valueResultArr = _nonempty_iter(valueResultArr)
+            seriesArr = [(varCode, valueResultArr)]
 
         if not valueResultArr:
             raise Exception(
                 "Values Not Found for {}:{} for dates {} - {}".format(
                     siteCode, varCode, startDateTime, endDateTime)
                 )
+        return siteCode, seriesArr, nextContinuation
+
+    def get_values_since_series(self, siteArg, varArg, startDateTime=None,
+                                endDateTime=None, since=None, pageSize=None):
+        """
+        Returns the site code, a list of (variable code, data values) pairs,
+        the watermark of the next request and whether more values are left
+        for an incremental GetValues request, which only returns the values
+        added after the since watermark.
+
+        The series has no values when nothing was added.
+        """
+        siteCode = self.get_site_code(siteArg)
+        varCode = self.get_variable_code(varArg)
 
-        if isinstance(valueResultArr, dict):
-            for key in valueResultArr.keys():
-                timeSeries = self.create_timeseries(
-                    siteCode,
-                    key,
-                    valueResultArr[key]
+        limit = paging.page_limit(pageSize, self.max_values_per_response)
+        valueResultArr, watermark, more = paging.read_since(
+            self.dao, siteCode, varCode, startDateTime, endDateTime, since,
+            limit)
+        return siteCode, [(varCode, valueResultArr)], watermark, more
+
+    def get_values_aggregate_series(self, siteArg, varArg,
+                                    startDateTime=None, endDateTime=None,
+                                    interval=None, statistic=None):
+        """
+        Returns the site code, a list of (variable code, data values) pairs
+        and the variable of an aggregated GetValues request, with one value
+        for each interval holding values, e.g. the daily means.
+
+        The variable has the time support of the interval and the data type
+        of the statistic.
+        """
+        siteCode = self.get_site_code(siteArg)
+        varCode = self.get_variable_code(varArg)
+        interval = aggregation.parse_interval(interval)
+        statistic = aggregation.check_statistic(statistic or 'mean')
+
+        valueResultArr = self.dao.get_datavalues_aggregate(
+            siteCode, varCode, startDateTime, endDateTime, interval,
+            statistic)
+        if not valueResultArr:
+            raise Exception(
+                "Values Not Found for {}:{} for dates {} - {}".format(
+                    siteCode, varCode, startDateTime, endDateTime)
                 )
-                timeSeriesResponse.add_timeSeries(timeSeries)
+        varResult = aggregation.AggregateVariable(
+            self.dao.get_variable_by_code(varCode), interval, statistic)
+        return siteCode, [(varCode, valueResultArr)], varResult
+
+    def query_values(self, siteArg, varArg, startDateTime=None,
+                     endDateTime=None, pageSize=None, continuation=None,
+                     since=None, interval=None, statistic=None):
+        """
+        Returns the site code, the (variable code, data values) pairs, the
+        queryInfo and the variables by code of a GetValues response, read
+        incrementally when since is given, aggregated when interval is
+        given and by pages otherwise. The variables are only given when
+        they differ from the DAO's.
+        """
+        varResults = {}
+        if interval is not None:
+            if since is not None or continuation or pageSize is not None:
+                raise ValueError(
+                    'interval can not be used with since, pageSize or '
+                    'continuation')
+            siteCode, seriesArr, varResult = \
+                self.get_values_aggregate_series(
+                    siteArg, varArg, startDateTime, endDateTime, interval,
+                    statistic)
+            varResults[seriesArr[0][0]] = varResult
+            nextContinuation = None
+        elif since is not None:
+            if continuation:
+                raise ValueError(
+                    'continuation and since can not be used together')
+            siteCode, seriesArr, watermark, more = \
+                self.get_values_since_series(siteArg, varArg, startDateTime,
+                                             endDateTime, since, pageSize)
         else:
+            siteCode, seriesArr, nextContinuation = self.get_values_series(
+                siteArg, varArg, startDateTime, endDateTime, pageSize,
+                continuation)
+
+        queryInfo = self.create_get_values_query_info(
+            siteArg, varArg, startDateTime, endDateTime)
+        if since is not None:
+            queryInfo.criteria.add_parameter(
+                WaterML.parameterType(name='since', value=since))
+            paging.add_watermark_notes(WaterML, queryInfo, watermark, more)
+        elif nextContinuation is not None:
+            paging.add_page_notes(WaterML, queryInfo, nextContinuation)
+        if interval is not None:
+            queryInfo.criteria.add_parameter(
+                WaterML.parameterType(name='interval', value=interval))
+            queryInfo.criteria.add_parameter(
+                WaterML.parameterType(name='statistic',
+                                      value=statistic or 'mean'))
+        return siteCode, seriesArr, queryInfo, varResults
+
+    def create_get_values_response(self, siteArg, varArg, startDateTime=None,
+                                   endDateTime=None, pageSize=None,
+                                   continuation=None, since=None,
+                                   interval=None, statistic=None):
+
+        siteCode, seriesArr, queryInfo, varResults = self.query_values(
+            siteArg, varArg, startDateTime, endDateTime, pageSize,
+            continuation, since, interval, statistic)
+
+        timeSeriesResponse = WaterML.TimeSeriesResponseType()
+        timeSeriesResponse.set_queryInfo(queryInfo)
+
+        for varCode, valueResultArr in seriesArr:
             timeSeries = self.create_timeseries(
                 siteCode,
                 varCode,
-                valueResultArr
+                valueResultArr,
+                varResult=varResults.get(varCode)
             )
             timeSeriesResponse.add_timeSeries(timeSeries)
         return timeSeriesResponse
 
-    def create_timeseries(self, siteCode, varCode, valueResultArr):
+    def create_get_values_stream(self, siteArg, varArg, startDateTime=None,
+                                 endDateTime=None, chunk_size=65536,
+                                 pretty_print=True, pageSize=None,
+                                 continuation=None, since=None,
+                                 interval=None, statistic=None):
+        """
+        Returns the generator of the GetValues timeSeriesResponse document
+        as text chunks of roughly chunk_size characters.
+
+        Value elements are exported as the data values are consumed, so the
+        full response is never held in memory. The output matches exporting
+        the create_get_values_response document. The values are queried
+        before the generator is returned, so invalid requests raise
+        ValueError from this call.
+        """
+        siteCode, seriesArr, queryInfo, varResults = self.query_values(
+            siteArg, varArg, startDateTime, endDateTime, pageSize,
+            continuation, since, interval, statistic)
+        return self._iter_values_stream(siteCode, seriesArr, queryInfo,
+                                        varResults, chunk_size, pretty_print)
+
+    def _iter_values_stream(self, siteCode, seriesArr, queryInfo, varResults,
+                            chunk_size, pretty_print):
+        timeSeriesResponse = WaterML.TimeSeriesResponseType()
+
+        out = core.ChunkWriter()
+        core.export_start_tag(timeSeriesResponse, out, 0,
+                              'timeSeriesResponse', NSDEF, pretty_print)
+        queryInfo.export(out, 1, name_='queryInfo', pretty_print=pretty_print)
+
+        for varCode, valueResultArr in seriesArr:
+            for chunk in self.export_timeseries_stream(
+                    out, siteCode, varCode, valueResultArr, chunk_size,
+                    pretty_print, varResult=varResults.get(varCode)):
+                yield chunk
+
+        core.export_end_tag(out, 0, 'timeSeriesResponse', pretty_print)
+        yield out.drain()
+
+    def export_timeseries_stream(self, out, siteCode, varCode,
+                                 valueResultArr, chunk_size=65536,
+                                 pretty_print=True, siteResult=None,
+                                 varResult=None):
+        """
+        Exports the timeSeries element of a series to the ChunkWriter out,
+        yielding its content whenever more than chunk_size characters are
+        buffered.
+        """
+        timeSeries = self.create_timeseries_element(siteCode, varCode,
+                                                    siteResult, varResult)
+        core.export_start_tag(timeSeries, out, 1, 'timeSeries',
+                              pretty_print=pretty_print)
+        if timeSeries.sourceInfo is not None:
+            timeSeries.sourceInfo.export(out, 2, name_='sourceInfo',
+                                         pretty_print=pretty_print)
+        if timeSeries.variable is not None:
+            timeSeries.variable.export(out, 2, name_='variable',
+                                       pretty_print=pretty_print)
 
+        values = WaterML.TsValuesSingleVariableType()
+        core.export_start_tag(values, out, 2, 'values',
+                              pretty_print=pretty_print)
+        valueIds = _ValueMetadataIds()
+        valueElements = self.create_value_elements()
+        batch_size = max(1, chunk_size // 256)
+        for valueResult in valueResultArr:
+            valueIds.add(valueResult, valueElements.add(valueResult))
+            if len(valueElements) >= batch_size:
+                valueElements.export(out, 3, pretty_print=pretty_print)
+                valueElements.clear()
+                if len(out) >= chunk_size:
+                    yield out.drain()
+        valueElements.export(out, 3, pretty_print=pretty_print)
+
+        self.add_values_metadata(values, valueIds)
+        values.exportChildren(out, 3, pretty_print=pretty_print)
+        core.export_end_tag(out, 2, 'values', pretty_print)
+        core.export_end_tag(out, 1, 'timeSeries', pretty_print)
+
+    def create_timeseries_element(self, siteCode, varCode, siteResult=None,
+                                  varResult=None):
+        """
+        Returns a timeSeries element with its sourceInfo and variable set.
+        siteResult and varResult are read from the DAO when not given.
+        """
         timeSeries = WaterML.TimeSeriesType()
 
         # sourceInfo (which is a siteInfo) element
-        siteResult = self.dao.get_site_by_code(siteCode)
+        if siteResult is None:
+            siteResult = self.dao.get_site_by_code(siteCode)
 
         # TODO: Exception?
         if not siteResult:
             pass
 
-        sourceInfo = self.create_site_info_element(siteResult)
+        sourceInfo = self.cached_element(
+            'siteInfo', siteResult.SiteCode,
+            functools.partial(self.create_site_info_element, siteResult))
         timeSeries.sourceInfo = sourceInfo
 
         # Variable element.
-        varResult = self.dao.get_variable_by_code(varCode)
+        if varResult is None:
+            varResult = self.dao.get_variable_by_code(varCode)
 
         # TODO: Exception?
         if not varResult:
             pass
 
-        variable = self.create_variable_element(varResult)
+        variable = self.cached_variable_element(varResult)
         timeSeries.variable = variable
+        return timeSeries
+
+    def create_timeseries(self, siteCode, varCode, valueResultArr,
+                          siteResult=None, varResult=None):
+
+        timeSeries = self.create_timeseries_element(siteCode, varCode,
+                                                    siteResult, varResult)
 
         # TODO: fill in some more of the attributes in this element.
         values = WaterML.TsValuesSingleVariableType()
@@ -411,54 +771,44 @@ class WOF_1_1(object):
         #    values.unitsCode = varResult.VariableUnits.UnitsID
 
         # Need to keep track of unique methodIDs and sourceIDs.
-        methodIdSet = set()
-        sourceIdSet = set()
-        qualifierIdSet = set()
-        offsetTypeIdSet = set()
-        qualitycontrollevelIdSet = set()
-        censorcodeset = {}
+        valueIds = _ValueMetadataIds()
 
+        valueElements = self.create_value_elements()
         for valueResult in valueResultArr:
-            v = self.create_value_element(valueResult)
-            values.add_value(v)
-            if valueResult.MethodID is not None and valueResult.MethodCode:
-                methodIdSet.add(valueResult.MethodID)
-
-            if valueResult.SourceID is not None:
-                sourceIdSet.add(valueResult.SourceID)
-
-            if valueResult.QualifierID is not None:
-                qualifierIdSet.add(valueResult.QualifierID)
+            valueIds.add(valueResult, valueElements.add(valueResult))
+        if len(valueElements):
+            values.add_value(valueElements)
 
-            if valueResult.OffsetTypeID is not None:
-                offsetTypeIdSet.add(valueResult.OffsetTypeID)
+        self.add_values_metadata(values, valueIds)
 
-            if valueResult.QualityControlLevelID is not None:
-                qualitycontrollevelIdSet.add(valueResult.QualityControlLevelID)
-
-            if valueResult.CensorCode is not None:
-                censorcode = v.get_censorCode()
-                censorcodeset[censorcode] = valueResult.CensorCode
+        timeSeries.add_values(values)
+        # timeSeriesResponse.set_timeSeries(timeSeries)
+        return timeSeries
 
+    def add_values_metadata(self, values, valueIds):
+        """
+        Adds the method, source, qualifier, offset, quality control level
+        and censor code elements referenced by the values.
+        """
         # Add method elements for each unique methodID.
-        if methodIdSet:
-            methodIdArr = list(methodIdSet)
+        if valueIds.methodIdSet:
+            methodIdArr = list(valueIds.methodIdSet)
             methodResultArr = self.dao.get_methods_by_ids(methodIdArr)
             for methodResult in methodResultArr:
-                method = self.create_method_element(methodResult)
+                method = self.cached_method_element(methodResult)
                 values.add_method(method)
 
         # Add source elements for each unique sourceID.
-        if sourceIdSet:
-            sourceIdArr = list(sourceIdSet)
+        if valueIds.sourceIdSet:
+            sourceIdArr = list(valueIds.sourceIdSet)
             sourceResultArr = self.dao.get_sources_by_ids(sourceIdArr)
             for sourceResult in sourceResultArr:
-                source = self.create_source_element(sourceResult)
+                source = self.cached_source_element(sourceResult)
                 values.add_source(source)
 
         # Add qualifier elements.
-        if qualifierIdSet:
-            qualIdArr = list(qualifierIdSet)
+        if valueIds.qualifierIdSet:
+            qualIdArr = list(valueIds.qualifierIdSet)
             qualResultArr = self.dao.get_qualifiers_by_ids(qualIdArr)
             for qualifierResult in qualResultArr:
                 q = WaterML.QualifierType(
@@ -470,8 +820,8 @@ class WOF_1_1(object):
                 values.add_qualifier(q)
 
         # Add offset elements
-        if offsetTypeIdSet:
-            offsetTypeIdArr = list(offsetTypeIdSet)
+        if valueIds.offsetTypeIdSet:
+            offsetTypeIdArr = list(valueIds.offsetTypeIdSet)
             offsetTypeResultArr = self.dao.get_offsettypes_by_ids(
                 offsetTypeIdArr)
             for offsetTypeResult in offsetTypeResultArr:
@@ -479,8 +829,8 @@ class WOF_1_1(object):
                 values.add_offset(offset)
 
         # Add qualitycontrollevel elements.
-        if qualitycontrollevelIdSet:
-            qlevelIdIdArr = list(qualitycontrollevelIdSet)
+        if valueIds.qualitycontrollevelIdSet:
+            qlevelIdIdArr = list(valueIds.qualitycontrollevelIdSet)
             try:
                 qlevelResultArr = self.dao.get_qualcontrollvls_by_ids(qlevelIdIdArr)  # noqa
                 for qlevelResult in qlevelResultArr:
@@ -493,21 +843,26 @@ class WOF_1_1(object):
                     values.add_qualityControlLevel(qlevel)
 
         # Add censorcode element.
-        if censorcodeset:
-            for key in censorcodeset:
+        if valueIds.censorcodeset:
+            for key in valueIds.censorcodeset:
                 cCode = WaterML.CensorCodeType(
                     censorCode=key,
-                    censorCodeDescription=censorcodeset[key]
+                    censorCodeDescription=valueIds.censorcodeset[key]
                 )
                 values.add_censorCode(cCode)
 
-        timeSeries.add_values(values)
-        # timeSeriesResponse.set_timeSeries(timeSeries)
-        return timeSeries
-
     def create_get_values_site_response(self, site,
                                         startDateTime,
-                                        endDateTime):
+                                        endDateTime,
+                                        pageSize=None,
+                                        continuation=None):
+        """
+        Returns the timeSeriesResponse of all the series of a site.
+
+        The response holds at most pageSize or max_values_per_response
+        values in all, read by paging.read_series_page; its queryInfo then
+        has the continuation token of the next page.
+        """
 
         timeSeriesResponse = WaterML.TimeSeriesResponseType()
         queryInfo = WaterML.QueryInfoType(creationTime=datetime.datetime.now())
@@ -534,30 +889,319 @@ class WOF_1_1(object):
 
         siteCode = self.get_site_code(site)
         seriesResultArr = self.dao.get_series_by_sitecode(siteCode)
-        if seriesResultArr:
-            for seriesResult in seriesResultArr:
-                valueResultArr = self.dao.get_datavalues(
-                    siteCode,
-                    seriesResult.Variable.VariableCode,
-                    startDateTime,
-                    endDateTime
-                )
-                # if not valueResultArr:
-                #    raise Exception(
-                #        ('ERROR: No data found for {} for dates '
-                #         '{} - {}').format(site, startDateTime, endDateTime))
-                if not valueResultArr:
-                    continue
-
-                timeSeries = self.create_timeseries(
-                    siteCode,
-                    seriesResult.Variable.VariableCode,
-                    valueResultArr
-                )
-                timeSeriesResponse.add_timeSeries(timeSeries)
+        if not seriesResultArr:
+            return timeSeriesResponse
+
+        limit = paging.page_limit(pageSize, self.max_values_per_response)
+        if limit is None and not continuation:
+            seriesValues = self.iter_series_values(
+                siteCode, seriesResultArr, startDateTime, endDateTime)
+        else:
+            def read(seriesResult, limit, token):
+                return paging.read_page(
+                    self.dao, siteCode, seriesResult.Variable.VariableCode,
+                    startDateTime, endDateTime, limit, token)
+
+            seriesValues, nextContinuation = paging.read_series_page(
+                self.map_fetch, read, seriesResultArr, limit, continuation)
+            if nextContinuation is not None:
+                paging.add_page_notes(WaterML, queryInfo, nextContinuation)
+
+        siteResult = None
+        varResults = {}
+        for seriesResult, valueResultArr in seriesValues:
+            # if not valueResultArr:
+            #    raise Exception(
+            #        ('ERROR: No data found for {} for dates '
+            #         '{} - {}').format(site, startDateTime, endDateTime))
+            if not valueResultArr:
+                continue
+
+            # The site and each variable are only read once.
+            if siteResult is None:
+                siteResult = self.dao.get_site_by_code(siteCode)
+            varCode = seriesResult.Variable.VariableCode
+            if varCode not in varResults:
+                varResults[varCode] = self.dao.get_variable_by_code(
+                    varCode)
+
+            timeSeries = self.create_timeseries(
+                siteCode,
+                varCode,
+                valueResultArr,
+                siteResult,
+                varResults[varCode]
+            )
+            timeSeriesResponse.add_timeSeries(timeSeries)
 
         return timeSeriesResponse
 
+    def get_fetch_pool(self):
+        """
+        Returns the pool of fetch_workers threads reading the values of
+        GetValuesForASite series, shared by all the requests.
+        """
+        with _fetch_pool_lock:
+            if self._fetch_pool is None:
+                self._fetch_pool = ThreadPool(self.fetch_workers)
+            return self._fetch_pool
+
+    def iter_series_values(self, siteCode, seriesResultArr, startDateTime,
+                           endDateTime):
+        """
+        Yields a (seriesResult, values) pair for each of the series of a
+        site, in order, with None values for the series without values in
+        the date range. The values are read with map_fetch.
+        """
+        def fetch(seriesResult):
+            return _nonempty_iter(self.dao.get_datavalues_iter(
+                siteCode,
+                seriesResult.Variable.VariableCode,
+                startDateTime,
+                endDateTime
+            ))
+
+        return self.map_fetch(fetch, seriesResultArr)
+
+    def map_fetch(self, fetch, items):
+        """
+        Yields an (item, fetch(item)) pair for each of the items, in order.
+
+        When fetch_workers is more than 1 the items are fetched
+        concurrently by the fetch pool and iterable results are read in
+        full, so the DAO must allow calls from several threads. Only
+        fetch_workers items are in flight at a time: the next item is
+        submitted as a result is taken, so results are held in memory no
+        faster than they are consumed, and closing the generator, e.g. when
+        the client disconnects, stops submitting items. Otherwise the items
+        are fetched lazily one after the other.
+        """
+        if self.fetch_workers <= 1 or len(items) < 2:
+            for item in items:
+                yield item, fetch(item)
+            return
+
+        def fetch_all(item):
+            try:
+                result = fetch(item)
+                if result is not None and not isinstance(result, dict):
+                    result = list(result)
+                return result
+            finally:
+                # Pool threads outlive the request, release their session.
+                close_session = getattr(self.dao, 'close_session', None)
+                if close_session is not None:
+                    close_session()
+
+        pool = self.get_fetch_pool()
+        remaining = iter(items)
+        pending = collections.deque()
+
+        def submit():
+            for item in remaining:
+                pending.append((item, pool.apply_async(fetch_all, (item,))))
+                return
+
+        for _ in range(self.fetch_workers):
+            submit()
+        try:
+            while pending:
+                item, result = pending.popleft()
+                valueResult = result.get()
+                submit()
+                yield item, valueResult
+        finally:
+            # Tasks already in flight finish in the pool, their results are
+            # dropped.
+            pending.clear()
+
+    def split_codes(self, arg, get_code):
+        """
+        Returns the codes of a comma separated list of sites or variables,
+        in order and without duplicates.
+        """
+        codes = []
+        for codeArg in arg.split(','):
+            codeArg = codeArg.strip()
+            if not codeArg:
+                continue
+            code = get_code(codeArg)
+            if code is not None and code not in codes:
+                codes.append(code)
+        return codes
+
+    def get_values_multiple_series(self, siteArg, varArg,
+                                   startDateTime=None, endDateTime=None,
+                                   pageSize=None, continuation=None):
+        """
+        Returns an iterator of (siteCode, varCode, siteResult, varResult,
+        values) tuples, one for each site and variable pair of a
+        GetValuesMultiple request with values in the date range, site by
+        site in the order of the requested sites and variables, and the
+        continuation token of the next page, None when there is none.
+
+        siteArg and varArg are comma separated lists, of at most
+        max_multiple_pairs pairs. The values of the pairs are read with
+        map_fetch; when pageSize, max_values_per_response or continuation
+        is given, they are read by paging.read_series_page, at most
+        pageSize or max_values_per_response values in all.
+        """
+        siteCodes = self.split_codes(siteArg, self.get_site_code)
+        varCodes = self.split_codes(varArg, self.get_variable_code)
+        if not siteCodes or not varCodes:
+            raise ValueError(
+                'GetValuesMultiple requires at least one site and one '
+                'variable')
+        if self.max_multiple_pairs and \
+                len(siteCodes) * len(varCodes) > self.max_multiple_pairs:
+            raise ValueError(
+                'GetValuesMultiple accepts at most {0:d} site and variable '
+                'pairs, {1:d} were requested'.format(
+                    self.max_multiple_pairs,
+                    len(siteCodes) * len(varCodes)))
+
+        siteResults = dict(
+            (siteResult.SiteCode, siteResult)
+            for siteResult in self.dao.get_sites_by_codes(siteCodes))
+        # The pairs are listed in the same order on every request, as the
+        # continuation token holds the index of a pair.
+        pairs = [(siteCode, varCode)
+                 for siteCode in siteCodes
+                 for varCode in varCodes
+                 if siteCode in siteResults]
+
+        limit = paging.page_limit(pageSize, self.max_values_per_response)
+        if limit is None and not continuation:
+            def fetch(pair):
+                valueResultArr = self.dao.get_datavalues_iter(
+                    pair[0], pair[1], startDateTime, endDateTime)
+                if isinstance(valueResultArr, dict):
+                    return valueResultArr
+                return _nonempty_iter(valueResultArr)
+
+            pairValues = self.map_fetch(fetch, pairs)
+            nextContinuation = None
+        else:
+            def read(pair, limit, token):
+                return paging.read_page(
+                    self.dao, pair[0], pair[1], startDateTime, endDateTime,
+                    limit, token)
+
+            pairValues, nextContinuation = paging.read_series_page(
+                self.map_fetch, read, pairs, limit, continuation)
+
+        return (self._iter_multiple_series(pairValues, siteResults),
+                nextContinuation)
+
+    def _iter_multiple_series(self, pairValues, siteResults):
+        varResults = {}
+        for (siteCode, varCode), valueResultArr in pairValues:
+            if not valueResultArr:
+                continue
+            if isinstance(valueResultArr, dict):
+                seriesArr = list(valueResultArr.items())
+            else:
+                seriesArr = [(varCode, valueResultArr)]
+            for seriesVarCode, seriesValues in seriesArr:
+                # Each variable is only read once.
+                if seriesVarCode not in varResults:
+                    varResults[seriesVarCode] = \
+                        self.dao.get_variable_by_code(seriesVarCode)
+                yield (siteCode, seriesVarCode, siteResults[siteCode],
+                       varResults[seriesVarCode], seriesValues)
+
+    def create_get_values_multiple_query_info(self, siteArg, varArg,
+                                              startDateTime=None,
+                                              endDateTime=None,
+                                              continuation=None):
+        queryInfo = self.create_get_values_query_info(
+            siteArg, varArg, startDateTime, endDateTime)
+        queryInfo.criteria.MethodCalled = 'GetValuesMultiple'
+        if continuation is not None:
+            paging.add_page_notes(WaterML, queryInfo, continuation)
+        return queryInfo
+
+    def create_get_values_multiple_response(self, siteArg, varArg,
+                                            startDateTime=None,
+                                            endDateTime=None,
+                                            pageSize=None,
+                                            continuation=None):
+        """
+        Returns one timeSeriesResponse with the series of every site and
+        variable pair of the comma separated siteArg and varArg lists, and
+        the continuation token of the next page in its queryInfo when the
+        values are paged.
+        """
+        series, nextContinuation = self.get_values_multiple_series(
+            siteArg, varArg, startDateTime, endDateTime, pageSize,
+            continuation)
+
+        timeSeriesResponse = WaterML.TimeSeriesResponseType()
+        timeSeriesResponse.set_queryInfo(
+            self.create_get_values_multiple_query_info(
+                siteArg, varArg, startDateTime, endDateTime,
+                nextContinuation))
+
+        for siteCode, varCode, siteResult, varResult, valueResultArr in \
+                series:
+            timeSeries = self.create_timeseries(
+                siteCode,
+                varCode,
+                valueResultArr,
+                siteResult,
+                varResult
+            )
+            timeSeriesResponse.add_timeSeries(timeSeries)
+        return timeSeriesResponse
+
+    def create_get_values_multiple_stream(self, siteArg, varArg,
+                                          startDateTime=None,
+                                          endDateTime=None,
+                                          chunk_size=65536,
+                                          pretty_print=True,
+                                          pageSize=None,
+                                          continuation=None):
+        """
+        Returns the generator of the GetValuesMultiple timeSeriesResponse
+        document as text chunks, like create_get_values_stream. Each series
+        is exported as soon as its values are read, or once the page is
+        read when the values are paged. Invalid requests raise ValueError
+        before any chunk is generated.
+        """
+        series, nextContinuation = self.get_values_multiple_series(
+            siteArg, varArg, startDateTime, endDateTime, pageSize,
+            continuation)
+        return self._iter_multiple_stream(
+            siteArg, varArg, startDateTime, endDateTime, series,
+            nextContinuation, chunk_size, pretty_print)
+
+    def _iter_multiple_stream(self, siteArg, varArg, startDateTime,
+                              endDateTime, series, nextContinuation,
+                              chunk_size, pretty_print):
+        # Read the first series before any output, so that DAO errors are
+        # raised by the first chunk.
+        first = next(series, None)
+
+        timeSeriesResponse = WaterML.TimeSeriesResponseType()
+        queryInfo = self.create_get_values_multiple_query_info(
+            siteArg, varArg, startDateTime, endDateTime, nextContinuation)
+
+        out = core.ChunkWriter()
+        core.export_start_tag(timeSeriesResponse, out, 0,
+                              'timeSeriesResponse', NSDEF, pretty_print)
+        queryInfo.export(out, 1, name_='queryInfo', pretty_print=pretty_print)
+
+        if first is not None:
+            for siteCode, varCode, siteResult, varResult, valueResultArr in \
+                    itertools.chain([first], series):
+                for chunk in self.export_timeseries_stream(
+                        out, siteCode, varCode, valueResultArr, chunk_size,
+                        pretty_print, siteResult, varResult):
+                    yield chunk
+
+        core.export_end_tag(out, 0, 'timeSeriesResponse', pretty_print)
+        yield out.drain()
+
     def create_qlevel_element(self, qlevelResult):
         qlevel = WaterML.QualityControlLevelType(
             qualityControlLevelID=qlevelResult.QualityControlLevelID,
@@ -646,6 +1290,13 @@ class WOF_1_1(object):
         return None
 
     # TODO: lots more stuff to fill out here.
+    def create_value_elements(self):
+        """
+        Returns the bulk renderer of the <value> elements of a time series,
+        whose output matches exporting create_value_element elements.
+        """
+        return rendering.ValueElements_1_1()
+
     def create_value_element(self, valueResult):
         # datetime_string = core._get_datavalues_datetime(
         #  valueResult, "LocalDateTime", "DateTimeUTC")
@@ -693,10 +1344,38 @@ class WOF_1_1(object):
     def create_site_element(self, siteResult,
                             seriesResultArr=None, IncludeSeries=True):
         site = WaterML.siteType()
-        siteInfo = self.create_site_info_element(siteResult)
+        siteInfo = self.cached_element(
+            'siteInfoProperties', siteResult.SiteCode,
+            functools.partial(self.create_site_info_properties_element,
+                              siteResult))
 
         site.set_siteInfo(siteInfo)
 
+        if IncludeSeries:
+            seriesCatalog = WaterML.seriesCatalogType()
+            if seriesResultArr is not None:
+                seriesCatalog.menuGroupName = self.menu_group_name
+                # TODO: Make sure this is set properly in config filename.
+                seriesCatalog.serviceWsdl = self.service_wsdl
+
+                for seriesResult in seriesResultArr:
+                    series = self.create_series_element(seriesResult)
+                    seriesCatalog.add_series(series)
+
+            site.add_seriesCatalog(seriesCatalog)
+
+        # need at least one extension element to meet WaterML 1.0
+        # schema validation
+        # site.set_extension('')
+        return site
+
+    def create_site_info_properties_element(self, siteResult):
+        """
+        Returns the siteInfo element of a site element, with the county,
+        state and comments site properties.
+        """
+        siteInfo = self.create_site_info_element(siteResult)
+
         if any([siteResult.County, siteResult.State, siteResult.Comments]):
             if siteResult.County:
                 countyNote = WaterML.PropertyType(
@@ -718,23 +1397,7 @@ class WOF_1_1(object):
                     valueOf_=escape(siteResult.Comments))
                 siteInfo.add_siteProperty(commentsNote)
 
-        if IncludeSeries:
-            seriesCatalog = WaterML.seriesCatalogType()
-            if seriesResultArr is not None:
-                seriesCatalog.menuGroupName = self.menu_group_name
-                # TODO: Make sure this is set properly in config filename.
-                seriesCatalog.serviceWsdl = self.service_wsdl
-
-                for seriesResult in seriesResultArr:
-                    series = self.create_series_element(seriesResult)
-                    seriesCatalog.add_series(series)
-
-            site.add_seriesCatalog(seriesCatalog)
-
-        # need at least one extension element to meet WaterML 1.0
-        # schema validation
-        # site.set_extension('')
-        return site
+        return siteInfo
 
     def create_site_info_element(self, siteResult):
         siteInfo = WaterML.SiteInfoType()
@@ -793,7 +1456,7 @@ class WOF_1_1(object):
         series = WaterML.seriesType()
 
         # Variable
-        variable = self.create_variable_element(seriesResult.Variable)
+        variable = self.cached_variable_element(seriesResult.Variable)
         series.set_variable(variable)
 
         series.valueCount = WaterML.valueCountType(
@@ -805,11 +1468,11 @@ class WOF_1_1(object):
             seriesResult, "EndDateTime", "EndDateTimeUTC")
         # WML1_1 wants a datetime, no zone. breaks the conversion
         try:
-            beginDateTime = dateutil.parser.parse(beginDateTime)
+            beginDateTime = isodates.parse(beginDateTime)
         except Exception as inst:
             logging.warning('bad datetime conversion on beginDateTime:' + str(inst))  # noqa
         try:
-            endDateTime = dateutil.parser.parse(endDateTime)
+            endDateTime = isodates.parse(endDateTime)
         except Exception as inst:
             logging.warning('bad datetime conversion on endDateTime:' + str(inst))  # noqa
 
@@ -826,12 +1489,12 @@ class WOF_1_1(object):
 
         # Method.
         if seriesResult.Method:
-            method = self.create_method_element(seriesResult.Method)
+            method = self.cached_method_element(seriesResult.Method)
             series.method = method
 
         # Source.
         if seriesResult.Source:
-            source = self.create_source_element(seriesResult.Source)
+            source = self.cached_source_element(seriesResult.Source)
             series.source = source
 
         # QualityControlLevel.
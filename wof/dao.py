@@ -1,10 +1,43 @@
 from __future__ import (absolute_import, division, print_function)
 
+import itertools
+import threading
+import time
+
+try:
+    from types import MappingProxyType
+except ImportError:  # Python 2
+    MappingProxyType = dict
+
+from wof import aggregation
+from wof.paging import local_datetime
+from wof.spatial import SiteGridIndex
+
 msg = '{} Method not implemented by this service.'.format
 
+# Serializes reloads of MetadataPreloadMixin maps.
+_metadata_lock = threading.Lock()
+
+# Serializes rebuilds of SpatialIndexMixin indexes.
+_spatial_lock = threading.Lock()
+
+
+def iter_records(rows, record_class):
+    """
+    Yields a record_class object for each row of a column-only query, with
+    the row's labeled columns as attributes.
+    """
+    for row in rows:
+        record = record_class()
+        record.__dict__.update(row._asdict())
+        yield record
+
 
 class BaseDao(object):
 
+    # Number of rows fetched at a time by get_datavalues_iter implementations.
+    datavalues_batch_size = 1000
+
     def get_all_sites(self):
         """
         Returns a list of all the Sites in the data source.
@@ -47,6 +80,18 @@ class BaseDao(object):
         """
         raise NotImplementedError(msg('get_series_by_sitecode'))
 
+    def get_series_by_sitecodes(self, site_codes_arr):
+        """
+        Returns a dictionary mapping each of the given site codes to its list
+        of Series.
+
+        The default implementation calls get_series_by_sitecode once per site
+        code. Data sources that can fetch the Series of many sites in one
+        query should override it.
+        """
+        return dict((site_code, self.get_series_by_sitecode(site_code))
+                    for site_code in site_codes_arr)
+
     def get_series_by_sitecode_and_varcode(self, site_code, var_code):
         """
         Returns a list of Series for the given site code and variable
@@ -62,6 +107,106 @@ class BaseDao(object):
         """
         raise NotImplementedError(msg('get_datavalues'))
 
+    def get_datavalues_iter(self, site_code, var_code, begin_date_time=None,
+                            end_date_time=None):
+        """
+        Returns an iterable of DataValues for the given site code and
+        variable code, filtered by the optional begin and end datetimes.
+
+        Data sources that can read values in batches should override this,
+        so that a long record is not held in memory at once. The default
+        implementation returns the result of get_datavalues.
+        """
+        return self.get_datavalues(site_code, var_code, begin_date_time,
+                                   end_date_time)
+
+    def get_datavalues_page(self, site_code, var_code, begin_date_time=None,
+                            end_date_time=None, limit=None, start=None,
+                            skip=0):
+        """
+        Returns an iterable of at most limit DataValues of
+        get_datavalues_iter, None for all of them, starting at the values
+        dated start, a timezone-aware datetime, after skipping the first
+        skip values.
+
+        Values must be in date time order, with ties always in the same
+        order, as GetValues pages start at the date time of the last value
+        of the previous page and skip the values of that date time it
+        already sent. Data sources that can query a range of rows should
+        override this to push the start, skip and limit down into the
+        query. The default implementation filters and slices
+        get_datavalues_iter.
+        """
+        valueResultArr = self.get_datavalues_iter(
+            site_code, var_code, begin_date_time, end_date_time)
+        if valueResultArr is None or isinstance(valueResultArr, dict):
+            return valueResultArr
+        if start is not None:
+            valueResultArr = itertools.dropwhile(
+                lambda valueResult: local_datetime(valueResult) < start,
+                valueResultArr)
+        stop = None if limit is None else skip + limit
+        return itertools.islice(valueResultArr, skip, stop)
+
+    def get_datavalues_since(self, site_code, var_code, begin_date_time=None,
+                             end_date_time=None, since_value_id=None,
+                             since_date_time=None, limit=None):
+        """
+        Returns an iterable of at most limit DataValues of
+        get_datavalues_iter with a ValueID greater than since_value_id and
+        a date time later than since_date_time, a timezone-aware datetime,
+        when given.
+
+        Values with ids must be in ValueID order, as incremental GetValues
+        requests resume after the largest ValueID already sent; values
+        without ids are in date time order. Data sources that keep the
+        value ids in a database should override this with a keyset query
+        on the id. The default implementation filters and sorts
+        get_datavalues_iter.
+        """
+        valueResultArr = self.get_datavalues_iter(
+            site_code, var_code, begin_date_time, end_date_time)
+        if valueResultArr is None or isinstance(valueResultArr, dict):
+            return valueResultArr
+        if since_value_id is not None:
+            valueResultArr = (
+                valueResult for valueResult in valueResultArr
+                if getattr(valueResult, 'ValueID', None) is not None and
+                valueResult.ValueID > since_value_id)
+        if since_date_time is not None:
+            valueResultArr = (
+                valueResult for valueResult in valueResultArr
+                if local_datetime(valueResult) > since_date_time)
+        valueResultArr = list(valueResultArr)
+        if all(getattr(valueResult, 'ValueID', None) is not None
+               for valueResult in valueResultArr):
+            valueResultArr.sort(key=lambda valueResult: valueResult.ValueID)
+        return valueResultArr[:limit]
+
+    def get_datavalues_aggregate(self, site_code, var_code,
+                                 begin_date_time=None, end_date_time=None,
+                                 interval=None, statistic='mean'):
+        """
+        Returns a list of DataValues with the statistic of the values of
+        each interval, a wof.aggregation.Interval, in date time order, as
+        computed by wof.aggregation.aggregate.
+
+        Data sources that can group values in their queries should override
+        this to push the aggregation down, e.g. with a GROUP BY. The default
+        implementation aggregates get_datavalues_iter, leaving out the no
+        data values of the variable.
+        """
+        valueResultArr = self.get_datavalues_iter(
+            site_code, var_code, begin_date_time, end_date_time)
+        if valueResultArr is None:
+            return []
+        if isinstance(valueResultArr, dict):
+            raise ValueError('Aggregation is not supported by this service')
+        varResult = self.get_variable_by_code(var_code)
+        return aggregation.aggregate(
+            valueResultArr, interval, statistic,
+            getattr(varResult, 'NoDataValue', None))
+
     def get_method_by_id(self, method_id):
         """
         Returns a single Method identified by the given id.
@@ -127,3 +272,265 @@ class BaseDao(object):
         Returns a list of OffsetTypes identified by the given id list.
         """
         raise NotImplementedError(msg('get_sites_by_box'))
+
+    def get_sites_with_series_by_box(self, west, south, east, north):
+        """
+        Returns a list of (Site, list of Series) pairs for the Sites within
+        the given bounding box.
+
+        The default implementation combines get_sites_by_box with
+        get_series_by_sitecodes.
+        """
+        siteResultArr = self.get_sites_by_box(west, south, east, north)
+        seriesDict = self.get_series_by_sitecodes(
+            [siteResult.SiteCode for siteResult in siteResultArr])
+        return [(siteResult, seriesDict.get(siteResult.SiteCode, []))
+                for siteResult in siteResultArr]
+
+    def close_session(self):
+        """
+        Releases the database session of the current thread at the end of
+        a request; wof.flask calls it once a response has been sent.
+
+        The default implementation removes db_session when it is a
+        SQLAlchemy scoped_session, and does nothing otherwise.
+        """
+        db_session = getattr(self, 'db_session', None)
+        if hasattr(db_session, 'remove'):
+            db_session.remove()
+
+
+class MetadataPreloadMixin(object):
+    """
+    Serves the *_by_id and *_by_ids metadata calls of a DAO from immutable
+    id to record maps loaded in memory, instead of querying the data source
+    for every GetValues response.
+
+    Mix it in before the class that defines the DAO's own lookups, which
+    would otherwise shadow the mixin, and implement load_metadata for the
+    kinds the data source can load in full:
+
+        class MyDao(MetadataPreloadMixin, MyQueryDao):
+            def load_metadata(self, kind):
+                ...
+
+    Kinds are 'methods', 'sources', 'qualifiers', 'qualcontrollvls' and
+    'offsettypes'. Kinds for which load_metadata raises NotImplementedError,
+    and ids missing from a loaded map, are passed on to the DAO's own
+    methods. The maps are loaded by preload_metadata, which servers call
+    at startup so that no request waits for them, or else on first use.
+    They are reloaded when they are older than metadata_refresh_interval
+    seconds (None never expires), or when refresh_metadata is called, e.g.
+    from a signal handler. Each
+    reload increments metadata_generation, which invalidates the WaterML
+    fragments rendered from the previous maps.
+    """
+
+    # Seconds after which the maps are reloaded, None to only reload on
+    # refresh_metadata.
+    metadata_refresh_interval = None
+
+    metadata_kinds = {
+        'methods': 'MethodID',
+        'sources': 'SourceID',
+        'qualifiers': 'QualifierID',
+        'qualcontrollvls': 'QualityControlLevelID',
+        'offsettypes': 'OffsetTypeID',
+    }
+
+    metadata_generation = 0
+
+    _metadata = None
+    _metadata_loaded_at = None
+    _metadata_timer = staticmethod(time.time)
+
+    def load_metadata(self, kind):
+        """
+        Returns a list of all the records of the given metadata kind.
+        """
+        raise NotImplementedError(msg('load_metadata'))
+
+    def refresh_metadata(self):
+        """
+        Reloads the metadata maps and returns them.
+        """
+        metadata = {}
+        for kind, id_attr in self.metadata_kinds.items():
+            try:
+                records = self.load_metadata(kind)
+            except NotImplementedError:
+                continue
+            metadata[kind] = MappingProxyType(dict(
+                (getattr(record, id_attr), record) for record in records))
+        # Replace the whole snapshot at once, readers never see a partial
+        # reload.
+        self._metadata = MappingProxyType(metadata)
+        self._metadata_loaded_at = self._metadata_timer()
+        self.metadata_generation += 1
+        return self._metadata
+
+    def preload_metadata(self):
+        """
+        Loads the metadata maps before the first request and returns them.
+        """
+        with _metadata_lock:
+            return self.refresh_metadata()
+
+    def get_metadata(self, kind):
+        """
+        Returns the id to record map of the given kind, or None if the kind
+        is not preloaded.
+        """
+        metadata = self._metadata
+        interval = self.metadata_refresh_interval
+        if metadata is None or (
+                interval is not None and
+                self._metadata_timer() - self._metadata_loaded_at >= interval):
+            with _metadata_lock:
+                if metadata is self._metadata:
+                    metadata = self.refresh_metadata()
+                else:
+                    metadata = self._metadata
+        return metadata.get(kind)
+
+    def _preloaded_by_id(self, kind, record_id, load):
+        records = self.get_metadata(kind)
+        if records is not None and record_id in records:
+            return records[record_id]
+        return load(record_id)
+
+    def _preloaded_by_ids(self, kind, id_arr, load):
+        records = self.get_metadata(kind)
+        if records is None:
+            return load(id_arr)
+        resultArr = []
+        missing = []
+        for record_id in id_arr:
+            if record_id in records:
+                resultArr.append(records[record_id])
+            else:
+                missing.append(record_id)
+        if missing:
+            resultArr.extend(load(missing) or [])
+        return resultArr
+
+    def get_method_by_id(self, method_id):
+        return self._preloaded_by_id(
+            'methods', method_id,
+            super(MetadataPreloadMixin, self).get_method_by_id)
+
+    def get_methods_by_ids(self, method_id_arr):
+        return self._preloaded_by_ids(
+            'methods', method_id_arr,
+            super(MetadataPreloadMixin, self).get_methods_by_ids)
+
+    def get_source_by_id(self, source_id):
+        return self._preloaded_by_id(
+            'sources', source_id,
+            super(MetadataPreloadMixin, self).get_source_by_id)
+
+    def get_sources_by_ids(self, source_id_arr):
+        return self._preloaded_by_ids(
+            'sources', source_id_arr,
+            super(MetadataPreloadMixin, self).get_sources_by_ids)
+
+    def get_qualifier_by_id(self, qualifier_id):
+        return self._preloaded_by_id(
+            'qualifiers', qualifier_id,
+            super(MetadataPreloadMixin, self).get_qualifier_by_id)
+
+    def get_qualifiers_by_ids(self, qualifier_id_arr):
+        return self._preloaded_by_ids(
+            'qualifiers', qualifier_id_arr,
+            super(MetadataPreloadMixin, self).get_qualifiers_by_ids)
+
+    def get_qualcontrollvl_by_id(self, qual_control_lvl_id):
+        return self._preloaded_by_id(
+            'qualcontrollvls', qual_control_lvl_id,
+            super(MetadataPreloadMixin, self).get_qualcontrollvl_by_id)
+
+    def get_qualcontrollvls_by_ids(self, qual_control_lvl_id_arr):
+        return self._preloaded_by_ids(
+            'qualcontrollvls', qual_control_lvl_id_arr,
+            super(MetadataPreloadMixin, self).get_qualcontrollvls_by_ids)
+
+    def get_offsettype_by_id(self, offset_type_id):
+        return self._preloaded_by_id(
+            'offsettypes', offset_type_id,
+            super(MetadataPreloadMixin, self).get_offsettype_by_id)
+
+    def get_offsettypes_by_ids(self, offset_type_id_arr):
+        return self._preloaded_by_ids(
+            'offsettypes', offset_type_id_arr,
+            super(MetadataPreloadMixin, self).get_offsettypes_by_ids)
+
+
+class SpatialIndexMixin(object):
+    """
+    Serves get_sites_by_box from an in-memory SiteGridIndex of the DAO's
+    sites instead of querying the data source for every GetSitesByBox
+    request. Boxes whose west is greater than their east are taken to
+    cross the antimeridian.
+
+    Mix it in before the class that defines the DAO's own get_sites_by_box:
+
+        class MyDao(SpatialIndexMixin, MyQueryDao):
+            pass
+
+    The index is built from load_spatial_sites, get_all_sites by default,
+    on first use or when refresh_spatial_index is called, e.g. at startup
+    and whenever the DAO refreshes its site catalog. It is rebuilt when it
+    is older than spatial_refresh_interval seconds (None never expires).
+
+    Sites added, moved or removed in the data source are not seen by
+    GetSitesByBox until the index is rebuilt, so it may be up to
+    spatial_refresh_interval seconds stale. DAOs of data sources that
+    change while the service runs should set an interval or call
+    refresh_spatial_index when their sites change.
+    """
+
+    # Size in degrees of the grid cells of the index.
+    spatial_cell_size = 1.0
+
+    # Seconds after which the index is rebuilt, None to only rebuild on
+    # refresh_spatial_index. With None, the index never sees the changes
+    # of the data source made after it was built.
+    spatial_refresh_interval = None
+
+    _spatial_index = None
+    _spatial_loaded_at = None
+    _spatial_timer = staticmethod(time.time)
+
+    def load_spatial_sites(self):
+        """
+        Returns a list of all the sites to index.
+        """
+        return self.get_all_sites()
+
+    def refresh_spatial_index(self):
+        """
+        Rebuilds the spatial index and returns it.
+        """
+        self._spatial_index = SiteGridIndex(self.load_spatial_sites(),
+                                            self.spatial_cell_size)
+        self._spatial_loaded_at = self._spatial_timer()
+        return self._spatial_index
+
+    def get_spatial_index(self):
+        """
+        Returns the spatial index, building it if it is missing or expired.
+        """
+        index = self._spatial_index
+        interval = self.spatial_refresh_interval
+        if index is None or (
+                interval is not None and
+                self._spatial_timer() - self._spatial_loaded_at >= interval):
+            with _spatial_lock:
+                if index is self._spatial_index:
+                    index = self.refresh_spatial_index()
+                else:
+                    index = self._spatial_index
+        return index
+
+    def get_sites_by_box(self, west, south, east, north):
+        return self.get_spatial_index().query(west, south, east, north)
@@ -3,13 +3,13 @@ from __future__ import (absolute_import, division, print_function)
 import datetime
 
 import configparser
-from sqlalchemy import create_engine, distinct, func
+from sqlalchemy import distinct, func
 from sqlalchemy.orm import mapper, scoped_session, sessionmaker
 from sqlalchemy.sql import and_
-from dateutil.parser import parse
 from dateutil.tz import tzutc, tzoffset
 
-from wof.dao import BaseDao
+from wof import database, isodates
+from wof.dao import BaseDao, iter_records
 import wof.examples.flask.barebones.sqlalch_LCM_models as model
 import wof.models as wof_base
 
@@ -32,17 +32,12 @@ class LCMDao(BaseDao):
     }
     def __init__(self, db_connection_string, config_file_path):
         '''
-        For SQLite connection - no need to specify for pool size in connection
-        string, e.g.
-        self.engine = create_engine(db_connection_string, convert_unicode=True)
-
-        For non-SQLite connections (e.g. MSSQL) - indicate default pool_size of
-        100, e.g.
-        self.engine = create_engine(db_connection_string, convert_unicode=True,
-         pool_size=100)
+        Pool settings, e.g. Pool_Size for non-SQLite connections (e.g. MSSQL),
+        are read from the [Database] section of the config file.
         '''
 
-        self.engine = create_engine(db_connection_string, convert_unicode=True)
+        self.engine = database.create_engine(
+            db_connection_string, **database.engine_options(config_file_path))
 
         self.db_session = scoped_session(sessionmaker(
             autocommit=False, autoflush=False, bind=self.engine))
@@ -168,6 +163,36 @@ class LCMDao(BaseDao):
             return seriesCatArr
         return None
 
+    def get_series_by_sitecodes(self, site_codes_arr):
+        siteDict = dict((s.SiteCode, s)
+                        for s in self.get_sites_by_codes(site_codes_arr))
+        seriesDict = dict((site_code, []) for site_code in site_codes_arr)
+        if not siteDict:
+            return seriesDict
+
+        resultList = self.db_session.query(
+            model.DataValue.SiteCode.label('SiteCode'),
+            model.DataValue.VariableCode.label('VariableCode'),
+            func.count(model.DataValue.DataValue).label('ValueCount'),
+            func.min(model.DataValue.DateTimeUTC).label('BeginDateTimeUTC'),
+            func.max(model.DataValue.DateTimeUTC).label('EndDateTimeUTC')
+        ).group_by(
+            model.DataValue.SiteCode, model.DataValue.VariableCode).filter(
+                model.DataValue.SiteCode.in_(list(siteDict))
+            ).order_by(
+                model.DataValue.SiteCode, model.DataValue.VariableCode).all()
+        varCodeArr = set(r.VariableCode for r in resultList)
+        varDict = dict((v.VariableCode, v) for v in model.Variable.query.filter(
+            model.Variable.VariableCode.in_(varCodeArr)).all())
+        sourceResult = self.get_source_by_id()
+
+        for r in resultList:
+            seriesCat = model.Series(
+                siteDict[r.SiteCode], varDict[r.VariableCode], r.ValueCount,
+                r.BeginDateTimeUTC, r.EndDateTimeUTC, sourceResult)
+            seriesDict.setdefault(r.SiteCode, []).append(seriesCat)
+        return seriesDict
+
     def get_series_by_sitecode_and_varcode(self, site_code, var_code):
         siteResult = model.Site.query.filter(
             model.Site.SiteCode == site_code).one()
@@ -197,20 +222,10 @@ class LCMDao(BaseDao):
         varResult = self.get_variable_by_code(var_code)
         valueResultArr = None
         if siteResult and varResult:
-            if (not begin_date_time or not end_date_time):
-                valueResultArr = model.DataValue.query.filter(
-                    and_(model.DataValue.SiteCode == site_code,
-                        model.DataValue.VariableCode == var_code)
-                    ).order_by(model.DataValue.DateTimeUTC).all()
-            else:
-                begin_date_time = parse(begin_date_time)
-                end_date_time = parse(end_date_time)
-                valueResultArr = model.DataValue.query.filter(
-                    and_(model.DataValue.SiteCode == site_code,
-                         model.DataValue.VariableCode == var_code,
-                         model.DataValue.DateTimeUTC >= begin_date_time,
-                         model.DataValue.DateTimeUTC <= end_date_time)
-                    ).order_by(model.DataValue.DateTimeUTC).all()
+            valueResultArr = model.DataValue.query.filter(
+                self._datavalues_criteria(site_code, var_code,
+                                          begin_date_time, end_date_time)
+                ).order_by(model.DataValue.DateTimeUTC).all()
 
         for i in range(len(valueResultArr)):
             # Replace offset values of None with offset values = 0
@@ -223,6 +238,48 @@ class LCMDao(BaseDao):
 
         return valueResultArr
 
+    def get_datavalues_iter(self, site_code, var_code, begin_date_time=None,
+                            end_date_time=None):
+        siteResult = self.get_site_by_code(site_code)
+        varResult = self.get_variable_by_code(var_code)
+        if not (siteResult and varResult):
+            return
+
+        rows = self.db_session.query(
+            model.DataValue.ValueID.label('ValueID'),
+            model.DataValue.ValueID.label('MethodID'),
+            model.DataValue.DataValue.label('DataValue'),
+            model.DataValue.DateTimeUTC.label('DateTimeUTC'),
+            model.DataValue.SiteCode.label('SiteCode'),
+            model.DataValue.VariableCode.label('VariableCode'),
+            model.DataValue.OffsetValue.label('OffsetValue'),
+            model.DataValue.MethodDescription.label('MethodDescription')
+        ).filter(
+            self._datavalues_criteria(site_code, var_code,
+                                      begin_date_time, end_date_time)
+        ).order_by(model.DataValue.DateTimeUTC).yield_per(
+            self.datavalues_batch_size)
+
+        for value in iter_records(rows, model.DataValueRecord):
+            # Replace offset values of None with offset values = 0
+            if not value.OffsetValue:
+                value.OffsetValue = 0
+            # Compute local datetimes and assign time zones
+            d = value.DateTimeUTC.replace(tzinfo=utc)
+            value.DateTimeUTC = d
+            value.LocalDateTime = d.astimezone(local_tz)
+            yield value
+
+    def _datavalues_criteria(self, site_code, var_code, begin_date_time,
+                             end_date_time):
+        if (not begin_date_time or not end_date_time):
+            return and_(model.DataValue.SiteCode == site_code,
+                        model.DataValue.VariableCode == var_code)
+        return and_(model.DataValue.SiteCode == site_code,
+                    model.DataValue.VariableCode == var_code,
+                    model.DataValue.DateTimeUTC >= isodates.parse(begin_date_time),
+                    model.DataValue.DateTimeUTC <= isodates.parse(end_date_time))
+
     def get_method_by_id(self, method_id):
         #return model.Method.query.filter(
         #    model.Method.MethodID == method_id).first()
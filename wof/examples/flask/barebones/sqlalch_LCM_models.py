@@ -8,9 +8,9 @@ from sqlalchemy import (Table, Column, Integer, String, ForeignKey, Float,
 from sqlalchemy.sql import join, select, func, label
 from sqlalchemy.orm import mapper, relationship
 from sqlalchemy.ext.declarative import declarative_base
-from dateutil.parser import parse
 from dateutil.tz import tzutc, tzoffset
 
+from wof import isodates
 import wof.models as wof_base
 
 Base = declarative_base()
@@ -117,6 +117,16 @@ class DataValue(Base, wof_base.BaseDataValue):
     QualityControlLevel = wof_base.QualityControlLevelTypes['RAW_DATA'][0]
     QualityControlLevelID = wof_base.QualityControlLevelTypes['RAW_DATA'][1]
 
+
+class DataValueRecord(wof_base.BaseDataValue):
+    """DataValue read from selected columns by LCMDao.get_datavalues_iter"""
+    UTCOffset = DataValue.UTCOffset
+    OffsetTypeID = DataValue.OffsetTypeID
+    MethodLink = DataValue.MethodLink
+    CensorCode = DataValue.CensorCode
+    QualityControlLevel = DataValue.QualityControlLevel
+    QualityControlLevelID = DataValue.QualityControlLevelID
+
 #LCM is the Source/contact for all LCM data
 class Source(wof_base.BaseSource):
     SourceID = 1
@@ -174,9 +184,9 @@ class Series(wof_base.BaseSeries):
                  begin_date_time_utc=None, end_date_time_utc=None,
                  source=None):
         if not type(begin_date_time_utc) is datetime.datetime:
-            begin_date_time_utc = parse(begin_date_time_utc)
+            begin_date_time_utc = isodates.parse(begin_date_time_utc)
         if not type(end_date_time_utc) is datetime.datetime:
-            end_date_time_utc = parse(end_date_time_utc)
+            end_date_time_utc = isodates.parse(end_date_time_utc)
 
         if begin_date_time_utc.tzinfo is None:
             begin_date_time_utc = begin_date_time_utc.replace(tzinfo=utc)
@@ -5,7 +5,6 @@ import time
 from io import StringIO
 
 from lxml import etree
-from sqlalchemy import create_engine
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.sql import and_
 
@@ -13,6 +12,7 @@ from wof.examples.flask.cbi import cbi_cache_models as cache
 from wof.examples.flask.cbi import cbi_models as model
 from wof.examples.flask.cbi import cbi_sos_client
 from wof.examples.flask.cbi import cbi_sos_parser
+from wof import database
 from wof.dao import BaseDao
 
 
@@ -22,8 +22,8 @@ class CbiDao(BaseDao):
         config.read(config_file_path)
         if not database_uri:
             database_uri = config.get('Database', 'URI')
-        self.engine = create_engine(database_uri, convert_unicode=True)
-        #TODO: use pool_size for non-sqlite database
+        self.engine = database.create_engine(
+            database_uri, **database.engine_options(config_file_path))
         self.db_session = scoped_session(sessionmaker(
             autocommit=False, autoflush=False, bind=self.engine))
         cache.init_model(self.db_session)
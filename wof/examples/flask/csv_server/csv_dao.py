@@ -1,15 +1,16 @@
 from __future__ import (absolute_import, division, print_function)
 
-import csv
 import os
 
 import pytz
-from dateutil.parser import parse
 from pytz import timezone
 
-import wof.examples.flask.csv_server.csv_model
+import wof.examples.flask.csv_server.csv_model as csv_model
 import wof.models as wof_base
+from wof import isodates
 from wof.dao import BaseDao
+from wof.examples.flask.csv_server.csv_index import (CsvSiteIndex,
+                                                     CsvValueIndex)
 
 class CsvDao(BaseDao):
     #local_time_zone = tz(None, -21600)
@@ -49,6 +50,12 @@ class CsvDao(BaseDao):
 
         self.variable_dict = variable_dict
 
+        # Sites are looked up by code and values by site and date range
+        # through indexes that are updated when the files change.
+        self.site_index = CsvSiteIndex(self.sites_file_path,
+                                       self.create_site_from_row)
+        self.values_index = CsvValueIndex(self.values_file_path)
+
     def __del__(self):
         pass # Could end database session here for more sophisticated DAOs
 
@@ -61,46 +68,13 @@ class CsvDao(BaseDao):
         return site
 
     def get_all_sites(self):
-        sites = []
-        with open(self.sites_file_path, 'rb') as f:
-            reader = csv.reader(f)
-            at_header = True
-            for row in reader:
-                if at_header:
-                    at_header = False
-                    continue
-
-                site = self.create_site_from_row(row)
-                sites.append(site)
-        return sites
+        return self.site_index.get_all_sites()
 
     def get_site_by_code(self, site_code):
-        with open(self.sites_file_path, 'rb') as f:
-            reader = csv.reader(f)
-            at_header = True
-            for row in reader:
-                if at_header:
-                    at_header = False
-                    continue
-
-                if row[0] == site_code:
-                    site = self.create_site_from_row(row)
-                    return site
+        return self.site_index.get_site(site_code)
 
     def get_sites_by_codes(self, site_codes_arr):
-        sites = []
-        with open(self.sites_file_path, 'rb') as f:
-            reader = csv.reader(f)
-            at_header = True
-            for row in reader:
-                if at_header:
-                    at_header = False
-                    continue
-
-                if row[0] in site_codes_arr:
-                    site = self.create_site_from_row(row)
-                    sites.append(site)
-        return sites
+        return self.site_index.get_sites(site_codes_arr)
 
     def get_all_variables(self):
         return list(self.variable_dict.values())
@@ -120,45 +94,41 @@ class CsvDao(BaseDao):
         series_list = []
         site = self.get_site_by_code(site_code)
         if site:
-            # stage
-            series = self.get_series_by_sitecode_and_varcode(
-                site_code, 'Stage_ft')
-            series_list.extend(series)
-            # discharge
-            series = self.get_series_by_sitecode_and_varcode(
-                site_code, 'Discharge_cfs')
-            series_list.extend(series)
+            for var_code in ('Stage_ft', 'Discharge_cfs'):
+                series_list.append(self.create_series(
+                    site, self.get_variable_by_code(var_code)))
 
         return series_list
 
-
     def get_series_by_sitecode_and_varcode(self, site_code, var_code):
         series_list = []
         site = self.get_site_by_code(site_code)
         if site:
             var = self.get_variable_by_code(var_code)
             if var:
-                series = csv_model.Series()
-                series.SiteCode = site.SiteCode
-                series.SiteName = site.SiteName
-                series.VariableCode = var.VariableCode
-                series.VariableName = var.VariableName
-                series.VariableUnitsID = var.VariableUnitsID
-                series.VariableUnitsName = var.VariableUnits.UnitsName
-                series.SampleMedium = var.SampleMedium
-                series.ValueType = var.ValueType
-                series.TimeSupport = var.TimeSupport
-                series.TimeUnitsID = var.TimeUnitsID
-                series.TimeUnitsName = var.TimeUnits.UnitsName
-                series.DataType = var.DataType
-                series.GeneralCategory = var.GeneralCategory
-                series.Site = site
-                series.Variable = var
-
-                series_list.append(series)
+                series_list.append(self.create_series(site, var))
 
         return series_list
 
+    def create_series(self, site, var):
+        series = csv_model.Series()
+        series.SiteCode = site.SiteCode
+        series.SiteName = site.SiteName
+        series.VariableCode = var.VariableCode
+        series.VariableName = var.VariableName
+        series.VariableUnitsID = var.VariableUnitsID
+        series.VariableUnitsName = var.VariableUnits.UnitsName
+        series.SampleMedium = var.SampleMedium
+        series.ValueType = var.ValueType
+        series.TimeSupport = var.TimeSupport
+        series.TimeUnitsID = var.TimeUnitsID
+        series.TimeUnitsName = var.TimeUnits.UnitsName
+        series.DataType = var.DataType
+        series.GeneralCategory = var.GeneralCategory
+        series.Site = site
+        series.Variable = var
+        return series
+
     def parse_date_strings(self, begin_date_time_string, end_date_time_string):
         """Returns a list with parsed datetimes in the local time zone.
 
@@ -175,19 +145,19 @@ class CsvDao(BaseDao):
         # Convert input strings to datetime objects
         try:
             if begin_date_time_string:
-                b = parse(begin_date_time_string)
+                b = isodates.parse(begin_date_time_string)
             else:
                 # Provide default start date at beginning of period of record
-                b = parse('20080101T00:00:00-0600')
+                b = isodates.parse('20080101T00:00:00-0600')
         except:
             raise ValueError('invalid start date: ' + \
                              str(begin_date_time_string))
         try:
             if end_date_time_string:
-                e = parse(end_date_time_string)
+                e = isodates.parse(end_date_time_string)
             else:
                 # Provide default end date at end of period of record
-                e = parse('20080430T00:00:00-0600')
+                e = isodates.parse('20080430T00:00:00-0600')
         except:
             raise ValueError('invalid end date: ' + str(end_date_time_string))
 
@@ -205,14 +175,15 @@ class CsvDao(BaseDao):
 
         return [b, e]
 
-    def create_datavalue_from_row(self, row, value_index):
+    def create_datavalue_from_row(self, row, value_index, value_date=None):
         datavalue = csv_model.DataValue()
 
         datavalue.DataValue = row[value_index]
 
         # All values are in local time. For this example, local time is always
         # six hours behind UTC time.
-        value_date = parse(row[1])
+        if value_date is None:
+            value_date = isodates.parse(row[1])
 
         #value_date = value_date.replace(tzinfo=self.local_time_zone)
         value_date = self.local_time_zone.localize(value_date)
@@ -247,24 +218,12 @@ class CsvDao(BaseDao):
             b = parse_result[0] # begin datetime
             e = parse_result[1] # end datetime
 
-            # Read values
-            with open(self.values_file_path, 'rb') as f:
-                reader = csv.reader(f)
-                at_header = True
-                values = []
-                for row in reader:
-                    if at_header:
-                        at_header = False
-                        continue
-
-                    # Make sure we're within input date range
-                    value_date = parse(row[1])
-                    if (value_date >= b and value_date <= e and
-                        row[0] == site_code):
-                        # Add data value to result list
-                        datavalue = self.create_datavalue_from_row(row,
-                                                                   value_index)
-                        valueResultArr.append(datavalue)
+            # Read the values of the site within the input date range
+            for value_date, row in self.values_index.get_rows(site_code,
+                                                              b, e):
+                datavalue = self.create_datavalue_from_row(
+                    row, value_index, value_date)
+                valueResultArr.append(datavalue)
 
         return valueResultArr
 
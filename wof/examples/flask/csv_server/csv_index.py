@@ -0,0 +1,228 @@
+from __future__ import (absolute_import, division, print_function)
+
+import bisect
+import csv
+import io
+import logging
+import mmap
+import os
+import threading
+
+from wof import isodates
+
+logger = logging.getLogger(__name__)
+
+# Number of bytes before the end of the indexed part of a values file that
+# must be unchanged for appended rows to be indexed incrementally.
+TAIL_SIZE = 256
+
+
+def file_signature(stat):
+    """
+    Returns the (inode, size, mtime) of an os.stat result, which changes
+    whenever the file is replaced or written.
+    """
+    return (stat.st_ino, stat.st_size, stat.st_mtime)
+
+
+def parse_line(line, encoding='utf-8'):
+    """
+    Returns the fields of one CSV line read from a values file.
+    """
+    return next(csv.reader([line.rstrip(b'\r\n').decode(encoding)]))
+
+
+class CsvSiteIndex(object):
+    """
+    Site code index of a sites file, with a header row and one site per
+    row. The file is reloaded when its signature changes.
+    """
+
+    def __init__(self, path, create_site):
+        self.path = path
+        self.create_site = create_site
+        self._snapshot = None
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """
+        Reloads the sites if the file changed and returns the
+        (signature, sites, sites by code) snapshot of the index.
+        """
+        signature = file_signature(os.stat(self.path))
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot[0] == signature:
+            return snapshot
+        with self._lock:
+            if self._snapshot is snapshot:
+                with io.open(self.path, newline='') as f:
+                    signature = file_signature(os.fstat(f.fileno()))
+                    reader = csv.reader(f)
+                    next(reader, None)
+                    sites = [self.create_site(row) for row in reader if row]
+                self._snapshot = (
+                    signature, sites,
+                    dict((site.SiteCode, site) for site in sites))
+            return self._snapshot
+
+    def get_all_sites(self):
+        return list(self.refresh()[1])
+
+    def get_site(self, site_code):
+        return self.refresh()[2].get(site_code)
+
+    def get_sites(self, site_codes):
+        by_code = self.refresh()[2]
+        return [by_code[site_code] for site_code in site_codes
+                if site_code in by_code]
+
+
+class _ValuesSnapshot(object):
+    """
+    Index of the values file as of one signature. Snapshots are not
+    modified once published, readers may keep using one while the next is
+    built.
+    """
+
+    def __init__(self, signature, data, tail, series):
+        self.signature = signature
+        self.data = data
+        self.tail = tail
+        # Site code -> (sorted dates, (start, end) byte offsets of the rows)
+        self.series = series
+
+
+class CsvValueIndex(object):
+    """
+    Time index of a values file with a header row and one row per site and
+    date, e.g. Site,Date,Stage_ft,Discharge_cfs.
+
+    For each site the index holds the dates of its rows in sorted order
+    with the byte offsets of the rows in the file. A query bisects to the
+    requested date range and only parses the rows of that range, read from
+    a memory map of the file.
+
+    Every query compares the signature of the file with the indexed one.
+    When rows were only appended after the indexed ones, just the new rows
+    are indexed; any other change rebuilds the index. builds and updates
+    count the full and incremental indexing passes.
+    """
+
+    def __init__(self, path, site_column=0, date_column=1,
+                 parse_date=isodates.parse, encoding='utf-8'):
+        self.path = path
+        self.site_column = site_column
+        self.date_column = date_column
+        self.parse_date = parse_date
+        self.encoding = encoding
+        self.builds = 0
+        self.updates = 0
+        self._snapshot = None
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """
+        Indexes the file if it changed and returns the current snapshot.
+        """
+        signature = file_signature(os.stat(self.path))
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.signature == signature:
+            return snapshot
+        with self._lock:
+            if self._snapshot is snapshot:
+                self._snapshot = self._index(snapshot)
+            return self._snapshot
+
+    def _index(self, previous):
+        with open(self.path, 'rb') as f:
+            signature = file_signature(os.fstat(f.fileno()))
+            size = signature[1]
+            data = b''
+            if size:
+                data = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+
+        if self._appended(previous, signature, data):
+            start = previous.signature[1]
+            series = dict(previous.series)
+            self.updates += 1
+        else:
+            # Skip the header row.
+            start = data.find(b'\n') + 1 if size else 0
+            if start == 0:
+                start = size
+            series = {}
+            self.builds += 1
+
+        rows = {}
+        for site_code, date, span in self._scan(data, start, size):
+            rows.setdefault(site_code, []).append((date, span))
+        for site_code, site_rows in rows.items():
+            series[site_code] = self._merge(series.get(site_code), site_rows)
+
+        tail = data[max(0, size - TAIL_SIZE):size]
+        return _ValuesSnapshot(signature, data, tail, series)
+
+    def _appended(self, previous, signature, data):
+        if previous is None or previous.signature[0] != signature[0]:
+            return False
+        indexed_size = previous.signature[1]
+        if not indexed_size or signature[1] < indexed_size:
+            return False
+        # The indexed part must be unchanged and end with a whole row.
+        return (data[indexed_size - 1:indexed_size] == b'\n' and
+                data[max(0, indexed_size - TAIL_SIZE):indexed_size] ==
+                previous.tail)
+
+    def _scan(self, data, start, end):
+        dates = {}
+        pos = start
+        while pos < end:
+            eol = data.find(b'\n', pos, end)
+            next_pos = end if eol == -1 else eol + 1
+            line = data[pos:next_pos]
+            if line.strip():
+                try:
+                    row = parse_line(line, self.encoding)
+                    date_string = row[self.date_column]
+                    date = dates.get(date_string)
+                    if date is None:
+                        date = dates[date_string] = self.parse_date(
+                            date_string)
+                    yield row[self.site_column], date, (pos, next_pos)
+                except (IndexError, ValueError, OverflowError):
+                    logger.warning('Skipping invalid row at byte %d of %s',
+                                   pos, self.path)
+            pos = next_pos
+
+    def _merge(self, indexed, rows):
+        rows.sort(key=lambda row: row[0])
+        if indexed is None:
+            return ([date for date, span in rows],
+                    [span for date, span in rows])
+        dates, spans = list(indexed[0]), list(indexed[1])
+        for date, span in rows:
+            if not dates or date >= dates[-1]:
+                dates.append(date)
+                spans.append(span)
+            else:
+                i = bisect.bisect_right(dates, date)
+                dates.insert(i, date)
+                spans.insert(i, span)
+        return dates, spans
+
+    def get_rows(self, site_code, begin=None, end=None):
+        """
+        Returns (date, row) pairs of the rows of a site dated between begin
+        and end inclusive, in date order. None leaves a side open.
+        """
+        snapshot = self.refresh()
+        indexed = snapshot.series.get(site_code)
+        if indexed is None:
+            return []
+        dates, spans = indexed
+        lo = 0 if begin is None else bisect.bisect_left(dates, begin)
+        hi = len(dates) if end is None else bisect.bisect_right(dates, end)
+        data = snapshot.data
+        return [(dates[i], parse_line(data[spans[i][0]:spans[i][1]],
+                                      self.encoding))
+                for i in range(lo, hi)]
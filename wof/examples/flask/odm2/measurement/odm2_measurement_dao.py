@@ -3,12 +3,13 @@ import os
 import yaml
 
 from datetime import datetime
-from sqlalchemy import create_engine, distinct, func
+from sqlalchemy import distinct, func
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.sql import and_
 
 from dateutil.parser import parse
 
+from wof import database
 from wof.dao import BaseDao
 import wof.examples.flask.odm2.measurement.sqlalch_odm2_models as model
 import odm2api.ODM2.models as odm2_models
@@ -23,11 +24,13 @@ import re
 
 class Odm2Dao(BaseDao):
 
-    def __init__(self, db_connection_string):
-        self.engine = create_engine(db_connection_string, convert_unicode=True,
-            pool_size=100)
+    def __init__(self, db_connection_string, engine_options=None):
+        # Default application pool size is 5. Use 100 to improve performance,
+        # unless the [Database] section of the config file sets Pool_Size.
+        options = {'pool_size': 100}
+        options.update(engine_options or {})
+        self.engine = database.create_engine(db_connection_string, **options)
         odm2_models.setSchema(self.engine)
-        # Default application pool size is 5. Use 100 to improve performance.
         self.db_session = scoped_session(sessionmaker(
             autocommit=False, autoflush=False, bind=self.engine))
         #odm2_models.Base.query = self.db_session.query_property()
@@ -35,15 +38,13 @@ class Odm2Dao(BaseDao):
         with open(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'cvmap_wml_1_1.yml'))) as yml:
             self.yml_dict = yaml.load(yml)
     def __del__(self):
-        self.db_session.close()
+        self.db_session.remove()
 
     def db_check(self):
-        try:
-            self.db_session.query(odm2_models.SamplingFeatures).first()
-        except:
-            self.db_session.rollback()
-        finally:
-            pass
+        # Roll back the session of the current thread, so that a transaction
+        # an earlier error aborted in the database, which the session may
+        # still report active, does not fail the next queries.
+        self.db_session.rollback()
 
     def get_match(self, cvkey, term):
         for k, v in self.yml_dict[cvkey].items():
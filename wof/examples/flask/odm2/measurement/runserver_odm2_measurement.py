@@ -2,6 +2,7 @@ from __future__ import (absolute_import, division, print_function)
 
 import os, sys
 
+import wof.database
 import wof.flask
 
 import logging
@@ -19,7 +20,8 @@ from wof.examples.flask.odm2.measurement.odm2_measurement_dao import Odm2Dao
 
 def startServer(config='odm2_config_measurement.cfg',connection=None,
                     openPort = 8080):
-    dao = Odm2Dao(connection.read())
+    dao = Odm2Dao(connection.read(),
+                  engine_options=wof.database.engine_options(config))
     app = wof.flask.create_wof_flask_app(dao, config)
     app.config['DEBUG'] = True
 
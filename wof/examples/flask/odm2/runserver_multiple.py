@@ -10,6 +10,7 @@ from werkzeug.serving import run_simple
 from werkzeug.exceptions import NotFound
 
 import wof
+import wof.database
 import wof.flask
 from wof.examples.flask.odm2.measurement.odm2_measurement_dao import Odm2Dao as measurement
 from wof.examples.flask.odm2.timeseries.odm2_timeseries_dao import Odm2Dao as timeseries
@@ -28,8 +29,10 @@ def startServer(m_config=M_CONFIG_FILE,
                 openPort=8080):
     if m_connection is None and t_connection is None:
         sys.exit("connection  must be provided")
-    m_dao = measurement(m_connection.read())
-    t_dao = timeseries(t_connection.read())
+    m_dao = measurement(m_connection.read(),
+                        engine_options=wof.database.engine_options(m_config))
+    t_dao = timeseries(t_connection.read(),
+                       engine_options=wof.database.engine_options(t_config))
 
     m_conf = wof.core.wofConfig(m_dao, m_config)
     t_conf = wof.core.wofConfig(t_dao, t_config)
@@ -2,34 +2,50 @@
 """Data Access Objects (DAO) used to retrieve Data from ODM2 Database."""
 from __future__ import (absolute_import, division, print_function)
 
-from dateutil.parser import parse
+import datetime
+import itertools
 import os
 import yaml
 
-from sqlalchemy import (create_engine, func)
-from sqlalchemy.orm import (scoped_session, sessionmaker)
+from sqlalchemy import func
+from sqlalchemy.orm import (contains_eager, scoped_session, sessionmaker)
 
 from odm2api.ODM2 import models as odm2_models
 
+from wof import database, isodates
 import wof.examples.flask.odm2.timeseries.sqlalch_odm2_models as model
-from wof.dao import BaseDao
+from wof.examples.flask.odm2.timeseries.series_catalog import SeriesCatalog
+from wof.dao import BaseDao, MetadataPreloadMixin, SpatialIndexMixin
+from wof.paging import local_datetime
 
 
-class Odm2Dao(BaseDao):
+class _Odm2Dao(BaseDao):
     """Odm2Dao Object for use with WOFpy Server."""
-    def __init__(self, db_connection_string):
-        """Initialize Odm2Dao Object."""
-
-        # Default application pool size is 5. Use 100 to improve performance.
-        self.engine = create_engine(
-            db_connection_string,
-            convert_unicode=True,
-            # pool_size=100
-        )
+    def __init__(self, db_connection_string, series_catalog=True,
+                 engine_options=None, catalog_refresh_interval=600):
+        """Initialize Odm2Dao Object.
+
+        :param db_connection_string: SQLAlchemy Connection String
+        :param series_catalog: Answer the variable and series methods from
+            a SeriesCatalog instead of querying the values table
+        :param catalog_refresh_interval: Seconds after which the series
+            catalog is refreshed, None to only refresh it on
+            refresh_series_catalog
+        :param engine_options: wof.database.create_engine arguments, Ex.
+            wof.database.engine_options('odm2_config_timeseries.cfg')
+        """
+
+        # Connections are tested when checked out of the pool, so a dropped
+        # connection is replaced instead of failing a request. Pool sizing
+        # comes from the [Database] section of the config file.
+        self.engine = database.create_engine(db_connection_string,
+                                             **(engine_options or {}))
 
         odm2_models.setSchema(self.engine)
 
-        Session = scoped_session(
+        # Each thread gets its own session from the registry; close_session
+        # removes it at the end of every request.
+        self.db_session = scoped_session(
             sessionmaker(
                 autocommit=False,
                 autoflush=False,
@@ -37,23 +53,34 @@ class Odm2Dao(BaseDao):
             )
         )
 
-        self.db_session = Session()
-
         # Read in WaterML -> ODM2 CV Mapping
         with open(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'cvmap_wml_1_1.yml'))) as yml:
             self.yml_dict = yaml.load(yml)
 
+        self.series_catalog = None
+        if series_catalog:
+            self.series_catalog = SeriesCatalog(
+                self, refresh_interval=catalog_refresh_interval)
+
     def __del__(self):
         """Closes Database Session."""
-        self.db_session.close()
+        self.db_session.remove()
 
     def db_check(self):
-        try:
-            self.db_session.query(odm2_models.SamplingFeatures).first()
-        except:
-            self.db_session.rollback()
-        finally:
-            pass
+        """Roll back the session of the current thread, so that a
+        transaction an earlier error aborted in the database does not fail
+        the next queries. is_active can not be relied on, as a session may
+        report active while PostgreSQL has aborted its transaction; the
+        rollback costs nothing when no transaction is pending."""
+        self.db_session.rollback()
+
+    def refresh_series_catalog(self):
+        """Build or incrementally refresh the series catalog.
+
+        :return: Number of catalog entries rebuilt
+        """
+        self.db_check()
+        return self.series_catalog.refresh()
 
     def get_match(self, cvkey, term):
         for k, v in self.yml_dict[cvkey].items():
@@ -160,6 +187,9 @@ class Odm2Dao(BaseDao):
             else:
                 l_var_codes = var_codes
 
+        if self.series_catalog is not None:
+            return self.series_catalog.get_variables(l_var_codes)
+
         r_t_Arr = []
         if l_var_codes is None:
             if self.engine.name in ('postgresql', 'mssql'):
@@ -247,6 +277,8 @@ class Odm2Dao(BaseDao):
         :return: List of WOF Series
         """
         self.db_check()
+        if self.series_catalog is not None:
+            return self.series_catalog.get_series_by_sitecode(site_code)
         r = self.db_session.query(odm2_models.TimeSeriesResults). \
             join(odm2_models.FeatureActions). \
             join(odm2_models.SamplingFeatures). \
@@ -261,24 +293,129 @@ class Odm2Dao(BaseDao):
 
         edt_dict = _get_tsrv_enddatetimes(self.db_session, ids)
 
+        return self._create_series(r, edt_dict)
+
+    def get_series_by_sitecodes(self, site_codes_arr):
+        """Get wof series from odm2 database for several site codes.
+
+        The results of all sites are read with a single grouped query.
+
+        :param site_codes_arr: List of Site Codes Ex. ['USU-LBR-Mendon']
+        :return: Dictionary of site code to List of WOF Series
+        """
+        self.db_check()
+        if self.series_catalog is not None:
+            return dict(
+                (site_code,
+                 self.series_catalog.get_series_by_sitecode(site_code))
+                for site_code in site_codes_arr)
+        # The joined feature action is loaded with its result, so reading
+        # its ActionID does not query once per site.
+        r = self.db_session.query(
+            odm2_models.TimeSeriesResults,
+            odm2_models.SamplingFeatures.SamplingFeatureCode). \
+            join(odm2_models.FeatureActions). \
+            join(odm2_models.SamplingFeatures). \
+            options(contains_eager(odm2_models.TimeSeriesResults.FeatureActionObj)). \
+            filter(
+            odm2_models.TimeSeriesResults.FeatureActionID == odm2_models.FeatureActions.FeatureActionID,  # noqa
+            odm2_models.SamplingFeatures.SamplingFeatureCode.in_(site_codes_arr)). \
+            group_by(odm2_models.SamplingFeatures.SamplingFeatureCode,
+                     odm2_models.TimeSeriesResults.VariableID,
+                     odm2_models.TimeSeriesResults.ResultID,
+                     odm2_models.Results.ResultID,
+                     odm2_models.FeatureActions.FeatureActionID).all()
+
+        ids = [i.ResultID for i, site_code in r]
+
+        edt_dict = _get_tsrv_enddatetimes(self.db_session, ids)
+
+        r_dict = dict((site_code, []) for site_code in site_codes_arr)
+        for i, site_code in r:
+            r_dict.setdefault(site_code, []).append(i)
+
+        # The first values and the affiliations of all sites are read
+        # once, not per site.
+        tsrv_dict = self.get_first_tsrvs(ids)
+        aff_dict = self.get_action_affiliations(
+            set(site_r[0].FeatureActionObj.ActionID
+                for site_r in r_dict.values() if site_r))
+        return dict((site_code,
+                     self._create_series(site_r, edt_dict, tsrv_dict,
+                                         aff_dict))
+                    for site_code, site_r in r_dict.items())
+
+    def _create_series(self, r, edt_dict, tsrv_dict=None, aff_dict=None):
+        """Create wof series from the time series results of one site.
+
+        The series of the site get the affiliation of the action of its
+        first result. Results without values are left out.
+
+        :param r: List of TimeSeriesResults
+        :param edt_dict: Dictionary of End Date Time by result id
+        :param tsrv_dict: Dictionary of first TimeSeriesResultValues by
+            result id, read for r when None
+        :param aff_dict: Dictionary of Affiliations by action id, read for
+            r when None
+        :return: List of WOF Series
+        """
+        if not r:
+            return []
+        if tsrv_dict is None:
+            tsrv_dict = self.get_first_tsrvs([i.ResultID for i in r])
+        action_id = r[0].FeatureActionObj.ActionID
+        if aff_dict is None:
+            aff_dict = self.get_action_affiliations([action_id])
+        aff = aff_dict.get(action_id)
+
         r_arr = []
-        aff = None
-        for i in range(len(r)):
-            if i == 0:
-                aff = self.db_session.query(odm2_models.Affiliations). \
-                    join(odm2_models.ActionBy). \
-                    filter(odm2_models.ActionBy.ActionID == r[i].FeatureActionObj.ActionID).first()  # noqa
-
-            r[i].tsrv_EndDateTime = edt_dict[r[i].ResultID]
-            tsrv = self.db_session.query(odm2_models.TimeSeriesResultValues). \
-                filter(odm2_models.TimeSeriesResults.ResultID == r[i].ResultID).first()
-            w_r = model.Series(r[i], aff, tsrv)
-            w_r.Variable.DataType = self.get_match('datatype', w_r.Variable.DataType)
-            w_r.Variable.SampleMedium = self.get_match('samplemedium', w_r.Variable.SampleMedium)
-            w_r.SampleMedium = w_r.Variable.SampleMedium
+        for i in r:
+            tsrv = tsrv_dict.get(i.ResultID)
+            if tsrv is None:
+                continue
+            i.tsrv_EndDateTime = edt_dict.get(i.ResultID)
+            w_r = model.Series(i, aff, tsrv)
+            self.match_series_cvs(w_r)
             r_arr.append(w_r)
         return r_arr
 
+    def match_series_cvs(self, w_r):
+        """Map the ODM2 CV terms of a wof series to WaterML 1.1 terms.
+
+        :param w_r: WOF Series
+        """
+        w_r.Variable.DataType = self.get_match('datatype', w_r.Variable.DataType)
+        w_r.Variable.SampleMedium = self.get_match('samplemedium', w_r.Variable.SampleMedium)
+        w_r.SampleMedium = w_r.Variable.SampleMedium
+
+    def get_tsrv_enddatetimes(self, resultids):
+        """Get the latest value datetime of a list of results.
+
+        :param resultids: List of result id. Ex. [1, 2, 3]
+        :return: Dictionary of End Date Time
+        """
+        if not resultids:
+            return {}
+        return _get_tsrv_enddatetimes(self.db_session, resultids)
+
+    def get_first_tsrvs(self, resultids):
+        """Get the first value of a list of results.
+
+        :param resultids: List of result id. Ex. [1, 2, 3]
+        :return: Dictionary of TimeSeriesResultValues by result id
+        """
+        if not resultids:
+            return {}
+        return _get_first_tsrvs(self.db_session, resultids)
+
+    def get_action_affiliations(self, action_ids):
+        """Get the affiliation of a list of actions.
+
+        :param action_ids: List of action id. Ex. [1, 2, 3]
+        :return: Dictionary of Affiliations by action id
+        """
+        return _get_action_affiliations(self.db_session, action_ids)
+
     def get_series_by_sitecode_and_varcode(self, site_code, var_code):
         """Get wof series from odm2 database by a site code and a variable code.
 
@@ -287,6 +424,9 @@ class Odm2Dao(BaseDao):
         :return: List of WOF Series
         """
         self.db_check()
+        if self.series_catalog is not None:
+            return self.series_catalog.get_series_by_sitecode_and_varcode(
+                site_code, var_code)
         r = self.db_session.query(odm2_models.TimeSeriesResults). \
             join(odm2_models.FeatureActions). \
             join(odm2_models.SamplingFeatures). \
@@ -304,23 +444,7 @@ class Odm2Dao(BaseDao):
 
         edt_dict = _get_tsrv_enddatetimes(self.db_session, ids)
 
-        r_arr = []
-        aff = None
-        for i in range(len(r)):
-            if i is 0:
-                aff = self.db_session.query(odm2_models.Affiliations). \
-                    join(odm2_models.ActionBy). \
-                    filter(odm2_models.ActionBy.ActionID == r[i].FeatureActionObj.ActionID).first()
-
-            r[i].tsrv_EndDateTime = edt_dict[r[i].ResultID]
-            tsrv = self.db_session.query(odm2_models.TimeSeriesResultValues). \
-                filter(odm2_models.TimeSeriesResults.ResultID == r[i].ResultID).first()
-            w_r = model.Series(r[i], aff, tsrv)
-            w_r.Variable.DataType = self.get_match('datatype', w_r.Variable.DataType)
-            w_r.Variable.SampleMedium = self.get_match('samplemedium', w_r.Variable.SampleMedium)
-            w_r.SampleMedium = w_r.Variable.SampleMedium
-            r_arr.append(w_r)
-        return r_arr
+        return self._create_series(r, edt_dict)
 
     def get_datavalues(self, site_code, var_code,
                        begin_date_time=None, end_date_time=None):
@@ -334,56 +458,215 @@ class Odm2Dao(BaseDao):
         :return: List of WOF DataValue
         """
         self.db_check()
-        if not begin_date_time or not end_date_time:
-            try:
-                valueResultArr = self.db_session.query(odm2_models.TimeSeriesResultValues). \
-                    join(odm2_models.TimeSeriesResults). \
-                    join(odm2_models.FeatureActions). \
-                    join(odm2_models.SamplingFeatures). \
-                    join(odm2_models.Variables). \
-                    filter(
-                    odm2_models.TimeSeriesResults.FeatureActionID == odm2_models.FeatureActions.FeatureActionID,  # noqa
-                    odm2_models.TimeSeriesResults.VariableID == odm2_models.Variables.VariableID,
-                    odm2_models.SamplingFeatures.SamplingFeatureCode == site_code,
-                    odm2_models.Variables.VariableCode == var_code). \
-                    order_by(odm2_models.TimeSeriesResultValues.ValueDateTime).all()
-            except:
-                valueResultArr = []
-        else:
-            begin_date_time = parse(begin_date_time)
-            end_date_time = parse(end_date_time)
-            try:
-                valueResultArr = self.db_session.query(odm2_models.TimeSeriesResultValues). \
-                    join(odm2_models.TimeSeriesResults). \
-                    join(odm2_models.FeatureActions). \
-                    join(odm2_models.SamplingFeatures). \
-                    join(odm2_models.Variables). \
-                    filter(
-                    odm2_models.TimeSeriesResults.FeatureActionID == odm2_models.FeatureActions.FeatureActionID,  # noqa
-                    odm2_models.TimeSeriesResults.VariableID == odm2_models.Variables.VariableID,
-                    odm2_models.SamplingFeatures.SamplingFeatureCode == site_code,
-                    odm2_models.Variables.VariableCode == var_code,
-                    odm2_models.TimeSeriesResultValues.ValueDateTime >= begin_date_time,
-                    odm2_models.TimeSeriesResultValues.ValueDateTime <= end_date_time). \
-                    order_by(odm2_models.TimeSeriesResultValues.ValueDateTime).all()
-            except:
-                valueResultArr = []
-        v_arr = []
-        if len(valueResultArr) is not 0:
-            org_id = None
-            aff = None
-            first_flag = True
-            for valueResult in valueResultArr:
-                if first_flag:
-                    first_flag = False
-                    act_id = valueResult.ResultObj.FeatureActionObj.ActionID
-                    aff = self.db_session.query(odm2_models.Affiliations). \
-                        join(odm2_models.ActionBy). \
-                        filter(odm2_models.ActionBy.ActionID == act_id).first()
-                w_v = model.DataValue(valueResult, aff)
-                w_v.CensorCode = self.get_match('censorcode', w_v.CensorCode)
-                v_arr.append(w_v)
-        return v_arr
+        if begin_date_time and end_date_time:
+            begin_date_time = isodates.parse(begin_date_time)
+            end_date_time = isodates.parse(end_date_time)
+        try:
+            valueResultArr = self._datavalues_query(
+                site_code, var_code, begin_date_time, end_date_time).all()
+        except:
+            valueResultArr = []
+        return list(self._create_datavalues(valueResultArr))
+
+    def get_datavalues_iter(self, site_code, var_code,
+                            begin_date_time=None, end_date_time=None):
+        """Get wof datavalues from odm2 database like get_datavalues,
+        reading the time series result values in batches.
+
+        :param site_code: Site Code Ex. 'USU-LBR-Mendon'
+        :param var_code: Variable Code Ex. 'TEMP'
+        :param begin_date_time: Start Time Ex. '2007-08-16 23:30:00.000'
+        :param end_date_time: End Time Ex. '2008-03-27 19:30:00.000'
+        :return: Generator of WOF DataValue
+        """
+        self.db_check()
+        if begin_date_time and end_date_time:
+            begin_date_time = isodates.parse(begin_date_time)
+            end_date_time = isodates.parse(end_date_time)
+        valueResults = self._datavalues_query(
+            site_code, var_code, begin_date_time, end_date_time). \
+            yield_per(self.datavalues_batch_size)
+        for w_v in self._create_datavalues(valueResults):
+            yield w_v
+
+    def get_datavalues_page(self, site_code, var_code, begin_date_time=None,
+                            end_date_time=None, limit=None, start=None,
+                            skip=0):
+        """Get a page of wof datavalues from odm2 database, with the start,
+        skip and limit of the page applied in the query.
+
+        :param site_code: Site Code Ex. 'USU-LBR-Mendon'
+        :param var_code: Variable Code Ex. 'TEMP'
+        :param begin_date_time: Start Time Ex. '2007-08-16 23:30:00.000'
+        :param end_date_time: End Time Ex. '2008-03-27 19:30:00.000'
+        :param limit: Maximum number of values, None for all
+        :param start: Local datetime of the first value of the page
+        :param skip: Number of values skipped from start
+        :return: Generator of WOF DataValue
+        """
+        self.db_check()
+        if begin_date_time and end_date_time:
+            begin_date_time = isodates.parse(begin_date_time)
+            end_date_time = isodates.parse(end_date_time)
+        tsrv = odm2_models.TimeSeriesResultValues
+        q = self._datavalues_query(
+            site_code, var_code, begin_date_time, end_date_time). \
+            order_by(tsrv.ValueID)
+        if start is not None:
+            # ValueDateTime holds the local date time of a value.
+            q = q.filter(tsrv.ValueDateTime >= start.replace(tzinfo=None))
+        if skip:
+            q = q.offset(skip)
+        if limit is not None:
+            q = q.limit(limit)
+        for w_v in self._create_datavalues(
+                q.yield_per(self.datavalues_batch_size)):
+            yield w_v
+
+    def get_datavalues_since(self, site_code, var_code,
+                             begin_date_time=None, end_date_time=None,
+                             since_value_id=None, since_date_time=None,
+                             limit=None):
+        """Get the wof datavalues added after a watermark from odm2
+        database, with a keyset query on the time series result value id.
+
+        :param site_code: Site Code Ex. 'USU-LBR-Mendon'
+        :param var_code: Variable Code Ex. 'TEMP'
+        :param begin_date_time: Start Time Ex. '2007-08-16 23:30:00.000'
+        :param end_date_time: End Time Ex. '2008-03-27 19:30:00.000'
+        :param since_value_id: Only values with a larger ValueID
+        :param since_date_time: Only values later than this aware datetime
+        :param limit: Maximum number of values, None for all
+        :return: Generator of WOF DataValue in ValueID order
+        """
+        self.db_check()
+        if begin_date_time and end_date_time:
+            begin_date_time = isodates.parse(begin_date_time)
+            end_date_time = isodates.parse(end_date_time)
+        tsrv = odm2_models.TimeSeriesResultValues
+        q = self._datavalues_query(
+            site_code, var_code, begin_date_time, end_date_time). \
+            order_by(None).order_by(tsrv.ValueID)
+        if since_value_id is not None:
+            q = q.filter(tsrv.ValueID > since_value_id)
+        if since_date_time is not None:
+            # ValueDateTime holds local date times, select every value that
+            # may be later in any UTC offset and compare them exactly below.
+            q = q.filter(tsrv.ValueDateTime > (
+                since_date_time.astimezone(isodates.tzinfo_for_offset(0)).
+                replace(tzinfo=None) - datetime.timedelta(hours=14)))
+        elif limit is not None:
+            q = q.limit(limit)
+        w_vs = self._create_datavalues(
+            q.yield_per(self.datavalues_batch_size))
+        if since_date_time is not None:
+            w_vs = itertools.islice(
+                (w_v for w_v in w_vs
+                 if local_datetime(w_v) > since_date_time), limit)
+        for w_v in w_vs:
+            yield w_v
+
+    def _datavalues_query(self, site_code, var_code,
+                          begin_date_time=None, end_date_time=None):
+        """Build the query of time series result values by site code,
+        variable code, start datetime, and end datetime.
+
+        Only the value columns are selected, result level metadata is
+        resolved once per result by _get_result_metadata.
+
+        :param begin_date_time: Start Time as datetime or None
+        :param end_date_time: End Time as datetime or None
+        :return: SQLAlchemy Query of TimeSeriesResultValues columns
+        """
+        tsrv = odm2_models.TimeSeriesResultValues
+        q = self.db_session.query(
+            tsrv.ValueID,
+            tsrv.ResultID,
+            tsrv.DataValue,
+            tsrv.ValueDateTime,
+            tsrv.ValueDateTimeUTCOffset,
+            tsrv.CensorCodeCV). \
+            select_from(tsrv). \
+            join(odm2_models.TimeSeriesResults). \
+            join(odm2_models.FeatureActions). \
+            join(odm2_models.SamplingFeatures). \
+            join(odm2_models.Variables). \
+            filter(
+            odm2_models.TimeSeriesResults.FeatureActionID == odm2_models.FeatureActions.FeatureActionID,  # noqa
+            odm2_models.TimeSeriesResults.VariableID == odm2_models.Variables.VariableID,
+            odm2_models.SamplingFeatures.SamplingFeatureCode == site_code,
+            odm2_models.Variables.VariableCode == var_code)
+        if begin_date_time and end_date_time:
+            q = q.filter(
+                tsrv.ValueDateTime >= begin_date_time,
+                tsrv.ValueDateTime <= end_date_time)
+        return q.order_by(tsrv.ValueDateTime)
+
+    def _create_datavalues(self, valueResults):
+        """Create WOF DataValues from time series result value rows,
+        looking up result metadata and censor codes once each.
+
+        :param valueResults: Iterable of _datavalues_query rows
+        :return: Generator of WOF DataValue
+        """
+        result_mds = {}
+        censor_codes = {}
+        for valueResult in valueResults:
+            result_md = result_mds.get(valueResult.ResultID)
+            if result_md is None:
+                result_md = self._get_result_metadata(valueResult.ResultID)
+                result_mds[valueResult.ResultID] = result_md
+            w_v = model.DataValue(valueResult, result_md=result_md)
+            censor_code = w_v.CensorCode
+            if censor_code not in censor_codes:
+                censor_codes[censor_code] = self.get_match('censorcode',
+                                                           censor_code)
+            w_v.CensorCode = censor_codes[censor_code]
+            yield w_v
+
+    def _get_result_metadata(self, result_id):
+        """Get the metadata shared by the values of one result.
+
+        :param result_id: Result ID
+        :return: WOF ResultMetadata
+        """
+        r = self.db_session.query(
+            odm2_models.FeatureActions.ActionID,
+            odm2_models.Actions.MethodID,
+            odm2_models.ProcessingLevels.ProcessingLevelID,
+            odm2_models.ProcessingLevels.ProcessingLevelCode). \
+            select_from(odm2_models.Results). \
+            join(odm2_models.FeatureActions,
+                 odm2_models.Results.FeatureActionID == odm2_models.FeatureActions.FeatureActionID). \
+            join(odm2_models.Actions,
+                 odm2_models.FeatureActions.ActionID == odm2_models.Actions.ActionID). \
+            join(odm2_models.ProcessingLevels,
+                 odm2_models.Results.ProcessingLevelID == odm2_models.ProcessingLevels.ProcessingLevelID). \
+            filter(odm2_models.Results.ResultID == result_id).one()
+        aff = self.db_session.query(odm2_models.Affiliations). \
+            join(odm2_models.ActionBy). \
+            filter(odm2_models.ActionBy.ActionID == r.ActionID).first()
+        return model.ResultMetadata(r.MethodID, r.ProcessingLevelID,
+                                    r.ProcessingLevelCode, aff)
+
+    def load_metadata(self, kind):
+        """Load all wof methods, sources or quality control levels
+        from odm2 database for MetadataPreloadMixin.
+
+        :param kind: Metadata kind Ex. 'methods'
+        :return: List of WOF Method, Source or Quality Control Level
+        """
+        self.db_check()
+        if kind == 'methods':
+            return [model.Method(m) for m in
+                    self.db_session.query(odm2_models.Methods).all()]
+        elif kind == 'sources':
+            return [model.Source(aff) for aff in
+                    self.db_session.query(odm2_models.Affiliations).all()]
+        elif kind == 'qualcontrollvls':
+            return [model.QualityControlLevel(pl) for pl in
+                    self.db_session.query(odm2_models.ProcessingLevels).all()]
+        raise NotImplementedError(kind)
 
     def get_method_by_id(self, method_id):
         """Get wof method from odm2 database by Method ID.
@@ -467,6 +750,36 @@ class Odm2Dao(BaseDao):
         return pl_arr
 
 
+class Odm2Dao(SpatialIndexMixin, MetadataPreloadMixin, _Odm2Dao):
+    """Odm2Dao answering GetSitesByBox from the spatial index of
+    SpatialIndexMixin and the metadata lookups of GetValues from the maps
+    preloaded by MetadataPreloadMixin. Both mixins must precede the
+    queries of _Odm2Dao in the MRO.
+
+    The spatial index expires with the series catalog, every
+    catalog_refresh_interval seconds, or every spatial_refresh_interval
+    seconds without a catalog."""
+
+    spatial_refresh_interval = 600
+
+    def __init__(self, *args, **kwargs):
+        """Initialize Odm2Dao Object, see _Odm2Dao."""
+        super(Odm2Dao, self).__init__(*args, **kwargs)
+        if self.series_catalog is not None:
+            self.spatial_refresh_interval = \
+                self.series_catalog.refresh_interval
+
+    def refresh_series_catalog(self):
+        """Refresh the series catalog and rebuild the spatial index of
+        the sites.
+
+        :return: Number of catalog entries rebuilt
+        """
+        count = super(Odm2Dao, self).refresh_series_catalog()
+        self.refresh_spatial_index()
+        return count
+
+
 def _get_tsrv_enddatetimes(db_session, resultids):
     """Extracts Latest DateTime from Timeseries Result Values.
 
@@ -481,3 +794,45 @@ def _get_tsrv_enddatetimes(db_session, resultids):
                          group_by(odm2_models.TimeSeriesResultValues.ResultID).all())
 
     return edt_dict
+
+
+def _get_first_tsrvs(db_session, resultids):
+    """Extracts the first Timeseries Result Value of every result.
+
+    The values are read with one query, grouped by result id.
+
+    :param db_session: SQLAlchemy Session Object
+    :param resultids: List of result id. Ex. [1, 2, 3]
+    :return: Dictionary of TimeSeriesResultValues by result id
+    """
+    first_ids = db_session.query(
+        func.min(odm2_models.TimeSeriesResultValues.ValueID)). \
+        filter(odm2_models.TimeSeriesResultValues.ResultID.in_(resultids)). \
+        group_by(odm2_models.TimeSeriesResultValues.ResultID)
+    tsrvs = db_session.query(odm2_models.TimeSeriesResultValues). \
+        filter(odm2_models.TimeSeriesResultValues.ValueID.in_(
+            first_ids.subquery())).all()
+    return dict((tsrv.ResultID, tsrv) for tsrv in tsrvs)
+
+
+def _get_action_affiliations(db_session, action_ids):
+    """Extracts the Affiliation of a list of actions.
+
+    The affiliations are read with one query; an action with several gets
+    the one of its first ActionBy row.
+
+    :param db_session: SQLAlchemy Session Object
+    :param action_ids: List of action id. Ex. [1, 2, 3]
+    :return: Dictionary of Affiliations by action id
+    """
+    aff_dict = {}
+    if not action_ids:
+        return aff_dict
+    for action_id, aff in db_session.query(
+            odm2_models.ActionBy.ActionID, odm2_models.Affiliations). \
+            join(odm2_models.Affiliations,
+                 odm2_models.ActionBy.AffiliationID == odm2_models.Affiliations.AffiliationID). \
+            filter(odm2_models.ActionBy.ActionID.in_(list(action_ids))). \
+            order_by(odm2_models.ActionBy.BridgeID):
+        aff_dict.setdefault(action_id, aff)
+    return aff_dict
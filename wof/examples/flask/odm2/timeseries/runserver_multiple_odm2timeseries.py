@@ -7,6 +7,7 @@ import configparser
 import os
 
 import wof
+import wof.database
 import wof.flask
 import wof.vocabularies
 from wof.examples.flask.odm2.timeseries.odm2_timeseries_dao import Odm2Dao as timeseries
@@ -36,8 +37,10 @@ parser.add_argument('--port',
 args = parser.parse_args()
 
 # Add the necessary DAO objects for each config
-m_dao = timeseries(get_connection(M_CONFIG_FILE))
-s_dao = timeseries(get_connection(S_CONFIG_FILE))
+m_dao = timeseries(get_connection(M_CONFIG_FILE),
+                   engine_options=wof.database.engine_options(M_CONFIG_FILE))
+s_dao = timeseries(get_connection(S_CONFIG_FILE),
+                   engine_options=wof.database.engine_options(S_CONFIG_FILE))
 
 # Create the necessary WOF config from the DAO and Config File Path
 m_conf = wof.core.wofConfig(m_dao, M_CONFIG_FILE)
@@ -10,6 +10,7 @@ import argparse
 
 import configparser
 
+import wof.database
 import wof.flask
 import wof.vocabularies
 from wof.examples.flask.odm2.timeseries.odm2_timeseries_dao import Odm2Dao
@@ -39,7 +40,12 @@ parser.add_argument('--port',
                     type=int)
 args = parser.parse_args()
 
-dao = Odm2Dao(get_connection(args.config))
+dao = Odm2Dao(get_connection(args.config),
+              engine_options=wof.database.engine_options(args.config))
+# Build the series catalog, the spatial index of the sites and the metadata
+# maps before the first request.
+dao.refresh_series_catalog()
+dao.preload_metadata()
 app = wof.flask.create_wof_flask_app(dao, args.config)
 
 if __name__ == '__main__':
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""Series catalog of an ODM2 database built from Results metadata."""
+from __future__ import (absolute_import, division, print_function)
+
+import logging
+import threading
+import time
+
+from sqlalchemy.orm import contains_eager
+
+from odm2api.ODM2 import models as odm2_models
+
+import wof.examples.flask.odm2.timeseries.sqlalch_odm2_models as model
+
+# Keeps IN clauses below the bound parameter limit of SQLite.
+IN_CLAUSE_SIZE = 500
+
+logger = logging.getLogger(__name__)
+
+
+def _chunks(ids, size=IN_CLAUSE_SIZE):
+    """Split a list of ids in lists of at most size ids."""
+    ids = list(ids)
+    for i in range(0, len(ids), size):
+        yield ids[i:i + size]
+
+
+class CatalogEntry(object):
+    """Catalog entry of one ODM2 TimeSeriesResult."""
+    def __init__(self, result_id, site_code, state, series):
+        """Initialize CatalogEntry Object.
+
+        :param result_id: Result ID
+        :param site_code: Sampling Feature Code of the result
+        :param state: (ValueCount, end datetime) of the result the entry
+            was built from
+        :param series: WOF Series of the result
+        """
+        self.ResultID = result_id
+        self.SiteCode = site_code
+        self.State = state
+        self.Series = series
+        self.Variable = series.Variable
+        self.VariableCode = series.Variable.VariableCode
+
+
+class SeriesCatalog(object):
+    """Series catalog answering the catalog methods of Odm2Dao.
+
+    The catalog holds variable, units, aggregation interval, begin/end
+    datetime, value count and affiliation of every TimeSeriesResult. It is
+    built from the Results, Actions and ActionBy tables; the values table
+    is only touched to read the first value of every result and the end
+    datetime of results whose action has no EndDateTime.
+
+    refresh rereads the ValueCount and end datetime of every result and
+    only rebuilds the entries of new or changed results; the state of
+    results without values is remembered as well, so they are not reread
+    until they change. Lookups read immutable snapshots. Only the first
+    lookup waits for the catalog to be built; once built, the first lookup
+    after refresh_interval seconds (None never expires) starts a single
+    background refresh, and all lookups keep reading the current snapshot
+    until it completes.
+    """
+    _timer = staticmethod(time.time)
+
+    def __init__(self, dao, refresh_interval=None):
+        """Initialize SeriesCatalog Object.
+
+        :param dao: Odm2Dao the catalog reads from
+        :param refresh_interval: Seconds after which a lookup refreshes the
+            catalog, None to only refresh on refresh
+        """
+        self.dao = dao
+        self.refresh_interval = refresh_interval
+        self.built = False
+        self._built_at = None
+        self._entries = {}
+        self._empty = {}
+        self._by_site = {}
+        self._variables = {}
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """Build the catalog, or update the entries of results that were
+        added, removed or whose ValueCount or end datetime changed since
+        the last refresh.
+
+        :return: Number of entries rebuilt
+        """
+        with self._lock:
+            return self._refresh()
+
+    def ensure_built(self):
+        """Build the catalog if it has not been built yet, or start a
+        background refresh if it is older than refresh_interval and none is
+        running. Lookups do not wait for the background refresh."""
+        if self._is_current():
+            return
+        if not self.built:
+            with self._lock:
+                if not self.built:
+                    self._refresh()
+            return
+        if not self._lock.acquire(False):
+            return
+        try:
+            thread = threading.Thread(target=self._refresh_in_background,
+                                      name='SeriesCatalogRefresh')
+            thread.daemon = True
+            thread.start()
+        except Exception:
+            self._lock.release()
+            raise
+
+    def _refresh_in_background(self):
+        """Refresh the catalog on a background thread, which holds the lock
+        ensure_built acquired. A failed refresh is logged and retried after
+        refresh_interval, while lookups keep reading the current snapshot."""
+        dao = self.dao
+        try:
+            dao.db_check()
+            self._refresh()
+        except Exception:
+            logger.exception('Refreshing the series catalog failed')
+            self._built_at = self._timer()
+        finally:
+            try:
+                dao.close_session()
+            finally:
+                self._lock.release()
+
+    def _is_current(self):
+        """Tell whether the catalog is built and not expired."""
+        interval = self.refresh_interval
+        return self.built and (
+            interval is None or self._timer() - self._built_at < interval)
+
+    def _refresh(self):
+        """Refresh the catalog, with the lock held."""
+        states = self._read_states()
+        entries = dict(
+            (result_id, entry)
+            for result_id, entry in self._entries.items()
+            if states.get(result_id) == entry.State)
+        empty = dict(
+            (result_id, state)
+            for result_id, state in self._empty.items()
+            if states.get(result_id) == state)
+        changed_ids = [result_id for result_id in states
+                       if result_id not in entries and result_id not in empty]
+        for ids in _chunks(changed_ids):
+            for entry in self._create_entries(ids, states):
+                entries[entry.ResultID] = entry
+        # Results without values get no entry; their state is kept so that
+        # they are only reread once they change.
+        for result_id in changed_ids:
+            if result_id not in entries:
+                empty[result_id] = states[result_id]
+        self._empty = empty
+        self._publish(entries)
+        self._built_at = self._timer()
+        self.built = True
+        return len(changed_ids)
+
+    def _read_states(self):
+        """Read the (ValueCount, end datetime) of every result.
+
+        The end datetime is the action EndDateTime, or the latest value
+        datetime of open results, so that values written to an open series
+        without updating its ValueCount are noticed as well.
+
+        :return: Dictionary of state by result id
+        """
+        dao = self.dao
+        rows = dao.db_session.query(
+            odm2_models.TimeSeriesResults.ResultID,
+            odm2_models.TimeSeriesResults.ValueCount,
+            odm2_models.Actions.EndDateTime). \
+            join(odm2_models.FeatureActions,
+                 odm2_models.TimeSeriesResults.FeatureActionID == odm2_models.FeatureActions.FeatureActionID). \
+            join(odm2_models.Actions,
+                 odm2_models.FeatureActions.ActionID == odm2_models.Actions.ActionID).all()  # noqa
+        edt_dict = {}
+        for ids in _chunks(result_id for result_id, value_count, edt in rows
+                           if edt is None):
+            edt_dict.update(dao.get_tsrv_enddatetimes(ids))
+        return dict(
+            (result_id,
+             (value_count, edt if edt is not None else edt_dict.get(result_id)))
+            for result_id, value_count, edt in rows)
+
+    def get_series_by_sitecode(self, site_code):
+        """Get wof series of a site code from the catalog.
+
+        :param site_code: Site Code Ex. 'USU-LBR-Mendon'
+        :return: List of WOF Series
+        """
+        self.ensure_built()
+        return [entry.Series for entry in self._by_site.get(site_code, ())]
+
+    def get_series_by_sitecode_and_varcode(self, site_code, var_code):
+        """Get wof series of a site code and a variable code from the catalog.
+
+        :param site_code: Site Code Ex. 'USU-LBR-Mendon'
+        :param var_code: Variable Code Ex. 'TEMP'
+        :return: List of WOF Series
+        """
+        self.ensure_built()
+        return [entry.Series for entry in self._by_site.get(site_code, ())
+                if entry.VariableCode == var_code]
+
+    def get_variables(self, var_codes=None):
+        """Get wof variables from the catalog.
+
+        :param var_codes: List of Variable Codes, None for all variables
+        :return: List of WOF Variables
+        """
+        self.ensure_built()
+        variables = self._variables
+        if var_codes is None:
+            return list(variables.values())
+        return [variables[var_code] for var_code in var_codes
+                if var_code in variables]
+
+    def _publish(self, entries):
+        """Replace the catalog snapshots with the given entries."""
+        by_site = {}
+        variables = {}
+        for result_id in sorted(entries):
+            entry = entries[result_id]
+            by_site.setdefault(entry.SiteCode, []).append(entry)
+            variables.setdefault(entry.VariableCode, entry.Variable)
+        self._entries = entries
+        self._by_site = by_site
+        self._variables = dict(sorted(
+            variables.items(), key=lambda item: item[1].VariableID))
+
+    def _create_entries(self, result_ids, states):
+        """Create catalog entries of a list of result ids.
+
+        :param result_ids: List of result ids
+        :param states: Dictionary of (ValueCount, end datetime) by result id
+        """
+        dao = self.dao
+        db_session = dao.db_session
+        rows = db_session.query(
+            odm2_models.TimeSeriesResults,
+            odm2_models.SamplingFeatures.SamplingFeatureCode). \
+            join(odm2_models.FeatureActions). \
+            join(odm2_models.SamplingFeatures). \
+            options(contains_eager(odm2_models.TimeSeriesResults.FeatureActionObj)). \
+            filter(
+            odm2_models.TimeSeriesResults.FeatureActionID == odm2_models.FeatureActions.FeatureActionID,  # noqa
+            odm2_models.TimeSeriesResults.ResultID.in_(result_ids)).all()
+
+        aff_dict = dao.get_action_affiliations(
+            set(r.FeatureActionObj.ActionID for r, site_code in rows))
+
+        # The first value of every result gives its aggregation interval.
+        tsrv_dict = dao.get_first_tsrvs(result_ids)
+
+        entries = []
+        for r, site_code in rows:
+            tsrv = tsrv_dict.get(r.ResultID)
+            if tsrv is None:
+                continue
+            state = states[r.ResultID]
+            r.tsrv_EndDateTime = state[1]
+            w_r = model.Series(r, aff_dict.get(r.FeatureActionObj.ActionID),
+                               tsrv)
+            dao.match_series_cvs(w_r)
+            entries.append(CatalogEntry(r.ResultID, site_code, state, w_r))
+        return entries
@@ -152,29 +152,74 @@ def create_iso_utc_offset(utc_offset_hrs):
         return '%+.2d:%.2d' % (hours, minutes)
 
 
+class ResultMetadata(object):
+    """Result level metadata shared by the WOF DataValues of one result."""
+    def __init__(self, method_id, processing_level_id, processing_level_code,
+                 aff_obj=None):
+        """Initialize ResultMetadata Object.
+
+        :param method_id: Method ID of the result's action
+        :param processing_level_id: Processing Level ID of the result
+        :param processing_level_code: Processing Level Code of the result
+        :param aff_obj: ODM2 Affiliation Object
+        """
+        self.MethodID = method_id
+        self.QualityControlLevelID = processing_level_id
+        self.QualityControlLevel = processing_level_code
+        self.SourceID = None
+        if aff_obj is not None:
+            self.SourceID = '%d' % aff_obj.AffiliationID
+        self._iso_utc_offsets = {}
+
+    @classmethod
+    def from_result(cls, r_obj, aff_obj=None):
+        """Create ResultMetadata from an ODM2 Result Object.
+
+        :param r_obj: ODM2 TimeSeriesResult Object
+        :param aff_obj: ODM2 Affiliation Object
+        """
+        return cls(r_obj.FeatureActionObj.ActionObj.MethodID,
+                   r_obj.ProcessingLevelObj.ProcessingLevelID,
+                   r_obj.ProcessingLevelObj.ProcessingLevelCode,
+                   aff_obj)
+
+    def iso_utc_offset(self, utc_offset_hrs):
+        """Memoized create_iso_utc_offset for the offsets of the result."""
+        iso_utc_offset = self._iso_utc_offsets.get(utc_offset_hrs)
+        if iso_utc_offset is None:
+            iso_utc_offset = create_iso_utc_offset(utc_offset_hrs)
+            self._iso_utc_offsets[utc_offset_hrs] = iso_utc_offset
+        return iso_utc_offset
+
+
 class DataValue(wof_base.BaseDataValue):
     """WOF DataValue Model."""
-    def __init__(self, v, aff_obj=None):
+    def __init__(self, v, aff_obj=None, result_md=None):
         """Initialize WOF DataValue Object.
 
-        :param v: ODM2 TimeSeriesResultValue Object
+        :param v: ODM2 TimeSeriesResultValue Object, or a row with its
+            ValueID, DataValue, ValueDateTime, ValueDateTimeUTCOffset and
+            CensorCodeCV columns when result_md is given
         :param aff_obj: ODM2 Affiliation Object
+        :param result_md: ResultMetadata of the value's result
         """
+        if result_md is None:
+            result_md = ResultMetadata.from_result(v.ResultObj, aff_obj)
         self.ValueID = v.ValueID
         self.DataValue = v.DataValue
         self.LocalDateTime = v.ValueDateTime.isoformat()
-        localtime = datetime.strptime(self.LocalDateTime, '%Y-%m-%dT%H:%M:%S')
-        self.DateTimeUTC = localtime+timedelta(hours=((-1)*int(v.ValueDateTimeUTCOffset)))
-        self.UTCOffset = create_iso_utc_offset(v.ValueDateTimeUTCOffset)
-        if aff_obj is not None:
-            self.SourceID = '%d' % aff_obj.AffiliationID
+        self.DateTimeUTC = v.ValueDateTime - timedelta(
+            hours=int(v.ValueDateTimeUTCOffset))
+        self.UTCOffset = result_md.iso_utc_offset(v.ValueDateTimeUTCOffset)
+        if result_md.SourceID is not None:
+            self.SourceID = result_md.SourceID
             # self.SourceCode = aff_obj.OrganizationObj.OrganizationCode
         self.CensorCode = v.CensorCodeCV
-        self.MethodID = v.ResultObj.FeatureActionObj.ActionObj.MethodObj.MethodID
+        self.MethodID = result_md.MethodID
         # self.MethodCode = v.ResultObj.FeatureActionObj.ActionObj.MethodObj.MethodCode
-        self.QualityControlLevelID = v.ResultObj.ProcessingLevelObj.ProcessingLevelID
+        self.QualityControlLevelID = result_md.QualityControlLevelID
         # self.QualityControlLevel = QualityControlLevel(v.ResultObj.ProcessingLevelObj)
-        self.QualityControlLevel = v.ResultObj.ProcessingLevelObj.ProcessingLevelCode
+        self.QualityControlLevel = result_md.QualityControlLevel
 
 
 class Method(wof_base.BaseMethod):
@@ -1,27 +1,27 @@
 from __future__ import (absolute_import, division, print_function)
 
 from datetime import datetime
-from sqlalchemy import create_engine, distinct, func
-from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy import distinct, func
+from sqlalchemy.orm import joinedload, scoped_session, sessionmaker
 from sqlalchemy.sql import and_
 
-from dateutil.parser import parse
-
-from wof.dao import BaseDao
+from wof import database, isodates
+from wof.dao import BaseDao, MetadataPreloadMixin, iter_records
 import wof.examples.flask.odm_1_1.sqlalch_odm_models as model
 
 import pytz
-from dateutil.parser import parse
 #utc_time_zone = tz(None,0)
 UTC_TZ=pytz.utc
 
 
-class OdmDao(BaseDao):
+class _OdmDao(BaseDao):
 
-    def __init__(self, db_connection_string):
-        self.engine = create_engine(db_connection_string, convert_unicode=True,
-            pool_size=100)
-        # Default application pool size is 5. Use 100 to improve performance.
+    def __init__(self, db_connection_string, engine_options=None):
+        # Default application pool size is 5. Use 100 to improve performance,
+        # unless the [Database] section of the config file sets Pool_Size.
+        options = {'pool_size': 100}
+        options.update(engine_options or {})
+        self.engine = database.create_engine(db_connection_string, **options)
         self.db_session = scoped_session(sessionmaker(
             autocommit=False, autoflush=False, bind=self.engine))
         model.init_model(self.db_session)
@@ -92,6 +92,18 @@ class OdmDao(BaseDao):
 
         return seriesResultArr
 
+    def get_series_by_sitecodes(self, site_codes_arr):
+        seriesResultArr = model.Series.query.filter(
+            model.Series.SiteCode.in_(site_codes_arr)).all()
+
+        if seriesResultArr:
+            self.format_series_dates(seriesResultArr)
+
+        seriesDict = dict((site_code, []) for site_code in site_codes_arr)
+        for series in seriesResultArr:
+            seriesDict.setdefault(series.SiteCode, []).append(series)
+        return seriesDict
+
     def get_series_by_sitecode_and_varcode(self, site_code, var_code):
         seriesResultArr = model.Series.query.filter(and_(
             model.Series.SiteCode == site_code,
@@ -120,7 +132,7 @@ class OdmDao(BaseDao):
         # Convert input strings to datetime objects
         try:
             if begin_date_time_string:
-                b = parse(begin_date_time_string)
+                b = isodates.parse(begin_date_time_string)
             else:
                 b = None
         except:
@@ -128,7 +140,7 @@ class OdmDao(BaseDao):
                              str(begin_date_time_string))
         try:
             if end_date_time_string:
-                e = parse(end_date_time_string)
+                e = isodates.parse(end_date_time_string)
             else:
                 e = None
         except:
@@ -183,78 +195,126 @@ class OdmDao(BaseDao):
             end_datetime = parse_result[1]
             using_utc = parse_result[2]
 
-            if using_utc:
-                if begin_datetime and end_datetime:
-                    valueResultArr = model.DataValue.query.filter(
-                        and_(model.DataValue.SiteID == siteResult.SiteID,
-                             model.DataValue.VariableID == \
-                                                         varResult.VariableID,
-                             model.DataValue.DateTimeUTC >= begin_datetime,
-                             model.DataValue.DateTimeUTC <= end_datetime)
-                        ).order_by(model.DataValue.DateTimeUTC).all()
-                elif begin_datetime:
-                    valueResultArr = model.DataValue.query.filter(
-                        and_(model.DataValue.SiteID == siteResult.SiteID,
-                             model.DataValue.VariableID == \
-                                                         varResult.VariableID,
-                             model.DataValue.DateTimeUTC >= begin_datetime)
-                        ).order_by(model.DataValue.DateTimeUTC).all()
-                elif end_datetime:
-                    valueResultArr = model.DataValue.query.filter(
-                        and_(model.DataValue.SiteID == siteResult.SiteID,
-                             model.DataValue.VariableID == \
-                                                         varResult.VariableID,
-                             model.DataValue.DateTimeUTC <= end_datetime)
-                        ).order_by(model.DataValue.DateTimeUTC).all()
-                else:
-                    valueResultArr = model.DataValue.query.filter(
-                        and_(model.DataValue.SiteID == siteResult.SiteID,
-                             model.DataValue.VariableID == \
-                                                         varResult.VariableID)
-                        ).order_by(model.DataValue.DateTimeUTC).all()
-            else:
-                if begin_datetime and end_datetime:
-                    valueResultArr = model.DataValue.query.filter(
-                        and_(model.DataValue.SiteID == siteResult.SiteID,
-                             model.DataValue.VariableID == \
-                                                         varResult.VariableID,
-                             model.DataValue.LocalDateTime >= begin_datetime,
-                             model.DataValue.LocalDateTime <= end_datetime)
-                        ).order_by(model.DataValue.DateTimeUTC).all()
-                elif begin_datetime:
-                    valueResultArr = model.DataValue.query.filter(
-                        and_(model.DataValue.SiteID == siteResult.SiteID,
-                             model.DataValue.VariableID == \
-                                                         varResult.VariableID,
-                             model.DataValue.LocalDateTime >= begin_datetime)
-                        ).order_by(model.DataValue.DateTimeUTC).all()
-                elif end_datetime:
-                    valueResultArr = model.DataValue.query.filter(
-                        and_(model.DataValue.SiteID == siteResult.SiteID,
-                             model.DataValue.VariableID == \
-                                                         varResult.VariableID,
-                             model.DataValue.LocalDateTime <= end_datetime)
-                        ).order_by(model.DataValue.DateTimeUTC).all()
-                else:
-                    valueResultArr = model.DataValue.query.filter(
-                        and_(model.DataValue.SiteID == siteResult.SiteID,
-                             model.DataValue.VariableID == \
-                                                         varResult.VariableID)
-                        ).order_by(model.DataValue.DateTimeUTC).all()
+            valueResultArr = model.DataValue.query.filter(
+                self._datavalues_criteria(siteResult, varResult,
+                                          begin_datetime, end_datetime,
+                                          using_utc)
+                ).order_by(model.DataValue.DateTimeUTC).all()
 
         # Format dates as ISO date strings
         if valueResultArr:
             create_iso_offset = self.create_iso_utc_offset
             for value in valueResultArr:
                 iso_utc_offset = create_iso_offset(value.UTCOffset)
-                ldt = value.LocalDateTime.isoformat() + \
-                                      iso_utc_offset
-
-                value.LocalDateTime = parse(ldt)
+                value.LocalDateTime = value.LocalDateTime.replace(
+                    tzinfo=isodates.tzinfo_for_designator(iso_utc_offset))
                 #value.DateTimeUTC = value.DateTimeUTC.isoformat() + '+00:00'
                 value.DateTimeUTC = UTC_TZ.localize( value.DateTimeUTC)
         return valueResultArr
 
+    def get_datavalues_iter(self, site_code, var_code, begin_date_time=None,
+                            end_date_time=None):
+        return self.get_datavalues_page(site_code, var_code, begin_date_time,
+                                        end_date_time)
+
+    def get_datavalues_page(self, site_code, var_code, begin_date_time=None,
+                            end_date_time=None, limit=None, start=None,
+                            skip=0):
+        siteResult = self.get_site_by_code(site_code)
+        varResult = self.get_variable_by_code(var_code)
+        if not (siteResult and varResult):
+            return iter([])
+
+        begin_datetime, end_datetime, using_utc = self.parse_date_strings(
+            begin_date_time, end_date_time)
+        criteria = self._datavalues_criteria(
+            siteResult, varResult, begin_datetime, end_datetime, using_utc)
+        if start is not None:
+            # Pages start at the UTC date time of a value.
+            criteria = and_(criteria, model.DataValue.DateTimeUTC >=
+                            start.astimezone(UTC_TZ).replace(tzinfo=None))
+        query = self.db_session.query(
+            *model.DataValue.__table__.columns
+        ).filter(criteria).order_by(model.DataValue.DateTimeUTC,
+                                    model.DataValue.ValueID)
+        if skip:
+            query = query.offset(skip)
+        if limit is not None:
+            query = query.limit(limit)
+        return self._iter_datavalues(query)
+
+    def get_datavalues_since(self, site_code, var_code, begin_date_time=None,
+                             end_date_time=None, since_value_id=None,
+                             since_date_time=None, limit=None):
+        siteResult = self.get_site_by_code(site_code)
+        varResult = self.get_variable_by_code(var_code)
+        if not (siteResult and varResult):
+            return
+
+        begin_datetime, end_datetime, using_utc = self.parse_date_strings(
+            begin_date_time, end_date_time)
+        criteria = self._datavalues_criteria(
+            siteResult, varResult, begin_datetime, end_datetime, using_utc)
+        # Keyset query on the primary key, new values have larger ids.
+        if since_value_id is not None:
+            criteria = and_(criteria,
+                            model.DataValue.ValueID > since_value_id)
+        if since_date_time is not None:
+            criteria = and_(criteria, model.DataValue.DateTimeUTC >
+                            since_date_time.astimezone(UTC_TZ).replace(
+                                tzinfo=None))
+        query = self.db_session.query(
+            *model.DataValue.__table__.columns
+        ).filter(criteria).order_by(model.DataValue.ValueID)
+        if limit is not None:
+            query = query.limit(limit)
+        return self._iter_datavalues(query)
+
+    def _iter_datavalues(self, query):
+        rows = query.yield_per(self.datavalues_batch_size)
+
+        create_iso_offset = self.create_iso_utc_offset
+        for value in iter_records(rows, model.DataValueRecord):
+            iso_utc_offset = create_iso_offset(value.UTCOffset)
+            value.LocalDateTime = value.LocalDateTime.replace(
+                tzinfo=isodates.tzinfo_for_designator(iso_utc_offset))
+            value.DateTimeUTC = UTC_TZ.localize(value.DateTimeUTC)
+            yield value
+
+    def _datavalues_criteria(self, siteResult, varResult, begin_datetime,
+                             end_datetime, using_utc):
+        criteria = [model.DataValue.SiteID == siteResult.SiteID,
+                    model.DataValue.VariableID == varResult.VariableID]
+        if using_utc:
+            date_column = model.DataValue.DateTimeUTC
+        else:
+            date_column = model.DataValue.LocalDateTime
+        if begin_datetime:
+            criteria.append(date_column >= begin_datetime)
+        if end_datetime:
+            criteria.append(date_column <= end_datetime)
+        return and_(*criteria)
+
+    def load_metadata(self, kind):
+        if kind == 'methods':
+            query = model.Method.query
+        elif kind == 'sources':
+            query = model.Source.query.options(joinedload(model.Source.Metadata))
+        elif kind == 'qualifiers':
+            query = model.Qualifier.query
+        elif kind == 'qualcontrollvls':
+            query = model.QualityControlLevel.query
+        elif kind == 'offsettypes':
+            query = model.OffsetType.query.options(
+                joinedload(model.OffsetType.OffsetUnits))
+        else:
+            raise NotImplementedError(kind)
+        records = query.all()
+        # Detach the records so that a rollback does not expire them.
+        for record in records:
+            self.db_session.expunge(record)
+        return records
+
     def get_method_by_id(self, method_id):
         return model.Method.query.filter(
             model.Method.MethodID == method_id).first()
@@ -296,3 +356,11 @@ class OdmDao(BaseDao):
     def get_offsettypes_by_ids(self, offset_type_id_arr):
         return model.OffsetType.query.filter(model.OffsetType.OffsetTypeID.in_(
             offset_type_id_arr)).all()
+
+
+class OdmDao(MetadataPreloadMixin, _OdmDao):
+    """
+    ODM 1.1 DAO answering the metadata lookups of GetValues from the maps
+    preloaded by MetadataPreloadMixin, which must precede the queries of
+    _OdmDao in the MRO.
+    """
@@ -5,6 +5,7 @@ from __future__ import (absolute_import, division, print_function)
 import logging
 
 import wof
+import wof.database
 import wof.flask
 from wof.core import WOFConfig
 
@@ -21,7 +22,10 @@ logging.basicConfig(level=logging.DEBUG)
 
 def startServer(connection, config='config.cfg',openPort=8080):
     """given an open file on connection, read it to get a connection string to open the database and start up flask running WOF."""
-    dao = OdmDao(connection.read())
+    dao = OdmDao(connection.read(),
+                 engine_options=wof.database.engine_options(config))
+    # Load the metadata maps before the first request.
+    dao.preload_metadata()
     app = wof.flask.create_wof_flask_app(dao, config)
 
 
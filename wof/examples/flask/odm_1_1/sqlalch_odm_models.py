@@ -105,6 +105,10 @@ class DataValue(Base, wof_base.BaseDataValue):
 
         return wof_base.QualityControlLevelTypes['RAW_DATA'][0]
 
+class DataValueRecord(wof_base.BaseDataValue):
+    """DataValue read from selected columns by OdmDao.get_datavalues_iter"""
+    QualityControlLevel = DataValue.QualityControlLevel
+
 class Qualifier(Base, wof_base.BaseQualifier):
     __tablename__ = c('Qualifiers')
 
@@ -8,9 +8,9 @@ from sqlalchemy import (Table, Column, Integer, String, ForeignKey, Float,
 from sqlalchemy.sql import join, select, func, label
 from sqlalchemy.orm import mapper, relationship, column_property
 from sqlalchemy.ext.declarative import declarative_base
-from dateutil.parser import parse
 from dateutil.tz import tzutc
 
+from wof import isodates
 import wof.models as wof_base
 
 Base = declarative_base()
@@ -169,6 +169,15 @@ class DataValue(Base, wof_base.BaseDataValue):
     QualityControlLevelID = wof_base.QualityControlLevelTypes['RAW_DATA'][1]
 
 
+class DataValueRecord(wof_base.BaseDataValue):
+    """DataValue read from selected columns by SwisDao.get_datavalues_iter"""
+    UTCOffset = DataValue.UTCOffset
+    CensorCode = DataValue.CensorCode
+    SourceID = DataValue.SourceID
+    QualityControlLevel = DataValue.QualityControlLevel
+    QualityControlLevelID = DataValue.QualityControlLevelID
+
+
 #Using instrument information for Method of WaterML
 class Method(Base, wof_base.BaseMethod):
     __tablename__ = 'instrument'
@@ -271,9 +280,9 @@ class Series(wof_base.BaseSeries):
                  source=None):
 
         if not type(begin_date_time_utc) is datetime.datetime:
-            begin_date_time_utc = parse(begin_date_time_utc)
+            begin_date_time_utc = isodates.parse(begin_date_time_utc)
         if not type(end_date_time_utc) is datetime.datetime:
-            end_date_time_utc = parse(end_date_time_utc)
+            end_date_time_utc = isodates.parse(end_date_time_utc)
 
         if begin_date_time_utc.tzinfo is None:
             begin_date_time_utc = begin_date_time_utc.replace(tzinfo=utc)
@@ -4,10 +4,9 @@ from __future__ import (absolute_import, division, print_function)
 import datetime
 
 import configparser
-from sqlalchemy import create_engine, distinct, func
+from sqlalchemy import distinct, func
 from sqlalchemy.orm import mapper, scoped_session, sessionmaker
 from sqlalchemy.sql import and_
-from dateutil.parser import parse
 from dateutil.tz import tzutc
 
 # Instantiate some useful time zones.
@@ -15,7 +14,8 @@ utc = tzutc()
 
 import wof.examples.flask.swis.sqlalch_swis_models as model
 
-from wof.dao import BaseDao
+from wof import database, isodates
+from wof.dao import BaseDao, iter_records
 
 
 class SwisDao(BaseDao):
@@ -33,8 +33,8 @@ class SwisDao(BaseDao):
         }
 
     def __init__(self, config_file_path, database_uri=None):
-        self.engine = create_engine(database_uri, convert_unicode=True)
-        #TODO: Use pool_size for non-sqlite database connection
+        self.engine = database.create_engine(
+            database_uri, **database.engine_options(config_file_path))
         self.db_session = scoped_session(sessionmaker(
             autocommit=False, autoflush=False, bind=self.engine))
         model.init_model(self.db_session)
@@ -112,6 +112,37 @@ class SwisDao(BaseDao):
             return seriesCatArr
         return None
 
+    def get_series_by_sitecodes(self, site_codes_arr):
+        siteResultArr = self.get_sites_by_codes(site_codes_arr)
+        siteDict = dict((s.SiteID, s) for s in siteResultArr)
+        seriesDict = dict((site_code, []) for site_code in site_codes_arr)
+        if not siteDict:
+            return seriesDict
+
+        resultList = self.db_session.query(
+            model.DataValue.SiteID.label('SiteID'),
+            model.DataValue.VariableID.label('VariableID'),
+            func.count(model.DataValue.DataValue).label('ValueCount'),
+            func.min(model.DataValue.DateTimeUTC).label('BeginDateTimeUTC'),
+            func.max(model.DataValue.DateTimeUTC).label('EndDateTimeUTC')
+        ).group_by(
+            model.DataValue.SiteID, model.DataValue.VariableID).filter(
+                model.DataValue.SiteID.in_(list(siteDict))
+            ).order_by(
+                model.DataValue.SiteID, model.DataValue.VariableID).all()
+        varIDArr = set(r.VariableID for r in resultList)
+        varDict = dict((v.VariableID, v) for v in model.Variable.query.filter(
+            model.Variable.VariableID.in_(varIDArr)).all())
+        sourceResult = self.get_source_by_id()
+
+        for r in resultList:
+            siteResult = siteDict[r.SiteID]
+            seriesCat = model.Series(
+                siteResult, varDict[r.VariableID], r.ValueCount,
+                r.BeginDateTimeUTC, r.EndDateTimeUTC, sourceResult)
+            seriesDict.setdefault(siteResult.SiteCode, []).append(seriesCat)
+        return seriesDict
+
     def get_series_by_sitecode_and_varcode(self, site_code, var_code):
         siteResult = model.Site.query.filter(
             model.Site.SiteCode == site_code).one()
@@ -140,21 +171,10 @@ class SwisDao(BaseDao):
         varResult = self.get_variable_by_code(var_code)
         valueResultArr = None
         if siteResult and varResult:
-            if (not begin_date_time or not end_date_time):
-                valueResultArr = model.DataValue.query.filter(
-                    and_(model.DataValue.SiteID == siteResult.SiteID,
-                         model.DataValue.VariableID == varResult.VariableID)
-                    ).order_by(model.DataValue.DateTimeUTC).all()
-            else:
-                begin_date_time = parse(begin_date_time)
-                end_date_time = parse(end_date_time)
-                valueResultArr = model.DataValue.query.filter(
-                    and_(model.DataValue.SiteID == siteResult.SiteID,
-                         model.DataValue.VariableID == varResult.VariableID,
-                         #SWIS doesn't have localdatetime, so using UTC
-                         model.DataValue.DateTimeUTC >= begin_date_time,
-                         model.DataValue.DateTimeUTC <= end_date_time)
-                    ).order_by(model.DataValue.DateTimeUTC).all()
+            valueResultArr = model.DataValue.query.filter(
+                self._datavalues_criteria(siteResult, varResult,
+                                          begin_date_time, end_date_time)
+                ).order_by(model.DataValue.DateTimeUTC).all()
 
             for i in range(len(valueResultArr)):
                 # Assign time zones
@@ -165,6 +185,45 @@ class SwisDao(BaseDao):
 
         return valueResultArr
 
+    def get_datavalues_iter(self, site_code, var_code, begin_date_time=None,
+                            end_date_time=None):
+        siteResult = self.get_site_by_code(site_code)
+        varResult = self.get_variable_by_code(var_code)
+        if not (siteResult and varResult):
+            return
+
+        rows = self.db_session.query(
+            model.DataValue.ValueID.label('ValueID'),
+            model.DataValue.DataValue.label('DataValue'),
+            model.DataValue.DateTimeUTC.label('DateTimeUTC'),
+            model.DataValue.SiteID.label('SiteID'),
+            model.DataValue.VariableID.label('VariableID'),
+            model.DataValue.OffsetValue.label('OffsetValue'),
+            model.DataValue.MethodID.label('MethodID')
+        ).filter(
+            self._datavalues_criteria(siteResult, varResult,
+                                      begin_date_time, end_date_time)
+        ).order_by(model.DataValue.DateTimeUTC).yield_per(
+            self.datavalues_batch_size)
+
+        for value in iter_records(rows, model.DataValueRecord):
+            # Assign time zones
+            value.DateTimeUTC = value.DateTimeUTC.replace(tzinfo=utc)
+            #TODO: Use local time
+            value.LocalDateTime = value.DateTimeUTC
+            yield value
+
+    def _datavalues_criteria(self, siteResult, varResult, begin_date_time,
+                             end_date_time):
+        if (not begin_date_time or not end_date_time):
+            return and_(model.DataValue.SiteID == siteResult.SiteID,
+                        model.DataValue.VariableID == varResult.VariableID)
+        return and_(model.DataValue.SiteID == siteResult.SiteID,
+                    model.DataValue.VariableID == varResult.VariableID,
+                    #SWIS doesn't have localdatetime, so using UTC
+                    model.DataValue.DateTimeUTC >= isodates.parse(begin_date_time),
+                    model.DataValue.DateTimeUTC <= isodates.parse(end_date_time))
+
     def get_method_by_id(self, methodID):
         return model.Method.query.filter(
             model.Method.MethodID == methodID).first()
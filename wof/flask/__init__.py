@@ -19,6 +19,36 @@ try:
 except ImportError:
     version = 'dev'
 
+class SessionTeardownMiddleware(object):
+    """
+    WSGI middleware that calls close_session on the DAOs of a WOF app once
+    each response, streamed or not, has been sent, so every request works
+    with its own database session.
+
+    Other attributes are looked up on the wrapped app, e.g. the mounts of a
+    DispatcherMiddleware.
+    """
+
+    def __init__(self, app, daos):
+        self.app = app
+        self.daos = list(daos)
+
+    def __getattr__(self, name):
+        return getattr(self.app, name)
+
+    def close_sessions(self):
+        for dao in self.daos:
+            dao.close_session()
+
+    def __call__(self, environ, start_response):
+        try:
+            app_iter = self.app(environ, start_response)
+        except Exception:
+            self.close_sessions()
+            raise
+        return werkzeug.wsgi.ClosingIterator(app_iter, self.close_sessions)
+
+
 def create_simple_app():
     app = Flask(__name__)
 
@@ -261,5 +291,8 @@ def create_wof_flask_multiple(wofConfig=[], templates=None):
                      soap_service_url=None,
                      soap_service_1_1_url=None)
 
-    app.wsgi_app = werkzeug.wsgi.DispatcherMiddleware(app.wsgi_app, spyneapps)
+    app.wsgi_app = SessionTeardownMiddleware(
+        werkzeug.wsgi.DispatcherMiddleware(app.wsgi_app, spyneapps),
+        set(wConf.dao for wConf in wofConfig
+            if hasattr(wConf.dao, 'close_session')))
     return app
@@ -0,0 +1,132 @@
+from __future__ import (absolute_import, division, print_function)
+
+import threading
+import time
+from collections import OrderedDict
+from io import StringIO
+
+
+def variable_key(variableResult):
+    """
+    Returns the fragment key of a Variable.
+
+    Besides the variable code, the key holds the attributes that vary
+    between series of the same variable, e.g. in ODM2 where time support
+    and data type come from each result.
+    """
+    timeUnits = variableResult.TimeUnits
+    return (variableResult.VariableID,
+            variableResult.VariableCode,
+            variableResult.DataType,
+            variableResult.SampleMedium,
+            variableResult.ValueType,
+            variableResult.VariableUnitsID,
+            variableResult.TimeSupport,
+            getattr(timeUnits, 'UnitsID', None),
+            getattr(variableResult, 'IsRegular', None))
+
+
+class FragmentCache(object):
+    """
+    LRU cache of exported WaterML sub-elements (siteInfo, variable, method,
+    source), so that the same entity is not rebuilt and re-exported for
+    every series and every response that contains it.
+
+    Keys are (network, vocabulary, WaterML version, element kind, entity
+    key) tuples, extended with the export arguments since the indentation
+    of pretty printed output depends on the nesting level. The cache is
+    cleared when the DAO's metadata_generation changes, e.g. when
+    MetadataPreloadMixin reloads its maps, and entries expire ttl seconds
+    after they were exported (None never expires), so the fragments of
+    DAOs without a metadata_generation follow edits of their data source.
+    """
+
+    def __init__(self, max_entries=4096, ttl=None, timer=time.time):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.timer = timer
+        self.generation = None
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def element(self, key, factory, generation=None):
+        """
+        Returns a FragmentElement exporting the element created by factory
+        through the cache.
+        """
+        if generation != self.generation:
+            with self._lock:
+                self._entries.clear()
+                self.generation = generation
+        return FragmentElement(self, key, factory)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None or (entry[0] is not None and
+                                 entry[0] <= self.timer()):
+                self.misses += 1
+                return None
+            self._entries[key] = entry
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, text):
+        expires = None
+        if self.ttl is not None:
+            expires = self.timer() + self.ttl
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (expires, text)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class FragmentElement(object):
+    """
+    Stands in for a generateDS element. export writes the cached text of
+    the element when there is one; the element itself is only created,
+    through factory, when it has to be exported or when any of its
+    attributes is read.
+    """
+
+    def __init__(self, cache, key, factory):
+        self._cache = cache
+        self._key = key
+        self._factory = factory
+        self._element = None
+
+    @property
+    def element(self):
+        if self._element is None:
+            self._element = self._factory()
+        return self._element
+
+    def __getattr__(self, name):
+        return getattr(self.element, name)
+
+    def export(self, outfile, level, namespace_='', name_=None,
+               namespacedef_='', pretty_print=True):
+        key = self._key + (level, namespace_, name_, namespacedef_,
+                           pretty_print)
+        text = self._cache.get(key)
+        if text is None:
+            buf = StringIO()
+            kwargs = {}
+            if name_ is not None:
+                kwargs['name_'] = name_
+            self.element.export(buf, level, namespace_,
+                                namespacedef_=namespacedef_,
+                                pretty_print=pretty_print, **kwargs)
+            text = buf.getvalue()
+            self._cache.set(key, text)
+        outfile.write(text)
@@ -0,0 +1,115 @@
+from __future__ import (absolute_import, division, print_function)
+
+import datetime
+import re
+
+import dateutil.parser
+import dateutil.tz
+
+# Strict ISO 8601 date times, e.g. 2007-04-05, 2007-04-05 00:00,
+# 2007-04-05T00:00:00.5-06, 2007-04-05T06:00:00Z or
+# 20080101T00:00:00-0600.
+ISO_DATETIME_RE = re.compile(
+    r'(\d{4})-?(\d{2})-?(\d{2})'
+    r'(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:[.,](\d{1,6}))?)?)?'
+    r'\s*(Z|[+-]\d{2}(?::?\d{2})?)?$')
+
+_tzinfos = {}
+_tz_suffixes = {}
+
+
+def tzinfo_for_offset(seconds):
+    """
+    Returns the tzinfo of a UTC offset in seconds, one shared object per
+    offset.
+    """
+    tzinfo = _tzinfos.get(seconds)
+    if tzinfo is None:
+        if seconds == 0:
+            tzinfo = dateutil.tz.tzutc()
+        else:
+            tzinfo = dateutil.tz.tzoffset(None, seconds)
+        tzinfo = _tzinfos.setdefault(seconds, tzinfo)
+    return tzinfo
+
+
+def _offset_seconds(designator):
+    if designator == 'Z':
+        return 0
+    sign = -1 if designator[0] == '-' else 1
+    digits = designator[1:].replace(':', '')
+    minutes = int(digits[2:4]) if len(digits) > 2 else 0
+    return sign * (int(digits[:2]) * 3600 + minutes * 60)
+
+
+def tzinfo_for_designator(designator):
+    """
+    Returns the tzinfo of an ISO 8601 UTC offset designator, e.g. 'Z',
+    '-06', '+05:30' or '-0600'.
+    """
+    return tzinfo_for_offset(_offset_seconds(designator))
+
+
+def parse(value):
+    """
+    Returns value as a datetime.
+
+    Datetimes are returned unchanged. Strings in strict ISO 8601 form are
+    parsed directly, with the tzinfo of their UTC offset shared through
+    tzinfo_for_offset; any other string is left to dateutil.
+    """
+    if isinstance(value, datetime.datetime):
+        return value
+    match = ISO_DATETIME_RE.match(value)
+    if match is None:
+        return dateutil.parser.parse(value)
+    (year, month, day, hour, minute, second, fraction,
+     designator) = match.groups()
+    try:
+        return datetime.datetime(
+            int(year), int(month), int(day),
+            int(hour or 0), int(minute or 0), int(second or 0),
+            int(fraction.ljust(6, '0')) if fraction else 0,
+            tzinfo_for_designator(designator) if designator else None)
+    except ValueError:
+        return dateutil.parser.parse(value)
+
+
+def tz_suffix(dt):
+    """
+    Returns the ISO 8601 UTC offset suffix of a datetime: '' when it is
+    naive, 'Z' for UTC or [+-]hh:mm.
+    """
+    if dt.tzinfo is None:
+        return ''
+    tzoff = dt.tzinfo.utcoffset(dt)
+    if tzoff is None:
+        return ''
+    suffix = _tz_suffixes.get(tzoff)
+    if suffix is None:
+        total_seconds = tzoff.seconds + (86400 * tzoff.days)
+        if total_seconds == 0:
+            suffix = 'Z'
+        else:
+            if total_seconds < 0:
+                sign = '-'
+                total_seconds *= -1
+            else:
+                sign = '+'
+            hours = total_seconds // 3600
+            minutes = (total_seconds - (hours * 3600)) // 60
+            suffix = '{0}{1:02d}:{2:02d}'.format(sign, hours, minutes)
+        suffix = _tz_suffixes.setdefault(tzoff, suffix)
+    return suffix
+
+
+def format_datetime(dt):
+    """
+    Returns a datetime in the ISO 8601 form written by generateDS, with
+    'Z' for UTC and [+-]hh:mm for other offsets.
+    """
+    text = '%04d-%02d-%02dT%02d:%02d:%02d' % (
+        dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second)
+    if dt.microsecond:
+        text += '.%06d' % dt.microsecond
+    return text + tz_suffix(dt)
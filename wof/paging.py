@@ -0,0 +1,314 @@
+from __future__ import (absolute_import, division, print_function)
+
+import datetime
+import itertools
+
+from wof import core
+from wof import isodates
+
+# Titles of the queryInfo notes of a truncated GetValues response.
+CONTINUATION_NOTE = 'continuationToken'
+NEXT_START_NOTE = 'nextStartDate'
+
+# Separates the series index from the page token in the continuation token
+# of a response of several series.
+SERIES_SEPARATOR = '|'
+
+# Titles of the queryInfo notes of an incremental GetValues response.
+WATERMARK_NOTE = 'watermark'
+MORE_VALUES_NOTE = 'moreValues'
+
+
+def format_token(start, skip):
+    """
+    Returns the continuation token of a page starting at the timezone-aware
+    local datetime start, after the first skip values dated start.
+    """
+    return '{0}_{1:d}'.format(isodates.format_datetime(start), skip)
+
+
+def parse_token(token):
+    """
+    Returns the (start datetime, skip) pair of a continuation token.
+    """
+    start, sep, skip = token.rpartition('_')
+    try:
+        if not sep or int(skip) < 0:
+            raise ValueError(token)
+        start = isodates.parse(start)
+        if start.tzinfo is None:
+            raise ValueError(token)
+        return start, int(skip)
+    except (ValueError, OverflowError):
+        raise ValueError('Invalid continuation token: {0}'.format(token))
+
+
+def page_limit(page_size, max_values):
+    """
+    Returns the number of values of a GetValues page, the smaller of the
+    requested page_size and the server's max_values, or None when neither
+    is set.
+    """
+    if page_size is not None:
+        page_size = int(page_size)
+        if page_size < 1:
+            raise ValueError('pageSize must be a positive integer')
+    limits = [limit for limit in (page_size, max_values) if limit]
+    if not limits:
+        return None
+    return min(limits)
+
+
+def local_datetime(valueResult):
+    """
+    Returns the timezone-aware local datetime of a data value.
+    """
+    return core._get_datavalues_datetime(
+        valueResult, 'LocalDateTime', 'DateTimeUTC')
+
+
+def read_page(dao, site_code, var_code, begin_date_time=None,
+              end_date_time=None, limit=None, continuation=None):
+    """
+    Returns the data values of one GetValues page and the continuation
+    token of the next page, None when this page is the last one.
+
+    The values are read with dao.get_datavalues_page, from the position of
+    the continuation token, and one value more than limit to find out
+    whether there is a next page. A limit of None reads all the remaining
+    values. Data sources returning a dict of series are not paged.
+    """
+    start, skip = None, 0
+    if continuation:
+        start, skip = parse_token(continuation)
+
+    valueResultArr = dao.get_datavalues_page(
+        site_code, var_code, begin_date_time, end_date_time,
+        None if limit is None else limit + 1, start, skip)
+    if limit is None or valueResultArr is None or \
+            isinstance(valueResultArr, dict):
+        return valueResultArr, None
+
+    valueResultArr = list(itertools.islice(valueResultArr, limit + 1))
+    if len(valueResultArr) <= limit:
+        return valueResultArr, None
+    del valueResultArr[limit:]
+    return valueResultArr, page_token(valueResultArr, start, skip)
+
+
+def page_token(valueResultArr, start=None, skip=0):
+    """
+    Returns the continuation token of the page following the non-empty
+    valueResultArr, a page read from the position start and skip.
+    """
+    # The next page starts at the datetime of the last value, after the
+    # values of this page with that datetime.
+    nextStart = local_datetime(valueResultArr[-1])
+    ties = 0
+    for valueResult in reversed(valueResultArr):
+        if local_datetime(valueResult) != nextStart:
+            break
+        ties += 1
+    if ties == len(valueResultArr) and start == nextStart:
+        ties += skip
+    return format_token(nextStart, ties)
+
+
+def format_series_token(index, token=None):
+    """
+    Returns the continuation token of a response of several series, which
+    resumes at the series index, from the page token of that series or
+    from its start when token is None.
+    """
+    return '{0:d}{1}{2}'.format(index, SERIES_SEPARATOR, token or '')
+
+
+def parse_series_token(continuation):
+    """
+    Returns the (series index, page token or None) pair of a continuation
+    token of a response of several series.
+    """
+    index, sep, token = continuation.partition(SERIES_SEPARATOR)
+    if not sep or not index.isdigit():
+        raise ValueError(
+            'Invalid continuation token: {0}'.format(continuation))
+    if token:
+        parse_token(token)
+    return int(index), token or None
+
+
+def read_series_page(map_fetch, read, items, limit, continuation=None):
+    """
+    Returns the (item, data values) pairs of one page of at most limit
+    values in all over the series of items, in order, and the continuation
+    token of the next page, None when this page is the last one. A limit
+    of None reads all the remaining values.
+
+    read(item, limit, token) returns the values of the series of an item
+    and their next page token like read_page; map_fetch(fetch, items)
+    yields (item, fetch(item)) pairs, like WOF_1_1.map_fetch. Series
+    without values are left out. The token holds the index of the series
+    in items, so the items must be listed in the same order on every
+    request.
+    """
+    index, token = 0, None
+    if continuation:
+        index, token = parse_series_token(continuation)
+    start, skip = parse_token(token) if token else (None, 0)
+
+    def fetch(indexed):
+        i, item = indexed
+        return read(item, limit, token if i == index else None)
+
+    pairs = []
+    remaining = limit
+    nextContinuation = None
+    fetched = map_fetch(fetch, list(enumerate(items))[index:])
+    try:
+        for (i, item), (valueResultArr, nextToken) in fetched:
+            if isinstance(valueResultArr, dict):
+                # Data sources returning a dict of series are not paged.
+                pairs.append((item, valueResultArr))
+                continue
+            valueResultArr = list(valueResultArr or [])
+            if not valueResultArr:
+                continue
+            if remaining is not None and len(valueResultArr) > remaining:
+                del valueResultArr[remaining:]
+                if i == index:
+                    nextToken = page_token(valueResultArr, start, skip)
+                else:
+                    nextToken = page_token(valueResultArr)
+            pairs.append((item, valueResultArr))
+            if nextToken is not None:
+                nextContinuation = format_series_token(i, nextToken)
+                break
+            if remaining is None:
+                continue
+            remaining -= len(valueResultArr)
+            if remaining == 0:
+                if i + 1 < len(items):
+                    nextContinuation = format_series_token(i + 1)
+                break
+    finally:
+        close = getattr(fetched, 'close', None)
+        if close is not None:
+            close()
+    return pairs, nextContinuation
+
+
+def add_page_notes(WaterML, queryInfo, continuation):
+    """
+    Adds the continuation token and next start date notes of a truncated
+    response to its queryInfo.
+    """
+    queryInfo.add_note(WaterML.NoteType(title=CONTINUATION_NOTE,
+                                        valueOf_=continuation))
+    # Tokens of several series start with the series index.
+    nextStart = continuation.rpartition(SERIES_SEPARATOR)[2].rpartition(
+        '_')[0]
+    if nextStart:
+        queryInfo.add_note(WaterML.NoteType(title=NEXT_START_NOTE,
+                                            valueOf_=nextStart))
+
+
+def parse_since(since):
+    """
+    Returns the (value id, datetime, skip) triple of the since argument of
+    an incremental GetValues request, a watermark: either a value id, or a
+    date time optionally followed by the number of values dated that date
+    time already sent, as in a continuation token. Date times without a UTC
+    offset are in UTC.
+    """
+    since = since.strip()
+    if since.isdigit():
+        return int(since), None, 0
+    if '_' in since:
+        try:
+            since_date_time, skip = parse_token(since)
+        except ValueError:
+            raise ValueError('Invalid since watermark: {0}'.format(since))
+        return None, since_date_time, skip
+    try:
+        since_date_time = isodates.parse(since)
+    except (ValueError, OverflowError):
+        raise ValueError('Invalid since watermark: {0}'.format(since))
+    if since_date_time.tzinfo is None:
+        since_date_time = since_date_time.replace(
+            tzinfo=isodates.tzinfo_for_offset(0))
+    return None, since_date_time, 0
+
+
+def format_watermark(valueResultArr, since):
+    """
+    Returns the watermark of the values of an incremental response, the
+    largest value id, or when the values have no ids the latest date time
+    and the number of values with that date time sent so far, so that a
+    response cut by limit between values of equal date times resumes
+    after the ones already sent. Without values the watermark is unchanged.
+    """
+    if not valueResultArr:
+        return since
+    valueIds = [getattr(valueResult, 'ValueID', None)
+                for valueResult in valueResultArr]
+    if None not in valueIds:
+        return str(max(valueIds))
+    since_value_id, since_date_time, skip = parse_since(since)
+    return page_token(sorted(valueResultArr, key=local_datetime),
+                      since_date_time, skip)
+
+
+def read_since(dao, site_code, var_code, begin_date_time=None,
+               end_date_time=None, since=None, limit=None):
+    """
+    Returns the data values added after the since watermark in date time
+    order, the watermark of the next request and whether more values were
+    left out by limit.
+
+    The values are read with dao.get_datavalues_since, one value more than
+    limit to find out whether there are more. Data sources returning a
+    dict of series are not read incrementally.
+    """
+    since_value_id, since_date_time, skip = parse_since(since)
+    after_date_time = since_date_time
+    if skip:
+        # Read the values dated since_date_time again and leave out the
+        # ones already sent; date times have a resolution of a microsecond.
+        after_date_time -= datetime.timedelta(microseconds=1)
+    valueResultArr = dao.get_datavalues_since(
+        site_code, var_code, begin_date_time, end_date_time,
+        since_value_id, after_date_time,
+        None if limit is None else limit + skip + 1)
+    if valueResultArr is None:
+        return [], since, False
+    if isinstance(valueResultArr, dict):
+        raise ValueError('Incremental GetValues is not supported by this '
+                         'service')
+
+    valueResultArr = list(valueResultArr)
+    if skip:
+        unsent = []
+        for valueResult in valueResultArr:
+            if skip and local_datetime(valueResult) == since_date_time:
+                skip -= 1
+            else:
+                unsent.append(valueResult)
+        valueResultArr = unsent
+    more = limit is not None and len(valueResultArr) > limit
+    if more:
+        del valueResultArr[limit:]
+    watermark = format_watermark(valueResultArr, since)
+    valueResultArr.sort(key=local_datetime)
+    return valueResultArr, watermark, more
+
+
+def add_watermark_notes(WaterML, queryInfo, watermark, more):
+    """
+    Adds the watermark note of an incremental response to its queryInfo,
+    and the more values note when limit left values out.
+    """
+    queryInfo.add_note(WaterML.NoteType(title=WATERMARK_NOTE,
+                                        valueOf_=watermark))
+    if more:
+        queryInfo.add_note(WaterML.NoteType(title=MORE_VALUES_NOTE,
+                                            valueOf_='true'))
@@ -0,0 +1,225 @@
+from __future__ import (absolute_import, division, print_function)
+
+import datetime
+
+from wof import WaterML
+from wof import WaterML_1_1
+from wof import core
+from wof import isodates
+from wof import vocabularies as voc
+
+QUOTED = 'quoted'
+INTEGER = 'integer'
+DOUBLE = 'double'
+DATETIME = 'datetime'
+
+
+def _memoized(fmt):
+    """
+    Returns fmt memoized on the type and value of its argument. Codes and
+    ids repeat for most of the values of a series.
+    """
+    formatted = {}
+
+    def memoized_fmt(value):
+        key = (value.__class__, value)
+        text = formatted.get(key)
+        if text is None:
+            text = formatted[key] = fmt(value)
+        return text
+    return memoized_fmt
+
+
+class ValueElements(object):
+    """
+    Renders the <value> elements of a series in bulk, from columns of
+    attribute values instead of one generateDS ValueSingleVariable per
+    value, with output identical to exporting those elements.
+
+    Subclasses set fields, the (attribute, kind) pairs in the order of
+    ValueSingleVariable.exportAttributes, and add the data values. An
+    instance stands in for the value list of a TsValuesSingleVariableType:
+    its export writes all the rendered <value> elements.
+    """
+
+    fields = ()
+    WaterML = None
+
+    def __init__(self):
+        self.columns = [[] for field in self.fields]
+        self.texts = []
+
+    def __len__(self):
+        return len(self.texts)
+
+    def clear(self):
+        for column in self.columns:
+            del column[:]
+        del self.texts[:]
+
+    def _formatter(self, name, kind):
+        quote_attrib = self.WaterML.quote_attrib
+        if kind == QUOTED:
+            return _memoized(
+                lambda value: ' %s=%s' % (name, quote_attrib(value)))
+        elif kind == INTEGER:
+            return _memoized(lambda value: ' %s="%d"' % (name, int(value)))
+        elif kind == DOUBLE:
+            return _memoized(
+                lambda value: ' %s="%s"' % (name, '{0}'.format(float(value))))
+        elif kind == DATETIME:
+            return self._datetime_formatter(name)
+        raise ValueError(kind)
+
+    def _datetime_formatter(self, name):
+        prefix = ' %s="' % name
+
+        def fmt(value):
+            if isinstance(value, str):
+                value = datetime.datetime.strptime(value, '%Y-%m-%dT%H:%M:%S')
+            return prefix + isodates.format_datetime(value) + '"'
+        return fmt
+
+    def render(self, level, namespace_='', name_='value', pretty_print=True):
+        """
+        Returns the text of the <value> elements.
+        """
+        if pretty_print:
+            indent = '    ' * level
+            eol = '\n'
+        else:
+            indent = ''
+            eol = ''
+        start = indent + '<' + namespace_ + name_
+        end = '</' + namespace_ + name_ + '>' + eol
+        empty = '/>' + eol
+
+        formatted = []
+        for (name, kind), column in zip(self.fields, self.columns):
+            if not any(value is not None for value in column):
+                continue
+            fmt = self._formatter(name, kind)
+            formatted.append([fmt(value) if value is not None else ''
+                              for value in column])
+        if formatted:
+            attributes = [''.join(parts) for parts in zip(*formatted)]
+        else:
+            attributes = [''] * len(self.texts)
+
+        return ''.join([
+            start + attrs + '>' + text + end if text else
+            start + attrs + empty
+            for attrs, text in zip(attributes, self.texts)])
+
+    def export(self, outfile, level, namespace_='', name_='value',
+               namespacedef_='', pretty_print=True):
+        outfile.write(self.render(level, namespace_, name_, pretty_print))
+
+
+class ValueElements_1_1(ValueElements):
+    """
+    WaterML 1.1 <value> elements, as created by
+    WOF_1_1.create_value_element.
+    """
+
+    WaterML = WaterML_1_1
+    fields = (
+        ('sampleID', INTEGER),
+        ('methodCode', QUOTED),
+        ('qualityControlLevelCode', QUOTED),
+        ('censorCode', QUOTED),
+        ('accuracyStdDev', DOUBLE),
+        ('offsetTypeID', INTEGER),
+        ('dateTime', DATETIME),
+        ('dateTimeUTC', DATETIME),
+        ('sourceCode', QUOTED),
+        ('timeOffset', QUOTED),
+        ('offsetValue', DOUBLE),
+        ('qualifiers', QUOTED),
+    )
+
+    def __init__(self):
+        super(ValueElements_1_1, self).__init__()
+        self._check_censorCode = _memoized(voc.check_censorCode)
+
+    def add(self, valueResult):
+        """
+        Adds a data value and returns its WaterML censor code.
+        """
+        aDate = core._get_datavalues_datetime(
+            valueResult, "LocalDateTime", "DateTimeUTC")
+
+        if not hasattr(valueResult, 'MethodCode'):
+            setattr(valueResult, 'MethodCode', None)
+        if not hasattr(valueResult, 'SourceCode'):
+            setattr(valueResult, 'SourceCode', None)
+
+        clean_censorCode = self._check_censorCode(valueResult.CensorCode)
+
+        for column, value in zip(self.columns, (
+                valueResult.SampleID,
+                valueResult.MethodID,
+                valueResult.QualityControlLevelID,
+                clean_censorCode,
+                valueResult.ValueAccuracy,
+                valueResult.OffsetTypeID,
+                aDate,
+                valueResult.DateTimeUTC,
+                valueResult.SourceCode,
+                valueResult.UTCOffset,
+                valueResult.OffsetValue,
+                valueResult.QualifierID)):
+            column.append(value)
+        self.texts.append(str(valueResult.DataValue))
+        return clean_censorCode
+
+
+class ValueElements_1_0(ValueElements):
+    """
+    WaterML 1.0 <value> elements, as created by WOF.create_value_element.
+    """
+
+    WaterML = WaterML
+    fields = (
+        ('qualityControlLevel', QUOTED),
+        ('methodID', INTEGER),
+        ('sourceID', INTEGER),
+        ('censorCode', QUOTED),
+        ('sampleID', INTEGER),
+        ('offsetTypeID', INTEGER),
+        ('accuracyStdDev', DOUBLE),
+        ('offsetValue', DOUBLE),
+        ('dateTime', QUOTED),
+        ('qualifiers', QUOTED),
+    )
+
+    def __init__(self, check_censorCode, check_QualityControlLevel):
+        super(ValueElements_1_0, self).__init__()
+        self._check_censorCode = _memoized(check_censorCode)
+        self._check_QualityControlLevel = _memoized(
+            check_QualityControlLevel)
+
+    def add(self, valueResult):
+        """
+        Adds a data value and returns its WaterML censor code.
+        """
+        adate = core._get_datavalues_datetime(
+            valueResult, "LocalDateTime", "DateTimeUTC").isoformat()
+        clean_censorCode = self._check_censorCode(valueResult.CensorCode)
+        clean_qcl = self._check_QualityControlLevel(
+            valueResult.QualityControlLevel)
+
+        for column, value in zip(self.columns, (
+                clean_qcl,
+                valueResult.MethodID,
+                valueResult.SourceID,
+                clean_censorCode,
+                valueResult.SampleID,
+                valueResult.OffsetTypeID,
+                valueResult.ValueAccuracy,
+                valueResult.OffsetValue,
+                adate,
+                valueResult.QualifierID)):
+            column.append(value)
+        self.texts.append(str(valueResult.DataValue))
+        return clean_censorCode
@@ -0,0 +1,73 @@
+from __future__ import (absolute_import, division, print_function)
+
+import math
+
+
+class SiteGridIndex(object):
+    """
+    In-memory grid index of sites for bounding box queries.
+
+    Sites are bucketed in cells of cell_size degrees of longitude and
+    latitude; a query only tests the sites of the cells its box overlaps.
+    Sites without coordinates are left out of the index.
+
+    Boxes are inclusive on all four sides, like the bounding box queries of
+    the DAOs. A box whose west is greater than its east crosses the
+    antimeridian, i.e. it covers [west, 180] and [-180, east].
+    """
+
+    def __init__(self, sites, cell_size=1.0):
+        self.cell_size = float(cell_size)
+        self._cells = {}
+        self._count = 0
+        for position, site in enumerate(sites):
+            if site.Latitude is None or site.Longitude is None:
+                continue
+            lon = float(site.Longitude)
+            lat = float(site.Latitude)
+            self._cells.setdefault(self._cell(lon, lat), []).append(
+                (lon, lat, position, site))
+            self._count += 1
+
+    def __len__(self):
+        return self._count
+
+    def _index(self, coordinate):
+        return int(math.floor(coordinate / self.cell_size))
+
+    def _cell(self, lon, lat):
+        return (self._index(lon), self._index(lat))
+
+    def query(self, west, south, east, north):
+        """
+        Returns the sites within the bounding box, in the order they were
+        indexed.
+        """
+        west, south, east, north = (
+            float(west), float(south), float(east), float(north))
+        if south > north:
+            return []
+        if west > east:
+            matches = (self._query(west, south, 180.0, north) +
+                       self._query(-180.0, south, east, north))
+        else:
+            matches = self._query(west, south, east, north)
+        matches.sort()
+        return [site for position, site in matches]
+
+    def _query(self, west, south, east, north):
+        x0, x1 = self._index(west), self._index(east)
+        y0, y1 = self._index(south), self._index(north)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(self._cells):
+            # Large boxes cover more cells than there are occupied ones.
+            cells = [bucket for (x, y), bucket in self._cells.items()
+                     if x0 <= x <= x1 and y0 <= y <= y1]
+        else:
+            cells = [self._cells[(x, y)]
+                     for x in range(x0, x1 + 1)
+                     for y in range(y0, y1 + 1)
+                     if (x, y) in self._cells]
+        return [(position, site)
+                for bucket in cells
+                for lon, lat, position, site in bucket
+                if west <= lon <= east and south <= lat <= north]
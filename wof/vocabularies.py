@@ -5,6 +5,8 @@ import json
 import logging
 import pytz
 import os
+import threading
+import time
 
 from lxml import objectify
 from suds.client import Client
@@ -55,6 +57,205 @@ def get_watermlcvs():
                                        'watermlcvs.json'), 'rb'))
 
 
+class CVRegistry(object):
+    """
+    Process-wide registry of controlled vocabularies.
+
+    The WaterML 1.1 vocabularies are read from watermlcvs.json once into
+    frozensets and reloaded only when the file modification time changes.
+    The modification time is checked at most every check_interval seconds.
+    Vocabularies that are not in the file, like the WaterML 1.0 schema
+    enumerations, can be added with register.
+
+    Term checks are memoized, so repeated terms cost one dictionary lookup.
+    The memo is cleared whenever the file is reloaded.
+    """
+
+    def __init__(self, file_name='watermlcvs.json', check_interval=5.0):
+        self.file_name = file_name
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._static = {}
+        self._cvs = {}
+        self._path = None
+        self._mtime = None
+        self._next_check = 0
+        self._memo = {}
+
+    def register(self, cv, terms):
+        """Registers a vocabulary that is not read from the CV file."""
+        self._static[cv] = frozenset(terms)
+        self._memo = {}
+
+    def invalidate(self):
+        """Forces the CV file to be reloaded on the next lookup."""
+        with self._lock:
+            self._mtime = None
+            self._next_check = 0
+
+    def terms(self, cv):
+        """Returns the frozenset of terms of a vocabulary."""
+        if cv in self._static:
+            return self._static[cv]
+        self._refresh()
+        return self._cvs[cv]
+
+    def is_valid(self, cv, term):
+        """Returns True if term is part of the vocabulary cv."""
+        if cv not in self._static:
+            self._refresh()
+        key = (cv, term)
+        try:
+            return self._memo[key]
+        except KeyError:
+            pass
+        valid = term in self.terms(cv)
+        self._memo[key] = valid
+        return valid
+
+    def check_term(self, cv, term, termdefault):
+        """
+        Returns term if it is part of the vocabulary cv, otherwise
+        termdefault. Unmatched terms are logged once per load.
+        """
+        self._refresh()
+        key = (cv, term, termdefault)
+        try:
+            return self._memo[key]
+        except KeyError:
+            pass
+        if term in self.terms(cv):
+            clean_term = term
+        else:
+            logging.warn('default returned: {0} {1} term does not match CV terms list'.format(cv, term))  # noqa
+            clean_term = termdefault
+        self._memo[key] = clean_term
+        return clean_term
+
+    def _refresh(self):
+        now = time.time()
+        if now < self._next_check:
+            return
+        with self._lock:
+            if now < self._next_check:
+                return
+            path = os.path.join(os.path.abspath(os.path.curdir),
+                                self.file_name)
+            mtime = os.stat(path).st_mtime
+            if path != self._path or mtime != self._mtime:
+                self._load(path, mtime)
+            self._next_check = now + self.check_interval
+
+    def _load(self, path, mtime):
+        with open(path, 'rb') as f:
+            watermlcvs = json.loads(f.read().decode('utf-8'))
+        cvs = {}
+        for cv, terms in watermlcvs['cv'].items():
+            cvs[cv] = frozenset(terms)
+        self._cvs = cvs
+        self._path = path
+        self._mtime = mtime
+        self._memo = {}
+
+
+registry = CVRegistry()
+
+WML10_CVS = {
+    'censorcode': [
+        "lt",
+        "gt",
+        "nc",
+        "nd",
+        "pnq",
+    ],
+    'qualitycontrollevel': [
+        "Raw data",
+        "Quality controlled data",
+        "Derived products",
+        "Interpreted products",
+        "Knowledge products",
+        "Unknown",
+    ],
+    'datatype': [
+        "Continuous",
+        "Instantaneous",
+        "Cumulative",
+        "Incremental",
+        "Average",
+        "Maximum",
+        "Minimum",
+        "Constant Over Interval",
+        "Categorical",
+        "Best Easy Systematic Estimator ",
+        "Unknown",
+        "Variance",
+        "Median",
+        "Mode",
+        "Best Easy Systematic Estimator",
+        "Standard Deviation",
+        "Skewness",
+        "Equivalent Mean",
+        "Sporadic",
+    ],
+    'unitstype': [
+        "Angle",
+        "Area",
+        "Dimensionless",
+        "Energy",
+        "Energy Flux",
+        "Flow",
+        "Force",
+        "Frequency",
+        "Length",
+        "Light",
+        "Mass",
+        "Permeability",
+        "Power",
+        "Pressure/Stress",
+        "Resolution",
+        "Scale",
+        "Temperature",
+        "Time",
+        "Velocity",
+        "Volume",
+    ],
+    'samplemedium': [
+        "Surface Water",
+        "Ground Water",
+        "Sediment",
+        "Soil",
+        "Air",
+        "Tissue",
+        "Precipitation",
+        "Unknown",
+        "Other",
+        "Snow",
+        "Not Relevant",
+    ],
+    'generalcategory': [
+        "Water Quality",
+        "Climate",
+        "Hydrology",
+        "Geology",
+        "Biota",
+        "Unknown",
+        "Instrumentation",
+    ],
+    'valuetype': [
+        "Field Observation",
+        "Sample",
+        "Model Simulation Result",
+        "Derived Value",
+        "Unknown",
+    ],
+}
+
+# The WaterML 1.0 enumerations are fixed by its schema, so they are
+# registered under a "wml10_" prefix instead of being read from the file.
+for _cv, _terms in WML10_CVS.items():
+    registry.register('wml10_' + _cv, _terms)
+
+
 def check_dataTypeEnum(term, validate=True):
     cv, default = "datatype", "Unknown"
     return _check_CVTerm(cv, term, default, checknone=True, validate=validate)
@@ -90,16 +291,8 @@ def check_censorCode(term, validate=True):
 # So, it's not using the common _check_CVTerm machinery at this time
 def check_QualityControlLevel(term):
     default = "Unknown"
-    cvterms = [
-        "Raw data",
-        "Quality controlled data",
-        "Derived products",
-        "Interpreted products",
-        "Knowledge products",
-        "Unknown",
-    ]
 
-    if term in cvterms:
+    if registry.is_valid('wml10_qualitycontrollevel', term):
         return term
     else:
         return default
@@ -112,12 +305,6 @@ def _check_CVTerm(cv, term, termdefault, checknone=True, validate=True):
         return termdefault
 
     if validate:
-        cvterms = get_watermlcvs()['cv'][cv]
-
-        if term in cvterms:
-            return term
-        else:
-            logging.warn('default returned: {0} {1} term does not match CV terms list'.format(cv, term))
-            return termdefault
+        return registry.check_term(cv, term, termdefault)
     else:
         return term
\ No newline at end of file